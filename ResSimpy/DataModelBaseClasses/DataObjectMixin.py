@@ -2,19 +2,23 @@
 from uuid import uuid4, UUID
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
 
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Time.ISODateTime import ISODateTime
 from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
 from ResSimpy.Units.AttributeMappings.BaseUnitMapping import BaseUnitMapping
 from ResSimpy.Utils import to_dict_generic
+from ResSimpy.Utils.content_hash import content_digest
 from ResSimpy.Utils.generic_repr import generic_repr, generic_str
 from ResSimpy.Utils.obj_to_table_string import to_table_line
 
 # generic type for dict
 DataObjectMixinDictType = dict[str, None | str | int | float | dict[int, float]]
 
+# attribute holding the memoized content digest of an object, along with the attributes it was calculated from
+_CONTENT_DIGEST_ATTRIBUTE = '_DataObjectMixin__content_digest'
+
 
 @dataclass(kw_only=True)
 class DataObjectMixin(ABC):
@@ -97,6 +101,31 @@ class DataObjectMixin(ABC):
 
         self.__iso_date = ISODateTime.convert_to_iso(self.date, self.date_format, self.start_date)
 
+    def __content_state(self) -> tuple[Any, ...]:
+        """Returns a snapshot of the attributes of the object, used to tell whether it has changed."""
+        return tuple(tuple(value) if isinstance(value, list) else
+                     tuple(value.items()) if isinstance(value, dict) else value
+                     for key, value in vars(self).items() if key != _CONTENT_DIGEST_ATTRIBUTE)
+
+    def content_digest(self) -> bytes:
+        """Returns a digest of the content of the object, equal for objects with equal attributes.
+
+        The digest covers the attributes returned by to_dict, excluding units and None values. It is memoized on the
+        object and recalculated once any attribute of the object has changed.
+        """
+        state = self.__content_state()
+        memo = vars(self).get(_CONTENT_DIGEST_ATTRIBUTE)
+        if memo is not None:
+            try:
+                if memo[0] == state:
+                    return memo[1]
+            except ValueError:
+                # attributes such as arrays can't be compared as a whole, so the digest is recalculated
+                pass
+        digest = content_digest(type(self).__name__, self.to_dict(add_units=False, include_nones=False))
+        setattr(self, _CONTENT_DIGEST_ATTRIBUTE, (state, digest))
+        return digest
+
     def to_dict(self, keys_in_keyword_style: bool = False, add_date: bool = True, add_units: bool = True,
                 add_iso_date: bool = False, include_nones: bool = True,
                 units_as_string: bool = True) -> DataObjectMixinDictType:
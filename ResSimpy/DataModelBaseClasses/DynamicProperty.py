@@ -1,14 +1,15 @@
 """Base class for handling any dynamic property simulator inputs, for use in inputs such as PVT, relperm, etc."""
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
 import numpy as np
 import pandas as pd
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from ResSimpy.FileOperations.File import File
 from ResSimpy.Units.AttributeMappings.BaseUnitMapping import BaseUnitMapping
+from ResSimpy.Utils.content_hash import content_digest
 
 
 @dataclass
@@ -34,6 +35,12 @@ class DynamicProperty(ABC):
         self.input_number: int = input_number
         self.file: Optional[File] = file
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets an attribute, discarding the memoized content digest."""
+        object.__setattr__(self, name, value)
+        if name != '_DynamicProperty__content_digest':
+            object.__setattr__(self, '_DynamicProperty__content_digest', None)
+
     @property
     @abstractmethod
     def units(self) -> BaseUnitMapping:
@@ -79,6 +86,26 @@ class DynamicProperty(ABC):
         elif overwrite_file is True and self.file is None:
             raise ValueError('Please specify a file to overwrite or provide new_file_location.')
 
+    def clear_cached_tables(self) -> None:
+        """Removes any tables cached from the properties, so that they are rebuilt after the properties change.
+
+        Call this after modifying the properties in place. Clears the memoized content digest, derived classes that
+        cache values computed from the properties extend this to clear them too.
+        """
+        self.__content_digest: Optional[bytes] = None
+
+    def content_digest(self) -> bytes:
+        """Returns a digest of the content of the dynamic property, equal for properties with equal content.
+
+        The digest covers the properties and the other compared attributes of the derived class (e.g. the unit system),
+        excluding the file and input number. It is memoized and recalculated when an attribute is set or
+        clear_cached_tables is called.
+        """
+        if self.__content_digest is None:
+            self.__content_digest = content_digest(
+                type(self).__name__, [(x.name, getattr(self, x.name, None)) for x in fields(self) if x.compare])
+        return self.__content_digest
+
     @property
     def ranges(self) -> dict[str, tuple[float, float]]:
         """Returns a dictionary of the ranges of the dynamic properties."""
@@ -115,13 +142,11 @@ class DynamicProperty(ABC):
     @staticmethod
     def convert_to_hashable(value: Union[str, float, pd.DataFrame, list[str], dict[str, float],
                                          tuple[str, dict[str, float]], dict[str, pd.DataFrame], np.ndarray,
-                                         dict[str, Union[float, pd.DataFrame]]]) -> Union[str, float, tuple, frozenset]:
+                                         dict[str, Union[float, pd.DataFrame]]]) -> \
+            Union[str, float, bytes, tuple, frozenset]:
         """Converts a value of a mix of datatypes and nested dictionaries to a hashable value."""
-        if isinstance(value, pd.DataFrame):
-            pd_hash = pd.util.hash_pandas_object(value)
-            return tuple(pd_hash.values)
-        elif isinstance(value, np.ndarray):
-            return np.array2string(value)
+        if isinstance(value, (pd.DataFrame, np.ndarray)):
+            return content_digest(value)
         elif isinstance(value, list):
             return tuple(value)
         elif isinstance(value, dict):
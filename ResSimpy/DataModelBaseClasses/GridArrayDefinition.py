@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
 import numpy as np
@@ -11,6 +11,11 @@ from ResSimpy.FileOperations.File import File
 from ResSimpy.FileOperations import file_operations as fo
 from ResSimpy.Utils.grid_filtering_functions import grid_filter_file_as_list, filter_grid_array_definition
 from ResSimpy.Utils.general_utilities import check_if_string_is_float
+from ResSimpy.Utils.structured_grid_indexing import (ARITHMETIC_OPERATORS, KEYWORD_OPERATOR_MAPPING,
+                                                     apply_indexed_operation, box_flat_indices)
+
+# attributes of a grid array definition that the effective array is calculated from
+_EFFECTIVE_ARRAY_INPUTS = frozenset(['modifier', 'value', 'mods', 'absolute_path', 'array'])
 
 
 @dataclass
@@ -35,6 +40,10 @@ class GridArrayDefinition:
     absolute_path: Optional[str] = None
     array: Optional[np.ndarray] = None
     __id: UUID = field(default_factory=lambda: uuid4(), compare=False)
+    __effective_array: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+    __effective_array_key: Optional[tuple[int, int, int]] = field(default=None, compare=False, repr=False)
+    __effective_array_version: int = field(default=0, compare=False, repr=False)
+    __array_loaded_from_value: bool = field(default=False, compare=False, repr=False)
 
     def __init__(self, modifier: Optional[str] = None, value: Optional[str] = None,
                  mods: Optional[dict[str, pd.DataFrame]] = None, keyword_in_include_file: bool = False,
@@ -53,6 +62,7 @@ class GridArrayDefinition:
             array (Optional[np.ndarray]): The loaded array from the grid file. Loads from the absolute path.
         """
         self.__id = uuid4()
+        self.__effective_array_version = 0
         self.name = name
         self.region_name = region_name
         self.modifier = modifier
@@ -61,6 +71,38 @@ class GridArrayDefinition:
         self.keyword_in_include_file = keyword_in_include_file
         self.absolute_path = absolute_path
         self.array = array
+        self.__effective_array = None
+        self.__effective_array_key = None
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Sets an attribute, clearing the cached effective array if the values or mods of the array change."""
+        super().__setattr__(name, value)
+        if name == 'array':
+            super().__setattr__('_GridArrayDefinition__array_loaded_from_value', False)
+        elif name in ('modifier', 'value', 'absolute_path') and self.__array_loaded_from_value:
+            # an array loaded from the previous value or include file is out of date
+            super().__setattr__('array', None)
+            super().__setattr__('_GridArrayDefinition__array_loaded_from_value', False)
+        if name in _EFFECTIVE_ARRAY_INPUTS:
+            self.clear_effective_array()
+
+    def clear_effective_array(self) -> None:
+        """Removes the cached effective array, so that it is recalculated when next requested.
+
+        Called whenever the value, array, modifier or mods are set. Call this after editing the array or the mod
+        tables in place.
+        """
+        super().__setattr__('_GridArrayDefinition__effective_array', None)
+        super().__setattr__('_GridArrayDefinition__effective_array_version', self.__effective_array_version + 1)
+
+    @property
+    def effective_array_version(self) -> int:
+        """A number that changes whenever the cached effective array is cleared.
+
+        Objects caching values calculated from the effective array, such as region indices, compare it to the version
+        they were calculated from to check that they are still up to date.
+        """
+        return self.__effective_array_version
 
     def load_grid_array_definition_to_file_as_list(self) -> list[str]:
         """Loads the grid array definition to a file as a list of strings."""
@@ -83,6 +125,7 @@ class GridArrayDefinition:
             return self.array
         file_as_list = self.load_grid_array_definition_to_file_as_list()
         self.array = self.grid_file_as_list_to_numpy_array(file_as_list, x_range, y_range, z_range)
+        self.__array_loaded_from_value = True
         return self.array
 
     def filtered_grid_array_def_as_file(self) -> File:
@@ -135,6 +178,143 @@ class GridArrayDefinition:
         """Returns the array from the grid array definition."""
         return self.get_array_from_file()
 
+    def get_effective_array(self, x_range: int, y_range: int, z_range: int, use_cache: bool = True) -> np.ndarray:
+        """Returns the array with any MOD and VMOD cards applied.
+
+        The result is cached on the object, so subsequent calls do not reload or recalculate the array. The cache is
+        cleared when the value, array, modifier or mods are set. Edits made in place to the array or the mod tables
+        are not detected, so call clear_effective_array after them.
+
+        Args:
+            x_range (int): number of cells in the i direction (NX).
+            y_range (int): number of cells in the j direction (NY).
+            z_range (int): number of cells in the k direction (NZ).
+            use_cache (bool): If False the effective array is recalculated, for example after the mods are changed.
+        """
+        cache_key = (x_range, y_range, z_range)
+        if use_cache and self.__effective_array is not None and self.__effective_array_key == cache_key:
+            return self.__effective_array
+        array_or_value: np.ndarray | float
+        if self.array is not None or self.modifier == 'VALUE':
+            array_or_value = self.get_array_from_file(x_range, y_range, z_range)
+        else:
+            array_or_value = self._get_array_or_value()
+        base_array = np.broadcast_to(np.asarray(array_or_value, dtype=float), (x_range * y_range * z_range,))
+        effective_array = self.apply_mods(base_array, x_range, y_range, z_range)
+        self.__effective_array = effective_array
+        self.__effective_array_key = cache_key
+        return effective_array
+
+    def transform_values(self, scale: float, offset: float = 0.0) -> None:
+        """Multiplies the values of the grid array by a scale and adds an offset, e.g. to convert their units.
+
+        CON values are updated in place. Values given in full (e.g. VALUE, LAYER or ZVAR), whether inline or in an
+        include file, are replaced with the transformed values inline. Values assigned by a MOD card are transformed
+        and values added or subtracted are scaled, while multiplications and divisions are left unchanged. VMOD cards
+        are left unchanged, as their values are held in include files.
+
+        Args:
+            scale (float): the factor to multiply the values by.
+            offset (float): the value to add after scaling. Defaults to 0.
+        """
+        if self.mods is not None and 'MOD' in self.mods and not self.mods['MOD'].empty:
+            mod_table = self.mods['MOD'].copy()
+            mod_table['#v'] = [self.__transform_mod_value(x, scale, offset) for x in mod_table['#v']]
+            self.mods = {**self.mods, 'MOD': mod_table}
+        if self.value is None:
+            return
+        if self.modifier == 'CON':
+            self.value = f'{float(self.value) * scale + offset:.9g}'
+        elif self.modifier in ['VALUE', 'XVAR', 'YVAR', 'ZVAR', 'LAYER']:
+            if self.modifier == 'VALUE' and self.array is not None:
+                values = self.array
+            elif self.absolute_path is None and not self.value.upper().isupper():
+                values = self.grid_file_as_list_to_numpy_array(self.value.splitlines(), None, None, None)
+            else:
+                values = self.grid_file_as_list_to_numpy_array(self.load_grid_array_definition_to_file_as_list(),
+                                                               None, None, None)
+            transformed = values * scale + offset
+            self.value = '\n'.join(' '.join(f'{x:.9g}' for x in transformed[i:i + 10])
+                                   for i in range(0, len(transformed), 10))
+            self.absolute_path = None
+            self.array = transformed if self.modifier == 'VALUE' else None
+
+    @staticmethod
+    def __transform_mod_value(mod_value: Any, scale: float, offset: float) -> Any:
+        """Transforms the value of a MOD card, e.g. '+2' or '5', returning multiplications and divisions unchanged."""
+        operation = str(mod_value).strip()
+        operator = operation[0] if operation and operation[0] in ARITHMETIC_OPERATORS else ''
+        if operator in ('*', '/'):
+            return mod_value
+        value = float(operation[1:] if operator else operation)
+        # an added or subtracted value is a difference between two values, so it doesn't take the offset
+        new_value = value * scale if operator in ('+', '-') else value * scale + offset
+        return f'{operator}{new_value:.9g}'
+
+    def apply_mods(self, array: np.ndarray, x_range: int, y_range: int, z_range: int) -> np.ndarray:
+        """Applies the MOD and VMOD cards for this grid array to a copy of the provided array.
+
+        MODX, MODY and MODZ cards only apply to corner point geometry and are ignored.
+
+        Args:
+            array (np.ndarray): flat base array with one value per cell.
+            x_range (int): number of cells in the i direction (NX).
+            y_range (int): number of cells in the j direction (NY).
+            z_range (int): number of cells in the k direction (NZ).
+
+        Returns:
+            np.ndarray: a new array with the mods applied.
+        """
+        modified_array = np.array(array, dtype=float)
+        if self.mods is None:
+            return modified_array
+        if 'MOD' in self.mods:
+            self.__apply_mod_table(modified_array, self.mods['MOD'], x_range, y_range, z_range)
+        if 'VMOD' in self.mods:
+            self.__apply_vmod_table(modified_array, self.mods['VMOD'], x_range, y_range, z_range)
+        return modified_array
+
+    @staticmethod
+    def __apply_mod_table(array: np.ndarray, mod_table: pd.DataFrame, x_range: int, y_range: int,
+                          z_range: int) -> None:
+        """Applies a MOD table in place, combining consecutive rows with the same operator into one operation."""
+        if mod_table.empty:
+            return
+        operations = pd.Series([str(x).strip() for x in mod_table['#v']], index=mod_table.index)
+        first_characters = operations.str[0]
+        has_operator = first_characters.isin(ARITHMETIC_OPERATORS)
+        # a value without an operator replaces the existing value
+        operators = first_characters.where(has_operator, '=')
+        values = operations.where(~has_operator, operations.str[1:]).astype(float).to_numpy()
+        boxes = mod_table[['i1', 'i2', 'j1', 'j2', 'k1', 'k2']].astype(int).to_numpy()
+
+        # operations of the same type commute, so consecutive rows with the same operator are applied together
+        run_ids = (operators != operators.shift()).cumsum().to_numpy()
+        operators_array = operators.to_numpy()
+        for run_id in np.unique(run_ids):
+            rows = np.flatnonzero(run_ids == run_id)
+            box_indices = [box_flat_indices(list(boxes[row]), x_range, y_range, z_range) for row in rows]
+            indices = np.concatenate(box_indices)
+            cell_values = np.repeat(values[rows], [len(x) for x in box_indices])
+            apply_indexed_operation(array, indices, operators_array[rows[0]], cell_values)
+
+    @staticmethod
+    def __apply_vmod_table(array: np.ndarray, vmod_table: pd.DataFrame, x_range: int, y_range: int,
+                           z_range: int) -> None:
+        """Applies a VMOD table in place, reading a value per cell of each box from the include files."""
+        for _, vmod_row in vmod_table.iterrows():
+            operator = KEYWORD_OPERATOR_MAPPING.get(str(vmod_row['operation']).upper(), None)
+            if operator is None:
+                raise ValueError(f'Unsupported VMOD operation {vmod_row["operation"]}.')
+            box = [int(vmod_row[x]) for x in ['i1', 'i2', 'j1', 'j2', 'k1', 'k2']]
+            indices = box_flat_indices(box, x_range, y_range, z_range)
+            values = GridArrayDefinition.grid_file_as_list_to_numpy_array(
+                fo.load_file_as_list(vmod_row['include_file']), None, None, None)
+            if values.size != indices.size:
+                raise ValueError(f'VMOD include file {vmod_row["include_file"]} has {values.size} values, '
+                                 f'expected {indices.size} for box {box}.')
+            apply_indexed_operation(array, indices, operator, values)
+
     @property
     def id(self) -> UUID:
         """Unique identifier for each object."""
@@ -0,0 +1,10 @@
+"""Enum for the kinds of change reported when comparing two models."""
+from enum import Enum
+
+
+class DiffChange(str, Enum):
+    """The kind of change to an item between a base model and another model."""
+
+    ADDED = 'ADDED'
+    REMOVED = 'REMOVED'
+    CHANGED = 'CHANGED'
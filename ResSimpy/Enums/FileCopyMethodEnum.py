@@ -0,0 +1,17 @@
+"""Enum for the ways of copying unmodified files when moving a model to a new location."""
+from enum import Enum
+
+
+class FileCopyMethod(str, Enum):
+    """How an unmodified file is copied to a new location.
+
+    WRITE writes out the content held in memory, loading files whose loading was skipped. COPY copies the file on
+    disk with copy_file_range where the operating system supports it, which makes a reflink on file systems that
+    support them, or shutil.copyfile otherwise. HARDLINK makes a hard link to the file on disk, copying it if no link
+    can be made. A hard linked file is the same file in both locations, so overwriting it in place in one location,
+    e.g. with update_simulator_files, changes it in the other.
+    """
+
+    WRITE = 'WRITE'
+    COPY = 'COPY'
+    HARDLINK = 'HARDLINK'
@@ -1,13 +1,15 @@
 """This module contains the abstract base class for file manipulations for simulator files."""
 from __future__ import annotations
+import copy
 import os
 import pathlib
 from datetime import datetime, timezone
 from uuid import uuid4, UUID
 from dataclasses import dataclass, field
-from typing import Optional, Sequence, TypeVar
+from typing import TYPE_CHECKING, Optional, Sequence, TypeVar
 import warnings
 from ResSimpy.FileOperations.FileBase import FileBase
+from ResSimpy.FileOperations.file_writer import FileWriter
 import ResSimpy.FileOperations.file_operations as fo
 from ResSimpy.FileOperations.simulator_constants import NEXUS_COMMENT_CHARACTERS, OTHER_SIMULATOR_COMMENT_CHARACTERS
 from ResSimpy.Utils.general_utilities import is_number
@@ -18,6 +20,10 @@ from ResSimpy.Nexus.NexusKeywords.structured_grid_keywords import GRID_ARRAY_FOR
 from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
 from ResSimpy.Time.ISODateTime import ISODateTime
 from ResSimpy.Utils.factory_methods import get_empty_list_file, get_empty_list_str, get_empty_dict_uuid_list_int
+from ResSimpy.Utils.load_profiler import profiled_phase
+
+if TYPE_CHECKING:
+    from ResSimpy.FileOperations.file_content_store import FileContentStore, _StoredContent
 
 T = TypeVar("T", bound='File')
 
@@ -51,6 +57,10 @@ class File(FileBase):
     __id: UUID = field(default_factory=lambda: uuid4(), compare=False)
     __file_modified: bool = False
     __file_loading_skipped: bool = False
+    __content_shared: bool = field(default=False, compare=False, repr=False)
+    __content: Optional[list[str]] = field(default=None, compare=False, repr=False)
+    _content_store: Optional[FileContentStore] = field(default=None, compare=False, repr=False)
+    _stored_content: Optional[_StoredContent] = field(default=None, compare=False, repr=False)
 
     def __init__(self, location: str,
                  include_locations: Optional[list[str]] = None,
@@ -120,6 +130,79 @@ class File(FileBase):
         """Whether loading the file contents has been skipped due to it being to large e.g. for array files."""
         return self.__file_loading_skipped
 
+    def clone(self: T, memo: Optional[dict[int, File]] = None) -> T:
+        """Returns a copy of the file and its includes that shares the file content with this file.
+
+        The content is shared until it is edited in place, at which point the file being edited takes its own copy.
+        Files that are never edited are therefore held once however many times they are cloned.
+
+        Args:
+            memo (Optional[dict[int, File]]): the clones already made, keyed by the id of the original file, so that
+                a file referenced from several places is only cloned once. Defaults to a new dictionary.
+
+        Returns:
+            File: the clone of the file.
+        """
+        if memo is None:
+            memo = {}
+        existing_clone = memo.get(id(self))
+        if isinstance(existing_clone, type(self)):
+            return existing_clone
+        if self._content_store is not None:
+            # restore the content if it has been evicted, so that the clone shares it
+            self._content_store.content_read(self)
+        new_file = copy.copy(self)
+        memo[id(self)] = new_file
+        if self.include_objects is not None:
+            new_file.include_objects = [x.clone(memo) for x in self.include_objects]
+        if self.include_locations is not None:
+            new_file.include_locations = list(self.include_locations)
+        self.__content_shared = True
+        new_file.__content_shared = True
+        if self._content_store is not None:
+            # the clone shares the stored content, so that it is counted once and evicted and restored together
+            self._content_store.attach(new_file)
+        return new_file
+
+    def _unshare_content(self) -> None:
+        """Takes a copy of the file content and object locations if they are shared with a clone of the file.
+
+        Called before the content or object locations are edited in place.
+        """
+        if not self.__content_shared:
+            return
+        if self.file_content_as_list is not None:
+            self.file_content_as_list = list(self.file_content_as_list)
+        if self.object_locations is not None:
+            self.object_locations = {obj_id: list(indices) for obj_id, indices in self.object_locations.items()}
+        self.__content_shared = False
+
+    def _get_file_content_as_list(self) -> Optional[list[str]]:
+        """Returns the content of the file, restoring it first if it has been evicted by a content store."""
+        if self._content_store is not None:
+            self._content_store.content_read(self)
+        return self.__content
+
+    def _set_file_content_as_list(self, value: Optional[list[str]]) -> None:
+        """Sets the content of the file, recording its size in the content store if one is attached."""
+        self.__content = value
+        if self._content_store is not None:
+            self._content_store.content_set(self, value)
+
+    def _evict_content(self) -> Optional[list[str]]:
+        """Removes the content of the file so that it can be held compressed by a content store.
+
+        Returns:
+            Optional[list[str]]: the content removed.
+        """
+        content = self.__content
+        self.__content = None
+        return content
+
+    def _restore_content(self, content: Optional[list[str]]) -> None:
+        """Restores the content of the file evicted by a content store, without recording it as new content."""
+        self.__content = content
+
     @property
     def location_in_including_file(self) -> str:
         """The location of the file as it is written after the INCLUDE token in the file including it."""
@@ -179,8 +262,10 @@ class File(FileBase):
         """
         raise NotImplementedError("Implement this in the derived class.")
 
+    @profiled_phase('write_to_file')
     def write_to_file(self, new_file_path: None | str = None, write_includes: bool = False,
-                      write_out_all_files: bool = False, overwrite_file: bool = False) -> None:
+                      write_out_all_files: bool = False, overwrite_file: bool = False,
+                      file_writer: Optional[FileWriter] = None, source_file_path: Optional[str] = None) -> None:
         """Writes to file specified in self.location the strings contained in the list self.file_content_as_list.
 
         Args:
@@ -189,8 +274,16 @@ class File(FileBase):
             write_out_all_files (bool): If False will write only modified files. Otherwise will write all files.
             overwrite_file (bool): If True will overwrite the file at the location specified by new_file_path. \
             Otherwise will raise an error if the file already exists.
+            file_writer (Optional[FileWriter]): Creates the directories, checks for existing files and writes out the \
+            files. Defaults to a FileWriter, which writes straight to the file system.
+            source_file_path (Optional[str]): Path to the file on disk, copied from if the file writer copies \
+            unmodified files from disk. Defaults to the location of the file.
         """
         # overwrite File base class method to allow for write_includes
+        if file_writer is None:
+            file_writer = FileWriter()
+        if source_file_path is None:
+            source_file_path = self.location
         if new_file_path is None:
             if overwrite_file:
                 # In this case just overwrite the file with the existing path:
@@ -202,16 +295,19 @@ class File(FileBase):
             raise ValueError(f'No file data to write out, instead found {self.file_content_as_list}')
 
         # create directories that do not exist
-        if not os.path.exists(os.path.dirname(new_file_path)):
-            os.makedirs(os.path.dirname(new_file_path))
+        file_writer.make_dirs(os.path.dirname(new_file_path))
 
         if write_includes and self.include_objects is not None:
             for file in self.include_objects:
                 write_file: bool = file.file_modified or write_out_all_files
-                write_file = write_file or (new_file_path != self.location and not os.path.isabs(file.location))
-
-                # if the array was previously skipped then load the file as list
-                if file.file_loading_skipped:
+                # includes referenced by a relative path are written alongside a file written to a new location
+                write_file = write_file or (new_file_path != self.location and
+                                            not os.path.isabs(file.location_in_including_file))
+
+                # the location of the include is updated below, so keep the location it is copied from
+                include_source_path = file.location
+                # if the array was previously skipped then load the file as list, unless it is copied from disk
+                if file.file_loading_skipped and not file_writer.copies_from_disk(file, include_source_path):
                     file.file_content_as_list = fo.load_file_as_list(file.location)
 
                 if file.file_content_as_list is None:
@@ -227,27 +323,25 @@ class File(FileBase):
                 if write_file:
                     self.update_include_location_in_file_as_list(include_file_name, file)
 
-                if os.path.exists(include_file_name):
+                if file_writer.exists(include_file_name):
                     # if the file is already copied across then move on to the next file
                     continue
 
                 if write_file:
                     file.write_to_file(include_file_name, write_includes=True, write_out_all_files=write_out_all_files,
-                                       overwrite_file=overwrite_file)
+                                       overwrite_file=overwrite_file, file_writer=file_writer,
+                                       source_file_path=include_source_path)
 
         # check if the file already exists so we aren't accidentally overwriting it
-        if os.path.exists(new_file_path) and not overwrite_file:
+        if file_writer.exists(new_file_path) and not overwrite_file:
             raise ValueError(f'File already exists at {new_file_path} and overwrite_file set to False')
 
-        file_str = ''.join(self.file_content_as_list)
-
         # update the location:
         if self.file_modified or write_out_all_files:
             self.location = new_file_path
 
         # write the file to the new location
-        with open(new_file_path, 'w') as fi:
-            fi.write(file_str)
+        file_writer.write(self, new_file_path, source_file_path)
         # reset the modified file state
         self._file_modified_set(False)
 
@@ -301,6 +395,7 @@ class File(FileBase):
         return datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
     @staticmethod
+    @profiled_phase('generate_file_include_structure')
     def generate_file_include_structure(simulator_type: type[T], file_path: str, origin: Optional[str] = None,
                                         rootdir: Optional[str] = None,
                                         recursive: bool = True, skip_arrays: bool = True,
@@ -671,3 +766,10 @@ class File(FileBase):
     def convert_line_to_full_file_path(line: str, full_base_file_path: str) -> str:
         """Modifies a file reference to contain the full file path for easier loading later."""
         raise NotImplementedError("Implement in the inheriting class")
+
+
+# file_content_as_list is declared above as a dataclass field so that it is compared by __eq__, and is replaced here by
+# a property so that content evicted by a FileContentStore is restored when the file is next read.
+File.file_content_as_list = property(  # type: ignore[assignment]
+    File._get_file_content_as_list, File._set_file_content_as_list,
+    doc='List of lines in the file, restored from its compressed form if it has been evicted by a FileContentStore.')
@@ -0,0 +1,257 @@
+"""A memory budget for the content of the files of loaded models.
+
+Once a model is loaded, the lines of each of its files are held in File.file_content_as_list for the lifetime of the
+model, even after the wells, network and grid have been parsed from them. A FileContentStore attached to the files
+keeps the content of the files within a budget: when the content held exceeds the budget, the content of the least
+recently used unmodified files is compressed in memory and is decompressed when the file is next read. Modified files
+are never compressed, as they are still being edited and are written out with the model.
+
+The content is compressed rather than reloaded from disk, as the content of a file is the processed form of the lines
+read, e.g. with the paths to its includes made absolute, and the file on disk may have changed since it was loaded.
+
+The store holds each content once, however many files share it, e.g. a file and its clones made with File.clone. The
+shared content is counted once against the budget, is compressed for all of the files sharing it together, and is
+restored to the same list for all of them, so that they keep sharing it until one of them is edited.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import weakref
+import zlib
+from array import array
+from collections import OrderedDict
+from itertools import accumulate
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ResSimpy.FileOperations.File import File
+
+
+class FileContentStore:
+    """Holds the content of files within a memory budget, compressing the least recently used unmodified content.
+
+    A store can be shared between several models, e.g. a base model and its clones, so that their files are held
+    within a single budget. Reading and setting the content of the files is thread safe.
+    """
+
+    def __init__(self, memory_budget: int, compression_level: int = 1) -> None:
+        """Initialises the FileContentStore class.
+
+        Args:
+            memory_budget (int): the maximum number of bytes of file content to hold uncompressed. Modified files and
+                the file most recently read are held even if they exceed the budget.
+            compression_level (int): the zlib compression level used for the content of evicted files, from 1 for
+                the fastest to 9 for the smallest. Defaults to 1.
+        """
+        self.__memory_budget = _validate_memory_budget(memory_budget)
+        self.__compression_level = compression_level
+        self.__lock = threading.RLock()
+        # content held uncompressed, ordered from the least to the most recently used
+        self.__resident: OrderedDict[_StoredContent, None] = OrderedDict()
+        self.__evicted: set[_StoredContent] = set()
+        self.__resident_bytes = 0
+
+    @property
+    def memory_budget(self) -> int:
+        """The maximum number of bytes of file content to hold uncompressed."""
+        return self.__memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, value: int) -> None:
+        """Sets the memory budget, compressing the content of files until the content held is within it."""
+        with self.__lock:
+            self.__memory_budget = _validate_memory_budget(value)
+            self.__evict()
+
+    @property
+    def resident_bytes(self) -> int:
+        """The estimated number of bytes of file content held uncompressed."""
+        return self.__resident_bytes
+
+    @property
+    def compressed_bytes(self) -> int:
+        """The number of bytes held by the compressed content of evicted files."""
+        with self.__lock:
+            return sum(len(x.compressed) + len(x.line_lengths) for x in self.__evicted)
+
+    @property
+    def evicted_file_count(self) -> int:
+        """The number of files whose content is held compressed."""
+        with self.__lock:
+            return sum(len(x.files) for x in self.__evicted)
+
+    def attach(self, file: File) -> None:
+        """Holds the content of a file in the store, so that it can be compressed while the file isn't in use.
+
+        A clone of a file already held by the store shares the stored content of the file.
+
+        Args:
+            file (File): the file to hold the content of.
+        """
+        with self.__lock:
+            stored_content = file._stored_content
+            if file._content_store is self and stored_content is not None:
+                if id(file) not in stored_content.files:
+                    stored_content.files[id(file)] = self.__file_reference(stored_content, file)
+                return
+            if file._content_store is not None:
+                file._content_store.detach(file)
+            content = file.file_content_as_list
+            file._content_store = self
+            self.content_set(file, content)
+
+    def detach(self, file: File) -> None:
+        """Restores the content of a file if it has been compressed and stops holding it in the store.
+
+        Args:
+            file (File): the file to stop holding the content of.
+        """
+        with self.__lock:
+            if file._content_store is not self:
+                return
+            self.content_read(file)
+            self.__remove_file(file)
+            file._content_store = None
+
+    def content_read(self, file: File) -> None:
+        """Restores the content of a file if it has been compressed and marks it as the most recently used.
+
+        Called by File whenever its content is read. The content is restored for every file sharing it.
+
+        Args:
+            file (File): the file being read.
+        """
+        with self.__lock:
+            stored_content = file._stored_content
+            if stored_content is None:
+                return
+            if stored_content not in self.__evicted:
+                if stored_content in self.__resident:
+                    self.__resident.move_to_end(stored_content)
+                return
+            self.__evicted.discard(stored_content)
+            content = stored_content.decompress()
+            for sharing_file in stored_content.live_files():
+                sharing_file._restore_content(content)
+            self.__resident[stored_content] = None
+            self.__resident_bytes += stored_content.size
+            self.__evict(keep=stored_content)
+
+    def content_set(self, file: File, content: Optional[list[str]]) -> None:
+        """Records new content for a file as the most recently used, compressing other content if over budget.
+
+        Called by File whenever its content is set. The file stops sharing the content of any clones of it.
+
+        Args:
+            file (File): the file whose content has been set.
+            content (Optional[list[str]]): the new content of the file.
+        """
+        with self.__lock:
+            self.__remove_file(file)
+            stored_content = _StoredContent(_content_size(content))
+            stored_content.files[id(file)] = self.__file_reference(stored_content, file)
+            file._stored_content = stored_content
+            self.__resident[stored_content] = None
+            self.__resident_bytes += stored_content.size
+            self.__evict(keep=stored_content)
+
+    def __file_reference(self, stored_content: _StoredContent, file: File) -> weakref.ref[File]:
+        """Returns a weak reference to a file that stops holding it once the file has been garbage collected."""
+        key = id(file)
+        return weakref.ref(file, lambda _: self.__forget_file(stored_content, key))
+
+    def __remove_file(self, file: File) -> None:
+        """Stops holding the content of a file, forgetting the content once no file shares it."""
+        stored_content = file._stored_content
+        file._stored_content = None
+        if stored_content is not None:
+            self.__forget_file(stored_content, id(file))
+
+    def __forget_file(self, stored_content: _StoredContent, key: int) -> None:
+        """Removes a file from the files sharing a content, e.g. once the file has been garbage collected."""
+        with self.__lock:
+            stored_content.files.pop(key, None)
+            if stored_content.files:
+                return
+            self.__evicted.discard(stored_content)
+            if stored_content in self.__resident:
+                del self.__resident[stored_content]
+                self.__resident_bytes -= stored_content.size
+
+    def __evict(self, keep: Optional[_StoredContent] = None) -> None:
+        """Compresses the least recently used content not shared with modified files until the content is in budget."""
+        if self.__resident_bytes <= self.__memory_budget:
+            return
+        for stored_content in list(self.__resident):
+            if self.__resident_bytes <= self.__memory_budget:
+                break
+            files = stored_content.live_files()
+            if stored_content is keep or not files or stored_content.size == 0 or \
+                    any(x.file_modified for x in files):
+                continue
+            content = None
+            for file in files:
+                content = file._evict_content()
+            if content is None:
+                continue
+            del self.__resident[stored_content]
+            self.__resident_bytes -= stored_content.size
+            # the content may have been edited in place since its size was estimated
+            stored_content.size = _content_size(content)
+            stored_content.compress(content, self.__compression_level)
+            self.__evicted.add(stored_content)
+
+
+class _StoredContent:
+    """The content shared by one or more files held in a FileContentStore, and its compressed form once evicted."""
+
+    def __init__(self, size: int) -> None:
+        """Initialises the _StoredContent class.
+
+        Args:
+            size (int): estimated number of bytes held by the content.
+        """
+        # weak references to the files sharing the content, keyed by the id of the file, so that the store doesn't
+        # keep the files alive
+        self.files: dict[int, weakref.ref[File]] = {}
+        self.size = size
+        self.compressed = b''
+        self.line_lengths = b''
+
+    def live_files(self) -> list[File]:
+        """Returns the files sharing the content that haven't been garbage collected."""
+        return [file for file in (x() for x in list(self.files.values())) if file is not None]
+
+    def compress(self, content: list[str], compression_level: int) -> None:
+        """Holds the content compressed, as the compressed text of the lines and the length of each line."""
+        self.compressed = zlib.compress(''.join(content).encode('utf-8', 'surrogatepass'), compression_level)
+        self.line_lengths = zlib.compress(array('Q', map(len, content)).tobytes(), compression_level)
+
+    def decompress(self) -> list[str]:
+        """Returns the lines of the compressed content, releasing the compressed form."""
+        text = zlib.decompress(self.compressed).decode('utf-8', 'surrogatepass')
+        line_ends = array('Q')
+        line_ends.frombytes(zlib.decompress(self.line_lengths))
+        self.compressed = b''
+        self.line_lengths = b''
+        line_start = 0
+        content = []
+        for line_end in accumulate(line_ends):
+            content.append(text[line_start:line_end])
+            line_start = line_end
+        return content
+
+
+def _content_size(content: Optional[list[str]]) -> int:
+    """Estimates the number of bytes held by the content of a file."""
+    if not content:
+        return 0
+    return sys.getsizeof(content) + sum(map(sys.getsizeof, content))
+
+
+def _validate_memory_budget(memory_budget: int) -> int:
+    """Raises a ValueError if the memory budget is negative."""
+    if memory_budget < 0:
+        raise ValueError(f'The memory budget must be zero or more bytes, instead got {memory_budget}.')
+    return memory_budget
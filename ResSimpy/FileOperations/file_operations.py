@@ -1,11 +1,16 @@
+from __future__ import annotations
+
 import os
 from functools import partial
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 import re
 from string import whitespace
 
-from ResSimpy.DataModelBaseClasses.GridArrayDefinition import GridArrayDefinition
 from ResSimpy.FileOperations.simulator_constants import NEXUS_COMMENT_CHARACTERS
+from ResSimpy.Utils.load_profiler import record_read
+
+if TYPE_CHECKING:
+    from ResSimpy.DataModelBaseClasses.GridArrayDefinition import GridArrayDefinition
 
 
 def strip_file_of_comments(file_as_list: list[str], strip_str: bool = False,
@@ -79,6 +84,7 @@ def load_file_as_list(file_path: str, strip_comments: bool = False, strip_str: b
     except UnicodeDecodeError:
         with open(file_path, 'r', errors='replace') as f:
             file_content = list(f)
+    record_read(file_content)
 
     if strip_comments:
         file_content = strip_file_of_comments(file_content, strip_str=strip_str,
@@ -287,6 +293,9 @@ def __replace_value_in_file_as_list(file_as_list: list[str], line_index: int, re
     if not isinstance(original_line, str):
         raise ValueError(f'No valid value found, hit INCLUDE statement instead on line number \
                                             {line_index}')
+    # imported here as GridArrayDefinition imports this module
+    from ResSimpy.DataModelBaseClasses.GridArrayDefinition import GridArrayDefinition
+
     new_line = original_line
     if isinstance(replace_with, str):
         new_value = replace_with
@@ -452,9 +461,49 @@ def get_token_value(token: str, token_line: str, file_list: list[str],
     return value
 
 
-def __extract_search_string(token: str, token_line: str, file_list: list[str]) -> tuple[str | None, int | None]:
+def get_token_value_at(token: str, file_list: list[str], line_index: int,
+                       ignore_values: Optional[list[str]] = None,
+                       replace_with: Union[str, GridArrayDefinition, None] = None,
+                       comment_characters: list[str] | None = None, single_c_comments: bool = True,
+                       remove_quotation_marks: bool = False) -> Optional[str]:
+    """Gets the value following a token on the line at a known index in the file.
+
+    Equivalent to get_token_value, but avoids searching the file for the token line. This means the time taken does
+    not grow with the position of the line in the file, and the correct line is used when identical lines repeat.
+
+    Arguments:
+        token (str): the token being searched for.
+        file_list (list[str]): a list of strings containing each line of the file as a new entry
+        line_index (int): index in file_list of the line containing the token.
+        ignore_values (list[str], optional): a list of values that should be ignored if found. \
+            Defaults to None.
+        replace_with (Union[str, VariableEntry, None], optional):  a value to replace the existing value with. \
+            Defaults to None.
+        comment_characters (Optional[list[str]], optional): a list of characters that are considered inline comments.
+            Defaults to the Nexus format (!)
+        single_c_comments: (bool): whether a single C character at the start of a line should be treated as a
+            comment. Defaults to Nexus setting which is True.
+        remove_quotation_marks: (bool): whether the returned value should remove quotation marks surrounding the value,
+            if there are any.
+
+    Returns:
+        Optional[str]: The value following the supplied token, if it is present.
+    """
+    search_string, value_line_index = __extract_search_string(token, file_list[line_index], file_list,
+                                                              line_index=line_index)
+    if search_string is None or value_line_index is None:
+        return None
+    value = get_next_value(value_line_index, file_list, search_string, ignore_values, replace_with,
+                           comment_characters=comment_characters, single_c_acts_as_comment=single_c_comments,
+                           remove_quotation_marks=remove_quotation_marks)
+    return value
+
+
+def __extract_search_string(token: str, token_line: str, file_list: list[str],
+                            line_index: Optional[int] = None) -> tuple[str | None, int | None]:
     """Extracts the search string from the token line and returns the line index.
-    The line index is index of the token line.
+    The line index is index of the token line. If the line index isn't provided the file is searched for the token
+    line.
     """
     token_upper = token.upper()
     token_line_upper = token_line.upper()
@@ -465,7 +514,8 @@ def __extract_search_string(token: str, token_line: str, file_list: list[str]) -
 
     search_start = token_line_upper.index(token_upper) + len(token) + 1
     search_string = token_line[search_start: len(token_line)]
-    line_index = file_list.index(token_line)
+    if line_index is None:
+        line_index = file_list.index(token_line)
 
     # If we have reached the end of the line, go to the next line to start our search
     if len(search_string) < 1:
@@ -514,6 +564,44 @@ def get_expected_token_value(token: str, token_line: str, file_list: list[str],
     return value
 
 
+def get_expected_token_value_at(token: str, file_list: list[str], line_index: int,
+                                ignore_values: Optional[list[str]] = None,
+                                replace_with: Union[str, GridArrayDefinition, None] = None,
+                                custom_message: Optional[str] = None,
+                                comment_characters: None | list[str] = None) -> str:
+    """Function that returns the result of get_token_value_at if a value is found, otherwise it raises a ValueError.
+
+    Args:
+        token (str): the token being searched for.
+        file_list (list[str]): a list of strings containing each line of the file as a new entry
+        line_index (int): index in file_list of the line containing the token.
+        ignore_values (list[str], optional): a list of values that should be ignored if found. \
+            Defaults to None.
+        replace_with (Union[str, VariableEntry, None], optional):  a value to replace the existing value with. \
+            Defaults to None.
+        custom_message (Optional[str]): A custom error message if no value is found.
+        comment_characters (Optional[list[str]], optional): a list of characters that are considered inline comments.
+            Defaults to the Nexus format (!)
+
+    Returns:
+        str:  The value following the supplied token, if it is present.
+
+    Raises:
+        ValueError if a value is not found
+    """
+    value = get_token_value_at(token=token, file_list=file_list, line_index=line_index, ignore_values=ignore_values,
+                               replace_with=replace_with, comment_characters=comment_characters)
+
+    if value is None:
+        token_line = file_list[line_index]
+        if custom_message is None:
+            raise ValueError(f"No value found in the line after the expected token ({token}), line: {token_line}")
+        else:
+            raise ValueError(f"{custom_message} {token_line}")
+
+    return value
+
+
 def get_token_value_with_line_index(token: str, token_line: str, file_list: list[str],
                                     ignore_values: Optional[list[str]] = None,
                                     replace_with: Union[str, GridArrayDefinition, None] = None,
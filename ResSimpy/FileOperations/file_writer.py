@@ -0,0 +1,277 @@
+"""Writers used by File.write_to_file to create directories, check for existing files and write out file content.
+
+FileWriter makes these calls directly on the file system for each file written, and can copy unmodified files from
+disk rather than writing out their content, so that large files such as grid arrays never pass through Python strings.
+BatchFileWriter is shared between the cases written together by NexusSimulator.write_out_cases, possibly from several
+threads. It creates each directory once, answers existence checks from a single listing of each directory rather than a
+call to the file system for each file, and links unmodified files with the same content as a file already written,
+e.g. the files of clones of the same base model, to the first copy written rather than writing the same content again.
+
+A file that already exists is never overwritten in place. The new content is written to a temporary file in the same
+directory that then replaces it, so that other files hard linked to the existing file, e.g. by an earlier batch of
+cases, keep their content.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from ResSimpy.Enums.FileCopyMethodEnum import FileCopyMethod
+from ResSimpy.Utils.content_hash import lines_digest
+
+if TYPE_CHECKING:
+    from ResSimpy.FileOperations.File import File
+
+
+class FileWriter:
+    """Writes files straight to the file system."""
+
+    def __init__(self, copy_method: FileCopyMethod = FileCopyMethod.WRITE) -> None:
+        """Initialises the FileWriter class.
+
+        Args:
+            copy_method (FileCopyMethod): How unmodified files that exist on disk are written. Defaults to
+                FileCopyMethod.WRITE, which writes out the content held in memory.
+        """
+        self.copy_method = copy_method
+
+    def copies_from_disk(self, file: File, source_path: Optional[str] = None) -> bool:
+        """Returns True if the file is copied from disk when written, so its content doesn't need to be loaded.
+
+        Args:
+            file (File): the file to write out.
+            source_path (Optional[str]): path to the file on disk. Defaults to the location of the file.
+        """
+        if source_path is None:
+            source_path = file.location
+        return self.copy_method is not FileCopyMethod.WRITE and not file.file_modified and os.path.isfile(source_path)
+
+    def make_dirs(self, directory: str) -> None:
+        """Creates a directory and any missing parent directories if it doesn't already exist.
+
+        Args:
+            directory (str): path to the directory.
+        """
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def exists(self, path: str) -> bool:
+        """Returns True if a file or directory exists at the path provided."""
+        return os.path.exists(path)
+
+    def write(self, file: File, path: str, source_path: Optional[str] = None) -> None:
+        """Writes out the content of a file, or copies it from disk if it is unmodified and copy_method allows.
+
+        Args:
+            file (File): the file to write out.
+            path (str): path to write the content of the file to.
+            source_path (Optional[str]): path to the file on disk. Defaults to the location of the file.
+        """
+        if source_path is None:
+            source_path = file.location
+        if self.copies_from_disk(file, source_path):
+            copy_file(source_path, path, self.copy_method)
+            return
+        if file.file_content_as_list is None:
+            raise ValueError(f'No file data to write out, instead found {file.file_content_as_list}')
+        file_str = ''.join(file.file_content_as_list)
+        with _replacement_path(path) as write_path, open(write_path, 'w') as fi:
+            fi.write(file_str)
+
+
+class BatchFileWriter(FileWriter):
+    """Writes the files of many cases, sharing the directory checks and links to identical files between them.
+
+    The listings of the directories are taken when a directory is first checked, so files created in those directories
+    by other programs while the cases are written aren't seen by the writer.
+    """
+
+    def __init__(self, link_identical_files: bool = True, allow_symlinks: bool = False,
+                 copy_method: FileCopyMethod = FileCopyMethod.WRITE) -> None:
+        """Initialises the BatchFileWriter class.
+
+        Args:
+            link_identical_files (bool): If True, unmodified files with the same content as a file already written are
+                hard linked to that file rather than written again. Defaults to True.
+            allow_symlinks (bool): If True, a symbolic link is made where a hard link can't be, e.g. between file
+                systems. Symbolic links break if the file they point to is removed. Defaults to False.
+            copy_method (FileCopyMethod): How unmodified files that exist on disk are written. Defaults to
+                FileCopyMethod.WRITE, which writes out the content held in memory.
+        """
+        super().__init__(copy_method)
+        self.__link_identical_files = link_identical_files
+        self.__allow_symlinks = allow_symlinks
+        self.__lock = threading.Lock()
+        self.__directories: set[str] = set()
+        self.__listings: dict[str, set[str]] = {}
+        # first copy written of each content, keyed by the path copied from disk or the digest of the content
+        self.__written_contents: dict[tuple[str, str], _WrittenContent] = {}
+
+    def make_dirs(self, directory: str) -> None:
+        """Creates a directory and any missing parent directories the first time it is requested.
+
+        Args:
+            directory (str): path to the directory.
+        """
+        directory = os.path.abspath(directory)
+        with self.__lock:
+            if directory in self.__directories:
+                return
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
+                self.__listings[directory] = set()
+            self.__directories.add(directory)
+
+    def exists(self, path: str) -> bool:
+        """Returns True if a file exists at the path provided, from a listing of its directory taken once."""
+        directory, file_name = os.path.split(os.path.abspath(path))
+        return file_name in self.__listing(directory)
+
+    def write(self, file: File, path: str, source_path: Optional[str] = None) -> None:
+        """Writes out the content of a file, or links it to a copy already written if it is unmodified and identical.
+
+        Files copied from disk are identical if they are copied from the same path, while other files are identical if
+        their content has the same digest, so files whose content has been restored from a FileContentStore are
+        still linked.
+
+        Args:
+            file (File): the file to write out.
+            path (str): path to write the content of the file to.
+            source_path (Optional[str]): path to the file on disk. Defaults to the location of the file.
+        """
+        content_key: Optional[tuple[str, str]] = None
+        if self.__link_identical_files and not file.file_modified:
+            if self.copies_from_disk(file, source_path):
+                content_key = ('path', os.path.abspath(file.location if source_path is None else source_path))
+            elif file.file_content_as_list is not None:
+                content_key = ('digest', lines_digest(file.file_content_as_list).hex())
+        if content_key is None:
+            super().write(file, path, source_path)
+            self.__record(path)
+            return
+        with self.__lock:
+            written_content = self.__written_contents.get(content_key)
+            if written_content is None:
+                written_content = _WrittenContent(path)
+                self.__written_contents[content_key] = written_content
+                is_first_copy = True
+            else:
+                is_first_copy = False
+        if is_first_copy:
+            try:
+                super().write(file, path, source_path)
+                written_content.succeeded = True
+            finally:
+                written_content.done.set()
+            self.__record(path)
+            return
+        # wait for the first copy to be written, e.g. by another thread, before linking to it
+        written_content.done.wait()
+        if not (written_content.succeeded and self.__link(written_content.path, path)):
+            super().write(file, path, source_path)
+        self.__record(path)
+
+    def __listing(self, directory: str) -> set[str]:
+        """Returns the names of the files in a directory, listing the directory the first time it is requested."""
+        with self.__lock:
+            listing = self.__listings.get(directory)
+            if listing is None:
+                listing = set(os.listdir(directory)) if os.path.isdir(directory) else set()
+                self.__listings[directory] = listing
+            return listing
+
+    def __record(self, path: str) -> None:
+        """Adds a file that has been written to the listing of its directory."""
+        directory, file_name = os.path.split(os.path.abspath(path))
+        self.__listing(directory)
+        with self.__lock:
+            self.__listings[directory].add(file_name)
+
+    def __link(self, source_path: str, path: str) -> bool:
+        """Links a path to a file already written, returning False if no link could be made."""
+        try:
+            os.link(source_path, path)
+            return True
+        except OSError:
+            if not self.__allow_symlinks:
+                return False
+        try:
+            os.symlink(os.path.abspath(source_path), path)
+        except OSError:
+            return False
+        return True
+
+
+def copy_file(source_path: str, destination_path: str, copy_method: FileCopyMethod = FileCopyMethod.COPY) -> None:
+    """Copies a file on disk without reading its content into Python.
+
+    Args:
+        source_path (str): path to the file to copy.
+        destination_path (str): path to copy the file to.
+        copy_method (FileCopyMethod): FileCopyMethod.HARDLINK to hard link the file, copying it if no link can be made,
+            e.g. between file systems. Otherwise copies the file. Defaults to FileCopyMethod.COPY.
+    """
+    with _replacement_path(destination_path) as copy_path:
+        if copy_method is FileCopyMethod.HARDLINK:
+            try:
+                os.link(source_path, copy_path)
+                return
+            except OSError:
+                pass
+        if hasattr(os, 'copy_file_range'):
+            try:
+                _copy_file_range(source_path, copy_path)
+                return
+            except OSError:
+                # e.g. not supported by the file system or kernel, so fall back to a regular copy
+                pass
+        shutil.copyfile(source_path, copy_path)
+
+
+@contextmanager
+def _replacement_path(path: str) -> Iterator[str]:
+    """Yields the path to write a file to, which is a temporary file that replaces the file if it already exists.
+
+    Replacing the existing file rather than writing over it leaves any other links to it unchanged. The temporary file
+    is removed if writing it fails.
+    """
+    if not os.path.lexists(path):
+        yield path
+        return
+    directory, file_name = os.path.split(path)
+    temporary_path = os.path.join(directory, f'.{file_name}.{uuid.uuid4().hex}.tmp')
+    try:
+        yield temporary_path
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.lexists(temporary_path):
+            os.remove(temporary_path)
+
+
+def _copy_file_range(source_path: str, destination_path: str) -> None:
+    """Copies a file within the kernel with copy_file_range, which makes a reflink where the file system supports it."""
+    with open(source_path, 'rb') as source, open(destination_path, 'wb') as destination:
+        bytes_left = os.fstat(source.fileno()).st_size
+        while bytes_left > 0:
+            bytes_copied = os.copy_file_range(source.fileno(), destination.fileno(), bytes_left)
+            if bytes_copied == 0:
+                break
+            bytes_left -= bytes_copied
+
+
+class _WrittenContent:
+    """The first copy written of content shared between several files."""
+
+    def __init__(self, path: str) -> None:
+        """Initialises the _WrittenContent class.
+
+        Args:
+            path (str): path the first copy is written to.
+        """
+        self.path = path
+        self.succeeded = False
+        self.done = threading.Event()
@@ -0,0 +1,107 @@
+"""Matcher for finding which of a list of keywords appear in a line in a single pass."""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Optional, Sequence
+
+from ResSimpy.FileOperations.simulator_constants import NEXUS_COMMENT_CHARACTERS
+
+# characters that separate a token from the text around it, matching check_token
+TOKEN_SEPARATOR_CHARACTERS = ' \n\t\'"'
+
+
+class KeywordMatcher:
+    """Finds all the keywords from a fixed list that appear as tokens in a line using one precompiled regex.
+
+    A keyword is found in a line under the same rules as file_operations.check_token, so
+    KeywordMatcher(keywords).find_all(line) returns the keywords for which check_token(keyword, line) is True.
+
+    Attributes:
+        keywords (tuple[str, ...]): the upper case keywords in the order they were provided.
+        keyword_set (frozenset[str]): the upper case keywords for fast membership checks.
+        comment_characters (Optional[list[str]]): the comment characters used, None for the Nexus default.
+    """
+    keywords: tuple[str, ...]
+    keyword_set: frozenset[str]
+    comment_characters: Optional[list[str]]
+
+    def __init__(self, keywords: Sequence[str], comment_characters: Optional[list[str]] = None) -> None:
+        """Initialises the KeywordMatcher class.
+
+        Args:
+            keywords (Sequence[str]): the keywords to search for.
+            comment_characters (Optional[list[str]]): characters that denote a comment. Defaults to the Nexus \
+            comment characters, where a line starting with 'C ' is also treated as a comment.
+        """
+        self.keywords = tuple(dict.fromkeys(x.upper() for x in keywords))
+        self.keyword_set = frozenset(self.keywords)
+        self.comment_characters = comment_characters
+        self.__positions = {keyword: position for position, keyword in enumerate(self.keywords)}
+        # longer keywords first so that a keyword which is the start of another keyword doesn't hide it
+        alternation = '|'.join(re.escape(x) for x in sorted(self.keywords, key=len, reverse=True) if x)
+        separators = re.escape(TOKEN_SEPARATOR_CHARACTERS)
+        self.__pattern: Optional[re.Pattern[str]] = None if not alternation else \
+            re.compile(f'(?<![^{separators}])(?:{alternation})(?![^{separators}])', flags=re.IGNORECASE)
+
+    def find_all(self, line: str) -> list[str]:
+        """Returns the keywords found in the line, in the order that they were provided to the matcher.
+
+        Args:
+            line (str): the line to search.
+        """
+        if self.__pattern is None:
+            return []
+        comment_characters = self.comment_characters
+        if comment_characters is None:
+            if line.startswith('C '):
+                return []
+            comment_characters = NEXUS_COMMENT_CHARACTERS
+        search_end = len(line)
+        for character in comment_characters:
+            comment_location = line.find(character)
+            if comment_location != -1:
+                search_end = comment_location
+                break
+
+        uppercase_line: Optional[str] = None
+        found: set[str] = set()
+        for match in self.__pattern.finditer(line, 0, search_end):
+            keyword = match.group().upper()
+            if keyword in found:
+                continue
+            if uppercase_line is None:
+                uppercase_line = line.upper()
+            # check_token only considers the first place the keyword appears, even if it is part of another word
+            if uppercase_line.find(keyword) == match.start():
+                found.add(keyword)
+        return sorted(found, key=self.__positions.__getitem__)
+
+    def find_first(self, line: str) -> Optional[str]:
+        """Returns the first keyword in the order provided to the matcher that is found in the line, otherwise None.
+
+        Args:
+            line (str): the line to search.
+        """
+        found = self.find_all(line)
+        return found[0] if found else None
+
+    def contains_any(self, line: str) -> bool:
+        """Returns True if any of the keywords are found in the line.
+
+        Args:
+            line (str): the line to search.
+        """
+        return bool(self.find_all(line))
+
+
+@lru_cache(maxsize=256)
+def get_keyword_matcher(keywords: tuple[str, ...], comment_characters: Optional[tuple[str, ...]] = None) \
+        -> KeywordMatcher:
+    """Returns a cached KeywordMatcher for a set of keywords, so the regex is only compiled once.
+
+    Args:
+        keywords (tuple[str, ...]): the keywords to search for.
+        comment_characters (Optional[tuple[str, ...]]): characters that denote a comment. Defaults to Nexus.
+    """
+    return KeywordMatcher(keywords, None if comment_characters is None else list(comment_characters))
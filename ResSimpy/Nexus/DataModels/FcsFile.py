@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 import os
 import warnings
 
+from ResSimpy.Enums.FileCopyMethodEnum import FileCopyMethod
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.FileOperations.File import File
+from ResSimpy.FileOperations.file_writer import FileWriter
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from typing import Optional, Generator
 
@@ -24,6 +26,7 @@ from ResSimpy.Nexus.NexusKeywords.fcs_keywords import FCS_KEYWORDS
 import ResSimpy.Nexus.nexus_file_operations as nfo
 import ResSimpy.FileOperations.file_operations as fo
 from ResSimpy.Utils.generic_repr import generic_str
+from ResSimpy.Utils.load_profiler import profiled_phase
 from datetime import datetime
 
 
@@ -208,7 +211,9 @@ class FcsNexusFile(NexusFile):
         return generic_str(self)
 
     @classmethod
-    def generate_fcs_structure(cls: type[Self], fcs_file_path: str, recursive: bool = True) -> Self:
+    @profiled_phase('generate_fcs_structure')
+    def generate_fcs_structure(cls: type[Self], fcs_file_path: str, recursive: bool = True,
+                               header_only: bool = False) -> Self:
         """Creates an instance of the FcsNexusFile, populates it through looking through the different keywords \
             in the FCS and assigning the paths to objects.
 
@@ -216,6 +221,8 @@ class FcsNexusFile(NexusFile):
         ----
             fcs_file_path (str): path to the fcs file of interest
             recursive (bool, optional): Whether the NexusFile structure will be recursively created. Defaults to True.
+            header_only (bool, optional): If True only the RUNCONTROL file is read, the other files in the fcs are \
+            created with their locations only and file_loading_skipped set. Defaults to False.
 
         Raises:
         ------
@@ -267,9 +274,7 @@ class FcsNexusFile(NexusFile):
                     fo.get_multiple_expected_sequential_values(flat_fcs_file_content[i:], 4, ['NORPT'])
                 )
                 full_file_path = fo.get_full_file_path(value, origin_path)
-                nexus_file = NexusFile.generate_file_include_structure(simulator_type=NexusFile, file_path=value,
-                                                                       origin=fcs_file_path, recursive=recursive,
-                                                                       top_level_file=True)
+                nexus_file = cls.__load_fcs_listed_file(key, value, fcs_file_path, recursive, header_only)
                 fcs_property = getattr(fcs_file, cls.fcs_keyword_map_multi()[key])
                 # manually initialise if the property is still a None after class instantiation
                 if fcs_property is None:
@@ -286,10 +291,7 @@ class FcsNexusFile(NexusFile):
                                             nexus_file.last_modified))
             elif key in cls.fcs_keyword_map_single():
                 full_file_path = fo.get_full_file_path(value, origin_path)
-                skip_arrays = True if key == 'STRUCTURED_GRID' else False
-                nexus_file = NexusFile.generate_file_include_structure(simulator_type=NexusFile, file_path=value,
-                                                                       origin=fcs_file_path, recursive=recursive,
-                                                                       top_level_file=True, skip_arrays=skip_arrays)
+                nexus_file = cls.__load_fcs_listed_file(key, value, fcs_file_path, recursive, header_only)
                 setattr(fcs_file, cls.fcs_keyword_map_single()[key], nexus_file)
                 fcs_file.include_objects.append(nexus_file)
                 fcs_file.include_locations.append(full_file_path)
@@ -305,12 +307,26 @@ class FcsNexusFile(NexusFile):
                 submodel_fcs_path = fo.get_full_file_path(submodel_fcs_path, origin_path)
                 reservoir_name = str(reservoir_name)
                 fcs_file.multi_reservoir_files[reservoir_name] = FcsNexusFile.generate_fcs_structure(
-                    fcs_file_path=submodel_fcs_path, recursive=recursive)
+                    fcs_file_path=submodel_fcs_path, recursive=recursive, header_only=header_only)
 
             else:
                 continue
         return fcs_file
 
+    @staticmethod
+    def __load_fcs_listed_file(key: str, file_path: str, fcs_file_path: str, recursive: bool,
+                               header_only: bool) -> NexusFile:
+        """Loads a file listed in the fcs, or only records its location for files other than RUNCONTROL if \
+        header_only is True.
+        """
+        if header_only and key != 'RUNCONTROL':
+            return NexusFile(location=file_path, origin=fcs_file_path, file_loading_skipped=True)
+        # arrays are only skipped in the single files for the structured grid, multiple method files always skip them
+        skip_arrays = key == 'STRUCTURED_GRID' or key in FcsNexusFile.fcs_keyword_map_multi()
+        return NexusFile.generate_file_include_structure(simulator_type=NexusFile, file_path=file_path,
+                                                         origin=fcs_file_path, recursive=recursive,
+                                                         top_level_file=True, skip_arrays=skip_arrays)
+
     @staticmethod
     def fcs_keyword_map_single() -> dict[str, str]:
         """Returns mapping of fcs keywords to single file categories."""
@@ -360,8 +376,8 @@ class FcsNexusFile(NexusFile):
         return_dict = dict(single_keywords, **multi_keywords)
         return return_dict
 
-    def move_model_files(self, new_file_path: str, new_include_file_location: str, overwrite_files: bool = False) -> \
-            None:
+    def move_model_files(self, new_file_path: str, new_include_file_location: str, overwrite_files: bool = False,
+                         copy_method: FileCopyMethod = FileCopyMethod.WRITE) -> None:
         """Moves all the model files to a new location.
 
         Args:
@@ -369,7 +385,11 @@ class FcsNexusFile(NexusFile):
             new_include_file_location (str): new location for the included files either absolute or relative
             to the new fcs file path
             overwrite_files (bool): whether to overwrite the files if they already exist in the new location
+            copy_method (FileCopyMethod): how files that are unmodified, including those whose loading was skipped,
+            are copied. FileCopyMethod.COPY and FileCopyMethod.HARDLINK copy them on disk without reading them into
+            memory. Defaults to FileCopyMethod.WRITE, which writes out their content.
         """
+        file_writer = FileWriter(copy_method)
         # Take the original file, find which files have changed and write out those locations
         # figure out where to store the include files:
         file_directory = os.path.dirname(new_file_path)
@@ -377,9 +397,8 @@ class FcsNexusFile(NexusFile):
         if not os.path.isabs(new_include_file_location):
             include_dir = os.path.join(file_directory, new_include_file_location)
 
-        if not os.path.exists(include_dir):
-            # make the folders if they don't already exist
-            os.makedirs(include_dir)
+        # make the folders if they don't already exist
+        file_writer.make_dirs(include_dir)
 
         # Loop through all files in the model, writing out the contents
         for keyword, attr_name in self.fcs_keyword_map_single().items():
@@ -389,7 +408,7 @@ class FcsNexusFile(NexusFile):
                 continue
             include_name = os.path.join(include_dir, os.path.basename(file.location))
             file.write_to_file(include_name, write_includes=True, write_out_all_files=True,
-                               overwrite_file=overwrite_files)
+                               overwrite_file=overwrite_files, file_writer=file_writer)
             self.change_file_path(include_name, keyword)
 
         for keyword, attr_name in self.fcs_keyword_map_multi().items():
@@ -399,13 +418,14 @@ class FcsNexusFile(NexusFile):
             for method_number, file in file_dict.items():
                 include_name = os.path.join(include_dir, os.path.basename(file.location))
                 file.write_to_file(include_name, write_includes=True, write_out_all_files=True,
-                                   overwrite_file=overwrite_files)
+                                   overwrite_file=overwrite_files, file_writer=file_writer)
                 self.change_file_path(include_name, keyword, method_number)
 
         # write out the final fcs file
         self.write_to_file(new_file_path, write_includes=False, overwrite_file=overwrite_files)
 
-    def write_out_case(self, new_file_path: str, new_include_file_location: str, case_suffix: str) -> None:
+    def write_out_case(self, new_file_path: str, new_include_file_location: str, case_suffix: str,
+                       file_writer: Optional[FileWriter] = None) -> None:
         """Writes out a new simulator with only modified files. For use with creating multiple cases from a base case.
 
         Args:
@@ -413,7 +433,11 @@ class FcsNexusFile(NexusFile):
             new_include_file_location (str): new location for the included files either absolute or relative
             to the new fcs file path
             case_suffix (str): suffix to append to the end of the file name e.g. case_1
+            file_writer (Optional[FileWriter]): Creates the directories, checks for existing files and writes out the
+            files, e.g. a BatchFileWriter shared between several cases. Defaults to a FileWriter.
         """
+        if file_writer is None:
+            file_writer = FileWriter()
 
         def new_include_file_name(file_name: str) -> str:
             """Returns the new include file name based on the original file name plus the suffix provided."""
@@ -427,9 +451,8 @@ class FcsNexusFile(NexusFile):
         if not os.path.isabs(new_include_file_location):
             include_dir = os.path.join(file_directory, new_include_file_location)
 
-        if not os.path.exists(include_dir):
-            # make the folders if they don't already exist
-            os.makedirs(include_dir)
+        # make the folders if they don't already exist
+        file_writer.make_dirs(include_dir)
 
         # Loop through all files in the model, writing out the contents
         for keyword, attr_name in self.fcs_keyword_map_single().items():
@@ -440,7 +463,8 @@ class FcsNexusFile(NexusFile):
             include_write_name = file.location
             if file.file_modified:
                 include_write_name = new_include_file_name(file.location)
-                file.write_to_file(include_write_name, write_includes=True, write_out_all_files=False)
+                file.write_to_file(include_write_name, write_includes=True, write_out_all_files=False,
+                                   file_writer=file_writer)
             self.change_file_path(include_write_name, keyword)
 
         for keyword, attr_name in self.fcs_keyword_map_multi().items():
@@ -451,9 +475,10 @@ class FcsNexusFile(NexusFile):
                 include_write_name = file.location
                 if file.file_modified:
                     include_write_name = new_include_file_name(file.location)
-                    file.write_to_file(include_write_name, write_includes=True, write_out_all_files=False)
+                    file.write_to_file(include_write_name, write_includes=True, write_out_all_files=False,
+                                       file_writer=file_writer)
                 self.change_file_path(include_write_name, keyword, method_number)
-        self.write_to_file(new_file_path, write_includes=False)
+        self.write_to_file(new_file_path, write_includes=False, file_writer=file_writer)
 
     def update_model_files(self) -> None:
         """Updates all the modified files in the model. Keeps file names and paths the same.
@@ -506,11 +531,50 @@ class FcsNexusFile(NexusFile):
             file_to_edit, index_to_mod = self.find_which_include_file(flattened_index=index)
             if file_to_edit.file_content_as_list is None:
                 raise ValueError(f'No content found within {file_to_edit.location}')
+            file_to_edit._unshare_content()
             file_to_edit.file_content_as_list[index_to_mod] = line.replace(path_to_replace, new_file_path)
             file_changed = True
             self._file_modified_set(file_changed)
         return file_changed
 
+    def clone(self, memo: Optional[dict[int, File]] = None) -> FcsNexusFile:
+        """Returns a copy of the fcs file and all the files in the model, sharing their content with this model.
+
+        Each file takes its own copy of its content when it is edited in place, so unmodified files are held once
+        across the model and its clones.
+
+        Args:
+            memo (Optional[dict[int, File]]): the clones already made, keyed by the id of the original file. Pass an
+                empty dictionary to get the clone of each file, e.g. to update references to the files held elsewhere.
+                Defaults to a new dictionary.
+
+        Returns:
+            FcsNexusFile: the clone of the fcs file.
+        """
+        if memo is None:
+            memo = {}
+        existing_clone = memo.get(id(self))
+        if isinstance(existing_clone, FcsNexusFile):
+            return existing_clone
+        new_fcs_file = super().clone(memo)
+        if not isinstance(new_fcs_file, FcsNexusFile):
+            raise TypeError(f'Expected a clone of type FcsNexusFile, instead got {type(new_fcs_file)}')
+        if self.restart_file is not None:
+            new_fcs_file.restart_file = self.restart_file.clone(memo)
+        for attribute_name in self.fcs_keyword_map_single().values():
+            file = getattr(self, attribute_name)
+            if file is not None:
+                setattr(new_fcs_file, attribute_name, file.clone(memo))
+        for attribute_name in self.fcs_keyword_map_multi().values():
+            files = getattr(self, attribute_name)
+            if files is not None:
+                setattr(new_fcs_file, attribute_name, {key: file.clone(memo) for key, file in files.items()})
+        if self.multi_reservoir_files is not None:
+            new_fcs_file.multi_reservoir_files = {key: file.clone(memo)
+                                                  for key, file in self.multi_reservoir_files.items()}
+        new_fcs_file.files_info = list(self.files_info)
+        return new_fcs_file
+
     @property
     def all_model_files(self) -> Generator[File]:
         """Generator property returning all the files linked to in the FCS file."""
@@ -256,6 +256,7 @@ class NexusFile(File):
             line_indices (list[int]): line number in the flattened file_content_as_list
                 (i.e. from the get_flat_list_str_file method).
         """
+        self._unshare_content()
         if self.object_locations is None:
             self.object_locations: dict[UUID, list[int]] = get_empty_dict_uuid_list_int()
         existing_line_locations = self.object_locations.get(obj_uuid, None)
@@ -387,6 +388,7 @@ class NexusFile(File):
         nexusfile_to_write_to, relative_index = self.find_which_include_file(index)
         if nexusfile_to_write_to.file_content_as_list is None:
             raise ValueError(f'No file content to write to in file: {nexusfile_to_write_to}')
+        self._unshare_content()
         nexusfile_to_write_to.file_content_as_list = \
             nexusfile_to_write_to.file_content_as_list[:relative_index] + \
             additional_content + nexusfile_to_write_to.file_content_as_list[relative_index:]
@@ -452,6 +454,8 @@ class NexusFile(File):
         if nexusfile_to_write_to.file_content_as_list is None:
             raise ValueError(
                 f'No file content in the file attempting to remove line from {nexusfile_to_write_to.location}')
+        self._unshare_content()
+        nexusfile_to_write_to._unshare_content()
 
         if string_to_remove is None:
             nexusfile_to_write_to.file_content_as_list.pop(relative_index)
@@ -493,6 +497,7 @@ class NexusFile(File):
             raise ValueError(
                 f'No file content in the file attempting to remove line from {nexusfile_to_write_to.location}')
 
+        self._unshare_content()
         nexusfile_to_write_to.file_content_as_list.pop(index)
         self.__update_object_locations(line_number=index, number_additional_lines=-1)
 
@@ -541,6 +546,7 @@ class NexusFile(File):
                 or include_file.location_in_including_file is None:
             raise ValueError('No include locations found and therefore cannot update include path')
         file_path_to_replace = include_file.location_in_including_file
+        self._unshare_content()
         file_content = self.file_content_as_list
         if file_content is None or not file_content:
             raise ValueError(f'No file content found within file {self.location}')
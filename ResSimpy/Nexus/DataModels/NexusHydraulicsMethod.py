@@ -16,6 +16,7 @@ from ResSimpy.Enums.UnitsEnum import UnitSystem, SUnits, TemperatureUnits
 from ResSimpy.DataModelBaseClasses.DynamicProperty import DynamicProperty
 from ResSimpy.Units.AttributeMappings.DynamicPropertyUnitMapping import HydraulicsUnits
 
+from ResSimpy.Nexus.hydraulics_interpolation import ArrayLike, HydraulicsExtrapolation, HydraulicsTableGrid
 from ResSimpy.Utils.factory_methods import get_empty_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
 
@@ -59,6 +60,7 @@ class NexusHydraulicsMethod(DynamicProperty):
             self.properties = {}
         self.unit_system = model_unit_system
         self.ratio_thousands = ratio_thousands
+        self.__interpolation_grid: Optional[HydraulicsTableGrid] = None
         super().__init__(input_number=input_number, file=file)
 
     @staticmethod
@@ -144,8 +146,47 @@ class NexusHydraulicsMethod(DynamicProperty):
         printable_str += '\n'
         return printable_str
 
+    @property
+    def interpolation_grid(self) -> HydraulicsTableGrid:
+        """Returns the hydraulics table reshaped into a dense grid for interpolation.
+
+        The grid is built on first use and cached. It is rebuilt when the properties are read again, or after calling
+        clear_interpolation_grid if the properties are modified directly.
+        """
+        if self.__interpolation_grid is None:
+            self.__interpolation_grid = HydraulicsTableGrid.from_properties(self.properties)
+        return self.__interpolation_grid
+
+    def clear_interpolation_grid(self) -> None:
+        """Removes the cached interpolation grid so that it is rebuilt from the current properties."""
+        self.__interpolation_grid = None
+
+    def clear_cached_tables(self) -> None:
+        """Removes the tables cached from the properties, so that they are rebuilt from the current properties."""
+        super().clear_cached_tables()
+        self.clear_interpolation_grid()
+
+    def interpolate_pressure(self, extrapolation: HydraulicsExtrapolation = HydraulicsExtrapolation.CLAMP,
+                             **variables: ArrayLike) -> np.ndarray:
+        """Interpolates the pressure in the hydraulics table (e.g. BHP for a table of THP) at a batch of points.
+
+        Args:
+            extrapolation (HydraulicsExtrapolation): how to evaluate points outside the limits of a variable, given by \
+                the LIMITS table or otherwise the range of the axis. Defaults to clamping them to the limits.
+            **variables (ArrayLike): arrays of values for each variable in the table keyed by the Nexus keyword, \
+                e.g. QOIL, GOR, WCUT, ALQ and THP.
+
+        Returns:
+            np.ndarray: the interpolated pressures, with the broadcast shape of the variables.
+
+        Examples:
+            >>> method.interpolate_pressure(QOIL=np.array([500., 2000.]), GOR=0.2, THP=300.)
+        """
+        return self.interpolation_grid.interpolate(variables, extrapolation=extrapolation)
+
     def read_properties(self) -> None:
         """Read Nexus hydraulics file contents and populate the NexusHydraulicsMethod object."""
+        self.__interpolation_grid = None
         if self.file is None:
             warnings.warn('No file provided to read Nexus hydraulics properties from.')
             return
@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Union
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.NexusKeywords.pvt_keywords import PVT_BLACKOIL_PRIMARY_KEYWORDS, PVT_TYPE_KEYWORDS, PVT_KEYWORDS
@@ -19,6 +20,7 @@ from ResSimpy.Enums.UnitsEnum import UnitSystem, SUnits, TemperatureUnits
 from ResSimpy.DataModelBaseClasses.DynamicProperty import DynamicProperty
 from ResSimpy.Units.AttributeMappings.DynamicPropertyUnitMapping import PVTUnits
 
+from ResSimpy.Nexus.pvt_interpolation import BlackOilPvtTables
 from ResSimpy.Utils.factory_methods import get_empty_dict_union, get_empty_list_str
 from ResSimpy.Utils.factory_methods import get_empty_eosopt_dict_union
 import ResSimpy.Nexus.nexus_file_operations as nfo
@@ -99,6 +101,7 @@ class NexusPVTMethod(DynamicProperty):
         else:
             self.properties = {}
         self.unit_system = model_unit_system
+        self.__black_oil_tables: Optional[BlackOilPvtTables] = None
         super().__init__(input_number=input_number, file=file)
 
     @staticmethod
@@ -379,8 +382,46 @@ class NexusPVTMethod(DynamicProperty):
             reading_flag = False
         return reading_flag
 
+    @property
+    def black_oil_tables(self) -> BlackOilPvtTables:
+        """Returns the saturated and undersaturated oil tables as sorted arrays for evaluating fluid properties.
+
+        The arrays are built on first use and cached. They are rebuilt when the properties are read again, or after
+        calling clear_black_oil_tables if the properties are modified directly.
+        """
+        if self.__black_oil_tables is None:
+            self.__black_oil_tables = BlackOilPvtTables.from_properties(self.properties)
+        return self.__black_oil_tables
+
+    def clear_black_oil_tables(self) -> None:
+        """Removes the cached black oil tables so that they are rebuilt from the current properties."""
+        self.__black_oil_tables = None
+
+    def clear_cached_tables(self) -> None:
+        """Removes the tables cached from the properties, so that they are rebuilt from the current properties."""
+        super().clear_cached_tables()
+        self.clear_black_oil_tables()
+
+    def interpolate_properties(self, pressure: npt.ArrayLike,
+                               solution_gas_oil_ratio: Optional[npt.ArrayLike] = None) -> dict[str, np.ndarray]:
+        """Evaluates the black oil fluid properties at arrays of pressures.
+
+        Args:
+            pressure (npt.ArrayLike): the pressures to evaluate the properties at.
+            solution_gas_oil_ratio (Optional[npt.ArrayLike]): the solution gas oil ratio of the oil at each pressure, \
+                for evaluating undersaturated oil. If None, the oil is taken to be saturated at every pressure.
+
+        Returns:
+            dict[str, np.ndarray]: the value of each property in the tables (e.g. BO, BG, RS, VO, VG) at each point.
+
+        Examples:
+            >>> pvt_method.interpolate_properties(np.array([1000., 2000.]), solution_gas_oil_ratio=0.3)['BO']
+        """
+        return self.black_oil_tables.evaluate(pressure, solution_gas_oil_ratio)
+
     def read_properties(self) -> None:
         """Read Nexus PVT file contents and populate the NexusPVTMethod object."""
+        self.__black_oil_tables = None
         file_as_list = self.file.get_flat_list_str_file
 
         # Check for common input data
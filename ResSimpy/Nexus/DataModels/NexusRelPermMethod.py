@@ -2,8 +2,9 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Union
+from typing import Mapping, Optional, Union
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.NexusKeywords.relpm_keywords import RELPM_TABLE_KEYWORDS, RELPM_KEYWORDS_VALUE_FLOAT
@@ -11,6 +12,7 @@ from ResSimpy.Nexus.NexusKeywords.relpm_keywords import RELPM_SINGLE_KEYWORDS, R
 from ResSimpy.Nexus.NexusKeywords.relpm_keywords import RELPM_KEYWORDS, RELPM_NONDARCY_KEYWORDS, RELPM_NONDARCY_PARAMS
 from ResSimpy.Enums.UnitsEnum import UnitSystem, SUnits, TemperatureUnits
 from ResSimpy.DataModelBaseClasses.DynamicProperty import DynamicProperty
+from ResSimpy.Nexus.relperm_interpolation import RelPermTables
 from ResSimpy.Units.AttributeMappings.DynamicPropertyUnitMapping import RelPermUnits
 
 from ResSimpy.Utils.factory_methods import get_empty_dict_union, get_empty_hysteresis_dict
@@ -62,6 +64,7 @@ class NexusRelPermMethod(DynamicProperty):
         else:
             self.hysteresis_params = {}
         self.unit_system = model_unit_system
+        self.__relperm_tables: Optional[RelPermTables] = None
         super().__init__(input_number=input_number, file=file)
 
     @staticmethod
@@ -193,8 +196,49 @@ class NexusRelPermMethod(DynamicProperty):
             else:
                 self.properties[keyword] = ''
 
+    @property
+    def relperm_tables(self) -> RelPermTables:
+        """Returns the saturation tables as sorted arrays for evaluation.
+
+        The arrays are built on first use and cached. They are rebuilt when the properties are read again, or after
+        calling clear_relperm_tables if the properties are modified directly.
+        """
+        if self.__relperm_tables is None:
+            self.__relperm_tables = RelPermTables.from_properties(self.properties)
+        return self.__relperm_tables
+
+    def clear_relperm_tables(self) -> None:
+        """Removes the cached relperm arrays so that they are rebuilt from the current properties."""
+        self.__relperm_tables = None
+
+    def clear_cached_tables(self) -> None:
+        """Removes the tables cached from the properties, so that they are rebuilt from the current properties."""
+        super().clear_cached_tables()
+        self.clear_relperm_tables()
+
+    def interpolate_relperm(self, table_name: str, saturation: npt.ArrayLike,
+                            end_points: Optional[Mapping[str, npt.ArrayLike]] = None,
+                            columns: Optional[list[str]] = None) -> dict[str, np.ndarray]:
+        """Looks up the relative permeabilities and capillary pressures of a table for arrays of saturations.
+
+        Args:
+            table_name (str): the Nexus keyword of the table, e.g. WOTABLE or GOTABLE.
+            saturation (npt.ArrayLike): the saturation of each cell, e.g. SW for a WOTABLE.
+            end_points (Optional[Mapping[str, npt.ArrayLike]]): the end points of each cell to scale the table to,
+                keyed by the Nexus name, e.g. SWL, SWR and SWU for a WOTABLE. Defaults to no scaling.
+            columns (Optional[list[str]]): the columns to evaluate, e.g. ['KRW', 'KROW']. Defaults to all of them.
+
+        Returns:
+            dict[str, np.ndarray]: the value of each column for each cell.
+
+        Examples:
+            >>> relperm_method.interpolate_relperm('WOTABLE', water_saturation, end_points={'SWL': swl, 'SWU': swu})
+        """
+        return self.relperm_tables.evaluate(table_name, saturation, end_points=end_points, columns=columns)
+
     def read_properties(self) -> None:
         """Read Nexus rel perm file contents and populate the NexusRelPermMethod object."""
+        self.__relperm_tables = None
         file_as_list = self.file.get_flat_list_str_file
 
         # Check for common input data
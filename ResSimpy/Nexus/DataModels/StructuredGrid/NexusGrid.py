@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 import copy
+import os
 
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, Sequence
 import warnings
 from sys import maxsize
+from uuid import UUID
 
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.FileOperations.File import File
@@ -27,7 +29,11 @@ from ResSimpy.Nexus.nexus_load_faults import load_nexus_fault_mult_table_from_li
 from ResSimpy.Nexus.structured_grid_operations import StructuredGridOperations
 import ResSimpy.Nexus.nexus_file_operations as nfo
 import ResSimpy.Nexus.array_function_operations as afo
+import ResSimpy.Nexus.grid_modifier_operations as gmo
+import ResSimpy.Nexus.grid_volumetrics_operations as gvo
+import ResSimpy.Nexus.region_statistics_operations as rso
 from ResSimpy.FileOperations import file_operations as fo
+from ResSimpy.Utils.load_profiler import profiled_phase, record_processed
 
 
 if TYPE_CHECKING:
@@ -131,6 +137,10 @@ class NexusGrid(Grid):
     __tovers: list[NexusTOver] = field(default_factory=list)
     __ftrans: list[NexusFtrans] = field(default_factory=list)
     __model_unit_system: UnitSystem
+    __unit_system: UnitSystem | None = field(default=None, compare=False, repr=False)
+    __region_indices: dict[str, tuple[tuple[UUID, int], rso.RegionIndex]] = field(default_factory=dict,
+                                                                                  compare=False, repr=False)
+    __pore_volume: tuple[tuple, np.ndarray] | None = field(default=None, compare=False, repr=False)
 
     def __init__(self, model_unit_system: UnitSystem, grid_nexus_file: NexusFile | None = None,
                  assume_loaded: bool = False,
@@ -234,6 +244,9 @@ class NexusGrid(Grid):
         self.__tovers: list[NexusTOver] = []
         self.__ftrans: list[NexusFtrans] = []
         self.__model_unit_system: UnitSystem = model_unit_system
+        self.__unit_system: UnitSystem | None = None
+        self.__region_indices: dict[str, tuple[tuple[UUID, int], rso.RegionIndex]] = {}
+        self.__pore_volume: tuple[tuple, np.ndarray] | None = None
 
     def __wrap(self, value: Any) -> Any:
         if isinstance(value, tuple | list | set | frozenset):
@@ -377,6 +390,7 @@ class NexusGrid(Grid):
         }
         return keyword_map
 
+    @profiled_phase('load_grid_properties_if_not_loaded')
     def load_grid_properties_if_not_loaded(self) -> None:
         """Checks if grid properties are not loaded and loads them."""
 
@@ -420,6 +434,7 @@ class NexusGrid(Grid):
                 file_as_list_with_original_line_numbers.append((i, cleaned_line[0]))
 
         file_as_list = [line for _, line in file_as_list_with_original_line_numbers]
+        record_processed(len(file_as_list))
 
         properties_to_load = [
             PropertyToLoad('NETGRS', GRID_ARRAY_FORMAT_KEYWORDS, self._netgrs),
@@ -549,7 +564,7 @@ class NexusGrid(Grid):
             if ignore_line:
                 continue
 
-            nfo.check_property_in_line(line, property_dict, file_as_list)
+            nfo.check_property_in_line(line, property_dict, file_as_list, line_index=idx)
             unit_system = property_dict.get('UNIT_SYSTEM', self.__model_unit_system)
 
             if nfo.check_token('ARRAYS', line):
@@ -615,6 +630,8 @@ class NexusGrid(Grid):
                 if len(cortol_values) >= 4:
                     self._tolpv = float(cortol_values[3])
 
+        self.__unit_system = unit_system
+
         # load the overs:
         if fo.value_in_file('OVER', file_as_list):
             self.__overs = NexusGrid.load_nexus_overs(file_as_list)
@@ -733,6 +750,104 @@ class NexusGrid(Grid):
             self.load_array_functions()
         return self.__array_functions_df
 
+    def get_grid_array_definition(self, keyword: str) -> GridArrayDefinition | None:
+        """Returns the grid array definition for a Nexus grid array keyword, e.g. 'KX' or 'WORKA1'.
+
+        For IREGION the first region array is returned. Returns None if the keyword is not a supported grid array.
+        """
+        mapped_keyword = self.keyword_mapping().get(keyword.upper(), None)
+        if mapped_keyword is None:
+            return None
+        grid_array = getattr(self, mapped_keyword[0])
+        if isinstance(grid_array, dict):
+            return next(iter(grid_array.values()), None)
+        return grid_array
+
+    def get_grid_array_values(self, keyword: str) -> np.ndarray | float:
+        """Returns the values of a grid array as a flat numpy array, or a single float for CON arrays.
+
+        Any MOD or VMOD cards for the array are applied, in which case a full array is always returned.
+
+        Args:
+            keyword (str): the Nexus grid array keyword, e.g. 'KX'.
+
+        Raises:
+            ValueError: if the array is not defined in the grid.
+            NotImplementedError: if the array uses a modifier which can not yet be converted to values.
+        """
+        grid_array = self.get_grid_array_definition(keyword)
+        if grid_array is None or (grid_array.array is None and grid_array.value is None):
+            raise ValueError(f'Grid array {keyword} is not defined in the grid.')
+        if grid_array.mods is not None and ('MOD' in grid_array.mods or 'VMOD' in grid_array.mods):
+            if self.range_x is None or self.range_y is None or self.range_z is None:
+                raise ValueError('Grid dimensions NX, NY, NZ must be loaded to apply MOD and VMOD cards.')
+            return grid_array.get_effective_array(self.range_x, self.range_y, self.range_z)
+        if grid_array.array is not None:
+            return grid_array.array
+        if grid_array.modifier == 'CON':
+            return float(str(grid_array.value))
+        if grid_array.modifier == 'VALUE':
+            return self.grid_array_definition_to_numpy_array(grid_array)
+        raise NotImplementedError(f'Cannot get values for {keyword} with modifier {grid_array.modifier}.')
+
+    def evaluate_array_function(self, array_function: NexusGridArrayFunction,
+                                input_arrays: dict[str, np.ndarray | float] | None = None,
+                                ) -> dict[str, GridArrayDefinition]:
+        """Evaluates a grid array function against the arrays in this grid.
+
+        Args:
+            array_function (NexusGridArrayFunction): the function to evaluate.
+            input_arrays (dict[str, np.ndarray | float] | None): values to use in place of the arrays stored on the \
+            grid, keyed by upper case array name. Used to chain the results of previous functions.
+
+        Returns:
+            dict[str, GridArrayDefinition]: array backed grid array definitions keyed by the output array name.
+        """
+        if self.range_x is None or self.range_y is None or self.range_z is None:
+            raise ValueError('Grid dimensions NX, NY, NZ must be loaded to evaluate array functions.')
+        if array_function.grid_name is not None and array_function.grid_name.upper() != 'ROOT':
+            raise NotImplementedError('Evaluating array functions on LGRs is not supported.')
+        if input_arrays is None:
+            input_arrays = {}
+
+        def array_values(keyword: str) -> np.ndarray | float:
+            return input_arrays[keyword] if keyword in input_arrays else self.get_grid_array_values(keyword)
+
+        function_inputs = {name.upper(): array_values(name.upper()) for name in array_function.input_array or []}
+        existing_outputs: dict[str, np.ndarray] = {}
+        for name in array_function.output_array or []:
+            try:
+                existing_outputs[name.upper()] = np.asarray(array_values(name.upper()))
+            except ValueError:
+                # output array not defined yet, so cells outside the function range are left undefined
+                continue
+        region_array = None
+        if array_function.region_type is not None and array_function.region_number is not None:
+            region_array = np.asarray(array_values(array_function.region_type.upper()))
+
+        return afo.evaluate_grid_array_function(array_function, function_inputs, self.range_x, self.range_y,
+                                                self.range_z, region_array=region_array,
+                                                existing_output_arrays=existing_outputs)
+
+    def evaluate_array_functions(self) -> dict[str, GridArrayDefinition]:
+        """Evaluates all the ROOT grid array functions in the order they appear in the grid file.
+
+        The output of each function is used as the input for any later function which refers to the same array.
+
+        Returns:
+            dict[str, GridArrayDefinition]: the effective arrays for every array written to by a function, keyed by \
+            the array name.
+        """
+        effective_arrays: dict[str, GridArrayDefinition] = {}
+        for array_function in self.array_functions or []:
+            if array_function.grid_name is not None and array_function.grid_name.upper() != 'ROOT':
+                warnings.warn(f'Skipping evaluation of array function on grid {array_function.grid_name}.')
+                continue
+            current_values: dict[str, np.ndarray | float] = {
+                name: definition.array for name, definition in effective_arrays.items() if definition.array is not None}
+            effective_arrays.update(self.evaluate_array_function(array_function, input_arrays=current_values))
+        return effective_arrays
+
     def load_faults(self) -> None:
         """Function to read faults in Nexus grid file defined using MULT and FNAME keywords."""
         file_content_as_list = self.__grid_file_contents
@@ -1678,6 +1793,171 @@ class NexusGrid(Grid):
 
         return ftrans_list
 
+    def apply_modifiers(self, base_arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Applies the MULTIR, OVER and TOVER modifiers from the grid file to a set of base arrays.
+
+        Args:
+            base_arrays (dict[str, np.ndarray]): flat base arrays keyed by array name, e.g. 'TX', 'TY', 'TZ', 'PV'.
+
+        Returns:
+            dict[str, np.ndarray]: the effective arrays keyed by array name. The base arrays are not modified.
+        """
+        if self.range_x is None or self.range_y is None or self.range_z is None:
+            raise ValueError('Grid dimensions NX, NY, NZ must be loaded to apply grid modifiers.')
+        multirs = self.get_multir()
+        multir_region_array = None
+        if multirs:
+            multir_region_array = np.asarray(self.get_grid_array_values('ITRAN'))
+        include_root = None
+        if self.__grid_nexus_file is not None and self.__grid_nexus_file.location is not None:
+            include_root = os.path.dirname(self.__grid_nexus_file.location)
+        return gmo.apply_grid_modifiers(base_arrays, self.range_x, self.range_y, self.range_z, overs=self.overs,
+                                        tovers=self.tovers, multirs=multirs,
+                                        multir_region_array=multir_region_array, include_root=include_root)
+
+    def calculate_volumetrics(self, input_arrays: dict[str, np.ndarray | float] | None = None,
+                              region_keywords: Sequence[str] = ('IREGION', 'IEQUIL', 'ISECTOR'),
+                              cell_outputs: dict[str, np.ndarray] | None = None) -> gvo.GridVolumetrics:
+        """Calculates the bulk volume, pore volume and hydrocarbon pore volume of the grid and totals per region.
+
+        Uses DX, DY, DZ, NETGRS, POROSITY, SW and PVMULT from the grid, along with TOLPV. NETGRS, PVMULT and SW are \
+        optional and default to 1, 1 and 0 respectively. The calculation streams over K-layers, so memory mapped \
+        arrays can be passed in through input_arrays for very large grids.
+
+        Args:
+            input_arrays (dict[str, np.ndarray | float] | None): values to use in place of the arrays stored on the \
+            grid, keyed by upper case array name, e.g. {'POROSITY': np.load('poro.npy', mmap_mode='r')}.
+            region_keywords (Sequence[str]): region arrays to total the volumes by. Each named IREGION array is \
+            totalled separately under the key 'IREGION <region name>'. Region arrays not defined in the grid are \
+            skipped.
+            cell_outputs (dict[str, np.ndarray] | None): preallocated flat arrays to write the per cell \
+            BULK_VOLUME, PORE_VOLUME or HCPV to.
+
+        Returns:
+            GridVolumetrics: the total volumes and the totals for each region.
+        """
+        if self.range_x is None or self.range_y is None or self.range_z is None:
+            raise ValueError('Grid dimensions NX, NY, NZ must be loaded to calculate volumetrics.')
+        provided_arrays = {name.upper(): values for name, values in (input_arrays or {}).items()}
+
+        def array_values(keyword: str, default: float | None = None) -> np.ndarray | float:
+            if keyword in provided_arrays:
+                return provided_arrays[keyword]
+            grid_array = self.get_grid_array_definition(keyword)
+            if default is not None and (grid_array is None or (grid_array.array is None and
+                                                               grid_array.value is None)):
+                return default
+            return self.get_grid_array_values(keyword)
+
+        region_arrays: dict[str, np.ndarray] = {}
+        for region_keyword in [keyword.upper() for keyword in region_keywords]:
+            if region_keyword in provided_arrays:
+                region_arrays[region_keyword] = np.asarray(provided_arrays[region_keyword])
+                continue
+            if region_keyword == 'IREGION':
+                for region_name, region_definition in self.iregion.items():
+                    region_arrays[f'IREGION {region_name}'.strip()] = np.asarray(
+                        region_definition.get_effective_array(self.range_x, self.range_y, self.range_z))
+                continue
+            keyword_definition = self.get_grid_array_definition(region_keyword)
+            if keyword_definition is None or (keyword_definition.array is None and keyword_definition.value is None):
+                continue
+            region_arrays[region_keyword] = np.broadcast_to(
+                np.asarray(self.get_grid_array_values(region_keyword)),
+                (self.range_x * self.range_y * self.range_z,))
+
+        return gvo.calculate_volumetrics(
+            dx=array_values('DX'), dy=array_values('DY'), dz=array_values('DZ'),
+            range_x=self.range_x, range_y=self.range_y, range_z=self.range_z,
+            netgrs=array_values('NETGRS', 1.0), porosity=array_values('POROSITY'),
+            sw=array_values('SW', 0.0), pvmult=array_values('PVMULT', 1.0), tolpv=self.tolpv,
+            region_arrays=region_arrays, cell_outputs=cell_outputs)
+
+    def get_region_index(self, region_keyword: str = 'IREGION', region_name: str | None = None) -> rso.RegionIndex:
+        """Returns the mapping from region number to cells for a region array, building it on first use.
+
+        Args:
+            region_keyword (str): the region array keyword, e.g. 'IREGION', 'IPVT', 'IROCK' or 'ISECTOR'.
+            region_name (str | None): for IREGION, the name of the region array to use. Defaults to the first one.
+        """
+        if self.range_x is None or self.range_y is None or self.range_z is None:
+            raise ValueError('Grid dimensions NX, NY, NZ must be loaded to get region statistics.')
+        region_keyword = region_keyword.upper()
+        if region_keyword == 'IREGION' and region_name is not None:
+            region_definition: GridArrayDefinition | None = self.iregion.get(region_name, None)
+        else:
+            region_definition = self.get_grid_array_definition(region_keyword)
+        if region_definition is None or (region_definition.array is None and region_definition.value is None):
+            raise ValueError(f'Region array {region_keyword} {region_name or ""} is not defined in the grid.'.strip())
+
+        cache_key = f'{region_keyword} {region_name or ""}'.strip()
+        cached_index = self.__region_indices.get(cache_key, None)
+        # the index is rebuilt if the region array has been replaced, or its values or mods have changed
+        version = (region_definition.id, region_definition.effective_array_version)
+        if cached_index is not None and cached_index[0] == version:
+            return cached_index[1]
+        region_array = np.broadcast_to(
+            np.asarray(region_definition.get_effective_array(self.range_x, self.range_y, self.range_z)),
+            (self.range_x * self.range_y * self.range_z,))
+        region_index = rso.RegionIndex(region_array)
+        # the version is taken once the array has been loaded, as loading it sets the array
+        self.__region_indices[cache_key] = ((region_definition.id, region_definition.effective_array_version),
+                                            region_index)
+        return region_index
+
+    @staticmethod
+    def __array_version(grid_array: GridArrayDefinition | None) -> tuple[UUID, int] | None:
+        """Returns a value that changes whenever a grid array is replaced or its values or mods change."""
+        if grid_array is None:
+            return None
+        return grid_array.id, grid_array.effective_array_version
+
+    def __pore_volume_inputs(self) -> tuple:
+        """Returns the versions of the grid arrays and values that the pore volume of each cell is calculated from."""
+        return (self.range_x, self.range_y, self.range_z, self.tolpv,
+                *(self.__array_version(self.get_grid_array_definition(keyword))
+                  for keyword in ('DX', 'DY', 'DZ', 'NETGRS', 'POROSITY', 'PVMULT', 'SW')))
+
+    def get_region_statistics(self, keyword: str, region_keyword: str = 'IREGION', region_name: str | None = None,
+                              statistics: Sequence[str] = ('mean', 'min', 'max'), percentiles: Sequence[float] = (),
+                              weight_by_pore_volume: bool = False) -> pd.DataFrame:
+        """Calculates statistics of a grid array for each region, e.g. the mean KX per IROCK region.
+
+        The region index, grid array values and pore volumes are cached on the grid, so repeated queries do not \
+        reload any arrays. They are recalculated when the arrays they are calculated from are replaced or set, or \
+        after GridArrayDefinition.clear_effective_array is called on them following an edit in place.
+
+        Args:
+            keyword (str): the grid array to calculate statistics for, e.g. 'KX', 'POROSITY' or 'NETGRS'.
+            region_keyword (str): the region array keyword, e.g. 'IREGION', 'IPVT', 'IROCK' or 'ISECTOR'.
+            region_name (str | None): for IREGION, the name of the region array to use. Defaults to the first one.
+            statistics (Sequence[str]): any of 'count', 'sum', 'mean', 'min' and 'max'.
+            percentiles (Sequence[float]): percentiles between 0 and 100 to calculate, added as columns e.g. 'P90'.
+            weight_by_pore_volume (bool): If True the mean and percentiles are weighted by the cell pore volume.
+
+        Returns:
+            pd.DataFrame: a row for each region, indexed by region number, with a column for each statistic.
+        """
+        region_index = self.get_region_index(region_keyword, region_name)
+        weights = None
+        if weight_by_pore_volume:
+            if self.__pore_volume is not None and self.__pore_volume[0] == self.__pore_volume_inputs():
+                weights = self.__pore_volume[1]
+            else:
+                weights = np.zeros(region_index.cell_count)
+                self.calculate_volumetrics(region_keywords=(), cell_outputs={'PORE_VOLUME': weights})
+                # the inputs are taken once the arrays have been loaded, as loading them sets their arrays
+                self.__pore_volume = (self.__pore_volume_inputs(), weights)
+        return rso.region_statistics(self.get_grid_array_values(keyword), region_index, statistics=statistics,
+                                     percentiles=percentiles, weights=weights)
+
+    @property
+    def unit_system(self) -> UnitSystem:
+        """Returns the unit system of the grid file, or the model unit system if the grid file doesn't declare one."""
+        if not self._grid_properties_loaded:
+            self.load_grid_properties_if_not_loaded()
+        return self.__model_unit_system if self.__unit_system is None else self.__unit_system
+
     @property
     def ftrans(self) -> list[NexusFtrans]:
         """Returns the OVER table as a list of NexusOver objects."""
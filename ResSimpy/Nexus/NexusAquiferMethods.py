@@ -11,6 +11,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusAquiferMethod import NexusAquiferMethod
 from ResSimpy.DataModelBaseClasses.Aquifer import Aquifer
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -82,6 +83,7 @@ class NexusAquiferMethods(Aquifer):
         """Returns dictionary of Nexus files where keys are of type int."""
         return self.__files
 
+    @profiled_phase('load_aquifer_methods')
     def load_aquifer_methods(self) -> None:
         """Loads a collection of aquifer method files.
         This method checks if aquifer files are available and read their properties into
@@ -11,6 +11,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusEquilMethod import NexusEquilMethod
 from ResSimpy.DataModelBaseClasses.Equilibration import Equilibration
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -82,6 +83,7 @@ class NexusEquilMethods(Equilibration):
         """Returns dictionary of Nexus files where keys are of type int."""
         return self.__files
 
+    @profiled_phase('load_equil_methods')
     def load_equil_methods(self) -> None:
         """Loads a collection of equilibration method files.
         This method checks if equil files are available and reads their properties into
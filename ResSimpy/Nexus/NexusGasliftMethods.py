@@ -10,6 +10,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusGasliftMethod import NexusGasliftMethod
 from ResSimpy.DataModelBaseClasses.Gaslift import Gaslift
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -82,6 +83,7 @@ class NexusGasliftMethods(Gaslift):
         """Returns dictionary of Nexus files where keys are of type int."""
         return self.__files
 
+    @profiled_phase('load_gaslift_methods')
     def load_gaslift_methods(self) -> None:
         """Loads a collection of gaslift method properties from files.
         This method checks if gaslift files are available and reads their properties into the
@@ -10,6 +10,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusHydraulicsMethod import NexusHydraulicsMethod
 from ResSimpy.GenericContainerClasses.Hydraulics import Hydraulics
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -82,6 +83,7 @@ class NexusHydraulicsMethods(Hydraulics):
         """Returns a dictionary of Nexus files where keys are of type int."""
         return self.__files
 
+    @profiled_phase('load_hydraulics_methods')
     def load_hydraulics_methods(self) -> None:
         """Loads a collection of hydraulic method files defined by the Nexus fcs files."""
         # Read in hydraulics properties from Nexus hydraulics method files
@@ -7,6 +7,7 @@ import ResSimpy.Nexus.nexus_file_operations as nfo
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusIPRMethod import NexusIprMethod
 from ResSimpy.Nexus.nexus_file_operations import read_table_to_df
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 if TYPE_CHECKING:
     from ResSimpy import NexusSimulator
@@ -73,6 +74,7 @@ class NexusIprMethods:
             self.load()
         return self.tables
 
+    @profiled_phase('load_ipr_methods')
     def load(self) -> None:
         """Loads IPRTables."""
         ipr_files = self.__model.model_files.ipr_files
@@ -54,6 +54,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.Network.NexusWellList import NexusWellList
 from ResSimpy.Nexus.NexusEnums.ActivationChangeEnum import ActivationChangeEnum
 from ResSimpy.Nexus.nexus_collect_tables import collect_all_tables_to_objects
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 if TYPE_CHECKING:
     from ResSimpy.Nexus.NexusSimulator import NexusSimulator
@@ -286,6 +287,7 @@ class NexusNetwork(Network):
 
         return combined_list
 
+    @profiled_phase('NexusNetwork.load')
     def load(self) -> None:
         """Loads all the objects from the surface files in the Simulator class.
 
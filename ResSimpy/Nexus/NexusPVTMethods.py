@@ -12,6 +12,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusPVTMethod import NexusPVTMethod
 from ResSimpy.DataModelBaseClasses.PVT import PVT
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -83,6 +84,7 @@ class NexusPVTMethods(PVT):
         """Returns dictionary of Nexus files."""
         return self.__files
 
+    @profiled_phase('load_pvt_methods')
     def load_pvt_methods(self) -> None:
         """Loads a collection of pvt properties from Nexus pvt method files."""
         # Read in pvt properties from Nexus pvt method files
@@ -11,6 +11,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusRelPermMethod import NexusRelPermMethod
 from ResSimpy.DataModelBaseClasses.RelPerm import RelPerm
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -85,6 +86,7 @@ class NexusRelPermMethods(RelPerm):
         """Returns dictionary of Nexus Files."""
         return self.__files
 
+    @profiled_phase('load_relperm_methods')
     def load_relperm_methods(self) -> None:
         """Loads a collection of relperm Nexus files."""
         # Read in relperm properties from Nexus relperm method files
@@ -13,11 +13,16 @@ from ResSimpy.Nexus.DataModels.NexusReportingRequests import NexusOutputRequest,
 from ResSimpy.Nexus.nexus_add_new_object_to_file import AddObjectOperations
 from ResSimpy.DataModelBaseClasses.Reporting import Reporting
 from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
+from ResSimpy.Nexus.runcontrol_event_parser import (RuncontrolEventBuffer, RuncontrolEventParser,
+                                                    RuncontrolLineEvent)
 from ResSimpy.Time.ISODateTime import ISODateTime
 
 if TYPE_CHECKING:
     from ResSimpy.Nexus.NexusSimulator import NexusSimulator
 
+_REPORTING_TOKENS = ['TIME', 'SPREADSHEET', 'ENDSPREADSHEET', 'OUTPUT', 'ENDOUTPUT', 'SSOUT', 'ENDSSOUT', 'MAPOUT',
+                     'ARRAYOUT', 'ENDMAPOUT', 'ENDARRAYOUT']
+
 
 @dataclass(kw_only=True)
 class NexusReporting(Reporting):
@@ -27,6 +32,7 @@ class NexusReporting(Reporting):
     __ss_output_contents: list[NexusOutputContents]
     __array_output_contents: list[NexusOutputContents]
     __load_status: bool = field(default=False, repr=False, compare=False)
+    __runcontrol_events: Optional[RuncontrolEventBuffer] = field(default=None, repr=False, compare=False)
 
     table_header = 'OUTPUT'
     table_footer = 'ENDOUTPUT'
@@ -44,11 +50,17 @@ class NexusReporting(Reporting):
                                                            model)
         if assume_loaded:
             self.__load_status = True
+        self.__runcontrol_events = None
         self.__ss_output_requests = []
         self.__ss_output_contents = []
         self.__array_output_requests = []
         self.__array_output_contents = []
 
+    @property
+    def output_requests_loaded(self) -> bool:
+        """Returns True if the output requests have been loaded from the runcontrol file."""
+        return self.__load_status
+
     @property
     def ss_output_requests(self) -> list[NexusOutputRequest]:
         """Gets the spreadsheet and tabulated output requests."""
@@ -117,12 +129,35 @@ class NexusReporting(Reporting):
             text_file.write(new_file_str)
 
     def load_output_requests(self) -> None:
-        """Loads output requests from the Nexus runcontrol file."""
-        if self.__model.model_files.runcontrol_file is None:
+        """Loads output requests from the Nexus runcontrol file.
+
+        Uses the events recorded from a shared parse of the runcontrol file if the file is unchanged since, otherwise
+        parses the file.
+        """
+        runcontrol_file = self.__model.model_files.runcontrol_file
+        if runcontrol_file is None:
             raise ValueError("No file path given or found for runcontrol file path. \
                 Please update runcontrol file path")
-        file_as_list = self.__model.model_files.runcontrol_file.get_flat_list_str_file
+        runcontrol_events = self.__runcontrol_events
+        if runcontrol_events is None or not runcontrol_events.is_current(runcontrol_file):
+            parser = RuncontrolEventParser.from_file(runcontrol_file)
+            runcontrol_events = RuncontrolEventBuffer(parser, _REPORTING_TOKENS)
+            parser.parse()
+        self.__runcontrol_events = None
+        self.__read_runcontrol_events(runcontrol_events.file_content, runcontrol_events.events)
+
+    def subscribe_to_runcontrol(self, parser: RuncontrolEventParser) -> None:
+        """Records the events from a parse of the runcontrol file shared with the other runcontrol consumers.
+
+        The output requests are read from the recorded events when they are first requested.
+
+        Args:
+            parser (RuncontrolEventParser): parser for the flattened runcontrol file.
+        """
+        self.__runcontrol_events = RuncontrolEventBuffer(parser, _REPORTING_TOKENS)
 
+    def __read_runcontrol_events(self, file_as_list: list[str], events: list[RuncontrolLineEvent]) -> None:
+        """Reads the output requests from the lines of the runcontrol file emitted by the parser."""
         # Get the output requests
         ss_output_requests: list[NexusOutputRequest] = []
         array_output_requests: list[NexusOutputRequest] = []
@@ -133,16 +168,18 @@ class NexusReporting(Reporting):
         ss_start_index: int = -1
         array_start_index: int = -1
         current_date = self.__model.start_date
-        for index, line in enumerate(file_as_list):
+        for event in events:
+            index, keywords = event.line_index, event.keywords
 
             # check for TIME keyword and update the current date
-            if nfo.check_token('TIME', line):
-                current_date = nfo.get_expected_token_value('TIME', token_line=line, file_list=file_as_list)
+            if 'TIME' in keywords:
+                current_date = event.time if event.time is not None else \
+                    nfo.get_expected_token_value_at('TIME', file_list=file_as_list, line_index=index)
 
-            if nfo.check_token('SPREADSHEET', line):
+            if 'SPREADSHEET' in keywords:
                 ss_start_index = index + 1
 
-            if ss_start_index > -1 and nfo.check_token('ENDSPREADSHEET', line):
+            if ss_start_index > -1 and 'ENDSPREADSHEET' in keywords:
                 ss_end_index = index
                 list_of_output_requests = self._get_output_request(file_as_list[ss_start_index:ss_end_index],
                                                                    date=current_date,
@@ -151,9 +188,9 @@ class NexusReporting(Reporting):
                                                                    start_date=self.__model.start_date)
                 ss_output_requests.extend(list_of_output_requests)
 
-            if nfo.check_token('OUTPUT', line):
+            if 'OUTPUT' in keywords:
                 array_start_index = index + 1
-            if array_start_index > -1 and nfo.check_token('ENDOUTPUT', line):
+            if array_start_index > -1 and 'ENDOUTPUT' in keywords:
                 array_end_index = index
                 list_of_output_requests = self._get_output_request(file_as_list[array_start_index:array_end_index],
                                                                    date=current_date,
@@ -162,9 +199,9 @@ class NexusReporting(Reporting):
                                                                    start_date=self.__model.start_date)
                 array_output_requests.extend(list_of_output_requests)
 
-            if nfo.check_token('SSOUT', line):
+            if 'SSOUT' in keywords:
                 ss_start_index = index + 1
-            if ss_start_index > -1 and nfo.check_token('ENDSSOUT', line):
+            if ss_start_index > -1 and 'ENDSSOUT' in keywords:
                 ss_end_index = index
                 list_of_output_contents = self._get_output_contents(file_as_list[ss_start_index:ss_end_index],
                                                                     date=current_date,
@@ -173,9 +210,9 @@ class NexusReporting(Reporting):
                                                                     start_date=self.__model.start_date)
                 ss_output_contents.extend(list_of_output_contents)
 
-            if nfo.check_token('MAPOUT', line) or nfo.check_token('ARRAYOUT', line):
+            if 'MAPOUT' in keywords or 'ARRAYOUT' in keywords:
                 ss_start_index = index + 1
-            if ss_start_index > -1 and nfo.check_token('ENDMAPOUT', line) or nfo.check_token('ENDARRAYOUT', line):
+            if ss_start_index > -1 and 'ENDMAPOUT' in keywords or 'ENDARRAYOUT' in keywords:
                 ss_end_index = index
                 list_of_output_contents = self._get_output_contents(file_as_list[ss_start_index:ss_end_index],
                                                                     date=current_date,
@@ -11,6 +11,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusRockMethod import NexusRockMethod
 from ResSimpy.DataModelBaseClasses.Rock import Rock
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -84,6 +85,7 @@ class NexusRockMethods(Rock):
         """Returns dictionary of NexusFile where keys are of type int."""
         return self.__files
 
+    @profiled_phase('load_rock_methods')
     def load_rock_methods(self) -> None:
         """Loads rock property files from Nexus fcs file."""
         # Read in rock properties from Nexus rock method files
@@ -11,6 +11,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusSeparatorMethod import NexusSeparatorMethod
 from ResSimpy.DataModelBaseClasses.Separator import Separator
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -88,6 +89,7 @@ class NexusSeparatorMethods(Separator):
         """
         return self.__files
 
+    @profiled_phase('load_separator_methods')
     def load_separator_methods(self) -> None:
         """Loads and processes the seperator method files."""
         # Read in separator properties from Nexus separator method files
@@ -3,16 +3,23 @@ from __future__ import annotations
 
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Union, Optional, Sequence
 
 from datetime import datetime
 
+import pandas as pd
+
 from ResSimpy.Nexus.NexusIPRMethods import NexusIprMethods
 
+from ResSimpy.Enums.FileCopyMethodEnum import FileCopyMethod
 from ResSimpy.Enums.FluidTypeEnums import PvtType
 from ResSimpy.Nexus.DataModels.NexusOptions import NexusOptions
 import ResSimpy.Nexus.nexus_file_operations as nfo
 import ResSimpy.FileOperations.file_operations as fo
+from ResSimpy.FileOperations.File import File
+from ResSimpy.FileOperations.file_content_store import FileContentStore
+from ResSimpy.FileOperations.file_writer import BatchFileWriter
 from ResSimpy.Nexus.DataModels.FcsFile import FcsNexusFile
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.NexusPVTMethods import NexusPVTMethods
@@ -32,11 +39,16 @@ from ResSimpy.Nexus.NexusNetwork import NexusNetwork
 from ResSimpy.Nexus.NexusReporting import NexusReporting
 from ResSimpy.Nexus.NexusWells import NexusWells
 from ResSimpy.Nexus.nexus_model_file_generator import NexusModelFileGenerator
+from ResSimpy.Nexus.nexus_model_clone import clone_model
+from ResSimpy.Nexus.nexus_model_diff import ModelDiff, diff_models
+from ResSimpy.Nexus.nexus_unit_conversion import convert_model_units
 from ResSimpy.Nexus.runcontrol_operations import SimControls
 from ResSimpy.Nexus.logfile_operations import Logging
 from ResSimpy.Nexus.structured_grid_operations import StructuredGridOperations
 from ResSimpy.DataModelBaseClasses.Simulator import Simulator
 from ResSimpy.Time.ISODateTime import ISODateTime
+from ResSimpy.Utils.content_hash import ContentHasher, digest_to_int
+from ResSimpy.Utils.load_profiler import LoadProfiler, attach_profiler, profiled_phase
 
 
 class NexusSimulator(Simulator):
@@ -46,7 +58,8 @@ class NexusSimulator(Simulator):
                  manual_fcs_tidy_call: bool = False, lazy_loading: bool = True, start_date: None | str = None,
                  run_units: None | UnitSystem = None, default_units: None | UnitSystem = None,
                  pvt_type: None | PvtType = None, assume_loaded: bool = False,
-                 eos_details: None | str = None, date_format: DateFormat = DateFormat.MM_DD_YYYY) -> None:
+                 eos_details: None | str = None, date_format: DateFormat = DateFormat.MM_DD_YYYY,
+                 recursive: bool = True, file_content_memory_budget: Optional[int] = None) -> None:
         """Nexus simulator class. Inherits from the Simulator super class.
 
         Args:
@@ -73,6 +86,12 @@ class NexusSimulator(Simulator):
             eos_details (None | str, optional): A string containing the EOS details. If not provided, \
                 it will be set to None and read from the fcs file if applicable. Defaults to None.
             date_format (DateFormat, optional): The date format to use for the model. Defaults to MM_DD_YYYY.
+            recursive (bool, optional): If False only the fcs file and the runcontrol file are read, loading the \
+                file paths from the fcs, the units, date format, start date and times. The other files in the fcs \
+                and the log files are not read until load_full_model is called. Defaults to True.
+            file_content_memory_budget (Optional[int], optional): The maximum number of bytes of file content to \
+                hold uncompressed. Once over the budget, the content of the least recently used unmodified files is \
+                compressed in memory until the file is next read. Defaults to None, which holds all file content.
 
         Attributes:
             run_control_file_path (Optional[str]): file path to the run control file - derived from the fcs file
@@ -127,6 +146,8 @@ class NexusSimulator(Simulator):
         self.use_american_input_units: bool = False
         self.__write_times: bool = write_times
         self.__manual_fcs_tidy_call: bool = manual_fcs_tidy_call
+        self.__header_only: bool = not recursive
+        self._load_profiler: LoadProfiler = LoadProfiler()
 
         self._default_units: UnitSystem = default_units if default_units is not None else (
             UnitSystem.ENGLISH)  # The Nexus default
@@ -171,15 +192,20 @@ class NexusSimulator(Simulator):
             self.set_output_path(path=destination.strip())
 
         # Check the status of any existing or completed runs related to this model
-        self.get_simulation_status(from_startup=True)
+        if not self.__header_only:
+            self.get_simulation_status(from_startup=True)
 
         self.__is_multi_reservoir: bool = False  # Flag to indicate if the model is a multi-reservoir model
         self.__reservoir_paths: dict[str, str] = {}
         self.__multi_reservoirs: dict[str, NexusSimulator] = {}
 
+        self.__file_content_store: Optional[FileContentStore] = None
+
         # Load in the model
         if not assume_loaded:
             self.__load_fcs_file()
+        self.__attach_load_profiler()
+        self.file_content_memory_budget = file_content_memory_budget
 
     def __repr__(self) -> str:
         """Pretty printing NexusSimulator data."""
@@ -228,14 +254,33 @@ class NexusSimulator(Simulator):
         wells_tuple = self._attr_info_to_tuple(wells_attr)
         return network_tuple, wells_tuple
 
+    def network_wells_digest(self) -> bytes:
+        """Returns a content digest of the network constraints and wells completions attributes.
+
+        The digest is built from the memoized digest of each constraint and completion, so repeated calls only rehash
+        the objects that have changed.
+
+        Returns:
+            bytes: digest of the network constraints and wells completions attributes
+        """
+        hasher = ContentHasher()
+        hasher.update('constraints')
+        for constraints in self.network.constraints.get_all().values():
+            for constraint in constraints:
+                hasher.update(constraint.content_digest())
+        hasher.update('completions')
+        for well in self.wells.get_all():
+            for completion in well.completions:
+                hasher.update(completion.content_digest())
+        return hasher.digest()
+
     def hash_network_wells(self) -> int:
         """Hashes the network constraints and wells completions attributes.
 
         Returns:
             int: hash value of the network constraints and wells completions attributes
         """
-        hash_attr_tuple = self.network_wells_tuple()
-        return hash(hash_attr_tuple)
+        return digest_to_int(self.network_wells_digest())
 
     def wells_and_network_equal(self, other: NexusSimulator) -> bool:
         """Compares the network constraints and wells completions of two NexusSimulator objects.
@@ -251,16 +296,72 @@ class NexusSimulator(Simulator):
             TypeError: if the other object is not a NexusSimulator object.
         """
         if isinstance(other, NexusSimulator):
-            base_class_tuple = self.network_wells_tuple()
-            other_class_tuple = other.network_wells_tuple()
-            if base_class_tuple == ((), ()) and other_class_tuple == ((), ()):
-                # if base_class_tuple and other_class_tuple both return empty tuple, that means both of them /
-                # have no network constraints or wells completions
+            if not self.__has_network_or_wells() and not other.__has_network_or_wells():
+                # both of them have no network constraints or wells completions
                 raise ValueError("Both models have empty network constraints or wells completions. Unable to compare.")
-            return self.network_wells_tuple() == other.network_wells_tuple()
+            return self.network_wells_digest() == other.network_wells_digest()
         raise TypeError(f"Unable to compare {type(self)} with {other}. Ensure that {other} is of type NexusSimulator. "
                         f"{other} has {type(other)}")
 
+    def diff(self, other: NexusSimulator) -> ModelDiff:
+        """Returns the structural differences between this model and another model.
+
+        Reports the files, wells, completions, wellmods, constraints, network objects, method tables and grid array
+        definitions that were added, removed or changed in the other model. Sections whose files are identical in both
+        models are skipped without being loaded, unless they have already been loaded in either model.
+
+        Args:
+            other (NexusSimulator): the model to compare against this one.
+
+        Returns:
+            ModelDiff: the differences, with items in the other model reported relative to this model.
+
+        Example usage:
+        >>> from ResSimpy import NexusSimulator
+        >>> base_model = NexusSimulator(origin='path/to/base_model.fcs')
+        >>> sensitivity_model = NexusSimulator(origin='path/to/sensitivity_model.fcs')
+        >>> model_diff = base_model.diff(sensitivity_model)
+        >>> model_diff.get_entries(section='wells')
+        """
+        return diff_models(self, other)
+
+    def clone(self) -> NexusSimulator:
+        """Returns a copy of the model for creating a new case, e.g. one of the cases of a sensitivity study.
+
+        The clone shares the content of the files of the model with this model until either of them edits a file, at
+        which point the file being edited takes its own copy. Files that a case doesn't change are therefore held once
+        however many cases are cloned. The wells, network objects, methods and grid arrays that have already been
+        loaded are copied so that they can be edited in the clone without changing this model, while sections that
+        haven't been loaded are loaded by the clone from the shared file content when first used. Each clone can be
+        written out as a new case with write_out_case, which writes only the files modified in that clone.
+
+        Arrays and tables that have already been loaded, such as grid arrays and method tables, are shared rather
+        than copied, and are made read only in both this model and the clone, so an in place edit such as
+        `table.loc[0, 'BO'] = 1.2` raises a ValueError in either of them. Edit them by replacing them instead, e.g.
+        `table['BO'] = new_values` or `grid.kx.array = new_array`, which changes only the model they are replaced in.
+
+        Returns:
+            NexusSimulator: the clone of the model.
+
+        Example usage:
+        >>> from ResSimpy import NexusSimulator
+        >>> base_model = NexusSimulator(origin='path/to/base_model.fcs')
+        >>> for skin in [0.0, 2.0, 5.0]:
+        ...     case = base_model.clone()
+        ...     case.wells.modify_completion(well_name='well1', properties_to_modify={'skin': skin},
+        ...                                  completion_to_change={'i': 1, 'j': 1, 'k': 1})
+        ...     case.write_out_case(new_file_path=f'path/to/skin_{skin}/model.fcs')
+        """
+        new_model = clone_model(self)
+        new_model._load_profiler = LoadProfiler()
+        new_model.__attach_load_profiler()
+        return new_model
+
+    def __has_network_or_wells(self) -> bool:
+        """Returns True if the model has any network constraints or wells completions."""
+        return any(self.network.constraints.get_all().values()) or \
+            any(well.completions for well in self.wells.get_all())
+
     def remove_temp_from_properties(self) -> None:
         """Updates model values if the files are moved from a temp directory.
 
@@ -312,7 +413,8 @@ class NexusSimulator(Simulator):
 
     @property
     def network(self) -> NexusNetwork:
-        """Returns an instance of Nexus network class."""
+        """Returns an instance of Nexus network class, loading the full model if only its header has been loaded."""
+        self.load_full_model()
         return self._network
 
     @property
@@ -374,6 +476,51 @@ class NexusSimulator(Simulator):
         """Returns path to the original fcs file path supplied."""
         return self.__original_fcs_file_path
 
+    @property
+    def file_content_memory_budget(self) -> Optional[int]:
+        """The maximum number of bytes of file content held uncompressed, or None if all file content is held.
+
+        Once the content of the files of the model exceeds the budget, the content of the least recently used
+        unmodified files is compressed in memory and is decompressed when the file is next read, so that long-lived
+        services can keep many models open. Modified files are always held uncompressed. Clones of the model share
+        its budget, and the content of files they haven't edited is counted once and compressed with the model's.
+
+        Example usage:
+        >>> model = NexusSimulator(origin='path/to/model.fcs', file_content_memory_budget=200_000_000)
+        >>> model.wells.get_df()
+        >>> model.file_content_memory_budget = 50_000_000
+        """
+        return None if self.__file_content_store is None else self.__file_content_store.memory_budget
+
+    @file_content_memory_budget.setter
+    def file_content_memory_budget(self, value: Optional[int]) -> None:
+        """Sets the memory budget for the content of the files of the model, or removes it if set to None."""
+        if value is None:
+            if self.__file_content_store is not None:
+                for file in self.__all_files():
+                    self.__file_content_store.detach(file)
+            self.__file_content_store = None
+            return
+        if self.__file_content_store is None:
+            self.__file_content_store = FileContentStore(value)
+        else:
+            self.__file_content_store.memory_budget = value
+        for file in self.__all_files():
+            self.__file_content_store.attach(file)
+
+    def __all_files(self) -> list[File]:
+        """Returns the fcs file and every file included from it, each listed once."""
+        files: dict[int, File] = {}
+        files_to_visit: list[File] = [self.model_files]
+        while files_to_visit:
+            file = files_to_visit.pop()
+            if id(file) in files:
+                continue
+            files[id(file)] = file
+            if file.include_objects is not None:
+                files_to_visit.extend(file.include_objects)
+        return list(files.values())
+
     @property
     def root_name(self) -> Optional[str]:
         """Returns root file name of the fcs."""
@@ -528,6 +675,7 @@ class NexusSimulator(Simulator):
         if self.__destination is not None and os.path.dirname(self._origin) != os.path.dirname(self.__destination):
             self._origin = self.__destination + "/" + os.path.basename(self.__original_fcs_file_path)
 
+    @profiled_phase('NexusSimulator.load_fcs_file')
     def __load_fcs_file(self) -> None:
         """Loads in the information from the supplied FCS file into the class instance.
 
@@ -544,7 +692,8 @@ class NexusSimulator(Simulator):
                                                                                origin=self.origin,
                                                                                file_path=self.__new_fcs_file_path)
                                      .get_flat_list_str_file)
-        self._model_files = FcsNexusFile.generate_fcs_structure(self.__new_fcs_file_path)
+        self._model_files = FcsNexusFile.generate_fcs_structure(self.__new_fcs_file_path,
+                                                                header_only=self.__header_only)
         if fcs_content_with_includes is None:
             raise ValueError(f'FCS file not found, no content for {self.__new_fcs_file_path}')
         for line in fcs_content_with_includes:
@@ -565,6 +714,10 @@ class NexusSimulator(Simulator):
                 if value is not None:
                     self._default_units = UnitSystem(value.upper())
 
+        if self.__header_only:
+            self.__load_header()
+            return
+
         if self._model_files.multi_reservoir_files:
             self.__is_multi_reservoir = True
             self.__process_multi_reservoir_model()
@@ -672,6 +825,81 @@ class NexusSimulator(Simulator):
             if self.pvt_type == PvtType.EOS:
                 self._eos_details = self.get_eos_details(surface_file)
 
+    def __load_header(self) -> None:
+        """Loads the runcontrol file and the reservoir paths for a model opened with only the header loaded."""
+        if self._model_files.multi_reservoir_files:
+            self.__is_multi_reservoir = True
+            for reservoir_name, reservoir_file in self._model_files.multi_reservoir_files.items():
+                if reservoir_file.location is not None:
+                    self.__reservoir_paths[reservoir_name] = reservoir_file.location
+
+        if self.model_files.runcontrol_file is not None:
+            self.run_control_file_path = self.model_files.runcontrol_file.location
+            self._sim_controls.load_run_control_file()
+
+    @classmethod
+    def open_header_only(cls: type[NexusSimulator], origin: str, **kwargs: Any) -> NexusSimulator:
+        """Opens a model reading only the fcs file and the runcontrol file.
+
+        The file paths from the fcs, the units, date format, start date and times are loaded. The other files in the \
+        fcs are not read until load_full_model is called, which happens automatically on first use of the wells, \
+        network, grid, options or any of the methods of the model, or when the model is written out.
+
+        Args:
+            origin (str): file path to the fcs file.
+            **kwargs: other arguments to pass to the NexusSimulator constructor.
+
+        Examples:
+            >>> from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+            >>> model = NexusSimulator.open_header_only("/path/to/fcs_file.fcs")
+            >>> model.model_files.pvt_files
+        """
+        return cls(origin=origin, recursive=False, **kwargs)
+
+    @property
+    def header_only(self) -> bool:
+        """Returns True if only the fcs file and runcontrol file of the model have been loaded."""
+        return self.__header_only
+
+    def load_full_model(self) -> None:
+        """Loads the rest of the model for a model opened with only the header loaded. Does nothing otherwise."""
+        if not self.__header_only or self.assume_loaded:
+            return
+        self.__header_only = False
+        self.get_simulation_status(from_startup=True)
+        self.__load_fcs_file()
+        self.__attach_load_profiler()
+        # hold the files loaded within the memory budget
+        self.file_content_memory_budget = self.file_content_memory_budget
+
+    def __attach_load_profiler(self) -> None:
+        """Records the phases of lazily loading parts of the model into the load report of the model."""
+        for model_part in [self._network, self._wells, self._grid, self._pvt, self._separator, self._water,
+                           self._equil, self._rock, self._relperm, self._valve, self._aquifer, self._hydraulics,
+                           self._gaslift, self.__ipr_methods]:
+            if model_part is not None:
+                attach_profiler(model_part, self._load_profiler)
+
+    def load_report(self) -> pd.DataFrame:
+        """Returns the time spent in each phase of loading and writing the model.
+
+        Phases are only recorded while profiling is enabled with ResSimpy.Utils.load_profiler.enable_profiling or the
+        RESSIMPY_PROFILE environment variable.
+
+        Returns:
+            pd.DataFrame: a row for each phase with the number of calls, the time taken in seconds, the number of \
+                lines and bytes read from files and the number of lines parsed during the phase, ordered by the time \
+                taken.
+
+        Examples:
+            >>> from ResSimpy.Utils.load_profiler import enable_profiling
+            >>> enable_profiling()
+            >>> model = NexusSimulator(origin="/path/to/fcs_file.fcs")
+            >>> model.wells.get_df()
+            >>> model.load_report()
+        """
+        return self._load_profiler.report()
+
     @staticmethod
     def update_file_value(file_path: str, token: str, new_value: str, add_to_start: bool = False) -> None:
         """Updates a value in a file if it is present and in the format {TOKEN} {VALUE}.
@@ -847,21 +1075,88 @@ class NexusSimulator(Simulator):
             file path provided.
             case_suffix (str): Suffix to append to the case name. Defaults to ''.
         """
-
+        self.load_full_model()
         self.model_files.write_out_case(new_file_path=new_file_path,
                                         new_include_file_location=new_include_file_location,
                                         case_suffix=case_suffix)
 
+    @staticmethod
+    def write_out_cases(cases: Sequence[NexusSimulator], new_file_paths: Sequence[str],
+                        new_include_file_location: str = 'include_files', case_suffixes: Optional[Sequence[str]] = None,
+                        max_workers: Optional[int] = None, link_identical_files: bool = True,
+                        allow_symlinks: bool = False) -> None:
+        """Writes out many cases together in a thread pool, e.g. the clones of a base model in a sensitivity study.
+
+        Each case is written as by write_out_case. The cases share a BatchFileWriter, which creates each directory
+        once, checks for existing files from a single listing of each directory and hard links unmodified files with
+        the same content as a file already written to the first copy rather than writing them again.
+
+        Args:
+            cases (Sequence[NexusSimulator]): the models to write out, each a separate object such as a clone.
+            new_file_paths (Sequence[str]): path to save the fcs file of each case to.
+            new_include_file_location (str): Saves included files to a path either absolute or relative to the
+            file path provided. Defaults to 'include_files'.
+            case_suffixes (Optional[Sequence[str]]): Suffix to append to the modified files of each case. Defaults to
+            case_1, case_2 etc. in the order of the cases.
+            max_workers (Optional[int]): number of threads to write the cases with. Writes the cases one at a time if
+            set to 1. Defaults to the default of ThreadPoolExecutor.
+            link_identical_files (bool): If True, identical unmodified files are hard linked rather than written
+            again. Files are replaced rather than overwritten in place when written out again, so a later write to
+            one case doesn't change the cases linked to it. Defaults to True.
+            allow_symlinks (bool): If True, identical files are symbolically linked where they can't be hard linked.
+            Defaults to False.
+
+        Example usage:
+        >>> from ResSimpy import NexusSimulator
+        >>> base_model = NexusSimulator(origin='path/to/base_model.fcs')
+        >>> cases = [base_model.clone() for _ in range(3)]
+        >>> NexusSimulator.write_out_cases(cases, [f'path/to/case_{i}/model.fcs' for i in range(3)])
+        """
+        if case_suffixes is None:
+            case_suffixes = [f'case_{i + 1}' for i in range(len(cases))]
+        if not len(cases) == len(new_file_paths) == len(case_suffixes):
+            raise ValueError(f'Expected a file path and case suffix for each of the {len(cases)} cases, instead found '
+                             f'{len(new_file_paths)} file paths and {len(case_suffixes)} case suffixes.')
+        if len({id(case) for case in cases}) != len(cases):
+            raise ValueError('The same model was provided for more than one case. Write out each case from a separate '
+                             'model, e.g. from a clone of the base model.')
+        if len(set(new_file_paths)) != len(new_file_paths):
+            raise ValueError('The same file path was provided for more than one case.')
+
+        file_writer = BatchFileWriter(link_identical_files=link_identical_files, allow_symlinks=allow_symlinks)
+        # create the directories for all the cases up front rather than checking them from each thread
+        for new_file_path in new_file_paths:
+            file_directory = os.path.dirname(new_file_path)
+            file_writer.make_dirs(file_directory)
+            if not os.path.isabs(new_include_file_location):
+                file_writer.make_dirs(os.path.join(file_directory, new_include_file_location))
+        if os.path.isabs(new_include_file_location):
+            file_writer.make_dirs(new_include_file_location)
+
+        for case in cases:
+            case.load_full_model()
+        case_arguments = list(zip(cases, new_file_paths, case_suffixes))
+        if max_workers == 1:
+            for case, new_file_path, case_suffix in case_arguments:
+                case.model_files.write_out_case(new_file_path, new_include_file_location, case_suffix, file_writer)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(case.model_files.write_out_case, new_file_path, new_include_file_location,
+                                       case_suffix, file_writer)
+                       for case, new_file_path, case_suffix in case_arguments]
+            for future in futures:
+                future.result()
+
     def update_simulator_files(self) -> None:
         """Updates the simulator with any changes to the included files. Overwrites existing files.
 
         IMPORTANT: No changes to the model will be saved until this method is called!
         """
-
+        self.load_full_model()
         self.model_files.update_model_files()
 
     def move_simulator_files(self, new_file_path: str, new_include_file_location: str,
-                             overwrite_files: bool = False) -> None:
+                             overwrite_files: bool = False, copy_method: FileCopyMethod = FileCopyMethod.WRITE) -> None:
         """Creates a set of simulator files.
 
         Args:
@@ -869,10 +1164,14 @@ class NexusSimulator(Simulator):
             new_include_file_location (str): Saves included files to a path either absolute or relative to the
             file path provided.
             overwrite_files (bool): Overwrite files if they already exist. Defaults to False.
+            copy_method (FileCopyMethod): How unmodified files are copied. FileCopyMethod.COPY and
+            FileCopyMethod.HARDLINK copy them on disk, e.g. large grid arrays whose loading was skipped, without
+            reading them into memory. Defaults to FileCopyMethod.WRITE, which writes out their content.
         """
+        self.load_full_model()
+        self.model_files.move_model_files(new_file_path, new_include_file_location, overwrite_files, copy_method)
 
-        self.model_files.move_model_files(new_file_path, new_include_file_location, overwrite_files)
-
+    @profiled_phase('NexusSimulator.write_out_new_model')
     def write_out_new_model(self, new_location: str, new_model_name: str,
                             new_include_file_location: str | None = None,
                             overwrite_files: bool = True) -> None:
@@ -905,6 +1204,7 @@ class NexusSimulator(Simulator):
             file.origin = new_model_path
             file.write_to_file(new_file_path=file.location, overwrite_file=overwrite_files)
 
+        self.load_full_model()
         # ensure the full path is made
         if new_include_file_location is None:
             new_include_file_location = os.path.join(new_location, 'include_files')
@@ -1015,6 +1315,30 @@ class NexusSimulator(Simulator):
         self.model_files.location = new_model_path
         self.model_files.write_to_file(new_file_path=new_model_path, overwrite_file=overwrite_files)
 
+    def to_unit_system(self, unit_system: UnitSystem) -> None:
+        """Converts the values held in the model to a new unit system in place.
+
+        Converts the completions, wellmods, network objects, constraints and method tables from the default units of
+        the model, and the dimensional grid arrays (e.g. DX, DEPTH, PRESSURE) and their MOD cards from the units of
+        the grid file, then sets the default units to the new unit system. Converted values are rounded to 9
+        significant figures. Call write_out_new_model afterwards to write the deck in the new unit system.
+        A warning is raised for VMOD cards that can't be converted, as their values are held in include files.
+
+        Args:
+            unit_system (UnitSystem): the unit system to convert the model to, e.g. UnitSystem.METRIC.
+
+        Raises:
+            ValueError: if the model or the new unit system can't be converted, e.g. METBAR to or from UNDEFINED.
+
+        Example usage:
+        >>> from ResSimpy import NexusSimulator
+        >>> from ResSimpy.Enums.UnitsEnum import UnitSystem
+        >>> nexus_sim = NexusSimulator(origin='path/to/original_model.fcs')
+        >>> nexus_sim.to_unit_system(UnitSystem.METRIC)
+        >>> nexus_sim.write_out_new_model(new_location='path/to/new_model_directory', new_model_name='metric_model')
+        """
+        convert_model_units(self, unit_system)
+
     @property
     def summary(self) -> str:
         """Returns a summary of the model contents."""
@@ -1068,7 +1392,8 @@ class NexusSimulator(Simulator):
 
     @property
     def options(self) -> NexusOptions | None:
-        """Returns an instance of Nexus options class."""
+        """Returns an instance of Nexus options class, loading the full model if only its header has been loaded."""
+        self.load_full_model()
         return self._options
 
     @property
@@ -1147,14 +1472,78 @@ class NexusSimulator(Simulator):
 
     @property
     def ipr_methods(self) -> NexusIprMethods:
-        """Returns an instance of NexusIPRMethods."""
+        """Returns an instance of NexusIPRMethods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
         return self.__ipr_methods
 
     @property
     def wells(self) -> NexusWells:
-        """Returns the associated NexusWells for the simulator."""
+        """Returns the associated NexusWells for the simulator, loading the full model if only its header has been \
+        loaded.
+        """
+        self.load_full_model()
         return self._wells
 
+    @property
+    def pvt(self) -> NexusPVTMethods:
+        """Returns the PVT methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._pvt
+
+    @property
+    def separator(self) -> NexusSeparatorMethods:
+        """Returns the separator methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._separator
+
+    @property
+    def water(self) -> NexusWaterMethods:
+        """Returns the water methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._water
+
+    @property
+    def equil(self) -> NexusEquilMethods:
+        """Returns the equilibration methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._equil
+
+    @property
+    def rock(self) -> NexusRockMethods:
+        """Returns the rock methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._rock
+
+    @property
+    def relperm(self) -> NexusRelPermMethods:
+        """Returns the relative permeability methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._relperm
+
+    @property
+    def valve(self) -> NexusValveMethods:
+        """Returns the valve methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._valve
+
+    @property
+    def aquifer(self) -> NexusAquiferMethods:
+        """Returns the aquifer methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._aquifer
+
+    @property
+    def hydraulics(self) -> NexusHydraulicsMethods:
+        """Returns the hydraulics methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._hydraulics
+
+    @property
+    def gaslift(self) -> NexusGasliftMethods:
+        """Returns the gaslift methods, loading the full model if only its header has been loaded."""
+        self.load_full_model()
+        return self._gaslift
+
     @property
     def reporting(self) -> NexusReporting:
         """Returns the associated NexusReporting for the simulator."""
@@ -1191,5 +1580,8 @@ class NexusSimulator(Simulator):
 
     @property
     def grid(self) -> NexusGrid | None:
-        """Returns the associated NexusGrid for the simulator."""
+        """Returns the associated NexusGrid for the simulator, loading the full model if only its header has been \
+        loaded.
+        """
+        self.load_full_model()
         return self._grid
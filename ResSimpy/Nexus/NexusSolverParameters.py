@@ -3,6 +3,7 @@ NexusSolverParam data objects.
 """
 from __future__ import annotations
 
+import copy
 from typing import Sequence, TYPE_CHECKING
 
 from ResSimpy.Enums.TimeSteppingMethodEnum import TimeSteppingMethod
@@ -13,11 +14,23 @@ from ResSimpy.Nexus.NexusKeywords.runcontrol_keywords import (DT_KEYWORDS, SOLVE
                                                               TOLS_KEYWORDS, DCMAX_KEYWORDS, MAX_CHANGE_KEYWORDS)
 from ResSimpy.GenericContainerClasses.SolverParameters import SolverParameters
 from ResSimpy.FileOperations import file_operations as fo
+from ResSimpy.Nexus.runcontrol_event_parser import (RuncontrolEventBuffer, RuncontrolEventParser,
+                                                    RuncontrolLineEvent)
 from ResSimpy.Time.ISODateTime import ISODateTime
 
 if TYPE_CHECKING:
     from ResSimpy.Nexus.NexusSimulator import NexusSimulator
 
+# solver parameter tokens that follow the generic KEYWORD VALUE format, with the keywords that are valid after each
+_SOLVER_PARAMETERS_THAT_WORK_WITH_GENERIC_FUNCTION = {
+    'DT': DT_KEYWORDS,
+    'GRIDSOLVER': GRIDSOLVER_KEYWORDS,
+    'TOLS': TOLS_KEYWORDS,
+}
+_SOLVER_PARAMETERS_THAT_WORK_WITH_GENERIC_FUNCTION.update({key: DCMAX_KEYWORDS for key in MAX_CHANGE_KEYWORDS})
+_SOLVER_PARAMETER_TOKENS = ['TIME', 'SOLVER', 'METHOD', 'IMPLICITMBAL', 'IMPSTAB', 'PERFREV', 'DRSDT',
+                            *_SOLVER_PARAMETERS_THAT_WORK_WITH_GENERIC_FUNCTION, *SOLO_KEYWORDS]
+
 
 class NexusSolverParameters(SolverParameters):
     def __init__(self, model: NexusSimulator, assume_loaded: bool = False) -> None:
@@ -33,6 +46,7 @@ class NexusSolverParameters(SolverParameters):
         self.file_content = ['']
         self.start_date = ''
         self.__assume_loaded = assume_loaded
+        self.__runcontrol_events: RuncontrolEventBuffer | None = None
 
     @property
     def solver_parameters(self) -> Sequence[NexusSolverParameter]:
@@ -47,6 +61,11 @@ class NexusSolverParameters(SolverParameters):
             return []
         return self.__solver_parameters
 
+    @property
+    def solver_parameters_loaded(self) -> bool:
+        """Returns True if the solver parameters have been loaded or are assumed to be loaded."""
+        return self.__solver_parameters is not None or self.__assume_loaded
+
     def get_all(self) -> Sequence[NexusSolverParameter]:
         """Returns all solver parameters."""
         return self.solver_parameters
@@ -60,10 +79,35 @@ class NexusSolverParameters(SolverParameters):
         self.__solver_parameters = value
 
     def load(self) -> None:
-        """Loads data from run control file and sets start date from the model."""
-        if self.__model.model_files.runcontrol_file is None:
+        """Loads data from run control file and sets start date from the model.
+
+        Uses the events recorded from a shared parse of the runcontrol file if the file is unchanged since, otherwise
+        parses the file.
+        """
+        runcontrol_file = self.__model.model_files.runcontrol_file
+        if runcontrol_file is None:
             raise ValueError('No runcontrol file found when trying to load solver parameters.')
-        self.file_content = self.__model.model_files.runcontrol_file.get_flat_list_str_file
+        runcontrol_events = self.__runcontrol_events
+        if runcontrol_events is None or not runcontrol_events.is_current(runcontrol_file):
+            parser = RuncontrolEventParser.from_file(runcontrol_file)
+            runcontrol_events = RuncontrolEventBuffer(parser, _SOLVER_PARAMETER_TOKENS, every_line=True)
+            parser.parse()
+        self.__runcontrol_events = None
+        self.__read_runcontrol_events(runcontrol_events.file_content, runcontrol_events.events)
+
+    def subscribe_to_runcontrol(self, parser: RuncontrolEventParser) -> None:
+        """Records the events from a parse of the runcontrol file shared with the other runcontrol consumers.
+
+        The solver parameters are read from the recorded events when they are first requested.
+
+        Args:
+            parser (RuncontrolEventParser): parser for the flattened runcontrol file.
+        """
+        self.__runcontrol_events = RuncontrolEventBuffer(parser, _SOLVER_PARAMETER_TOKENS, every_line=True)
+
+    def __read_runcontrol_events(self, file_content: list[str], events: list[RuncontrolLineEvent]) -> None:
+        """Reads the solver parameters from the lines of the runcontrol file emitted by the parser."""
+        self.file_content = file_content
         self.start_date = self.__model.start_date
 
         read_in_solver_parameter: list[NexusSolverParameter] = []
@@ -72,41 +116,41 @@ class NexusSolverParameters(SolverParameters):
         current_solver_param_token = None
         current_date = self.start_date
         solver_parameter_for_timestep = NexusSolverParameter(date=self.start_date)
+        # copied rather than created for each block to avoid converting the date again for the comparison
+        blank_solver_parameter = copy.copy(solver_parameter_for_timestep)
         current_solver_scope = 'ALL'
-        solver_parameters_that_work_with_generic_function = {
-            'DT': DT_KEYWORDS,
-            'GRIDSOLVER': GRIDSOLVER_KEYWORDS,
-            'TOLS': TOLS_KEYWORDS,
-        }
-        solver_parameters_that_work_with_generic_function.update({key: DCMAX_KEYWORDS for key in MAX_CHANGE_KEYWORDS})
-
-        for line in self.file_content:
-            # maybe put a for loop in here for all the potential starting tokens?
-            if fo.check_token(token='TIME', line=line):
+        solver_parameters_that_work_with_generic_function = _SOLVER_PARAMETERS_THAT_WORK_WITH_GENERIC_FUNCTION
+
+        for event in events:
+            line, line_index, keywords = event.line, event.line_index, event.keywords
+            if 'TIME' in keywords:
                 # append the existing solver parameter to the list
-                if solver_parameter_for_timestep != NexusSolverParameter(date=current_date):
+                if solver_parameter_for_timestep != blank_solver_parameter:
                     # prevent blank solver parameters from being added to the list
                     read_in_solver_parameter.append(solver_parameter_for_timestep)
                 # create a new solver parameter object for the new time block
-                current_date = fo.get_expected_token_value('TIME', line, file_list=self.file_content)
+                current_date = event.time if event.time is not None else \
+                    fo.get_expected_token_value_at('TIME', self.file_content, line_index)
                 solver_parameter_for_timestep = NexusSolverParameter(date=current_date)
+                blank_solver_parameter = copy.copy(solver_parameter_for_timestep)
                 # reset the current_solver_param_token
                 current_solver_param_token = None
 
             # see if we get any SOLVER blocks
-            if fo.check_token(token='SOLVER', line=line):
+            if 'SOLVER' in keywords:
                 current_solver_param_token = 'SOLVER'
-                solver_token_value = fo.get_expected_token_value('SOLVER', line, file_list=self.file_content)
+                solver_token_value = fo.get_expected_token_value_at('SOLVER', self.file_content, line_index)
                 solver_parameter_for_timestep = (
-                    self.__get_solver_token_values(solver_token_value, line, solver_parameter_for_timestep))
+                    self.__get_solver_token_values(solver_token_value, line, line_index,
+                                                   solver_parameter_for_timestep))
                 current_solver_scope = solver_token_value
 
-            if current_solver_param_token == 'SOLVER' and not fo.check_token(token='SOLVER', line=line):
-                solver_parameter_for_timestep = self.__set_solver_parameters(current_solver_scope, line,
+            if current_solver_param_token == 'SOLVER' and 'SOLVER' not in keywords:
+                solver_parameter_for_timestep = self.__set_solver_parameters(current_solver_scope, line, line_index,
                                                                              solver_parameter_for_timestep)
 
-            if fo.check_token(token='METHOD', line=line):
-                timestep_method = fo.get_expected_token_value('METHOD', line, file_list=self.file_content)
+            if 'METHOD' in keywords:
+                timestep_method = fo.get_expected_token_value_at('METHOD', self.file_content, line_index)
                 # convert the string to the enum
                 if timestep_method.lower() == 'implicit':
                     timestep_method_enum = TimeSteppingMethod.IMPLICIT
@@ -115,52 +159,54 @@ class NexusSolverParameters(SolverParameters):
                 # set the timestepping_method in the object
                 solver_parameter_for_timestep.timestepping_method = timestep_method_enum
 
-            if fo.check_token(token='IMPLICITMBAL', line=line):
-                solver_parameter_for_timestep.implicit_mbal = fo.get_expected_token_value('IMPLICITMBAL', line,
-                                                                                          file_list=self.file_content)
+            if 'IMPLICITMBAL' in keywords:
+                solver_parameter_for_timestep.implicit_mbal = fo.get_expected_token_value_at('IMPLICITMBAL',
+                                                                                             self.file_content,
+                                                                                             line_index)
 
-            if fo.check_token(token='IMPSTAB', line=line):
+            if 'IMPSTAB' in keywords:
                 current_solver_param_token = 'IMPSTAB'
-                impstab_token_value = fo.get_token_value('IMPSTAB', line, file_list=self.file_content)
+                impstab_token_value = fo.get_token_value_at('IMPSTAB', self.file_content, line_index)
                 if impstab_token_value is not None:
                     solver_parameter_for_timestep.impstab_on = impstab_token_value.upper() == 'ON'
 
-            if current_solver_param_token == 'IMPSTAB' and not fo.check_token(token='IMPSTAB', line=line):
+            if current_solver_param_token == 'IMPSTAB' and 'IMPSTAB' not in keywords:
                 next_value = fo.get_next_value(0, file_as_list=[line])
                 if next_value is not None and next_value in IMPSTAB_KEYWORDS:
-                    solver_parameter_for_timestep = self.__get_impstab_token_values(next_value, line,
+                    solver_parameter_for_timestep = self.__get_impstab_token_values(next_value, line_index,
                                                                                     solver_parameter_for_timestep)
 
             for possible_solver_param_tokens in solver_parameters_that_work_with_generic_function:
-                if fo.check_token(token=possible_solver_param_tokens, line=line):
+                if possible_solver_param_tokens in keywords:
                     current_solver_param_token = possible_solver_param_tokens
                     grid_solver_method = fo.get_expected_token_value(current_solver_param_token, line, file_list=[line])
                     solver_parameter_for_timestep = (
-                        self.__get_generic_solver_token_values(grid_solver_method, line, solver_parameter_for_timestep,
+                        self.__get_generic_solver_token_values(grid_solver_method, line_index,
+                                                               solver_parameter_for_timestep,
                                                                current_solver_param_token))
 
             if (current_solver_param_token in solver_parameters_that_work_with_generic_function and
-                    not fo.check_token(token=current_solver_param_token, line=line)):
+                    current_solver_param_token not in keywords):
                 next_value = fo.get_next_value(0, file_as_list=[line])
                 valid_keywords = solver_parameters_that_work_with_generic_function[current_solver_param_token]
                 if next_value is not None and next_value.upper() in valid_keywords:
                     solver_parameter_for_timestep = (
-                        self.__get_generic_solver_token_values(next_value, line, solver_parameter_for_timestep,
+                        self.__get_generic_solver_token_values(next_value, line_index,
+                                                               solver_parameter_for_timestep,
                                                                current_solver_param_token))
-            if fo.check_token(token='PERFREV', line=line):
-                solver_parameter_for_timestep.perfrev = fo.get_expected_token_value('PERFREV', line,
-                                                                                    file_list=self.file_content)
+            if 'PERFREV' in keywords:
+                solver_parameter_for_timestep.perfrev = fo.get_expected_token_value_at('PERFREV', self.file_content,
+                                                                                       line_index)
 
-            if fo.check_token(token='DRSDT', line=line):
-                drsdt_limit = fo.get_expected_token_value('LIMIT', line,
-                                                          file_list=self.file_content)
+            if 'DRSDT' in keywords:
+                drsdt_limit = fo.get_expected_token_value_at('LIMIT', self.file_content, line_index)
                 solver_parameter_for_timestep.drsdt_limit = float(drsdt_limit)
                 if "2PHASE" in line:
                     solver_parameter_for_timestep.drsdt_two_phases = True
 
             for keyword in SOLO_KEYWORDS:
-                if fo.check_token(token=keyword, line=line):
-                    self.__get_generic_solver_token_values(keyword, line, solver_parameter_for_timestep,
+                if keyword in keywords:
+                    self.__get_generic_solver_token_values(keyword, line_index, solver_parameter_for_timestep,
                                                            'SOLO')
 
         read_in_solver_parameter.append(solver_parameter_for_timestep)
@@ -168,7 +214,7 @@ class NexusSolverParameters(SolverParameters):
         # finally assign the read in solver parameters to the class variable
         self.__solver_parameters = read_in_solver_parameter
 
-    def __set_solver_parameters(self, current_solver_scope: str, line: str,
+    def __set_solver_parameters(self, current_solver_scope: str, line: str, line_index: int,
                                 solver_parameter_for_timestep: NexusSolverParameter) -> NexusSolverParameter:
         """Sets the solver parameters for the SOLVER keyword in the NexusSolverParameter object."""
         next_value = fo.get_next_value(0, file_as_list=[line])
@@ -176,7 +222,7 @@ class NexusSolverParameters(SolverParameters):
         if next_value in SOLVER_SCOPE_KEYWORDS:
             current_solver_scope = next_value
             # get the value of the next token and assign it to the solver_parameter_for_timestep object
-            solver_scoped_keyword = fo.get_expected_token_value(next_value, line, file_list=self.file_content)
+            solver_scoped_keyword = fo.get_expected_token_value_at(next_value, self.file_content, line_index)
             attribute_value, type_assignment = self.__get_solver_attribute_value(
                 current_solver_scope, solver_scoped_keyword)
             value = fo.get_token_value(solver_scoped_keyword, line, file_list=[line])
@@ -198,7 +244,7 @@ class NexusSolverParameters(SolverParameters):
             # to the solver_parameter_for_timestep object.
             attribute_value, type_assignment = self.__get_solver_attribute_value(
                 current_solver_scope, next_value)
-            value = fo.get_token_value(next_value, line, file_list=self.file_content)
+            value = fo.get_token_value_at(next_value, self.file_content, line_index)
             solver_parameter_for_timestep.__setattr__(attribute_value, type_assignment(value))
 
         elif next_value in ['NOCUT', 'CUT']:
@@ -207,16 +253,15 @@ class NexusSolverParameters(SolverParameters):
             solver_parameter_for_timestep.solver_precon = next_value
             precon_setting = fo.get_token_value(next_value, line, file_list=[line])
             if precon_setting is not None:
-                precon_value_num = fo.get_expected_token_value(precon_setting, line,
-                                                               file_list=self.file_content)
+                precon_value_num = fo.get_expected_token_value_at(precon_setting, self.file_content, line_index)
                 solver_parameter_for_timestep.solver_precon_value = float(precon_value_num)
                 solver_parameter_for_timestep.solver_precon_setting = precon_setting
         elif next_value in SOLVER_KEYWORDS:
-            solver_parameter_for_timestep = self.__get_solver_token_values(next_value,
-                                                                           line, solver_parameter_for_timestep)
+            solver_parameter_for_timestep = self.__get_solver_token_values(next_value, line, line_index,
+                                                                           solver_parameter_for_timestep)
         return solver_parameter_for_timestep
 
-    def __get_solver_token_values(self, solver_token_value: str, line: str,
+    def __get_solver_token_values(self, solver_token_value: str, line: str, line_index: int,
                                   solver_parameter_for_timestep: NexusSolverParameter) -> NexusSolverParameter:
         """Get the values for the SOLVER KEYWORD VALUE format."""
         solver_token_value = solver_token_value.upper()
@@ -226,11 +271,11 @@ class NexusSolverParameters(SolverParameters):
         if solver_token_value in SOLVER_SCOPE_KEYWORDS:
             property_set = fo.get_expected_token_value(solver_token_value, line, file_list=[line])
             attribute_value, type_assignment = self.__get_solver_attribute_value(solver_token_value, property_set)
-            value = fo.get_expected_token_value(property_set, line, file_list=self.file_content)
+            value = fo.get_expected_token_value_at(property_set, self.file_content, line_index)
 
         else:
             attribute_value, type_assignment = keyword_mapping[solver_token_value]
-            value = fo.get_expected_token_value(solver_token_value, line, file_list=self.file_content)
+            value = fo.get_expected_token_value_at(solver_token_value, self.file_content, line_index)
         if type_assignment is bool:
             # set to True if the value is 'ON' and False if the value is 'OFF' (the bool conversion happens
             # by type_assignment)
@@ -249,7 +294,7 @@ class NexusSolverParameters(SolverParameters):
 
         return attribute_value, type_assignment
 
-    def __get_impstab_token_values(self, token_value: str, line: str,
+    def __get_impstab_token_values(self, token_value: str, line_index: int,
                                    solver_parameter_for_timestep: NexusSolverParameter) -> NexusSolverParameter:
         keyword_mapping = NexusSolverParameter.impstab_keyword_mapping()
         attribute_value, type_assignment = keyword_mapping[token_value.upper()]
@@ -262,12 +307,12 @@ class NexusSolverParameters(SolverParameters):
             case 'PEACEMAN':
                 value = 'PEACEMAN'
             case _:
-                value = fo.get_expected_token_value(token_value, line, file_list=self.file_content)
+                value = fo.get_expected_token_value_at(token_value, self.file_content, line_index)
 
         solver_parameter_for_timestep.__setattr__(attribute_value, type_assignment(value))
         return solver_parameter_for_timestep
 
-    def __get_generic_solver_token_values(self, next_token: str, line: str,
+    def __get_generic_solver_token_values(self, next_token: str, line_index: int,
                                           solver_parameter_for_timestep: NexusSolverParameter,
                                           current_solver_param_token: str
                                           ) -> NexusSolverParameter:
@@ -282,7 +327,7 @@ class NexusSolverParameters(SolverParameters):
             # get the ressimpy attribute name
             attribute_value, type_assignment = keyword_mapping[next_token.upper()]
 
-        value = fo.get_expected_token_value(next_token, line, file_list=self.file_content)
+        value = fo.get_expected_token_value_at(next_token, self.file_content, line_index)
         # add the value to the solver_parameter_for_timestep object
         solver_parameter_for_timestep.__setattr__(attribute_value, type_assignment(value))
         return solver_parameter_for_timestep
@@ -11,6 +11,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusValveMethod import NexusValveMethod
 from ResSimpy.DataModelBaseClasses.Valve import Valve
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -81,6 +82,7 @@ class NexusValveMethods(Valve):
         """Returns dictionary of NexusFile where keys are of type int."""
         return self.__files
 
+    @profiled_phase('load_valve_methods')
     def load_valve_methods(self) -> None:
         """Loads valve methods from files and initialises 'NexusValveMethod' object."""
         # Read in valve properties from Nexus valve method files
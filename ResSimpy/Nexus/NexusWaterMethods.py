@@ -11,6 +11,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusWaterMethod import NexusWaterMethod
 from ResSimpy.DataModelBaseClasses.Water import Water
 from ResSimpy.Utils.dynamic_method_manipulations import add_dynamic_method
+from ResSimpy.Utils.load_profiler import profiled_phase
 
 
 @dataclass(kw_only=True)
@@ -81,6 +82,7 @@ class NexusWaterMethods(Water):
         """Returns dictionary of 'NexusFile' objects where keys are of type int."""
         return self.__files
 
+    @profiled_phase('load_water_methods')
     def load_water_methods(self) -> None:
         """Loads water properties from files and initialises NexusWaterMethod object."""
         # Read in water properties from Nexus water method files
@@ -25,6 +25,7 @@ from ResSimpy.Nexus.load_wells import load_wells
 import ResSimpy.FileOperations.file_operations as fo
 import ResSimpy.Nexus.nexus_file_operations as nfo
 from ResSimpy.Utils.invert_nexus_map import attribute_name_to_nexus_keyword
+from ResSimpy.Utils.load_profiler import profiled_phase
 from ResSimpy.Nexus.DataModels.NexusWell import NexusWell
 
 if TYPE_CHECKING:
@@ -117,6 +118,7 @@ class NexusWells(Wells):
         df_store = df_store.dropna(axis=1, how='all')
         return df_store
 
+    @profiled_phase('NexusWells.load')
     def _load(self) -> None:
         if self.__model.model_files.well_files is None:
             raise FileNotFoundError('No wells files found for current model.')
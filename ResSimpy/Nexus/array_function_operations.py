@@ -1,13 +1,19 @@
 """A collection of functions for handling grid functions from Nexus."""
 from __future__ import annotations
 import ResSimpy.Nexus.nexus_file_operations as nfo
+import numpy as np
 import pandas as pd
 from typing import Optional, Union
 import warnings
 
+from ResSimpy.DataModelBaseClasses.GridArrayDefinition import GridArrayDefinition
 from ResSimpy.Enums.GridFunctionTypes import GridFunctionTypeEnum
 from ResSimpy.Nexus.DataModels.StructuredGrid.NexusGridArrayFunction import NexusGridArrayFunction
 from ResSimpy.Nexus.NexusKeywords.structured_grid_keywords import GRID_ARRAY_KEYWORDS, STRUCTURED_GRID_KEYWORDS
+from ResSimpy.Utils.structured_grid_indexing import box_mask
+
+TWO_INPUT_FUNCTION_TYPES = [GridFunctionTypeEnum.ADD, GridFunctionTypeEnum.SUBT, GridFunctionTypeEnum.DIV,
+                            GridFunctionTypeEnum.MULT, GridFunctionTypeEnum.MIN, GridFunctionTypeEnum.MAX]
 
 
 def collect_all_function_blocks(file_as_list: list[str]) -> list[list[str]]:
@@ -502,3 +508,141 @@ def object_from_array_function_block(array_function: list[str], function_number:
         function_table_p_list=function_table_p_list
     )
     return new_grid_array_function
+
+
+def evaluate_grid_array_function(array_function: NexusGridArrayFunction,
+                                 input_arrays: dict[str, np.ndarray | float],
+                                 range_x: int, range_y: int, range_z: int,
+                                 region_array: Optional[np.ndarray] = None,
+                                 existing_output_arrays: Optional[dict[str, np.ndarray]] = None,
+                                 ) -> dict[str, GridArrayDefinition]:
+    """Applies a grid array function to a set of input arrays and returns the resulting output arrays.
+
+    The function is only applied to cells inside the BLOCKS range, in the requested regions and with input values
+    inside the RANGE INPUT limits. All other cells keep the value from existing_output_arrays, or are set to NaN if
+    no existing array is provided. Results are clipped to the RANGE OUTPUT limits.
+
+    Args:
+        array_function (NexusGridArrayFunction): the function to evaluate.
+        input_arrays (dict[str, np.ndarray | float]): flat arrays (or constant values) keyed by upper case array name.
+        range_x (int): number of cells in the i direction (NX).
+        range_y (int): number of cells in the j direction (NY).
+        range_z (int): number of cells in the k direction (NZ).
+        region_array (Optional[np.ndarray]): flat array of region numbers for the function's region_type.
+        existing_output_arrays (Optional[dict[str, np.ndarray]]): current values of the output arrays keyed by upper \
+        case array name.
+
+    Returns:
+        dict[str, GridArrayDefinition]: array backed grid array definitions keyed by the output array name.
+    """
+    if array_function.input_array is None or array_function.output_array is None:
+        raise ValueError('Grid array function must have both input and output arrays to be evaluated.')
+    if array_function.function_type is None:
+        raise ValueError('Grid array function has no function type to evaluate.')
+    if existing_output_arrays is None:
+        existing_output_arrays = {}
+    number_of_cells = range_x * range_y * range_z
+
+    inputs = []
+    for array_name in array_function.input_array:
+        if array_name.upper() not in input_arrays:
+            raise ValueError(f'No values provided for input array {array_name}.')
+        input_values = np.asarray(input_arrays[array_name.upper()], dtype=float)
+        inputs.append(np.broadcast_to(input_values, (number_of_cells,)))
+
+    mask = box_mask(array_function.blocks, range_x, range_y, range_z)
+    if array_function.region_number is not None:
+        if region_array is None:
+            raise ValueError(f'Region array {array_function.region_type} required to evaluate grid array function.')
+        mask &= np.isin(region_array, array_function.region_number)
+    if array_function.input_range is not None:
+        for (range_min, range_max), input_values in zip(array_function.input_range, inputs):
+            mask &= (input_values >= range_min) & (input_values <= range_max)
+
+    masked_inputs = [input_values[mask] for input_values in inputs]
+    results = _apply_array_function(array_function, masked_inputs)
+
+    output_arrays: dict[str, GridArrayDefinition] = {}
+    for output_number, (array_name, output_result) in enumerate(zip(array_function.output_array, results)):
+        result = output_result
+        if array_function.output_range is not None and output_number < len(array_function.output_range):
+            range_min, range_max = array_function.output_range[output_number]
+            result = np.clip(result, range_min, range_max)
+        existing_values = existing_output_arrays.get(array_name.upper(), None)
+        if existing_values is None:
+            output_values = np.full(number_of_cells, np.nan)
+        else:
+            output_values = np.array(np.broadcast_to(np.asarray(existing_values, dtype=float), (number_of_cells,)))
+        output_values[mask] = result
+        output_arrays[array_name.upper()] = GridArrayDefinition(name=array_name.upper(), modifier='VALUE',
+                                                                array=output_values)
+    return output_arrays
+
+
+def _apply_array_function(array_function: NexusGridArrayFunction,
+                          inputs: list[np.ndarray]) -> list[np.ndarray]:
+    """Evaluates the function on the (already masked) input arrays, returning one array per output array."""
+    output_names = array_function.output_array if array_function.output_array is not None else []
+    coefficients = array_function.function_values if array_function.function_values is not None else []
+    x = inputs[0]
+
+    if array_function.function_type == GridFunctionTypeEnum.FUNCTION_TABLE:
+        return _interpolate_function_table(array_function, inputs)
+    if array_function.function_type in [GridFunctionTypeEnum.GE, GridFunctionTypeEnum.LE] and len(coefficients) < 2:
+        raise ValueError(f'ANALYT {array_function.function_type.value} requires two coefficients.')
+    if array_function.function_type in TWO_INPUT_FUNCTION_TYPES and len(inputs) < 2:
+        raise ValueError(f'ANALYT {array_function.function_type.value} requires two input arrays.')
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        match array_function.function_type:
+            case GridFunctionTypeEnum.POLYN:
+                result = np.polyval(coefficients, x)
+            case GridFunctionTypeEnum.ABS:
+                result = np.abs(x)
+            case GridFunctionTypeEnum.EXP:
+                result = np.exp(x)
+            case GridFunctionTypeEnum.EXP10:
+                result = np.power(10.0, x)
+            case GridFunctionTypeEnum.LOG:
+                result = np.log(np.abs(x))
+            case GridFunctionTypeEnum.LOG10:
+                result = np.log10(np.abs(x))
+            case GridFunctionTypeEnum.SQRT:
+                result = np.sqrt(np.abs(x))
+            case GridFunctionTypeEnum.GE:
+                result = np.where(x >= coefficients[0], x, coefficients[1])
+            case GridFunctionTypeEnum.LE:
+                result = np.where(x <= coefficients[0], x, coefficients[1])
+            case GridFunctionTypeEnum.ADD:
+                result = x + inputs[1]
+            case GridFunctionTypeEnum.SUBT:
+                result = x - inputs[1]
+            case GridFunctionTypeEnum.DIV:
+                result = np.divide(x, inputs[1], out=x.copy(), where=inputs[1] != 0)
+            case GridFunctionTypeEnum.MULT:
+                result = x * inputs[1]
+            case GridFunctionTypeEnum.MIN:
+                result = np.minimum(x, inputs[1])
+            case GridFunctionTypeEnum.MAX:
+                result = np.maximum(x, inputs[1])
+            case _:
+                raise NotImplementedError(f'Function type {array_function.function_type} is not supported.')
+    return [result] * len(output_names)
+
+
+def _interpolate_function_table(array_function: NexusGridArrayFunction,
+                                inputs: list[np.ndarray]) -> list[np.ndarray]:
+    """Linearly interpolates each output column of a single input function table.
+
+    Values outside the table are held at the first or last table entry.
+    """
+    function_table = array_function.function_table
+    if function_table is None or array_function.input_array is None or array_function.output_array is None:
+        raise ValueError('No function table found to evaluate the tabular grid array function.')
+    if len(inputs) != 1:
+        raise NotImplementedError('Only function tables with a single input array are supported for evaluation.')
+    input_column = array_function.input_array[0]
+    sorted_table = function_table.sort_values(input_column)
+    table_inputs = sorted_table[input_column].to_numpy(dtype=float)
+    return [np.interp(inputs[0], table_inputs, sorted_table[output_column].to_numpy(dtype=float))
+            for output_column in array_function.output_array]
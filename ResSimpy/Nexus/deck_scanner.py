@@ -0,0 +1,468 @@
+"""Scanner for collections of Nexus decks, building a persistent SQLite index of their files, wells and dates.
+
+The DeckIndex walks directories for FCS files and opens each deck with NexusSimulator.open_header_only in a process
+pool, recording the files listed in the FCS and the files they include with their hashes, the well names from the
+WELLSPEC tables and the start date and times from the runcontrol file. Rescans only reopen decks whose FCS file, listed
+files or included files have changed modification time, so that questions such as which decks use a given PVT file
+or contain a given well can be answered across many thousands of decks from the index.
+
+Examples:
+    >>> from ResSimpy.Nexus.deck_scanner import DeckIndex
+    >>> index = DeckIndex('/path/to/deck_index.sqlite')
+    >>> index.scan(['/path/to/archived/decks'])
+    >>> index.find_decks_using_file('pvt_method_1.dat')
+    >>> index.find_decks_with_well('WELL_1')
+"""
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import os
+import sqlite3
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+import ResSimpy.FileOperations.file_operations as fo
+import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.FileOperations.File import File
+from ResSimpy.Nexus.DataModels.FcsFile import FcsNexusFile
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decks (
+    fcs_path TEXT PRIMARY KEY,
+    fcs_mtime REAL NOT NULL,
+    start_date TEXT,
+    run_units TEXT,
+    default_units TEXT,
+    date_format TEXT
+);
+CREATE TABLE IF NOT EXISTS files (
+    fcs_path TEXT NOT NULL REFERENCES decks(fcs_path) ON DELETE CASCADE,
+    keyword TEXT NOT NULL,
+    method_number INTEGER,
+    path TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    mtime REAL,
+    size INTEGER,
+    hash TEXT
+);
+CREATE TABLE IF NOT EXISTS wells (
+    fcs_path TEXT NOT NULL REFERENCES decks(fcs_path) ON DELETE CASCADE,
+    well_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS times (
+    fcs_path TEXT NOT NULL REFERENCES decks(fcs_path) ON DELETE CASCADE,
+    time TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_fcs_path ON files(fcs_path);
+CREATE INDEX IF NOT EXISTS files_path ON files(path);
+CREATE INDEX IF NOT EXISTS files_file_name ON files(file_name);
+CREATE INDEX IF NOT EXISTS files_hash ON files(hash);
+CREATE INDEX IF NOT EXISTS wells_fcs_path ON wells(fcs_path);
+CREATE INDEX IF NOT EXISTS wells_well_name ON wells(well_name);
+CREATE INDEX IF NOT EXISTS times_fcs_path ON times(fcs_path);
+"""
+
+
+@dataclass(frozen=True)
+class ScannedFile:
+    """A file listed in the FCS file of a scanned deck, or included from one of those files.
+
+    Attributes:
+        keyword (str): the FCS keyword that the file is listed under, e.g. PVT, or INCLUDE for a file included from
+            the runcontrol or wells files.
+        method_number (Optional[int]): the method or set number for keywords with multiple files, otherwise None.
+        path (str): full path to the file.
+        mtime (Optional[float]): modification time of the file, None if the file is missing.
+        size (Optional[int]): size of the file in bytes, None if the file is missing.
+        hash (Optional[str]): hex digest of the contents of the file, None if the file is missing.
+    """
+    keyword: str
+    method_number: Optional[int]
+    path: str
+    mtime: Optional[float]
+    size: Optional[int]
+    hash: Optional[str]
+
+
+@dataclass
+class ScannedDeck:
+    """The information recorded in the index for a single deck.
+
+    Attributes:
+        fcs_path (str): full path to the FCS file.
+        fcs_mtime (float): modification time of the FCS file.
+        start_date (Optional[str]): start date of the model from the runcontrol file.
+        run_units (Optional[str]): the run units of the model.
+        default_units (Optional[str]): the default units of the model.
+        date_format (Optional[str]): the date format of the model.
+        times (list[str]): the times from the runcontrol file.
+        files (list[ScannedFile]): the files listed in the FCS file, including the FCS file itself, and the files
+            included from the runcontrol and wells files.
+        wells (list[str]): the names of the wells in the WELLSPEC tables of the wells files.
+    """
+    fcs_path: str
+    fcs_mtime: float
+    start_date: Optional[str] = None
+    run_units: Optional[str] = None
+    default_units: Optional[str] = None
+    date_format: Optional[str] = None
+    times: list[str] = field(default_factory=list)
+    files: list[ScannedFile] = field(default_factory=list)
+    wells: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ScanSummary:
+    """The outcome of a DeckIndex scan.
+
+    Attributes:
+        scanned (list[str]): FCS paths of the decks that were opened and indexed.
+        unchanged (list[str]): FCS paths of the decks that were skipped as unchanged since the last scan.
+        removed (list[str]): FCS paths of the decks removed from the index as they no longer exist.
+        failed (dict[str, str]): error messages for the decks that could not be opened, keyed by FCS path.
+    """
+    scanned: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+def hash_file(file_path: str) -> str:
+    """Returns the blake2b hex digest of the contents of a file, reading it in chunks.
+
+    Args:
+        file_path (str): path to the file to hash.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _scan_file(keyword: str, method_number: Optional[int], path: str,
+               known_files: dict[str, tuple[float, int, str]]) -> ScannedFile:
+    """Records the modification time, size and hash of a file, reusing the known hash if the file is unchanged."""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return ScannedFile(keyword=keyword, method_number=method_number, path=path, mtime=None, size=None, hash=None)
+    mtime, size = stat_result.st_mtime, stat_result.st_size
+    known_file = known_files.get(path)
+    if known_file is not None and known_file[0] == mtime and known_file[1] == size:
+        file_hash: Optional[str] = known_file[2]
+    else:
+        try:
+            file_hash = hash_file(path)
+        except OSError:
+            file_hash = None
+    return ScannedFile(keyword=keyword, method_number=method_number, path=path, mtime=mtime, size=size,
+                       hash=file_hash)
+
+
+def _included_file_paths(nexus_file: File) -> Iterator[str]:
+    """Yields the full path of each file included from a file, and from the files it includes."""
+    for include_file in nexus_file.include_objects or []:
+        if include_file.location is not None:
+            yield os.path.abspath(include_file.location)
+        yield from _included_file_paths(include_file)
+
+
+def _read_well_names(wells_file: NexusFile) -> list[str]:
+    """Returns the names of the wells in the WELLSPEC tables of a wells file and its includes."""
+    file_content = wells_file.get_flat_list_str_file
+    well_names = []
+    for i, line in enumerate(file_content):
+        if 'WELLSPEC' not in line.upper() or not nfo.check_token('WELLSPEC', line):
+            continue
+        well_name = fo.get_token_value_at('WELLSPEC', file_content, i)
+        if well_name is not None:
+            well_names.append(well_name)
+    return list(dict.fromkeys(well_names))
+
+
+def scan_deck(fcs_path: str, known_files: Optional[dict[str, tuple[float, int, str]]] = None) -> ScannedDeck:
+    """Opens a deck with only its header loaded and records its files, wells and dates.
+
+    Runs in the worker processes of DeckIndex.scan, so is a module level function.
+
+    Args:
+        fcs_path (str): full path to the FCS file.
+        known_files (Optional[dict[str, tuple[float, int, str]]]): the modification time, size and hash of files \
+        already in the index, keyed by path. Files with the same modification time and size are not hashed again.
+
+    Returns:
+        ScannedDeck: the information to record in the index for the deck.
+    """
+    # imported here as the NexusSimulator imports are only needed in the worker processes
+    from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+
+    known_files = {} if known_files is None else known_files
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        model = NexusSimulator.open_header_only(fcs_path)
+
+    deck = ScannedDeck(fcs_path=fcs_path, fcs_mtime=os.stat(fcs_path).st_mtime, start_date=model.start_date or None,
+                       run_units=model.run_units.name, default_units=model.default_units.name,
+                       date_format=model.date_format.name, times=list(model.sim_controls.times or []))
+    deck.files.append(_scan_file('FCS', None, fcs_path, known_files))
+    included_paths: list[str] = []
+    model_files = model.model_files
+    for keyword, attribute in FcsNexusFile.fcs_keyword_map_single().items():
+        nexus_file = getattr(model_files, attribute, None)
+        if nexus_file is not None and nexus_file.location is not None:
+            full_path = os.path.abspath(fo.get_full_file_path(nexus_file.location, fcs_path))
+            deck.files.append(_scan_file(keyword, None, full_path, known_files))
+            if keyword == 'RUNCONTROL':
+                included_paths.extend(_included_file_paths(nexus_file))
+    for keyword, attribute in FcsNexusFile.fcs_keyword_map_multi().items():
+        method_files: Optional[dict[int, NexusFile]] = getattr(model_files, attribute, None)
+        if not method_files:
+            continue
+        for method_number, nexus_file in method_files.items():
+            if nexus_file.location is None:
+                continue
+            full_path = os.path.abspath(fo.get_full_file_path(nexus_file.location, fcs_path))
+            deck.files.append(_scan_file(keyword, method_number, full_path, known_files))
+            if keyword == 'WELLS' and deck.files[-1].mtime is not None:
+                wells_file = NexusFile.generate_file_include_structure(simulator_type=NexusFile, file_path=full_path,
+                                                                       origin=fcs_path, top_level_file=True)
+                included_paths.extend(_included_file_paths(wells_file))
+                deck.wells.extend(x for x in _read_well_names(wells_file) if x not in deck.wells)
+    # the includes are recorded so that editing one of them marks the deck as changed on the next scan
+    for included_path in dict.fromkeys(included_paths):
+        deck.files.append(_scan_file('INCLUDE', None, included_path, known_files))
+    return deck
+
+
+class DeckIndex:
+    """A persistent SQLite index of the files, wells and dates of a collection of Nexus decks.
+
+    Attributes:
+        database_path (str): path to the SQLite database file. Created if it doesn't exist.
+    """
+    database_path: str
+
+    def __init__(self, database_path: str) -> None:
+        """Initialises the DeckIndex class, creating the index tables if they don't exist.
+
+        Args:
+            database_path (str): path to the SQLite database file. Use ':memory:' for an index that isn't persisted.
+        """
+        self.database_path = database_path
+        self.__connection = sqlite3.connect(database_path)
+        self.__connection.execute('PRAGMA foreign_keys = ON')
+        self.__connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self.__connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @staticmethod
+    def find_fcs_files(directories: Iterable[str], pattern: str = '*.fcs') -> Iterator[str]:
+        """Walks the directories, yielding the full path of each FCS file found.
+
+        Args:
+            directories (Iterable[str]): the directories to search.
+            pattern (str): the file name pattern for FCS files, matched case insensitively. Defaults to '*.fcs'.
+        """
+        for directory in directories:
+            for root, _, file_names in os.walk(directory):
+                for file_name in file_names:
+                    if fnmatch.fnmatch(file_name.lower(), pattern.lower()):
+                        yield os.path.abspath(os.path.join(root, file_name))
+
+    def scan(self, directories: Iterable[str], processes: Optional[int] = None, pattern: str = '*.fcs',
+             remove_missing: bool = True) -> ScanSummary:
+        """Indexes the decks found in the directories, skipping those unchanged since the last scan.
+
+        A deck is unchanged if neither its FCS file, the files listed in it nor the files included from its runcontrol \
+        and wells files have a different modification time from when it was last indexed. A deck that raises an error \
+        while being opened is recorded as failed, and the scan carries on with the other decks.
+
+        Args:
+            directories (Iterable[str]): the directories to search for FCS files.
+            processes (Optional[int]): the number of worker processes to open the decks in. Defaults to the number \
+            of CPUs. If 1 the decks are opened in this process.
+            pattern (str): the file name pattern for FCS files. Defaults to '*.fcs'.
+            remove_missing (bool): if True removes decks from the index that are in the directories scanned but no \
+            longer exist. Defaults to True.
+
+        Returns:
+            ScanSummary: the decks that were scanned, unchanged, removed or failed.
+        """
+        directories = [os.path.abspath(x) for x in directories]
+        summary = ScanSummary()
+        found_fcs_paths = set()
+        decks_to_scan: dict[str, dict[str, tuple[float, int, str]]] = {}
+        for fcs_path in self.find_fcs_files(directories, pattern):
+            found_fcs_paths.add(fcs_path)
+            if self.__is_unchanged(fcs_path):
+                summary.unchanged.append(fcs_path)
+            else:
+                decks_to_scan[fcs_path] = self.__known_files(fcs_path)
+
+        for fcs_path, result in self.__scan_decks(decks_to_scan, processes):
+            if isinstance(result, ScannedDeck):
+                self.__store_deck(result)
+                summary.scanned.append(fcs_path)
+            else:
+                summary.failed[fcs_path] = result
+
+        if remove_missing:
+            for (fcs_path,) in self.__connection.execute('SELECT fcs_path FROM decks').fetchall():
+                in_directories = any(fcs_path.startswith(os.path.join(x, '')) for x in directories)
+                if in_directories and fcs_path not in found_fcs_paths:
+                    self.remove_deck(fcs_path)
+                    summary.removed.append(fcs_path)
+        return summary
+
+    @staticmethod
+    def __scan_decks(decks_to_scan: dict[str, dict[str, tuple[float, int, str]]],
+                     processes: Optional[int]) -> Iterator[tuple[str, ScannedDeck | str]]:
+        """Opens the decks, yielding the scanned deck or the error message for each FCS path."""
+        if not decks_to_scan:
+            return
+        if processes == 1:
+            for fcs_path, known_files in decks_to_scan.items():
+                try:
+                    yield fcs_path, scan_deck(fcs_path, known_files)
+                except Exception as error:  # noqa: BLE001
+                    # any error parsing a single deck is recorded rather than stopping the scan of the others
+                    yield fcs_path, f'{type(error).__name__}: {error}'
+            return
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = {fcs_path: executor.submit(scan_deck, fcs_path, known_files)
+                       for fcs_path, known_files in decks_to_scan.items()}
+            for fcs_path, future in futures.items():
+                try:
+                    yield fcs_path, future.result()
+                except Exception as error:  # noqa: BLE001
+                    yield fcs_path, f'{type(error).__name__}: {error}'
+
+    def __is_unchanged(self, fcs_path: str) -> bool:
+        """Returns True if the deck is in the index and none of its files have changed modification time."""
+        row = self.__connection.execute('SELECT fcs_mtime FROM decks WHERE fcs_path = ?', (fcs_path,)).fetchone()
+        if row is None:
+            return False
+        try:
+            if os.stat(fcs_path).st_mtime != row[0]:
+                return False
+        except OSError:
+            return False
+        for path, mtime in self.__connection.execute('SELECT path, mtime FROM files WHERE fcs_path = ?',
+                                                     (fcs_path,)):
+            try:
+                current_mtime: Optional[float] = os.stat(path).st_mtime
+            except OSError:
+                current_mtime = None
+            if current_mtime != mtime:
+                return False
+        return True
+
+    def __known_files(self, fcs_path: str) -> dict[str, tuple[float, int, str]]:
+        """Returns the modification time, size and hash of the files already indexed for the deck."""
+        rows = self.__connection.execute('SELECT path, mtime, size, hash FROM files WHERE fcs_path = ? AND '
+                                         'hash IS NOT NULL', (fcs_path,))
+        return {path: (mtime, size, file_hash) for path, mtime, size, file_hash in rows}
+
+    def __store_deck(self, deck: ScannedDeck) -> None:
+        """Replaces the indexed information for a deck."""
+        with self.__connection:
+            self.__connection.execute('DELETE FROM decks WHERE fcs_path = ?', (deck.fcs_path,))
+            self.__connection.execute('INSERT INTO decks VALUES (?, ?, ?, ?, ?, ?)',
+                                      (deck.fcs_path, deck.fcs_mtime, deck.start_date, deck.run_units,
+                                       deck.default_units, deck.date_format))
+            self.__connection.executemany(
+                'INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(deck.fcs_path, x.keyword, x.method_number, x.path, os.path.basename(x.path), x.mtime, x.size,
+                  x.hash) for x in deck.files])
+            self.__connection.executemany('INSERT INTO wells VALUES (?, ?)',
+                                          [(deck.fcs_path, x) for x in deck.wells])
+            self.__connection.executemany('INSERT INTO times VALUES (?, ?)',
+                                          [(deck.fcs_path, x) for x in deck.times])
+
+    def remove_deck(self, fcs_path: str) -> None:
+        """Removes a deck and its files, wells and times from the index.
+
+        Args:
+            fcs_path (str): full path to the FCS file of the deck.
+        """
+        with self.__connection:
+            self.__connection.execute('DELETE FROM decks WHERE fcs_path = ?', (fcs_path,))
+
+    def get_deck(self, fcs_path: str) -> Optional[ScannedDeck]:
+        """Returns the indexed information for a deck, None if it isn't in the index.
+
+        Args:
+            fcs_path (str): full path to the FCS file of the deck.
+        """
+        row = self.__connection.execute('SELECT * FROM decks WHERE fcs_path = ?', (fcs_path,)).fetchone()
+        if row is None:
+            return None
+        deck = ScannedDeck(*row)
+        deck.files = [ScannedFile(*x) for x in self.__connection.execute(
+            'SELECT keyword, method_number, path, mtime, size, hash FROM files WHERE fcs_path = ? ORDER BY rowid',
+            (fcs_path,))]
+        deck.wells = [x for (x,) in self.__connection.execute(
+            'SELECT well_name FROM wells WHERE fcs_path = ? ORDER BY rowid', (fcs_path,))]
+        deck.times = [x for (x,) in self.__connection.execute(
+            'SELECT time FROM times WHERE fcs_path = ? ORDER BY rowid', (fcs_path,))]
+        return deck
+
+    def find_decks_using_file(self, file_path_or_name: str, keyword: Optional[str] = None) -> list[str]:
+        """Returns the FCS paths of the decks that list a file in their FCS file, or include it.
+
+        Args:
+            file_path_or_name (str): the path of the file, or only its file name to match in any directory. Paths \
+            are made absolute and normalised before matching.
+            keyword (Optional[str]): only match files listed under this FCS keyword, e.g. PVT. Defaults to None.
+        """
+        if os.path.dirname(file_path_or_name):
+            # stored paths are made absolute when the decks are scanned, which also normalises them
+            query = 'SELECT DISTINCT fcs_path FROM files WHERE path = ?'
+            parameters: tuple[str, ...] = (os.path.abspath(file_path_or_name),)
+        else:
+            query = 'SELECT DISTINCT fcs_path FROM files WHERE file_name = ?'
+            parameters = (file_path_or_name,)
+        if keyword is not None:
+            query += ' AND keyword = ?'
+            parameters += (keyword.upper(),)
+        return [x for (x,) in self.__connection.execute(query + ' ORDER BY fcs_path', parameters)]
+
+    def find_decks_with_file_hash(self, file_hash: str) -> list[str]:
+        """Returns the FCS paths of the decks that list a file with the given contents hash, as from hash_file.
+
+        Args:
+            file_hash (str): the hex digest of the file contents.
+        """
+        return [x for (x,) in self.__connection.execute(
+            'SELECT DISTINCT fcs_path FROM files WHERE hash = ? ORDER BY fcs_path', (file_hash,))]
+
+    def find_decks_with_well(self, well_name: str) -> list[str]:
+        """Returns the FCS paths of the decks with a well of the given name in their WELLSPEC tables.
+
+        Args:
+            well_name (str): the name of the well.
+        """
+        return [x for (x,) in self.__connection.execute(
+            'SELECT DISTINCT fcs_path FROM wells WHERE well_name = ? ORDER BY fcs_path', (well_name,))]
@@ -0,0 +1,235 @@
+"""Functions for applying Nexus OVER, TOVER and MULTIR modifiers to transmissibility and pore volume arrays.
+
+The arrays are flat numpy arrays in Nexus ordering (i fastest, then j, then k). All operations are carried out on
+(k, j, i) views of the arrays so that each modifier is applied to a whole box in a single numpy operation.
+"""
+from __future__ import annotations
+
+import os
+import warnings
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ResSimpy.DataModelBaseClasses.GridArrayDefinition import GridArrayDefinition
+from ResSimpy.FileOperations import file_operations as fo
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusMultir import NexusMultir
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusOver import NexusOver
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusTOver import NexusTOver
+from ResSimpy.Utils.structured_grid_indexing import (ARITHMETIC_OPERATORS, KEYWORD_OPERATOR_MAPPING, as_3d_view,
+                                                     box_slices)
+
+# axis of the (k, j, i) view that each transmissibility array connects along
+TRANSMISSIBILITY_AXES = {'TX': 2, 'TY': 1, 'TZ': 0}
+
+
+def apply_grid_modifiers(base_arrays: dict[str, np.ndarray], range_x: int, range_y: int, range_z: int,
+                         overs: Optional[Sequence[NexusOver]] = None,
+                         tovers: Optional[Sequence[NexusTOver]] = None,
+                         multirs: Optional[Sequence[NexusMultir]] = None,
+                         multir_region_array: Optional[np.ndarray] = None,
+                         include_root: Optional[str] = None) -> dict[str, np.ndarray]:
+    """Applies MULTIR, OVER and TOVER modifiers (in that order) to a set of base arrays.
+
+    Args:
+        base_arrays (dict[str, np.ndarray]): flat base arrays keyed by array name, e.g. 'TX', 'TY', 'TZ', 'PV'. \
+        The base arrays are not modified.
+        range_x (int): number of cells in the i direction (NX).
+        range_y (int): number of cells in the j direction (NY).
+        range_z (int): number of cells in the k direction (NZ).
+        overs (Optional[Sequence[NexusOver]]): OVER operations in the order they appear in the grid file.
+        tovers (Optional[Sequence[NexusTOver]]): TOVER operations in the order they appear in the grid file.
+        multirs (Optional[Sequence[NexusMultir]]): MULTIR region to region multipliers.
+        multir_region_array (Optional[np.ndarray]): flat array of region numbers used by the MULTIR table.
+        include_root (Optional[str]): directory to resolve relative TOVER include files against.
+
+    Returns:
+        dict[str, np.ndarray]: the effective arrays keyed by array name.
+    """
+    effective_arrays = {name.upper(): np.array(array, dtype=float) for name, array in base_arrays.items()}
+    views = {name: as_3d_view(array, range_x, range_y, range_z) for name, array in effective_arrays.items()}
+
+    if multirs:
+        if multir_region_array is None:
+            raise ValueError('A region array is required to apply MULTIR multipliers.')
+        region_view = as_3d_view(np.asarray(multir_region_array), range_x, range_y, range_z)
+        apply_multirs(views, multirs, region_view)
+    if overs:
+        apply_overs(views, overs)
+    if tovers:
+        apply_tovers(views, tovers, include_root=include_root)
+    return effective_arrays
+
+
+def apply_overs(views: dict[str, np.ndarray], overs: Sequence[NexusOver]) -> None:
+    """Applies OVER operations in place to (k, j, i) views of the arrays.
+
+    Consecutive arithmetic operations on the same array and box are combined into a single multiply and add so the
+    box is only visited once. GE and LE replace values greater than or equal to (or less than or equal to) the
+    threshold with the value.
+
+    Args:
+        views (dict[str, np.ndarray]): (k, j, i) views of the arrays to modify keyed by upper case array name.
+        overs (Sequence[NexusOver]): OVER operations in the order they appear in the grid file.
+    """
+    for array_name, box, operations in _batch_overs(overs):
+        view = views.get(array_name, None)
+        if view is None:
+            warnings.warn(f'No base array provided for OVER on {array_name}, skipping.')
+            continue
+        cells = view[box_slices(*box)]
+        if operations[0][0] in ['GE', 'LE']:
+            operator, value, threshold = operations[0]
+            replace = cells >= threshold if operator == 'GE' else cells <= threshold
+            cells[replace] = value
+            continue
+        scale, shift = _combine_affine_operations([(operator, value) for operator, value, _ in operations])
+        if scale == 0.0:
+            cells[...] = shift
+        else:
+            cells *= scale
+            cells += shift
+
+
+def apply_tovers(views: dict[str, np.ndarray], tovers: Sequence[NexusTOver],
+                 include_root: Optional[str] = None) -> None:
+    """Applies TOVER operations in place, using a value per cell for each box.
+
+    TX+ refers to the connection from a cell to the next cell in the i direction, which is the TX value stored for
+    the cell. TX- refers to the connection to the previous cell, so is stored on the neighbouring cell.
+
+    Args:
+        views (dict[str, np.ndarray]): (k, j, i) views of the arrays to modify keyed by upper case array name.
+        tovers (Sequence[NexusTOver]): TOVER operations in the order they appear in the grid file.
+        include_root (Optional[str]): directory to resolve relative include files against.
+    """
+    for tover in tovers:
+        if tover.grid is not None and tover.grid.upper() != 'ROOT':
+            warnings.warn(f'Applying TOVER to LGR {tover.grid} is not supported, skipping.')
+            continue
+        array_name = tover.array.upper().rstrip('+-')
+        view = views.get(array_name, None)
+        if view is None or array_name not in TRANSMISSIBILITY_AXES:
+            warnings.warn(f'No base array provided for TOVER on {tover.array}, skipping.')
+            continue
+        operator = KEYWORD_OPERATOR_MAPPING.get(tover.operator.upper(), None)
+        if operator is None:
+            raise ValueError(f'Unsupported TOVER operator {tover.operator}.')
+
+        box_shape = (tover.k2 - tover.k1 + 1, tover.j2 - tover.j1 + 1, tover.i2 - tover.i1 + 1)
+        values = _tover_values(tover, include_root).reshape(box_shape)
+        box = list(box_slices(tover.i1, tover.i2, tover.j1, tover.j2, tover.k1, tover.k2))
+        if tover.array.endswith('-'):
+            # the minus face of a cell is the plus face of the previous cell, which doesn't exist for the first cell
+            axis = TRANSMISSIBILITY_AXES[array_name]
+            start = box[axis].start - 1
+            if start < 0:
+                values = np.delete(values, 0, axis=axis)
+            box[axis] = slice(max(start, 0), box[axis].stop - 1)
+        cells = view[tuple(box)]
+
+        match operator:
+            case '*':
+                cells *= values
+            case '/':
+                cells /= values
+            case '+':
+                cells += values
+            case '-':
+                cells -= values
+            case '=':
+                cells[...] = values
+
+
+def apply_multirs(views: dict[str, np.ndarray], multirs: Sequence[NexusMultir], region_view: np.ndarray) -> None:
+    """Applies MULTIR multipliers in place to the TX, TY and TZ arrays between cells in the two regions.
+
+    Args:
+        views (dict[str, np.ndarray]): (k, j, i) views of the arrays to modify keyed by upper case array name.
+        multirs (Sequence[NexusMultir]): MULTIR region to region multipliers.
+        region_view (np.ndarray): (k, j, i) view of the region numbers.
+    """
+    for array_name, axis in TRANSMISSIBILITY_AXES.items():
+        view = views.get(array_name, None)
+        if view is None:
+            continue
+        direction = array_name[-1]
+        # pair every cell with its neighbour in the positive direction along this axis
+        lower = [slice(None)] * 3
+        upper = [slice(None)] * 3
+        lower[axis] = slice(None, -1)
+        upper[axis] = slice(1, None)
+        region_from = region_view[tuple(lower)]
+        region_to = region_view[tuple(upper)]
+        connections = view[tuple(lower)]
+        for multir in multirs:
+            if not multir.std_connections or (multir.directions is not None and direction not in multir.directions):
+                continue
+            between_regions = (((region_from == multir.region_1) & (region_to == multir.region_2)) |
+                               ((region_from == multir.region_2) & (region_to == multir.region_1)))
+            connections[between_regions] *= multir.tmult
+
+
+def _batch_overs(overs: Sequence[NexusOver]) -> list[tuple[str, tuple[int, ...], list[tuple[str, float, float]]]]:
+    """Groups consecutive OVER operations on the same array and box into batches.
+
+    GE and LE operations are always in a batch on their own. OVERs on LGRs or named faults are skipped.
+    """
+    batches: list[tuple[str, tuple[int, ...], list[tuple[str, float, float]]]] = []
+    for over in overs:
+        if over.grid is not None and over.grid.upper() != 'ROOT':
+            warnings.warn(f'Applying OVER to LGR {over.grid} is not supported, skipping.')
+            continue
+        if over.fault_name is not None:
+            warnings.warn(f'Applying OVER to fault connections for {over.fault_name} is not supported, skipping.')
+            continue
+        operator = over.operator.upper()
+        if operator not in [*ARITHMETIC_OPERATORS, 'GE', 'LE']:
+            raise ValueError(f'Unsupported OVER operator {over.operator}.')
+        if operator in ['GE', 'LE'] and over.threshold is None:
+            raise ValueError(f'OVER {operator} requires a threshold value.')
+        if operator == '/' and over.value == 0:
+            raise ValueError(f'OVER {over.array} {over.i1} {over.i2} {over.j1} {over.j2} {over.k1} {over.k2} /0 '
+                             f'divides by zero.')
+        threshold = over.threshold if over.threshold is not None else np.nan
+        array_name = over.array.upper()
+        box = (over.i1, over.i2, over.j1, over.j2, over.k1, over.k2)
+        operation = (operator, over.value, threshold)
+        previous = batches[-1] if batches else None
+        if (previous is not None and previous[0] == array_name and previous[1] == box and
+                operator in ARITHMETIC_OPERATORS and previous[2][0][0] in ARITHMETIC_OPERATORS):
+            previous[2].append(operation)
+        else:
+            batches.append((array_name, box, [operation]))
+    return batches
+
+
+def _combine_affine_operations(operations: list[tuple[str, float]]) -> tuple[float, float]:
+    """Combines a sequence of arithmetic operations into a single scale and shift (x * scale + shift)."""
+    scale, shift = 1.0, 0.0
+    for operator, value in operations:
+        match operator:
+            case '*':
+                scale, shift = scale * value, shift * value
+            case '/':
+                scale, shift = scale / value, shift / value
+            case '+':
+                shift += value
+            case '-':
+                shift -= value
+            case '=':
+                scale, shift = 0.0, value
+    return scale, shift
+
+
+def _tover_values(tover: NexusTOver, include_root: Optional[str]) -> np.ndarray:
+    """Returns the per cell values for a TOVER from either the inline values or the include file."""
+    if tover.array_values is not None:
+        return np.asarray(tover.array_values, dtype=float)
+    if tover.include_file is None:
+        raise ValueError(f'No values found for TOVER on {tover.array}.')
+    include_path = tover.include_file
+    if include_root is not None and not os.path.isabs(include_path):
+        include_path = os.path.join(include_root, include_path)
+    file_as_list = fo.load_file_as_list(include_path)
+    return GridArrayDefinition.grid_file_as_list_to_numpy_array(file_as_list, None, None, None)
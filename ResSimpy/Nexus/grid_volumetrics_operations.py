@@ -0,0 +1,160 @@
+"""Functions for calculating bulk volume, pore volume and hydrocarbon pore volume from Nexus grid arrays.
+
+The calculation is carried out one K-layer at a time, so only a single layer of each input array needs to be in memory
+at once. This allows inputs to be memory mapped numpy arrays for very large grids. All volumes are in the units of the
+grid dimensions, e.g. ft3 for a grid with DX, DY and DZ in ft.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from ResSimpy.Utils.structured_grid_indexing import grid_shape
+
+VOLUMETRICS_COLUMNS = ['BULK_VOLUME', 'PORE_VOLUME', 'HCPV']
+
+
+@dataclass(kw_only=True)
+class GridVolumetrics:
+    """Class holding the total volumes for a grid and the totals for each region.
+
+    Attributes:
+        bulk_volume (float): total bulk volume of the grid.
+        pore_volume (float): total pore volume after PVMULT and TOLPV have been applied.
+        hydrocarbon_pore_volume (float): total pore volume multiplied by (1 - SW).
+        region_totals (dict[str, pd.DataFrame]): volumes per region number, keyed by the name of the region array. \
+        Each dataframe is indexed by region number with columns BULK_VOLUME, PORE_VOLUME and HCPV.
+    """
+    bulk_volume: float = 0.0
+    pore_volume: float = 0.0
+    hydrocarbon_pore_volume: float = 0.0
+    region_totals: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+
+def calculate_volumetrics(dx: np.ndarray | float, dy: np.ndarray | float, dz: np.ndarray | float,
+                          range_x: int, range_y: int, range_z: int,
+                          netgrs: np.ndarray | float = 1.0, porosity: np.ndarray | float = 0.0,
+                          sw: np.ndarray | float = 0.0, pvmult: np.ndarray | float = 1.0,
+                          tolpv: Optional[float] = None,
+                          region_arrays: Optional[Mapping[str, np.ndarray]] = None,
+                          cell_outputs: Optional[Mapping[str, np.ndarray]] = None) -> GridVolumetrics:
+    """Calculates the bulk volume, pore volume and hydrocarbon pore volume for a grid, streaming over K-layers.
+
+    Each input can either be a single value or a flat array (including np.memmap) with one value per cell.
+
+    Args:
+        dx (np.ndarray | float): cell size in the i direction.
+        dy (np.ndarray | float): cell size in the j direction.
+        dz (np.ndarray | float): cell size in the k direction.
+        range_x (int): number of cells in the i direction (NX).
+        range_y (int): number of cells in the j direction (NY).
+        range_z (int): number of cells in the k direction (NZ).
+        netgrs (np.ndarray | float): net to gross ratio.
+        porosity (np.ndarray | float): porosity.
+        sw (np.ndarray | float): water saturation.
+        pvmult (np.ndarray | float): pore volume multiplier.
+        tolpv (Optional[float]): cells with a pore volume less than this value are treated as having no pore volume.
+        region_arrays (Optional[Mapping[str, np.ndarray]]): flat integer region arrays to total the volumes by, \
+        keyed by name, e.g. {'IEQUIL': iequil_array}. Region numbers must be non-negative.
+        cell_outputs (Optional[Mapping[str, np.ndarray]]): preallocated flat arrays to write the per cell results \
+        to, keyed by any of 'BULK_VOLUME', 'PORE_VOLUME' and 'HCPV'. These can also be memory mapped.
+
+    Returns:
+        GridVolumetrics: the total volumes and the totals for each region.
+    """
+    inputs = {'DX': dx, 'DY': dy, 'DZ': dz, 'NETGRS': netgrs, 'POROSITY': porosity, 'SW': sw, 'PVMULT': pvmult}
+    layer_inputs = {name: _as_layered(values, name, range_x, range_y, range_z) for name, values in inputs.items()}
+    layer_regions = {name: _as_layered_array(values, name, range_x, range_y, range_z)
+                     for name, values in (region_arrays or {}).items()}
+    layer_outputs = {name.upper(): _as_layered_array(values, name, range_x, range_y, range_z)
+                     for name, values in (cell_outputs or {}).items()}
+    unknown_outputs = set(layer_outputs) - set(VOLUMETRICS_COLUMNS)
+    if unknown_outputs:
+        raise ValueError(f'Unknown cell outputs {sorted(unknown_outputs)}, expected any of {VOLUMETRICS_COLUMNS}.')
+
+    totals = np.zeros(len(VOLUMETRICS_COLUMNS))
+    # the last column holds the number of cells, so that region numbers which are not used can be removed
+    region_sums = {name: np.zeros((0, len(VOLUMETRICS_COLUMNS) + 1)) for name in layer_regions}
+
+    for k in range(range_z):
+        layer = {name: values[k] if isinstance(values, np.ndarray) else values
+                 for name, values in layer_inputs.items()}
+        bulk_volume = np.broadcast_to(np.asarray(layer['DX'] * layer['DY'] * layer['DZ'], dtype=float),
+                                      (range_y, range_x))
+        pore_volume = bulk_volume * layer['NETGRS'] * layer['POROSITY'] * layer['PVMULT']
+        if tolpv is not None:
+            pore_volume = np.where(pore_volume < tolpv, 0.0, pore_volume)
+        hcpv = pore_volume * (1.0 - layer['SW'])
+        layer_volumes = {'BULK_VOLUME': bulk_volume, 'PORE_VOLUME': pore_volume, 'HCPV': hcpv}
+
+        for name, output in layer_outputs.items():
+            output[k] = layer_volumes[name]
+        totals += [layer_volumes[column].sum() for column in VOLUMETRICS_COLUMNS]
+
+        for name, regions in layer_regions.items():
+            region_numbers = np.asarray(regions[k]).astype(np.int64, copy=False).ravel()
+            if region_numbers.size and region_numbers.min() < 0:
+                raise ValueError(f'Region array {name} contains negative region numbers.')
+            layer_sums = np.stack([*(np.bincount(region_numbers, weights=layer_volumes[column].ravel())
+                                     for column in VOLUMETRICS_COLUMNS), np.bincount(region_numbers)], axis=1)
+            region_sums[name] = _add_padded(region_sums[name], layer_sums)
+
+    region_totals = {}
+    for name, sums in region_sums.items():
+        region_table = pd.DataFrame(sums[:, :-1], columns=VOLUMETRICS_COLUMNS)
+        region_table.index.name = 'REGION'
+        region_totals[name] = region_table[sums[:, -1] > 0]
+
+    return GridVolumetrics(bulk_volume=float(totals[0]), pore_volume=float(totals[1]),
+                           hydrocarbon_pore_volume=float(totals[2]), region_totals=region_totals)
+
+
+def open_memory_mapped_array(file_path: str, range_x: int, range_y: int, range_z: int,
+                             dtype: np.typing.DTypeLike = np.float64) -> np.ndarray:
+    """Opens a grid array stored in a binary file as a read only memory mapped flat array.
+
+    Files with a .npy extension are opened with np.load, anything else is treated as raw values in Nexus ordering.
+
+    Args:
+        file_path (str): path to the binary file.
+        range_x (int): number of cells in the i direction (NX).
+        range_y (int): number of cells in the j direction (NY).
+        range_z (int): number of cells in the k direction (NZ).
+        dtype (np.typing.DTypeLike): type of the values in a raw binary file.
+    """
+    cell_count = range_x * range_y * range_z
+    if os.path.splitext(file_path)[1].lower() == '.npy':
+        array = np.load(file_path, mmap_mode='r').reshape(-1)
+    else:
+        array = np.memmap(file_path, dtype=dtype, mode='r', shape=(cell_count,))
+    if array.size != cell_count:
+        raise ValueError(f'Array in {file_path} has {array.size} values, expected {cell_count}.')
+    return array
+
+
+def _as_layered(values: np.ndarray | float, name: str, range_x: int, range_y: int,
+                range_z: int) -> np.ndarray | float:
+    """Returns a (k, j, i) view of an array without reading it into memory, or the value if it is a scalar."""
+    if np.ndim(values) == 0:
+        return float(values)  # type: ignore[arg-type]
+    return _as_layered_array(np.asarray(values), name, range_x, range_y, range_z)
+
+
+def _as_layered_array(array: np.ndarray, name: str, range_x: int, range_y: int, range_z: int) -> np.ndarray:
+    """Returns a (k, j, i) view of a flat array without reading it into memory."""
+    if array.size != range_x * range_y * range_z:
+        raise ValueError(f'Array {name} of size {array.size} does not match grid dimensions '
+                         f'{range_x} x {range_y} x {range_z}.')
+    return array.reshape(grid_shape(range_x, range_y, range_z))
+
+
+def _add_padded(running_sums: np.ndarray, layer_sums: np.ndarray) -> np.ndarray:
+    """Adds two tables of region sums which may cover a different number of regions."""
+    if len(layer_sums) > len(running_sums):
+        running_sums = np.pad(running_sums, ((0, len(layer_sums) - len(running_sums)), (0, 0)))
+    running_sums[:len(layer_sums)] += layer_sums
+    return running_sums
@@ -0,0 +1,202 @@
+"""Batched interpolation of Nexus hydraulics (VLP) tables.
+
+The hydraulics table of a NexusHydraulicsMethod is stored as a DataFrame with a column of 1 based indices into each of
+the variable axes (e.g. IGOR, IWCUT, IALQ, IQOIL) followed by a column of pressures for each value on the pressure axis
+(e.g. BHP0, BHP1, ... for each THP). HydraulicsTableGrid reshapes the table into a dense array with one dimension for
+each axis, so that many points can be interpolated at once with multilinear interpolation.
+
+Values outside of the axis range are linearly extrapolated up to the limits in the LIMITS table. Beyond the limits, or
+beyond the axis range for variables without limits, the HydraulicsExtrapolation policy applies.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Mapping, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ResSimpy.Nexus.NexusKeywords.hyd_keywords import HYD_PRESSURE_KEYWORDS
+
+ArrayLike = Union[float, npt.ArrayLike]
+
+# Maps the pressure axis keyword to the pressure in the table, as in NexusHydraulicsMethod.read_properties
+_TABLE_PRESSURE_FOR_AXIS = {'PIN': 'POUT', 'POUT': 'PIN', 'THP': 'BHP'}
+# number of points interpolated at a time, limiting the memory used for the weights of each corner of the cells
+_POINTS_PER_CHUNK = 65536
+
+
+class HydraulicsExtrapolation(str, Enum):
+    """How to evaluate a hydraulics table for variables outside of their limits.
+
+    Attributes:
+        CLAMP: evaluates the table at the nearest limit.
+        LINEAR: linearly extrapolates from the last two values on the axis.
+        NAN: returns NaN.
+    """
+    CLAMP = 'CLAMP'
+    LINEAR = 'LINEAR'
+    NAN = 'NAN'
+
+
+@dataclass(frozen=True)
+class HydraulicsTableGrid:
+    """A hydraulics table reshaped into a dense array for interpolation.
+
+    Attributes:
+        axis_names (tuple[str, ...]): the Nexus keyword for each axis, e.g. ('GOR', 'WCUT', 'QOIL', 'THP'). The last
+            axis is the pressure axis.
+        axes (tuple[np.ndarray, ...]): the values on each axis, in ascending order.
+        values (np.ndarray): the table pressures with one dimension for each axis. NaN where the table has no entry.
+        lower_limits (np.ndarray): the lowest value of each variable that is extrapolated to.
+        upper_limits (np.ndarray): the highest value of each variable that is extrapolated to.
+        pressure_name (str): the Nexus keyword for the pressure in the table, e.g. BHP.
+    """
+    axis_names: tuple[str, ...]
+    axes: tuple[np.ndarray, ...]
+    values: np.ndarray
+    lower_limits: np.ndarray
+    upper_limits: np.ndarray
+    pressure_name: str
+
+    @classmethod
+    def from_properties(cls: type[HydraulicsTableGrid], properties: Mapping[str, object]) -> HydraulicsTableGrid:
+        """Builds the grid from the properties of a NexusHydraulicsMethod.
+
+        Args:
+            properties (Mapping[str, object]): the properties read from a hydraulics method file.
+
+        Raises:
+            ValueError: if there is no hydraulics table, pressure axis or values for an axis in the table.
+        """
+        table = properties.get('HYD_TABLE')
+        if not isinstance(table, pd.DataFrame):
+            raise ValueError('No hydraulics table found to interpolate.')
+        pressure_axis_name = next((x for x in HYD_PRESSURE_KEYWORDS if x in properties), None)
+        if pressure_axis_name is None:
+            raise ValueError(f'No pressure axis found for the hydraulics table, expected one of '
+                             f'{HYD_PRESSURE_KEYWORDS}.')
+
+        index_columns = [x for x in table.columns if x.startswith('I')]
+        pressure_columns = [x for x in table.columns if x not in index_columns]
+        axis_names = tuple([x[1:] for x in index_columns] + [pressure_axis_name])
+
+        axes = []
+        for axis_name in axis_names:
+            axis = properties.get(axis_name)
+            if not isinstance(axis, np.ndarray):
+                raise ValueError(f'No values found for the {axis_name} axis of the hydraulics table.')
+            axes.append(np.asarray(axis, dtype=float))
+        if len(pressure_columns) != len(axes[-1]):
+            raise ValueError(f'Expected {len(axes[-1])} pressure columns in the hydraulics table, found '
+                             f'{len(pressure_columns)}.')
+
+        values = np.full([len(x) for x in axes], np.nan)
+        table_indices = tuple(table[column].to_numpy(dtype=int) - 1 for column in index_columns)
+        values[table_indices] = table[pressure_columns].to_numpy(dtype=float)
+
+        # sort any axes given in descending order
+        for dimension, axis in enumerate(axes):
+            order = np.argsort(axis, kind='stable')
+            axes[dimension] = axis[order]
+            values = np.take(values, order, axis=dimension)
+        values = np.ascontiguousarray(values)
+
+        lower_limits = np.array([x[0] for x in axes])
+        upper_limits = np.array([x[-1] for x in axes])
+        limits = properties.get('LIMITS')
+        if isinstance(limits, pd.DataFrame) and 'VARIABLE' in limits.columns:
+            for _, row in limits.iterrows():
+                variable = str(row['VARIABLE']).upper()
+                if variable not in axis_names:
+                    continue
+                dimension = axis_names.index(variable)
+                if 'MIN' in limits.columns and pd.notna(row['MIN']):
+                    lower_limits[dimension] = min(float(row['MIN']), lower_limits[dimension])
+                if 'MAX' in limits.columns and pd.notna(row['MAX']):
+                    upper_limits[dimension] = max(float(row['MAX']), upper_limits[dimension])
+
+        return cls(axis_names=axis_names, axes=tuple(axes), values=values, lower_limits=lower_limits,
+                   upper_limits=upper_limits, pressure_name=_TABLE_PRESSURE_FOR_AXIS[pressure_axis_name])
+
+    def interpolate(self, points: Mapping[str, ArrayLike],
+                    extrapolation: HydraulicsExtrapolation = HydraulicsExtrapolation.CLAMP) -> np.ndarray:
+        """Interpolates the table pressure at a batch of points.
+
+        Args:
+            points (Mapping[str, ArrayLike]): the values of each axis variable, keyed by the Nexus keyword (e.g. QOIL,
+                GOR, THP). Values are broadcast against each other. Variables with a single value on their axis can be
+                left out.
+            extrapolation (HydraulicsExtrapolation): how to evaluate points outside the limits of a variable.
+                Defaults to clamping them to the limits.
+
+        Raises:
+            ValueError: if a variable is missing or isn't an axis of the table.
+
+        Returns:
+            np.ndarray: the interpolated pressures, with the broadcast shape of the points.
+        """
+        unknown_variables = set(points) - set(self.axis_names)
+        if unknown_variables:
+            raise ValueError(f'Variables {sorted(unknown_variables)} are not axes of the hydraulics table, expected '
+                             f'{list(self.axis_names)}.')
+        missing_variables = [x for x, axis in zip(self.axis_names, self.axes) if x not in points and len(axis) > 1]
+        if missing_variables:
+            raise ValueError(f'Values are required for the variables {missing_variables}.')
+
+        queries = dict(zip(points, np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in points.values()])))
+        shape = next(iter(queries.values())).shape if queries else ()
+        flat_queries = {name: query.ravel() for name, query in queries.items()}
+        number_of_points = int(np.prod(shape))
+
+        result = np.empty(number_of_points)
+        for chunk_start in range(0, max(number_of_points, 1), _POINTS_PER_CHUNK):
+            chunk = slice(chunk_start, chunk_start + _POINTS_PER_CHUNK)
+            result[chunk] = self.__interpolate_chunk({name: query[chunk] for name, query in flat_queries.items()},
+                                                     extrapolation, len(result[chunk]))
+        return result.reshape(shape)
+
+    def __interpolate_chunk(self, queries: dict[str, np.ndarray], extrapolation: HydraulicsExtrapolation,
+                            number_of_points: int) -> np.ndarray:
+        """Interpolates the table pressure at a 1D array of points."""
+        outside_limits = np.zeros(number_of_points, dtype=bool)
+
+        # for each axis with more than one value, find the lower node and the weight given to the upper node
+        table_shape = self.values.shape
+        flat_index = np.zeros(number_of_points, dtype=np.intp)
+        active_dimensions: list[tuple[int, np.ndarray]] = []
+        for dimension, (name, axis) in enumerate(zip(self.axis_names, self.axes)):
+            if len(axis) == 1:
+                continue
+            query = queries[name]
+            lower_limit, upper_limit = self.lower_limits[dimension], self.upper_limits[dimension]
+            outside_limits |= (query < lower_limit) | (query > upper_limit)
+            if extrapolation is not HydraulicsExtrapolation.LINEAR:
+                query = np.clip(query, lower_limit, upper_limit)
+            lower_node = np.clip(np.searchsorted(axis, query, side='right') - 1, 0, len(axis) - 2)
+            weight = (query - axis[lower_node]) / (axis[lower_node + 1] - axis[lower_node])
+            stride = int(np.prod(table_shape[dimension + 1:]))
+            flat_index += lower_node * stride
+            active_dimensions.append((stride, weight))
+
+        # expand the weights and indices one dimension at a time to the corners of the cells containing the points
+        corners = [(np.ones(number_of_points), flat_index)]
+        for stride, weight in active_dimensions:
+            corners = [corner for corner_weight, corner_index in corners for corner in (
+                (corner_weight * (1.0 - weight), corner_index), (corner_weight * weight, corner_index + stride))]
+
+        # corners with no weight are skipped so that missing table entries only affect the points that depend on them
+        flat_values = self.values.ravel()
+        has_missing_values = bool(np.isnan(flat_values).any())
+        result = np.zeros(number_of_points)
+        for corner_weight, corner_index in corners:
+            contribution = corner_weight * flat_values[corner_index]
+            if has_missing_values:
+                contribution = np.where(corner_weight == 0.0, 0.0, contribution)
+            result += contribution
+
+        if extrapolation is HydraulicsExtrapolation.NAN:
+            result[outside_limits] = np.nan
+        return result
@@ -15,6 +15,7 @@ from ResSimpy.Nexus.DataModels.NexusRelPermEndPoint import NexusRelPermEndPoint
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Nexus.NexusKeywords.wells_keywords import WELLS_KEYWORDS
 from ResSimpy.Utils.invert_nexus_map import nexus_keyword_to_attribute_name
+from ResSimpy.Utils.load_profiler import profiled_phase, record_processed
 
 from ResSimpy.Nexus.DataModels.NexusWell import NexusWell
 
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
     from ResSimpy.Nexus.NexusWells import NexusWells
 
 
+@profiled_phase('load_wells')
 def load_wells(nexus_file: NexusFile, start_date: str, default_units: UnitSystem, parent_wells_instance: NexusWells,
                model_date_format: DateFormat) -> tuple[list[NexusWell], DateFormat]:
     """Loads a list of Nexus Well instances and populates it with the wells completions over time from a wells file.
@@ -45,6 +47,7 @@ def load_wells(nexus_file: NexusFile, start_date: str, default_units: UnitSystem
     """
     date_format = model_date_format
     file_as_list = nexus_file.get_flat_list_str_file
+    record_processed(len(file_as_list))
     well_name: Optional[str] = None
     wellspec_file_units: Optional[UnitSystem] = None
 
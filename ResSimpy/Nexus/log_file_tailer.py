@@ -0,0 +1,176 @@
+"""Incremental reader for the .log files produced by running a Nexus simulation.
+
+Log files of running simulations grow continuously and can be hundreds of MB. The LogFileTailer remembers the byte
+offset that it has read up to and the state parsed from the lines before it, so that each update only reads and parses
+the bytes appended to the file since the previous update.
+"""
+from __future__ import annotations
+
+import dataclasses
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.FileOperations.keyword_matcher import KeywordMatcher
+
+# a value in the TIME column of the timestep table, matching the values accepted by str.replace('.', '', 1).isdigit()
+_TIME_VALUE_PATTERN = re.compile(r'\d+\.?\d*|\.\d+')
+_TIME_HEADING_MATCHER = KeywordMatcher(['TIME'])
+
+
+@dataclass(kw_only=True)
+class LogFileState:
+    """State parsed from the lines of a simulation log file.
+
+    Attributes:
+        simulation_start_time (Optional[str]): start time of the simulation run from the pdsh prolog line.
+        simulation_end_time (Optional[str]): end time of the simulation run from the pdsh epilog line.
+        job_finished (bool): True if the 'Nexus finished' line has been found.
+        job_number_line (Optional[str]): the first line containing the job number.
+        errors_warnings_line (Optional[str]): the last line containing both the errors and warnings counts, lower case.
+        read_in_times (bool): True once the case name has been found and the timestep table is being read.
+        time_heading_location (Optional[int]): column of TIME in the latest timestep table header.
+        last_time (Optional[str]): the latest time reached in the timestep tables.
+    """
+    simulation_start_time: Optional[str] = None
+    simulation_end_time: Optional[str] = None
+    job_finished: bool = False
+    job_number_line: Optional[str] = None
+    errors_warnings_line: Optional[str] = None
+    read_in_times: bool = False
+    time_heading_location: Optional[int] = None
+    last_time: Optional[str] = None
+
+
+class LogFileTailer:
+    """Reads a simulation log file incrementally, only parsing the bytes appended since the last update.
+
+    A final line without a line ending, for example one that the simulator is part way through writing, is included in
+    the returned state but is read again on the next update. If the file becomes smaller than the offset read up to,
+    it is assumed to have been replaced and is read again from the start.
+
+    Attributes:
+        log_file_path (str): path to the log file.
+        case_name (Optional[str]): the case name that precedes the timestep table to read the progress from.
+        offset (int): the number of bytes of complete lines read so far.
+    """
+    log_file_path: str
+    case_name: Optional[str]
+    offset: int
+
+    def __init__(self, log_file_path: str, case_name: Optional[str] = None) -> None:
+        """Initialises the LogFileTailer class.
+
+        Args:
+            log_file_path (str): path to the log file.
+            case_name (Optional[str]): the case name that precedes the timestep table to read the progress from. \
+            Progress is not read if None.
+        """
+        self.log_file_path = log_file_path
+        self.case_name = case_name
+        self.offset = 0
+        self.__state = LogFileState()
+
+    def update(self) -> LogFileState:
+        """Reads and parses the bytes appended to the log file since the last update.
+
+        Returns:
+            LogFileState: the state parsed from the whole file so far.
+        """
+        try:
+            file_size: Optional[int] = os.stat(self.log_file_path).st_size
+        except OSError:
+            file_size = None
+        if file_size is not None and file_size < self.offset:
+            self.offset = 0
+            self.__state = LogFileState()
+
+        with open(self.log_file_path, 'rb') as log_file:
+            log_file.seek(self.offset)
+            new_bytes = log_file.read()
+
+        complete_length = new_bytes.rfind(b'\n') + 1
+        for line in self.__decode_lines(new_bytes[:complete_length]):
+            self.parse_line(line, self.__state, self.case_name)
+        self.offset += complete_length
+
+        partial_line = new_bytes[complete_length:]
+        if not partial_line:
+            return dataclasses.replace(self.__state)
+        state_with_partial_line = dataclasses.replace(self.__state)
+        for line in self.__decode_lines(partial_line):
+            self.parse_line(line, state_with_partial_line, self.case_name)
+        return state_with_partial_line
+
+    @staticmethod
+    def __decode_lines(data: bytes) -> list[str]:
+        """Splits bytes from the log file into lines, keeping the line endings in the same way as reading the file."""
+        if not data:
+            return []
+        text = data.decode('utf-8', errors='replace').replace('\r\n', '\n')
+        lines = [line + '\n' for line in text.split('\n')]
+        # remove the line ending added to the text after the final newline
+        lines[-1] = lines[-1][:-1]
+        return lines if lines[-1] else lines[:-1]
+
+    @staticmethod
+    def parse_line(line: str, state: LogFileState, case_name: Optional[str] = None) -> None:
+        """Updates the log file state with a single line of the log file.
+
+        Args:
+            line (str): the line to parse, including the line ending.
+            state (LogFileState): the state to update.
+            case_name (Optional[str]): the case name that precedes the timestep table to read the progress from.
+        """
+        if 'pdsh' in line:
+            if nfo.check_token('start generic pdsh   prolog', line):
+                state.simulation_start_time = LogFileTailer.__get_simulation_time(line)
+            if nfo.check_token('end generic pdsh   epilog', line):
+                state.simulation_end_time = LogFileTailer.__get_simulation_time(line)
+
+        if line == 'Nexus finished\n':
+            state.job_finished = True
+        if state.job_number_line is None and 'Job number:' in line:
+            state.job_number_line = line
+        lower_case_line = line.lower()
+        if 'errors' in lower_case_line and 'warnings' in lower_case_line:
+            state.errors_warnings_line = lower_case_line
+
+        if case_name is None:
+            return
+        if f'Case Name = {case_name}' in line:
+            state.read_in_times = True
+            return
+        if not state.read_in_times:
+            return
+        if 'time' in lower_case_line and _TIME_HEADING_MATCHER.contains_any(line):
+            columns = line.split()
+            if 'TIME' in columns:
+                state.time_heading_location = columns.index('TIME')
+
+        if state.time_heading_location is not None:
+            LogFileTailer.__read_time_from_table_row(line, state)
+
+    @staticmethod
+    def __read_time_from_table_row(line: str, state: LogFileState) -> None:
+        """Updates the latest time from a row of the timestep table, if the row starts with a number."""
+        time_heading_location = state.time_heading_location
+        if time_heading_location is None:
+            return
+        values = line.split(maxsplit=time_heading_location + 1)
+        if not values or _TIME_VALUE_PATTERN.fullmatch(values[0]) is None or len(values) <= time_heading_location:
+            return
+        time_value = values[time_heading_location]
+        if _TIME_VALUE_PATTERN.fullmatch(time_value) is None:
+            return
+        if state.last_time is None or float(time_value) > float(state.last_time):
+            state.last_time = time_value
+
+    @staticmethod
+    def __get_simulation_time(line: str) -> Optional[str]:
+        """Returns the date and time from a pdsh prolog or epilog line, None if one isn't found."""
+        # imported here as logfile_operations uses this module
+        from ResSimpy.Nexus.logfile_operations import Logging
+        return Logging.get_simulation_time(line)
@@ -0,0 +1,319 @@
+"""Asynchronous monitoring of the log files of many running Nexus simulations.
+
+The SimulationMonitor tails the log file of each case concurrently, running the blocking file reads in an executor, and
+yields a SimulationStatusUpdate each time the status, job id, progress or error and warning counts of a case change.
+Cases can be supplied as FCS file paths, in which case only the FCS file and runcontrol file are read to find the log
+file and the simulation end time, rather than loading the whole model into a NexusSimulator.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import Executor
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional, Sequence, TYPE_CHECKING, Union
+
+import ResSimpy.FileOperations.file_operations as fo
+import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+from ResSimpy.Nexus.constants import DATE_WITH_TIME_LENGTH
+from ResSimpy.Nexus.log_file_tailer import LogFileState, LogFileTailer
+from ResSimpy.Nexus.logfile_operations import Logging
+from ResSimpy.Nexus.runcontrol_event_parser import RuncontrolEventParser, RuncontrolLineEvent
+
+if TYPE_CHECKING:
+    from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+
+
+@dataclass(frozen=True)
+class SimulationStatusUpdate:
+    """The latest status of a monitored simulation.
+
+    Attributes:
+        case (str): the FCS file path of the case.
+        status (Optional[str]): the simulation status in the same form as Logging.get_simulation_status, None if the \
+            log file has not been found or has no status yet.
+        job_id (Optional[int]): the job id of the run, None if not found yet.
+        progress (Optional[float]): percentage of the simulated time completed, None if it can't be calculated.
+        errors (Optional[int]): number of errors reported in the log file, None if not reported yet.
+        warnings (Optional[int]): number of warnings reported in the log file, None if not reported yet.
+        finished (bool): True if the simulation has finished, or if the case has stopped being monitored because of \
+            an error or because its log file has stopped changing.
+        error (Optional[str]): the reason the case stopped being monitored before the simulation finished, None \
+            otherwise.
+    """
+    case: str
+    status: Optional[str] = None
+    job_id: Optional[int] = None
+    progress: Optional[float] = None
+    errors: Optional[int] = None
+    warnings: Optional[int] = None
+    finished: bool = False
+    error: Optional[str] = None
+
+
+class _MonitoredCase:
+    """Holds the log file tailer and the simulated time span for a single monitored case."""
+
+    def __init__(self, case: Union[str, NexusSimulator]) -> None:
+        self.case = case
+        self.tailer: Optional[LogFileTailer] = None
+        self.__start_date: Optional[str] = None
+        self.__end_date: Optional[str] = None
+        self.__date_format_string = '%m/%d/%Y'
+
+    @property
+    def name(self) -> str:
+        """The FCS file path of the case."""
+        return self.case if isinstance(self.case, str) else self.case.original_fcs_file_path
+
+    def read(self) -> SimulationStatusUpdate:
+        """Reads the lines appended to the log file of the case and returns the latest status. Blocks on file reads.
+
+        Any error reading the files of the case is returned as a finished status with the error set, rather than
+        raised, so that the other cases being monitored are unaffected.
+        """
+        try:
+            return self.__read()
+        except Exception as error:  # noqa: BLE001
+            return SimulationStatusUpdate(case=self.name, finished=True, error=f'{type(error).__name__}: {error}')
+
+    def __read(self) -> SimulationStatusUpdate:
+        """Reads the latest status of the case, raising any error reading its files."""
+        if self.tailer is None:
+            log_file_path, case_name = self.__find_log_file()
+            if log_file_path is None:
+                return SimulationStatusUpdate(case=self.name)
+            self.tailer = LogFileTailer(log_file_path, case_name=case_name)
+        return self.__to_update(self.tailer.update())
+
+    def __find_log_file(self) -> tuple[Optional[str], Optional[str]]:
+        """Returns the log file path and the case name written in the log, reading the runcontrol file for FCS paths."""
+        if not isinstance(self.case, str):
+            log_file_path = self.case.logging.get_log_file_path()
+            return log_file_path, self.case.root_name
+
+        case_name = os.path.splitext(os.path.basename(self.case))[0]
+        log_file_path = os.path.join(os.path.dirname(self.case), case_name + '.log')
+        if not os.path.isfile(log_file_path):
+            return None, None
+        self.__read_simulated_time_span(self.case)
+        return log_file_path, case_name
+
+    def __read_simulated_time_span(self, fcs_file_path: str) -> None:
+        """Reads the date format from the FCS file and the start and end dates from the runcontrol file."""
+        fcs_content = nfo.load_file_as_list(fcs_file_path)
+        runcontrol_path = None
+        for i, line in enumerate(fcs_content):
+            if nfo.check_token('DATEFORMAT', line) or nfo.check_token('DATE_FORMAT', line):
+                format_token = 'DATEFORMAT' if nfo.check_token('DATEFORMAT', line) else 'DATE_FORMAT'
+                if fo.get_token_value_at(format_token, fcs_content, i) == 'DD/MM/YYYY':
+                    self.__date_format_string = '%d/%m/%Y'
+            if nfo.check_token('RUNCONTROL', line):
+                runcontrol_path = fo.get_token_value_at('RUNCONTROL', fcs_content, i)
+        if runcontrol_path is None:
+            return
+
+        runcontrol_file = NexusFile.generate_file_include_structure(simulator_type=NexusFile, file_path=runcontrol_path,
+                                                                    origin=fcs_file_path, top_level_file=True)
+        parser = RuncontrolEventParser.from_file(runcontrol_file)
+        times: list[str] = []
+        stopped = False
+
+        def read_line(event: RuncontrolLineEvent) -> None:
+            nonlocal stopped
+            if 'START' in event.keywords:
+                self.__start_date = fo.get_token_value_at('START', parser.file_content, event.line_index)
+            if 'TIME' in event.keywords and not stopped and event.time is not None:
+                times.append(event.time)
+            if 'STOP' in event.keywords:
+                stopped = True
+
+        parser.subscribe(['START', 'TIME', 'STOP'], read_line)
+        parser.parse()
+        if self.__start_date is None and times:
+            self.__start_date = times[0]
+        if times:
+            self.__end_date = max(times, key=self.__convert_date_to_number)
+
+    def __convert_date_to_number(self, date: str) -> float:
+        """Converts a date or number of days to the number of days from the start date."""
+        try:
+            return float(date)
+        except ValueError:
+            pass
+        if self.__start_date is None:
+            raise ValueError('No start date found in the runcontrol file')
+
+        def to_datetime(value: str) -> datetime:
+            date_format = self.__date_format_string
+            if len(value) == DATE_WITH_TIME_LENGTH:
+                date_format += '(%H:%M:%S)'
+            return datetime.strptime(value, date_format)
+
+        difference = to_datetime(date) - to_datetime(self.__start_date)
+        return difference.total_seconds() / timedelta(days=1).total_seconds()
+
+    def __get_progress(self, last_time: Optional[str]) -> Optional[float]:
+        """Returns the percentage of the simulated time completed, None if the end of the simulation isn't known."""
+        if last_time is None:
+            return None
+        try:
+            if isinstance(self.case, str):
+                if self.__end_date is None:
+                    return None
+                total_days = self.__convert_date_to_number(self.__end_date)
+                days_completed = self.__convert_date_to_number(last_time)
+            else:
+                sim_controls = self.case.sim_controls
+                if not sim_controls.times:
+                    return None
+                total_days = sim_controls.convert_date_to_number(sim_controls.times[-1])
+                days_completed = sim_controls.convert_date_to_number(last_time)
+        except ValueError:
+            return None
+        if total_days == 0:
+            return None
+        return round((days_completed / total_days) * 100, 1)
+
+    def __to_update(self, state: LogFileState) -> SimulationStatusUpdate:
+        """Creates the status update for the case from the state of its log file."""
+        job_id = None
+        if state.job_number_line is not None:
+            try:
+                job_id = int(state.job_number_line.split(':')[1])
+            except (IndexError, ValueError):
+                job_id = None
+
+        errors = warnings = None
+        if state.errors_warnings_line is not None:
+            error_warning_list = [nfo.clean_up_string(x) for x in state.errors_warnings_line.split(' ') if x != '']
+            if len(error_warning_list) >= 4:
+                try:
+                    errors, warnings = int(error_warning_list[1]), int(error_warning_list[3])
+                except ValueError:
+                    errors = warnings = None
+
+        if state.job_finished:
+            errors_warnings_lines = [] if state.errors_warnings_line is None else [state.errors_warnings_line]
+            status = Logging.get_errors_warnings_string(errors_warnings_lines)
+        elif job_id is not None:
+            status = f"Job Running, ID: {job_id}"
+        else:
+            status = None
+
+        return SimulationStatusUpdate(case=self.name, status=status, job_id=job_id,
+                                      progress=self.__get_progress(state.last_time), errors=errors,
+                                      warnings=warnings, finished=state.job_finished)
+
+
+class SimulationMonitor:
+    """Concurrently tails the log files of many Nexus cases, yielding their status as it changes.
+
+    Each case is polled from its own task, with the log file reads run in an executor. A case whose log file hasn't
+    changed since the last poll is polled less often, up to max_poll_interval, and a case stops being polled once its
+    simulation has finished. A case also stops being polled if reading its files fails, or if its status hasn't changed
+    for idle_timeout seconds, e.g. because the simulation was killed or never started; its last status is then yielded
+    with finished set to True and the reason in error.
+
+    Attributes:
+        poll_interval (float): seconds between polls of a log file that is changing.
+        max_poll_interval (float): the longest time in seconds between polls of an idle log file.
+        backoff_factor (float): the factor the time between polls is multiplied by each time a poll finds no change.
+        executor (Optional[Executor]): the executor to run the file reads in. Uses the event loop's default \
+            executor if None.
+        idle_timeout (Optional[float]): seconds without a change in the status of a case after which it stops being \
+            monitored. Cases are monitored until they finish if None.
+    """
+    poll_interval: float
+    max_poll_interval: float
+    backoff_factor: float
+    executor: Optional[Executor]
+    idle_timeout: Optional[float]
+
+    def __init__(self, cases: Sequence[Union[str, NexusSimulator]], poll_interval: float = 1.0,
+                 max_poll_interval: float = 30.0, backoff_factor: float = 2.0,
+                 executor: Optional[Executor] = None, idle_timeout: Optional[float] = None) -> None:
+        """Initialises the SimulationMonitor class.
+
+        Args:
+            cases (Sequence[Union[str, NexusSimulator]]): the cases to monitor, as FCS file paths or loaded models.
+            poll_interval (float): seconds between polls of a log file that is changing. Defaults to 1.0.
+            max_poll_interval (float): the longest time in seconds between polls of an idle log file. Defaults to 30.0.
+            backoff_factor (float): the factor the time between polls is multiplied by each time a poll finds no \
+            change. Defaults to 2.0.
+            executor (Optional[Executor]): the executor to run the file reads in. Uses the event loop's default \
+            executor if None.
+            idle_timeout (Optional[float]): seconds without a change in the status of a case after which it stops \
+            being monitored. Cases are monitored until they finish if None, the default.
+        """
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError(f'The idle timeout must be zero or more seconds, instead got {idle_timeout}.')
+        self.__cases = [_MonitoredCase(case) for case in cases]
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.executor = executor
+        self.idle_timeout = idle_timeout
+
+    async def poll(self) -> list[SimulationStatusUpdate]:
+        """Reads the latest status of every case once, concurrently.
+
+        Returns:
+            list[SimulationStatusUpdate]: the latest status of each case, in the same order as the cases.
+        """
+        loop = asyncio.get_running_loop()
+        return list(await asyncio.gather(*[loop.run_in_executor(self.executor, case.read)
+                                           for case in self.__cases]))
+
+    async def updates(self) -> AsyncIterator[SimulationStatusUpdate]:
+        """Yields the status of each case every time it changes, until every case has stopped being monitored.
+
+        The first status of every case is always yielded, as is the last. A case that fails or times out yields a
+        final status with the error set, and the other cases carry on being monitored.
+        """
+        # each watcher task is put on the queue when it finishes, so that any exception is raised from here
+        queue: asyncio.Queue[Union[SimulationStatusUpdate, asyncio.Task[None]]] = asyncio.Queue()
+        tasks = [asyncio.create_task(self.__watch(case, queue)) for case in self.__cases]
+        for task in tasks:
+            task.add_done_callback(queue.put_nowait)
+        running_watchers = len(tasks)
+        try:
+            while running_watchers > 0:
+                update = await queue.get()
+                if isinstance(update, asyncio.Task):
+                    update.result()
+                    running_watchers -= 1
+                else:
+                    yield update
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def __watch(self, case: _MonitoredCase,
+                      queue: asyncio.Queue[Union[SimulationStatusUpdate, asyncio.Task[None]]]) -> None:
+        """Polls a single case, putting an update on the queue whenever its status changes."""
+        loop = asyncio.get_running_loop()
+        interval = self.poll_interval
+        previous_update: Optional[SimulationStatusUpdate] = None
+        last_change = loop.time()
+        while True:
+            update = await loop.run_in_executor(self.executor, case.read)
+            if update != previous_update:
+                queue.put_nowait(update)
+                previous_update = update
+                interval = self.poll_interval
+                last_change = loop.time()
+            else:
+                interval = min(interval * self.backoff_factor, self.max_poll_interval)
+            if update.finished:
+                return
+            if self.idle_timeout is not None:
+                idle_time = loop.time() - last_change
+                if idle_time >= self.idle_timeout:
+                    queue.put_nowait(replace(update, finished=True,
+                                             error=f'The status has not changed for {self.idle_timeout} seconds.'))
+                    return
+                interval = min(interval, self.idle_timeout - idle_time)
+            await asyncio.sleep(interval)
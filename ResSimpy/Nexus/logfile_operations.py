@@ -3,14 +3,32 @@ from __future__ import annotations
 
 import os
 import warnings
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
 import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.Nexus.log_file_tailer import LogFileState, LogFileTailer
 
 if TYPE_CHECKING:
     from ResSimpy.Nexus.NexusSimulator import NexusSimulator
 
 
+@dataclass(frozen=True)
+class SimulationPollResult:
+    """The status of a single model returned by Logging.poll_simulations.
+
+    Attributes:
+        status (Optional[str]): the simulation status as returned by get_simulation_status, None if no log file is \
+            found.
+        job_id (int): the job id of the run, -1 if not known.
+        progress (Optional[float]): the simulation progress as returned by get_simulation_progress, None if no log \
+            file or runcontrol times are found.
+    """
+    status: Optional[str]
+    job_id: int
+    progress: Optional[float]
+
+
 class Logging:
     def __init__(self, model: NexusSimulator) -> None:
         """Class for controlling all logging and logfile (*.log) related functionality.
@@ -28,6 +46,7 @@ class Logging:
         self.__simulation_start_time: Optional[str] = None
         self.__simulation_end_time: Optional[str] = None
         self.__previous_run_time: Optional[str] = None
+        self.__log_file_tailers: dict[str, LogFileTailer] = {}
 
     @staticmethod
     def get_simulation_time(line: str) -> str:
@@ -142,6 +161,16 @@ class Logging:
         """Get the job Id of a simulation run."""
         return self.__job_id
 
+    def get_log_file_path(self, from_startup: bool = False) -> Optional[str]:
+        """Returns the path of the log file for the simulation, None if it isn't found.
+
+        Args:
+            from_startup (bool, optional): Searches the same directory as the original_fcs_file_path if True. \
+            Otherwise searches the destination folder path, failing this then searches the \
+            original_fcs_file_path if False. Defaults to False.
+        """
+        return self.__get_log_path(from_startup)
+
     def __get_log_path(self, from_startup: bool = False) -> Optional[str]:
         """Returns the path of the log file for the simulation.
 
@@ -175,20 +204,26 @@ class Logging:
         else:
             return None
 
-    def __update_simulation_start_and_end_times(self, log_file_line_list: list[str]) -> None:
-        """Updates the stored simulation execution start and end times from the log files.
+    def __read_log_file(self, log_file_path: str) -> LogFileState:
+        """Reads the lines appended to the log file since it was last read and updates the stored start and end times.
 
         Args:
-            log_file_line_list (list[str]): log file information represented with a new entry per line of the file.
-        """
-        for line in log_file_line_list:
-            if nfo.check_token('start generic pdsh   prolog', line):
-                value = self.get_simulation_time(line)
-                self.__simulation_start_time = value
+            log_file_path (str): path to the log file.
 
-            if nfo.check_token('end generic pdsh   epilog', line):
-                value = self.get_simulation_time(line)
-                self.__simulation_end_time = value
+        Returns:
+            LogFileState: the state parsed from the whole log file.
+        """
+        tailer = self.__log_file_tailers.get(log_file_path)
+        if tailer is None or tailer.case_name != self.__model.root_name:
+            tailer = LogFileTailer(log_file_path, case_name=self.__model.root_name)
+            self.__log_file_tailers[log_file_path] = tailer
+        log_file_state = tailer.update()
+
+        if log_file_state.simulation_start_time is not None:
+            self.__simulation_start_time = log_file_state.simulation_start_time
+        if log_file_state.simulation_end_time is not None:
+            self.__simulation_end_time = log_file_state.simulation_end_time
+        return log_file_state
 
     def get_simulation_status(self, from_startup: bool = False) -> Optional[str]:
         """Gets the run status of the latest simulation run.
@@ -212,19 +247,16 @@ class Logging:
             raise NotImplementedError(
                 "Only retrieving status from a log file is supported at the moment")
         else:
-            log_file_line_list = nfo.load_file_as_list(log_file)
-            self.__update_simulation_start_and_end_times(log_file_line_list)
-            job_finished = 'Nexus finished\n' in log_file_line_list
-            if job_finished:
+            log_file_state = self.__read_log_file(log_file)
+            if log_file_state.job_finished:
                 self.__previous_run_time = self.__get_start_end_difference() if from_startup \
                     else self.__previous_run_time
-                return self.get_errors_warnings_string(log_file_line_list=log_file_line_list)
-            else:
-                job_number_line = [
-                    x for x in log_file_line_list if 'Job number:' in x]
-                if len(job_number_line) > 0:
-                    self.__job_id = int(job_number_line[0].split(":")[1])
-                    return f"Job Running, ID: {self.__job_id}"
+                errors_warnings_lines = [] if log_file_state.errors_warnings_line is None else \
+                    [log_file_state.errors_warnings_line]
+                return self.get_errors_warnings_string(log_file_line_list=errors_warnings_lines)
+            elif log_file_state.job_number_line is not None:
+                self.__job_id = int(log_file_state.job_number_line.split(":")[1])
+                return f"Job Running, ID: {self.__job_id}"
         return None
 
     def __get_start_end_difference(self) -> Optional[str]:
@@ -269,44 +301,7 @@ class Logging:
         log_file_path = self.__get_log_path()
         if log_file_path is None:
             raise NotImplementedError("Only retrieving status from a log file is supported at the moment")
-        log_file = nfo.load_file_as_list(log_file_path)
-
-        read_in_times = False
-        time_heading_location = None
-        last_time = None
-        for line in log_file:
-            case_name_string = f"Case Name = {self.__model.root_name}"
-            if case_name_string in line:
-                read_in_times = True
-                continue
-            if read_in_times and nfo.check_token('TIME', line):
-                heading_location = 0
-                line_string = line
-                while len(line_string) > 0:
-                    next_value = nfo.get_next_value(0, [line_string], line_string)
-                    if next_value is None:
-                        break
-
-                    line_string = line_string.replace(next_value, '', 1)
-                    if next_value == 'TIME':
-                        time_heading_location = heading_location
-                    heading_location += 1
-
-            if read_in_times and time_heading_location is not None:
-                line_string = line
-                next_value = nfo.get_next_value(0, [line_string], line_string)
-                if next_value is not None and next_value.replace('.', '', 1).isdigit():
-                    if time_heading_location == 0 and (last_time is None or float(next_value) > float(last_time)):
-                        last_time = next_value
-                    for x in range(time_heading_location):
-                        line_string = line_string.replace(next_value, '', 1)
-                        next_value = nfo.get_next_value(0, [line_string], line_string)
-                        if next_value is None:
-                            break
-                        # When we reach the time column, read in the time value.
-                        if x == (time_heading_location - 1) and \
-                                (last_time is None or float(next_value) > float(last_time)):
-                            last_time = next_value
+        last_time = self.__read_log_file(log_file_path).last_time
 
         if last_time is not None:
             days_completed = self.__model._sim_controls.convert_date_to_number(last_time)
@@ -316,3 +311,29 @@ class Logging:
             return round((days_completed / total_days) * 100, 1)
 
         return 0
+
+    @staticmethod
+    def poll_simulations(models: Iterable[NexusSimulator]) -> list[SimulationPollResult]:
+        """Gets the status and progress of many models in one call.
+
+        Each log file is only read from where it was read up to on the previous poll of that model.
+
+        Args:
+            models (Iterable[NexusSimulator]): the models to poll.
+
+        Returns:
+            list[SimulationPollResult]: the status, job id and progress of each model in the same order as the models.
+        """
+        results = []
+        for model in models:
+            try:
+                status = model.logging.get_simulation_status()
+            except NotImplementedError:
+                results.append(SimulationPollResult(status=None, job_id=model.logging.get_job_id(), progress=None))
+                continue
+            try:
+                progress: Optional[float] = model.logging.get_simulation_progress()
+            except ValueError:
+                progress = None
+            results.append(SimulationPollResult(status=status, job_id=model.logging.get_job_id(), progress=progress))
+        return results
@@ -122,6 +122,7 @@ class AddObjectOperations:
             if file_to_write_to.file_content_as_list is None:
                 raise ValueError(
                     f'No file content found in {file_to_write_to.location}. Cannot write to index {index_in_file}')
+            file_to_write_to._unshare_content()
             file_to_write_to.file_content_as_list[index_in_file] = new_header_line
         return header_index, headers, headers_original
 
@@ -154,6 +155,7 @@ class AddObjectOperations:
             nexusfile_to_write_to, index_in_file = file.find_which_include_file(index)
             if nexusfile_to_write_to.file_content_as_list is None:
                 raise ValueError(f'No file content to write to in file: {nexusfile_to_write_to}')
+            nexusfile_to_write_to._unshare_content()
             nexusfile_to_write_to.file_content_as_list[index_in_file] = new_completion_line
         if valid_line:
             return index
@@ -8,7 +8,7 @@ from typing import Any, Optional
 import ResSimpy.FileOperations.file_operations as fo
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.FileOperations.File import File
-from ResSimpy.FileOperations.file_operations import get_next_value, get_expected_token_value
+from ResSimpy.FileOperations.file_operations import get_next_value, get_expected_token_value_at
 from ResSimpy.Nexus.DataModels.Network.NexusActivationChange import NexusActivationChange
 from ResSimpy.Nexus.DataModels.Network.NexusConLists import NexusConLists
 from ResSimpy.Nexus.DataModels.Network.NexusNodeLists import NexusNodeLists
@@ -22,9 +22,11 @@ from ResSimpy.Nexus.nexus_file_operations import check_property_in_line, check_t
     load_table_to_objects
 from ResSimpy.Nexus.nexus_load_list_table import load_table_to_lists
 from ResSimpy.Time.ISODateTime import ISODateTime
+from ResSimpy.Utils.load_profiler import profiled_phase, record_processed
 
 
 # TODO refactor the collection of tables to an object with proper typing
+@profiled_phase('collect_all_tables_to_objects')
 def collect_all_tables_to_objects(nexus_file: File, table_object_map: dict[str, Any], start_date: Optional[str],
                                   default_units: Optional[UnitSystem], date_format: DateFormat) -> \
         tuple[dict[str, list[Any]], dict[str, list[NexusConstraint]]]:
@@ -57,6 +59,7 @@ def collect_all_tables_to_objects(nexus_file: File, table_object_map: dict[str,
     nexus_constraints: dict[str, list[NexusConstraint]] = {}
 
     file_as_list: list[str] = nexus_file.get_flat_list_str_file
+    record_processed(len(file_as_list))
     table_start: int = -1
     table_end: int = -1
     property_dict: dict = {}
@@ -72,7 +75,7 @@ def collect_all_tables_to_objects(nexus_file: File, table_object_map: dict[str,
     default_shutin: Optional[str] = None
     for index, line in enumerate(file_as_list):
         # check for changes in unit system
-        check_property_in_line(line, property_dict, file_as_list)
+        check_property_in_line(line, property_dict, file_as_list, line_index=index)
         unit_system = property_dict.get('UNIT_SYSTEM', default_units)
         if not isinstance(unit_system, UnitSystem):
             raise TypeError(f"Value found for {unit_system=} of type {type(unit_system)} \
@@ -108,15 +111,16 @@ def collect_all_tables_to_objects(nexus_file: File, table_object_map: dict[str,
                 continue
 
         if check_token('TIME', line) and table_start < 0:
-            time_value = get_expected_token_value(
-                token='TIME', token_line=line, file_list=file_as_list,
+            time_value = get_expected_token_value_at(
+                token='TIME', file_list=file_as_list, line_index=index,
                 custom_message=f"Cannot find the date associated with the TIME card in {line=} at line number {index}")
             if time_value.upper() != 'PLUS':
                 current_date = time_value
             else:
-                plus_value = get_expected_token_value(token='PLUS', token_line=line, file_list=file_as_list,
-                                                      custom_message="Cannot find the date associated with the TIME "
-                                                                     f"PLUS card in {line=} at line number {index}")
+                plus_value = get_expected_token_value_at(token='PLUS', file_list=file_as_list, line_index=index,
+                                                         custom_message="Cannot find the date associated with the "
+                                                                        f"TIME PLUS card in {line=} at line number "
+                                                                        f"{index}")
 
                 if current_date is None:
                     raise ValueError("Cannot calculate PLUS date without access to the initial date.")
@@ -275,8 +279,7 @@ def __set_crossflow_and_shutin_defaults(default_crossflow: Optional[str], defaul
                                                                                                  Optional[str]]:
     """Sets the default values for Crossflow and Shutin."""
     if check_token(token='CROSSFLOW', line=line):
-        crossflow_value = get_expected_token_value(token='CROSSFLOW', token_line=line,
-                                                   file_list=file_as_list[index:])
+        crossflow_value = get_expected_token_value_at(token='CROSSFLOW', file_list=file_as_list, line_index=index)
 
         default_crossflow = crossflow_value
     if check_token(token='SHUTINON', line=line):
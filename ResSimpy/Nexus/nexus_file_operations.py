@@ -13,7 +13,8 @@ import pandas as pd
 
 from ResSimpy.Enums.UnitsEnum import UnitSystem, TemperatureUnits, SUnits
 from ResSimpy.FileOperations.file_operations import get_next_value, check_token, get_expected_token_value, \
-    strip_file_of_comments, load_file_as_list
+    get_expected_token_value_at, strip_file_of_comments, load_file_as_list
+from ResSimpy.FileOperations.keyword_matcher import KeywordMatcher, get_keyword_matcher
 from ResSimpy.Nexus.DataModels.Network.NexusNodeConnection import NexusNodeConnection
 from ResSimpy.Nexus.DataModels.Network.NexusWellConnection import NexusWellConnection
 from ResSimpy.Nexus.DataModels.Network.NexusWellList import NexusWellList
@@ -21,6 +22,9 @@ from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
 from ResSimpy.Nexus.NexusKeywords.nexus_keywords import VALID_NEXUS_KEYWORDS
 from ResSimpy.Nexus.NexusKeywords.structured_grid_keywords import GRID_ARRAY_KEYWORDS
 
+COMMON_INPUT_DATA_MATCHER = KeywordMatcher(['DESC', 'LABEL', 'DATEFORMAT', 'ENGLISH', 'METRIC', 'METKG/CM2', 'METBAR',
+                                            'LAB', 'SUNITS', 'KELVIN', 'RANKINE', 'FAHR', 'CELSIUS'])
+
 
 def nexus_token_found(line_to_check: str, valid_list: list[str] = VALID_NEXUS_KEYWORDS) -> bool:
     """Checks if a valid Nexus token has been found  in the supplied line.
@@ -33,9 +37,13 @@ def nexus_token_found(line_to_check: str, valid_list: list[str] = VALID_NEXUS_KE
         token_found (bool): A boolean value stating whether the token is found or not
 
     """
-    valid_set = set(valid_list)
+    valid_set = __get_keyword_set(valid_list)
     uppercase_line = line_to_check.upper()
-    strip_comments = strip_file_of_comments([uppercase_line], square_bracket_comments=True)
+    if '!' in uppercase_line or '[' in uppercase_line:
+        strip_comments = strip_file_of_comments([uppercase_line], square_bracket_comments=True)
+    else:
+        # nothing to strip, so skip the regex based comment removal
+        strip_comments = uppercase_line.splitlines()[:1]
     if len(strip_comments) == 0:
         return False
     split_line = set(strip_comments[0].split())
@@ -43,6 +51,21 @@ def nexus_token_found(line_to_check: str, valid_list: list[str] = VALID_NEXUS_KE
     return not valid_set.isdisjoint(split_line)
 
 
+__KEYWORD_SET_CACHE: dict[int, tuple[list[str], int, frozenset[str]]] = {}
+
+
+def __get_keyword_set(keywords: list[str]) -> frozenset[str]:
+    """Returns the keywords as a frozenset, cached against the list object so each list is only converted once."""
+    cached = __KEYWORD_SET_CACHE.get(id(keywords), None)
+    if cached is not None and cached[0] is keywords and cached[1] == len(keywords):
+        return cached[2]
+    if len(__KEYWORD_SET_CACHE) >= 64:
+        __KEYWORD_SET_CACHE.clear()
+    keyword_set = frozenset(keywords)
+    __KEYWORD_SET_CACHE[id(keywords)] = (keywords, len(keywords), keyword_set)
+    return keyword_set
+
+
 def create_templated_file(template_location: str, substitutions: dict, output_file_name: str) -> None:
     """Creates a new text file at the requested destination substituting the supplied values.
 
@@ -189,16 +212,17 @@ def check_for_and_populate_common_input_data(
     Returns:
         dict: Dictionary including found common input data
     """
-    for line in file_as_list:
+    for line_index, line in enumerate(file_as_list):
         # Check for description
-        check_property_in_line(line, property_dict, file_as_list)
+        check_property_in_line(line, property_dict, file_as_list, line_index=line_index)
 
 
 def check_property_in_line(
         line: str,
         property_dict: dict[
         str, Union[str, int, float, Enum, list[
-        str], np.ndarray, pd.DataFrame, dict[str, Union[float, pd.DataFrame]]]], file_as_list: list[str]) -> None:
+        str], np.ndarray, pd.DataFrame, dict[str, Union[float, pd.DataFrame]]]], file_as_list: list[str],
+        line_index: Optional[int] = None) -> None:
     """Given a line of Nexus input file content looking for common input data.
 
     e.g., units such as ENGLISH or METRIC, temperature units such as FAHR or CELSIUS, DATEFORMAT, etc.,
@@ -208,56 +232,68 @@ def check_property_in_line(
     line (str): line to search for the common input data
     file_as_list (list[str]): Nexus input file content
     property_dict (dict): Dictionary in which to include common input data if found
+    line_index (Optional[int]): index of the line in file_as_list. If not provided the file is searched for the line.
 
     Returns:
     dict: Dictionary including found common input data
     """
-    if check_token('DESC', line):
+    found_tokens = COMMON_INPUT_DATA_MATCHER.find_all(line)
+    if not found_tokens:
+        return
+    if 'DESC' in found_tokens:
         if 'DESC' in property_dict.keys():
             if isinstance(property_dict['DESC'], list):
                 property_dict['DESC'].append(line.split('DESC')[1].strip())
         else:
             property_dict['DESC'] = [line.split('DESC')[1].strip()]
     # Check for label
-    if check_token('LABEL', line):
-        property_dict['LABEL'] = get_expected_token_value('LABEL', line, file_as_list,
-                                                          custom_message='Invalid file: LABEL value not provided')
+    if 'LABEL' in found_tokens:
+        property_dict['LABEL'] = __get_expected_property_value('LABEL', line, file_as_list, line_index,
+                                                               custom_message='Invalid file: LABEL value not provided')
     # Check for dateformat
-    if check_token('DATEFORMAT', line):
-        date_format_value = get_expected_token_value('DATEFORMAT', line, file_as_list)
+    if 'DATEFORMAT' in found_tokens:
+        date_format_value = __get_expected_property_value('DATEFORMAT', line, file_as_list, line_index)
         if date_format_value == 'MM/DD/YYYY':
             property_dict['DATEFORMAT'] = DateFormat.MM_DD_YYYY
         else:
             property_dict['DATEFORMAT'] = DateFormat.DD_MM_YYYY
     # Check unit system specification
-    if check_token('ENGLISH', line):
+    if 'ENGLISH' in found_tokens:
         property_dict['UNIT_SYSTEM'] = UnitSystem.ENGLISH
-    if check_token('METRIC', line):
+    if 'METRIC' in found_tokens:
         property_dict['UNIT_SYSTEM'] = UnitSystem.METRIC
-    if check_token('METKG/CM2', line):
+    if 'METKG/CM2' in found_tokens:
         property_dict['UNIT_SYSTEM'] = UnitSystem.METKGCM2
-    if check_token('METBAR', line):
+    if 'METBAR' in found_tokens:
         property_dict['UNIT_SYSTEM'] = UnitSystem.METBAR
-    if check_token('LAB', line):
+    if 'LAB' in found_tokens:
         property_dict['UNIT_SYSTEM'] = UnitSystem.LAB
     # Check to see if salinity unit is provided
-    if check_token('SUNITS', line):
-        s_units_value = get_expected_token_value('SUNITS', line, file_as_list)
+    if 'SUNITS' in found_tokens:
+        s_units_value = __get_expected_property_value('SUNITS', line, file_as_list, line_index)
         if s_units_value == 'PPM':
             property_dict['SUNITS'] = SUnits.PPM
         else:
             property_dict['SUNITS'] = SUnits.MEQ_ML
     # Check to see if temperature units are provided
-    if check_token('KELVIN', line):
+    if 'KELVIN' in found_tokens:
         property_dict['TEMP_UNIT'] = TemperatureUnits.KELVIN
-    if check_token('RANKINE', line):
+    if 'RANKINE' in found_tokens:
         property_dict['TEMP_UNIT'] = TemperatureUnits.RANKINE
-    if check_token('FAHR', line):
+    if 'FAHR' in found_tokens:
         property_dict['TEMP_UNIT'] = TemperatureUnits.FAHR
-    if check_token('CELSIUS', line):
+    if 'CELSIUS' in found_tokens:
         property_dict['TEMP_UNIT'] = TemperatureUnits.CELSIUS
 
 
+def __get_expected_property_value(token: str, line: str, file_as_list: list[str], line_index: Optional[int],
+                                  custom_message: Optional[str] = None) -> str:
+    """Gets the value following a token, using the line index to avoid searching the file if it is known."""
+    if line_index is None:
+        return get_expected_token_value(token, line, file_as_list, custom_message=custom_message)
+    return get_expected_token_value_at(token, file_as_list, line_index, custom_message=custom_message)
+
+
 def looks_like_grid_array(file_path: str, lines2check: int = 10) -> bool:
     """Returns true if a Nexus include file begins with one of the Nexus grid array keywords.
 
@@ -470,11 +506,11 @@ def check_list_tokens(list_tokens: list[str], line: str) -> Optional[str]:
         Optional[str]: returns the token which was found otherwise returns None.
 
     """
-    for x in list_tokens:
-        token_found = check_token(x, line)
-        if token_found:
-            return x
-    return None
+    found_tokens = get_keyword_matcher(tuple(list_tokens)).find_all(line)
+    if not found_tokens:
+        return None
+    # return the token as it was provided, which may not be upper case
+    return next(x for x in list_tokens if x.upper() == found_tokens[0])
 
 
 def correct_datatypes(value: None | float | str, dtype: type,
@@ -0,0 +1,130 @@
+"""Copy-on-write cloning of a NexusSimulator model, e.g. for creating the cases of a sensitivity study.
+
+clone_model copies the structure of a model while sharing its content. The files of the model are cloned with
+File.clone, which shares the lines of each file with the base model until either of them edits the file in place, so
+the files a case doesn't change are held once however many cases are made. The objects parsed from the files, such as
+wells, completions, constraints, network objects and method tables, are copied with their attribute values shared, so
+that editing an object in a clone doesn't change the base model. Arrays and tables, such as grid arrays and method
+tables, are shared with the base model as read only views, and the arrays of the base model are made read only too, so
+that neither the base model nor any of its clones can edit the shared data in place. An array or table is edited by
+replacing it, e.g. with an edited copy, which changes only the model it is replaced in. Sections of the model that
+haven't been loaded are copied in their unloaded state and are loaded lazily by each clone from the shared file
+content.
+"""
+from __future__ import annotations
+
+import copy
+import types
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from ResSimpy.FileOperations.File import File
+from ResSimpy.FileOperations.file_content_store import FileContentStore
+
+if TYPE_CHECKING:
+    from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+
+# values that can't be edited in place, which are shared between a model and its clones
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, Enum, type, frozenset, np.generic)
+# objects shared between a model and its clones, e.g. the memory budget for the content of their files
+_SHARED_TYPES = (FileContentStore,)
+
+
+class _ModelCloner:
+    """Copies the objects of a model, sharing the content of its files and the immutable values held by the objects.
+
+    Each object is copied once, so that objects referenced from several places in the model, such as the model itself
+    or the network holding a collection, are replaced by the same copy throughout the clone.
+    """
+
+    def __init__(self) -> None:
+        """Initialises the _ModelCloner class with no objects copied yet."""
+        self.__file_clones: dict[int, File] = {}
+        self.__copies: dict[int, Any] = {}
+
+    def copy_value(self, value: Any) -> Any:
+        """Returns a copy of a value that can be edited without changing the original.
+
+        Args:
+            value (Any): the value to copy.
+
+        Returns:
+            Any: the original value if it can't be edited in place, otherwise a copy of it.
+        """
+        if isinstance(value, _IMMUTABLE_TYPES) or isinstance(value, _SHARED_TYPES):
+            return value
+        existing_copy = self.__copies.get(id(value))
+        if existing_copy is not None:
+            return existing_copy
+        if isinstance(value, File):
+            return value.clone(self.__file_clones)
+        if isinstance(value, list):
+            return [self.copy_value(x) for x in value]
+        if isinstance(value, dict):
+            return {key: self.copy_value(x) for key, x in value.items()}
+        if isinstance(value, tuple):
+            return tuple(self.copy_value(x) for x in value)
+        if isinstance(value, set):
+            return {self.copy_value(x) for x in value}
+        if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+            return _share_read_only(value)
+        if isinstance(value, types.MethodType):
+            return types.MethodType(value.__func__, self.copy_value(value.__self__))
+        if type(value).__module__.startswith('ResSimpy.') and hasattr(value, '__dict__'):
+            return self.__copy_object(value)
+        return value
+
+    def __copy_object(self, obj: Any) -> Any:
+        """Copies an object from ResSimpy along with the values of its attributes.
+
+        References to objects that have already been copied, e.g. from a collection back to the network holding it,
+        are replaced by their copies.
+        """
+        new_obj = copy.copy(obj)
+        self.__copies[id(obj)] = new_obj
+        new_state = vars(new_obj)
+        for attribute_name, attribute_value in vars(obj).items():
+            new_state[attribute_name] = self.copy_value(attribute_value)
+        return new_obj
+
+
+def _share_read_only(value: np.ndarray | pd.DataFrame | pd.Series) -> np.ndarray | pd.DataFrame | pd.Series:
+    """Makes an array or table read only and returns a read only view of it, or a table sharing its data through read
+    only views, to share with a clone.
+
+    Both sides are made read only so that an in place edit of either of them can't change the other. Tables with
+    columns that aren't held in numpy arrays, e.g. categorical columns, are copied instead and are left writeable.
+    """
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(value, pd.Series) and not isinstance(value.dtype, np.dtype) or \
+            isinstance(value, pd.DataFrame) and not all(isinstance(x, np.dtype) for x in value.dtypes):
+        return value.copy()
+    # the arrays holding the data of the table, so that in place edits of the table itself are refused
+    for array in value._mgr.arrays:
+        array.flags.writeable = False
+    if isinstance(value, pd.Series):
+        return pd.Series(_share_read_only(value.to_numpy()), index=value.index, name=value.name, copy=False)
+    # the columns are keyed by position, as the column names of a table aren't necessarily unique
+    table = pd.DataFrame({i: _share_read_only(value.iloc[:, i].to_numpy()) for i in range(value.shape[1])},
+                         index=value.index, copy=False)
+    table.columns = value.columns
+    return table
+
+
+def clone_model(model: NexusSimulator) -> NexusSimulator:
+    """Returns a copy of a model that shares the content of its unmodified files with the original model.
+
+    Args:
+        model (NexusSimulator): the model to clone.
+
+    Returns:
+        NexusSimulator: the clone, which can be edited and written out without changing the original model.
+    """
+    return _ModelCloner().copy_value(model)
@@ -0,0 +1,414 @@
+"""Structural comparison of two NexusSimulator models.
+
+diff_models reports the files, wells, completions, constraints, network objects, methods and grid array definitions
+that were added, removed or changed between a base model and another model. The files listed in the fcs file are
+compared first from their content digests, treating unmodified files at the same location as identical without reading
+them. A section whose files are identical in both models is skipped without being loaded, unless it has already been
+loaded in either model, in which case its objects are compared as they may have been edited in memory. Objects are
+compared from their memoized content digests so that only the objects which differ have their attributes compared, and
+methods are narrowed down to the tables that differ.
+"""
+from __future__ import annotations
+
+import os
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+import pandas as pd
+
+from ResSimpy.DataModelBaseClasses.DataObjectMixin import DataObjectMixin
+from ResSimpy.DataModelBaseClasses.DynamicProperty import DynamicProperty
+from ResSimpy.DataModelBaseClasses.GridArrayDefinition import GridArrayDefinition
+from ResSimpy.Enums.DiffChangeEnum import DiffChange
+from ResSimpy.FileOperations.File import File
+from ResSimpy.Nexus.DataModels.FcsFile import FcsNexusFile
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusGrid import NexusGrid
+from ResSimpy.Utils.content_hash import content_digest, file_digest, lines_digest
+
+if TYPE_CHECKING:
+    from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+
+# network collections compared object by object, other than the constraints which are keyed by name
+_NETWORK_COLLECTIONS = ('nodes', 'connections', 'well_connections', 'wellheads', 'wellbores', 'targets', 'welllists',
+                        'procs', 'actions', 'conlists', 'stations', 'nodelists', 'activation_changes', 'drills',
+                        'drill_sites', 'guide_rates', 'stream_tracers')
+
+# fcs keyword of the files holding each collection of methods, keyed by the name of the NexusSimulator property
+_METHOD_COLLECTIONS = {'pvt': 'PVT', 'separator': 'SEPARATOR', 'water': 'WATER', 'equil': 'EQUIL', 'rock': 'ROCK',
+                       'relperm': 'RELPM', 'valve': 'VALVE', 'aquifer': 'AQUIFER', 'hydraulics': 'HYD',
+                       'gaslift': 'GASLIFT'}
+
+# attributes identifying a completion within a well, used to pair up the completions that have changed
+_COMPLETION_KEY_ATTRIBUTES = ('date', 'i', 'j', 'k', 'cell_number', 'measured_depth')
+
+
+@dataclass
+class ModelDiffEntry:
+    """A single difference between a base model and another model.
+
+    Attributes:
+        section (str): the part of the model the item belongs to, e.g. 'files', 'wells.completions', 'network.nodes',
+            'pvt' or 'grid'.
+        name (str): the name of the item, e.g. the well name, the method number or the grid array name.
+        change (DiffChange): whether the item was added, removed or changed in the other model.
+        key (tuple[Any, ...]): identifies the item within the named object, e.g. the date and cell of a completion or
+            the name of a method table. Empty for items identified by their name alone.
+        changes (dict[str, tuple[Any, Any]]): the base and other values of each attribute that differs.
+    """
+    section: str
+    name: str
+    change: DiffChange
+    key: tuple[Any, ...] = ()
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class ModelDiff:
+    """The differences between a base model and another model.
+
+    Attributes:
+        entries (list[ModelDiffEntry]): the items that were added, removed or changed in the other model.
+        skipped_sections (list[str]): the sections that weren't compared as their files are identical in both models.
+    """
+    entries: list[ModelDiffEntry] = field(default_factory=list)
+    skipped_sections: list[str] = field(default_factory=list)
+
+    @property
+    def is_equal(self) -> bool:
+        """Returns True if no differences were found between the models."""
+        return not self.entries
+
+    def get_entries(self, section: Optional[str] = None, change: Optional[DiffChange] = None) -> \
+            list[ModelDiffEntry]:
+        """Returns the differences in a section of the model and/or of a kind of change.
+
+        Args:
+            section (Optional[str]): the section to return, including its subsections, e.g. 'network' also returns
+                the entries for 'network.nodes'. Defaults to all sections.
+            change (Optional[DiffChange]): the kind of change to return. Defaults to all changes.
+        """
+        return [x for x in self.entries
+                if (section is None or x.section == section or x.section.startswith(f'{section}.'))
+                and (change is None or x.change == change)]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Returns the differences as a DataFrame with a row per entry."""
+        return pd.DataFrame([(x.section, x.name, x.change.value, x.key, x.changes) for x in self.entries],
+                            columns=['section', 'name', 'change', 'key', 'changes'])
+
+
+class _FileComparer:
+    """Compares model files from the digests of their content, caching the digest of each file."""
+
+    def __init__(self) -> None:
+        """Initialises the _FileComparer class with empty caches."""
+        self.__file_digests: dict[int, bytes] = {}
+        self.__path_digests: dict[str, bytes] = {}
+
+    def file_digest(self, file: File) -> bytes:
+        """Returns the digest of the content of a file, excluding its includes."""
+        digest = self.__file_digests.get(id(file))
+        if digest is None:
+            if file.file_content_as_list is not None and not file.file_loading_skipped:
+                digest = lines_digest(file.file_content_as_list)
+            else:
+                digest = self.path_digest(file.location)
+            self.__file_digests[id(file)] = digest
+        return digest
+
+    def path_digest(self, path: str) -> bytes:
+        """Returns the digest of a file on disk, or of its path if the file doesn't exist."""
+        digest = self.__path_digests.get(path)
+        if digest is None:
+            digest = file_digest(path) if os.path.isfile(path) else content_digest(path)
+            self.__path_digests[path] = digest
+        return digest
+
+    def files_identical(self, base_file: File, other_file: File) -> bool:
+        """Returns True if two files and all of their includes have identical content."""
+        if base_file is other_file:
+            return True
+        same_unmodified_file = (os.path.normpath(base_file.location) == os.path.normpath(other_file.location)
+                                and not base_file.file_modified and not other_file.file_modified)
+        if not same_unmodified_file and self.file_digest(base_file) != self.file_digest(other_file):
+            return False
+        base_includes = base_file.include_objects or []
+        other_includes = other_file.include_objects or []
+        return len(base_includes) == len(other_includes) and \
+            all(self.files_identical(x, y) for x, y in zip(base_includes, other_includes))
+
+
+def _model_files_by_role(model_files: FcsNexusFile) -> dict[str, File]:
+    """Returns the files listed in an fcs file keyed by their role, e.g. 'STRUCTURED_GRID' or 'WELLS 1'."""
+    files_by_role: dict[str, File] = {}
+    for keyword, attribute_name in FcsNexusFile.fcs_keyword_map_single().items():
+        file = getattr(model_files, attribute_name)
+        if file is not None:
+            files_by_role[keyword] = file
+    for keyword, attribute_name in FcsNexusFile.fcs_keyword_map_multi().items():
+        for number, file in (getattr(model_files, attribute_name) or {}).items():
+            files_by_role[f'{keyword} {number}'] = file
+    return files_by_role
+
+
+def _changed_attributes(base_dict: dict[str, Any], other_dict: dict[str, Any]) -> dict[str, tuple[Any, Any]]:
+    """Returns the base and other values of each key whose value differs between two dictionaries."""
+    return {key: (base_dict.get(key), other_dict.get(key)) for key in dict.fromkeys([*base_dict, *other_dict])
+            if content_digest(base_dict.get(key)) != content_digest(other_dict.get(key))}
+
+
+def _diff_data_objects(section: str, base_objects: Sequence[DataObjectMixin],
+                       other_objects: Sequence[DataObjectMixin], key_attributes: Sequence[str],
+                       name: Optional[str] = None) -> list[ModelDiffEntry]:
+    """Compares two sequences of data objects, pairing up the objects that differ by their name and key attributes.
+
+    Args:
+        section (str): the section of the model the objects belong to.
+        base_objects (Sequence[DataObjectMixin]): the objects in the base model.
+        other_objects (Sequence[DataObjectMixin]): the objects in the other model.
+        key_attributes (Sequence[str]): the attributes identifying an object amongst those with the same name.
+        name (Optional[str]): the name to report the objects under. Defaults to the name of each object.
+    """
+    base_digests = [x.content_digest() for x in base_objects]
+    other_digests = [x.content_digest() for x in other_objects]
+    unmatched_digests = Counter(other_digests)
+    removed_objects = []
+    for base_object, digest in zip(base_objects, base_digests):
+        if unmatched_digests[digest] > 0:
+            unmatched_digests[digest] -= 1
+        else:
+            removed_objects.append(base_object)
+    added_objects = []
+    for other_object, digest in zip(other_objects, other_digests):
+        if unmatched_digests[digest] > 0:
+            unmatched_digests[digest] -= 1
+            added_objects.append(other_object)
+
+    def object_id(obj: DataObjectMixin) -> tuple[str, tuple[Any, ...]]:
+        return (name if name is not None else str(obj.name),
+                tuple(getattr(obj, attribute, None) for attribute in key_attributes))
+
+    removed_by_id: dict[tuple[str, tuple[Any, ...]], list[DataObjectMixin]] = {}
+    for removed_object in removed_objects:
+        removed_by_id.setdefault(object_id(removed_object), []).append(removed_object)
+
+    entries = []
+    for added_object in added_objects:
+        entry_name, key = object_id(added_object)
+        matching_removed = removed_by_id.get((entry_name, key))
+        if matching_removed:
+            changes = _changed_attributes(matching_removed.pop(0).to_dict(add_units=False, include_nones=False),
+                                          added_object.to_dict(add_units=False, include_nones=False))
+            entries.append(ModelDiffEntry(section, entry_name, DiffChange.CHANGED, key, changes))
+        else:
+            entries.append(ModelDiffEntry(section, entry_name, DiffChange.ADDED, key))
+    for (entry_name, key), unpaired_objects in removed_by_id.items():
+        entries.extend(ModelDiffEntry(section, entry_name, DiffChange.REMOVED, key) for _ in unpaired_objects)
+    return entries
+
+
+def _diff_files(base_files: dict[str, File], other_files: dict[str, File], comparer: _FileComparer) -> \
+        tuple[list[ModelDiffEntry], set[str]]:
+    """Compares the files listed in the fcs files, returning the differences and the roles of the identical files."""
+    entries = []
+    identical_roles = set()
+    for role in dict.fromkeys([*base_files, *other_files]):
+        base_file = base_files.get(role)
+        other_file = other_files.get(role)
+        if base_file is None:
+            entries.append(ModelDiffEntry('files', role, DiffChange.ADDED))
+        elif other_file is None:
+            entries.append(ModelDiffEntry('files', role, DiffChange.REMOVED))
+        elif comparer.files_identical(base_file, other_file):
+            identical_roles.add(role)
+        else:
+            entries.append(ModelDiffEntry('files', role, DiffChange.CHANGED,
+                                          changes={'location': (base_file.location, other_file.location)}))
+    return entries, identical_roles
+
+
+def _diff_wells(base: NexusSimulator, other: NexusSimulator) -> list[ModelDiffEntry]:
+    """Compares the wells of two models, along with their completions and wellmods."""
+    base_wells = {x.well_name: x for x in base.wells.get_all()}
+    other_wells = {x.well_name: x for x in other.wells.get_all()}
+    entries = []
+    for well_name in dict.fromkeys([*base_wells, *other_wells]):
+        base_well = base_wells.get(well_name)
+        other_well = other_wells.get(well_name)
+        if base_well is None:
+            entries.append(ModelDiffEntry('wells', well_name, DiffChange.ADDED))
+        elif other_well is None:
+            entries.append(ModelDiffEntry('wells', well_name, DiffChange.REMOVED))
+        else:
+            entries.extend(_diff_data_objects('wells.completions', base_well.completions, other_well.completions,
+                                              _COMPLETION_KEY_ATTRIBUTES, name=well_name))
+            entries.extend(_diff_data_objects('wells.wellmods', base_well.wellmods, other_well.wellmods, ('date',),
+                                              name=well_name))
+    return entries
+
+
+def _diff_network(base: NexusSimulator, other: NexusSimulator) -> list[ModelDiffEntry]:
+    """Compares the constraints and the objects in each collection of the networks of two models."""
+    entries = []
+    for collection_name in _NETWORK_COLLECTIONS:
+        entries.extend(_diff_data_objects(f'network.{collection_name}',
+                                          getattr(base.network, collection_name).get_all(),
+                                          getattr(other.network, collection_name).get_all(), ('date',)))
+    base_constraints = [x for constraints in base.network.constraints.get_all().values() for x in constraints]
+    other_constraints = [x for constraints in other.network.constraints.get_all().values() for x in constraints]
+    entries.extend(_diff_data_objects('network.constraints', base_constraints, other_constraints, ('date',)))
+    return entries
+
+
+def _diff_method(section: str, number: int, base_method: DynamicProperty, other_method: DynamicProperty) -> \
+        list[ModelDiffEntry]:
+    """Compares two methods table by table, returning an entry per table and one for any other changed attribute."""
+    name = str(number)
+    entries = []
+    base_properties = base_method.properties
+    other_properties = other_method.properties
+    for table_name in dict.fromkeys([*base_properties, *other_properties]):
+        if table_name not in base_properties:
+            entries.append(ModelDiffEntry(section, name, DiffChange.ADDED, (table_name,)))
+        elif table_name not in other_properties:
+            entries.append(ModelDiffEntry(section, name, DiffChange.REMOVED, (table_name,)))
+        elif content_digest(base_properties[table_name]) != content_digest(other_properties[table_name]):
+            base_value = base_properties[table_name]
+            other_value = other_properties[table_name]
+            # tables are reported by name only, as their values can be compared from the methods themselves
+            changes = {} if isinstance(base_value, (pd.DataFrame, dict)) else {'value': (base_value, other_value)}
+            entries.append(ModelDiffEntry(section, name, DiffChange.CHANGED, (table_name,), changes))
+    other_attributes = {x.name: getattr(base_method, x.name, None) for x in fields(base_method)
+                        if x.compare and x.name != 'properties'}
+    changes = _changed_attributes(other_attributes,
+                                  {x: getattr(other_method, x, None) for x in other_attributes})
+    if changes:
+        entries.append(ModelDiffEntry(section, name, DiffChange.CHANGED, changes=changes))
+    return entries
+
+
+def _diff_grid_arrays(base_array: GridArrayDefinition, other_array: GridArrayDefinition, name: str,
+                      key: tuple[Any, ...], comparer: _FileComparer) -> Optional[ModelDiffEntry]:
+    """Compares two grid array definitions, comparing the content of include files rather than their paths."""
+    if base_array.value is None and other_array.value is None:
+        return None
+    if base_array.value is None:
+        return ModelDiffEntry('grid', name, DiffChange.ADDED, key)
+    if other_array.value is None:
+        return ModelDiffEntry('grid', name, DiffChange.REMOVED, key)
+    base_value: Any = base_array.value
+    other_value: Any = other_array.value
+    if base_array.absolute_path is not None and other_array.absolute_path is not None:
+        if os.path.normpath(base_array.absolute_path) == os.path.normpath(other_array.absolute_path):
+            base_value = other_value = base_array.absolute_path
+        else:
+            base_value = comparer.path_digest(base_array.absolute_path)
+            other_value = comparer.path_digest(other_array.absolute_path)
+    changes = _changed_attributes(
+        {'modifier': base_array.modifier, 'value': base_value, 'mods': base_array.mods, 'array': base_array.array},
+        {'modifier': other_array.modifier, 'value': other_value, 'mods': other_array.mods,
+         'array': other_array.array})
+    if not changes:
+        return None
+    if 'value' in changes:
+        changes['value'] = (base_array.value, other_array.value)
+    return ModelDiffEntry('grid', name, DiffChange.CHANGED, key, changes)
+
+
+def _diff_grid(base_grid: NexusGrid, other_grid: NexusGrid, comparer: _FileComparer) -> list[ModelDiffEntry]:
+    """Compares the grid array definitions of two grids."""
+    entries = []
+    # the unique array names in the order they are written out
+    array_names = dict.fromkeys(x[0] for x in NexusGrid.keyword_mapping().values())
+    for array_name in array_names:
+        base_arrays = getattr(base_grid, array_name)
+        other_arrays = getattr(other_grid, array_name)
+        pairs: list[tuple[tuple[Any, ...], GridArrayDefinition, GridArrayDefinition]]
+        if isinstance(base_arrays, dict):
+            # region arrays are keyed by the region name
+            empty_array = GridArrayDefinition()
+            pairs = [((region_name,), base_arrays.get(region_name, empty_array),
+                      other_arrays.get(region_name, empty_array))
+                     for region_name in dict.fromkeys([*base_arrays, *other_arrays])]
+        else:
+            pairs = [((), base_arrays, other_arrays)]
+        for key, base_array, other_array in pairs:
+            entry = _diff_grid_arrays(base_array, other_array, array_name, key, comparer)
+            if entry is not None:
+                entries.append(entry)
+    return entries
+
+
+def _properties_loaded(methods: Any) -> bool:
+    """Returns True if a collection of methods has already loaded its methods."""
+    return getattr(methods, f'_{type(methods).__name__}__properties_loaded', True)
+
+
+def diff_models(base: NexusSimulator, other: NexusSimulator) -> ModelDiff:
+    """Returns the structural differences between a base model and another model.
+
+    Args:
+        base (NexusSimulator): the model to compare against.
+        other (NexusSimulator): the model to compare, whose items are reported as added, removed or changed relative
+            to the base model.
+
+    Returns:
+        ModelDiff: the differences between the models and the sections skipped as their files are identical.
+    """
+    comparer = _FileComparer()
+    base_files = _model_files_by_role(base.model_files)
+    other_files = _model_files_by_role(other.model_files)
+    file_entries, identical_roles = _diff_files(base_files, other_files, comparer)
+    result = ModelDiff(entries=file_entries)
+    all_roles = {*base_files, *other_files}
+
+    def files_identical(keyword: str, number: Optional[int] = None) -> bool:
+        roles = [x for x in all_roles if x.split(' ')[0] == keyword and (number is None or x == f'{keyword} {number}')]
+        return all(x in identical_roles for x in roles)
+
+    base_grid = base.grid
+    other_grid = other.grid
+    # whether each section was loaded before the comparison, as loading one section can load another
+    already_loaded = {
+        'wells': base.wells._wells_loaded or other.wells._wells_loaded,
+        'network': base.network._has_been_loaded or other.network._has_been_loaded,
+        'grid': (base_grid is not None and base_grid._grid_properties_loaded) or
+                (other_grid is not None and other_grid._grid_properties_loaded),
+    }
+    for section in _METHOD_COLLECTIONS:
+        already_loaded[section] = _properties_loaded(getattr(base, section)) or \
+            _properties_loaded(getattr(other, section))
+
+    def compare_section(section: str, keyword: str) -> bool:
+        if already_loaded[section] or not files_identical(keyword):
+            return True
+        result.skipped_sections.append(section)
+        return False
+
+    if compare_section('wells', 'WELLS'):
+        result.entries.extend(_diff_wells(base, other))
+
+    if compare_section('network', 'SURFACE'):
+        result.entries.extend(_diff_network(base, other))
+
+    for section, keyword in _METHOD_COLLECTIONS.items():
+        if not compare_section(section, keyword):
+            continue
+        base_inputs = getattr(base, section).inputs
+        other_inputs = getattr(other, section).inputs
+        for number in dict.fromkeys([*base_inputs, *other_inputs]):
+            if not already_loaded[section] and files_identical(keyword, number):
+                # methods loaded from identical files are identical
+                continue
+            if number not in base_inputs:
+                result.entries.append(ModelDiffEntry(section, str(number), DiffChange.ADDED))
+            elif number not in other_inputs:
+                result.entries.append(ModelDiffEntry(section, str(number), DiffChange.REMOVED))
+            else:
+                result.entries.extend(_diff_method(section, number, base_inputs[number], other_inputs[number]))
+
+    if base_grid is not None and other_grid is not None and compare_section('grid', 'STRUCTURED_GRID'):
+        result.entries.extend(_diff_grid(base_grid, other_grid, comparer))
+
+    return result
@@ -0,0 +1,79 @@
+"""Conversion of a whole NexusSimulator model to a different unit system."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ResSimpy.DataModelBaseClasses.GridArrayDefinition import GridArrayDefinition
+from ResSimpy.Enums.UnitsEnum import UnitSystem
+from ResSimpy.Units.UnitConversion import (conversion_factors, convert_data_objects, convert_dynamic_property,
+                                           convert_grid_array, set_stored_attribute)
+from ResSimpy.Units.Units import Compressibility, Length, Pressure, Temperature, UnitDimension
+
+if TYPE_CHECKING:
+    from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+
+# network collections holding objects with a unit system, other than the constraints which are keyed by name
+_NETWORK_COLLECTIONS = ('nodes', 'connections', 'well_connections', 'wellheads', 'wellbores', 'targets', 'welllists',
+                        'procs', 'actions', 'conlists', 'stations', 'nodelists', 'drills', 'drill_sites',
+                        'guide_rates', 'stream_tracers')
+
+# dimension of each grid array that changes with the unit system, keyed by the name of the NexusGrid property
+_GRID_ARRAY_DIMENSIONS: dict[str, UnitDimension] = {
+    'dx': Length(),
+    'dy': Length(),
+    'dz': Length(),
+    'depth': Length(),
+    'mdepth': Length(),
+    'dznet': Length(),
+    'corp': Length(),
+    'pressure': Pressure(),
+    'pcw_swl': Pressure(),
+    'pcg_sgu': Pressure(),
+    'temperature': Temperature(),
+    'compr': Compressibility(),
+}
+
+
+def convert_model_units(model: NexusSimulator, unit_system: UnitSystem) -> None:
+    """Converts the wells, network, methods and grid of a model to a unit system in place.
+
+    Args:
+        model (NexusSimulator): the model to convert.
+        unit_system (UnitSystem): the unit system to convert the model to.
+    """
+    # raises a ValueError before anything is changed if any of the unit systems can't be converted
+    conversion_factors(Length(), model.default_units, unit_system)
+    grid = model.grid
+    # the grid file can declare a unit system different to the model's
+    grid_unit_system = grid.unit_system if grid is not None else unit_system
+    conversion_factors(Length(), grid_unit_system, unit_system)
+
+    for well in model.wells.get_all():
+        convert_data_objects(well.completions, unit_system)
+        convert_data_objects(well.wellmods, unit_system)
+        set_stored_attribute(well, 'unit_system', unit_system)
+
+    network = model.network
+    for collection_name in _NETWORK_COLLECTIONS:
+        collection = getattr(network, collection_name)
+        convert_data_objects(collection.get_all(), unit_system)
+        if hasattr(collection, '_resolved_network_objects'):
+            del collection._resolved_network_objects
+    convert_data_objects([x for constraints in network.constraints.get_all().values() for x in constraints],
+                         unit_system)
+
+    for methods in (model.pvt, model.separator, model.water, model.equil, model.rock, model.relperm, model.valve,
+                    model.aquifer, model.hydraulics, model.gaslift):
+        for method in methods.inputs.values():
+            convert_dynamic_property(method, unit_system)
+
+    if grid is not None:
+        for array_name, dimension in _GRID_ARRAY_DIMENSIONS.items():
+            grid_arrays = getattr(grid, array_name)
+            for grid_array in grid_arrays.values() if isinstance(grid_arrays, dict) else [grid_arrays]:
+                if isinstance(grid_array, GridArrayDefinition):
+                    convert_grid_array(grid_array, dimension, grid_unit_system, unit_system)
+        set_stored_attribute(grid, 'model_unit_system', unit_system)
+        set_stored_attribute(grid, 'unit_system', unit_system)
+
+    set_stored_attribute(model, 'default_units', unit_system)
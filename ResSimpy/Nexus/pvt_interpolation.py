@@ -0,0 +1,217 @@
+"""Vectorised evaluation of Nexus black oil PVT tables.
+
+BlackOilPvtTables converts the SATURATED (or OIL and GAS) tables and the UNSATOIL branches of a NexusPVTMethod into
+sorted NumPy arrays once, then evaluates the fluid properties for arrays of pressures with NumPy operations only.
+
+Saturated properties are linearly interpolated in pressure and held constant beyond the ends of the table. For
+undersaturated oil, the saturation pressure is found from the solution gas oil ratio of each point. The oil formation
+volume factor and viscosity are the saturated values at that saturation pressure multiplied by a factor interpolated
+from the UNSATOIL branches: linearly in the pressure above the saturation pressure within each branch, and linearly
+in saturation pressure between the two nearest branches.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+# properties of the oil that change with pressure above the saturation pressure, and the columns giving them as a
+# factor of the value at the saturation pressure
+_UNDERSATURATED_OIL_FACTORS = {'BO': 'BOFAC', 'VO': 'VOFAC'}
+
+
+@dataclass(frozen=True)
+class UndersaturatedOilBranch:
+    """An UNSATOIL table converted to factors of the saturated values.
+
+    Attributes:
+        saturation_pressure (float): the saturation pressure the branch emanates from.
+        pressure_above_saturation (np.ndarray): the pressures of the branch minus the saturation pressure, ascending.
+        factors (dict[str, np.ndarray]): the property (e.g. BO, VO) divided by its value at the saturation pressure,
+            for each pressure of the branch.
+    """
+    saturation_pressure: float
+    pressure_above_saturation: np.ndarray
+    factors: dict[str, np.ndarray]
+
+
+@dataclass(frozen=True)
+class BlackOilPvtTables:
+    """The black oil tables of a PVT method as sorted arrays.
+
+    Attributes:
+        saturated (dict[str, tuple[np.ndarray, np.ndarray]]): the ascending pressures and values of each saturated
+            property, keyed by the Nexus column name (e.g. BO, BG, RS, VO, VG).
+        undersaturated_oil (tuple[UndersaturatedOilBranch, ...]): the UNSATOIL branches, in order of ascending
+            saturation pressure.
+    """
+    saturated: dict[str, tuple[np.ndarray, np.ndarray]]
+    undersaturated_oil: tuple[UndersaturatedOilBranch, ...]
+
+    @classmethod
+    def from_properties(cls: type[BlackOilPvtTables], properties: Mapping[str, object]) -> BlackOilPvtTables:
+        """Builds the arrays from the properties of a NexusPVTMethod.
+
+        Args:
+            properties (Mapping[str, object]): the properties read from a PVT method file.
+
+        Raises:
+            ValueError: if there are no saturated tables with a PRES column.
+        """
+        saturated: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for table_name in ['SATURATED', 'OIL', 'GAS']:
+            table = properties.get(table_name)
+            if not isinstance(table, pd.DataFrame) or 'PRES' not in table.columns:
+                continue
+            table = table.sort_values('PRES')
+            pressure = table['PRES'].to_numpy(dtype=float)
+            for column in table.columns:
+                if column != 'PRES' and column not in saturated:
+                    saturated[column] = (pressure, table[column].to_numpy(dtype=float))
+        if not saturated:
+            raise ValueError('No SATURATED, OIL or GAS table with a PRES column found to evaluate.')
+
+        tables = cls(saturated=saturated, undersaturated_oil=())
+        branches = []
+        for table_name, branch_key in [('UNSATOIL_PSAT', 'PSAT'), ('UNSATOIL_RSSAT', 'RSSAT')]:
+            branch_tables = properties.get(table_name)
+            if not isinstance(branch_tables, dict):
+                continue
+            for key, table in branch_tables.items():
+                if not isinstance(table, pd.DataFrame):
+                    continue
+                saturation_pressure = float(key) if branch_key == 'PSAT' else \
+                    float(tables.saturation_pressure(np.array(float(key))))
+                branches.append(tables.__undersaturated_branch(saturation_pressure, table))
+
+        branches.sort(key=lambda x: x.saturation_pressure)
+        return cls(saturated=saturated, undersaturated_oil=tuple(branches))
+
+    def __undersaturated_branch(self, saturation_pressure: float, table: pd.DataFrame) -> UndersaturatedOilBranch:
+        """Converts an UNSATOIL table to pressures above the saturation pressure and factors of the saturated values."""
+        if 'DP' in table.columns:
+            pressure_above_saturation = table['DP'].to_numpy(dtype=float)
+        else:
+            pressure_above_saturation = table['PRES'].to_numpy(dtype=float) - saturation_pressure
+        order = np.argsort(pressure_above_saturation, kind='stable')
+
+        factors = {}
+        for column, factor_column in _UNDERSATURATED_OIL_FACTORS.items():
+            if factor_column in table.columns:
+                factors[column] = table[factor_column].to_numpy(dtype=float)[order]
+            elif column in table.columns and column in self.saturated:
+                saturated_value = self.__interpolate_saturated(column, np.array(saturation_pressure))
+                factors[column] = table[column].to_numpy(dtype=float)[order] / saturated_value
+        return UndersaturatedOilBranch(saturation_pressure=saturation_pressure,
+                                       pressure_above_saturation=pressure_above_saturation[order], factors=factors)
+
+    def __interpolate_saturated(self, column: str, pressure: np.ndarray) -> np.ndarray:
+        """Interpolates a saturated property, holding it constant beyond the ends of the table."""
+        table_pressure, values = self.saturated[column]
+        return np.interp(pressure, table_pressure, values)
+
+    def saturation_pressure(self, solution_gas_oil_ratio: npt.ArrayLike) -> np.ndarray:
+        """Returns the saturation pressure for solution gas oil ratios, from the RS column of the saturated table.
+
+        Args:
+            solution_gas_oil_ratio (npt.ArrayLike): the solution gas oil ratios.
+
+        Raises:
+            ValueError: if there is no RS column in the saturated tables.
+        """
+        if 'RS' not in self.saturated:
+            raise ValueError('No RS column found in the saturated tables.')
+        table_pressure, table_rs = self.saturated['RS']
+        return np.interp(np.asarray(solution_gas_oil_ratio, dtype=float), table_rs, table_pressure)
+
+    def evaluate(self, pressure: npt.ArrayLike, solution_gas_oil_ratio: Optional[npt.ArrayLike] = None) -> \
+            dict[str, np.ndarray]:
+        """Evaluates the fluid properties at arrays of pressures.
+
+        Args:
+            pressure (npt.ArrayLike): the pressures to evaluate the properties at.
+            solution_gas_oil_ratio (Optional[npt.ArrayLike]): the solution gas oil ratio (RS) of the oil at each
+                pressure. Points with a lower RS than the saturated RS at their pressure are undersaturated. If None,
+                the oil is taken to be saturated at every pressure.
+
+        Returns:
+            dict[str, np.ndarray]: the value of each property in the tables (e.g. BO, BG, RS, VO, VG) at each point,
+                with the broadcast shape of the inputs.
+        """
+        if solution_gas_oil_ratio is None:
+            solution_gas_oil_ratio = np.inf
+        pressure, rs = np.broadcast_arrays(np.asarray(pressure, dtype=float),
+                                           np.asarray(solution_gas_oil_ratio, dtype=float))
+        shape = pressure.shape
+        results = self.__evaluate_flat(pressure.ravel(), rs.ravel())
+        return {column: values.reshape(shape) for column, values in results.items()}
+
+    def __evaluate_flat(self, pressure: np.ndarray, rs: np.ndarray) -> dict[str, np.ndarray]:
+        """Evaluates the fluid properties at 1D arrays of pressures and solution gas oil ratios."""
+        results = {column: self.__interpolate_saturated(column, pressure) for column in self.saturated}
+        saturated_rs = results.get('RS')
+        if saturated_rs is None:
+            return results
+
+        undersaturated = rs < saturated_rs
+        if not undersaturated.any():
+            return results
+        results['RS'] = np.where(undersaturated, rs, saturated_rs)
+
+        undersaturated_pressure = pressure[undersaturated]
+        saturation_pressure = self.saturation_pressure(rs[undersaturated])
+        factors = self.__undersaturated_factors(saturation_pressure, undersaturated_pressure - saturation_pressure)
+        for column in _UNDERSATURATED_OIL_FACTORS:
+            if column not in results:
+                continue
+            oil_property = results[column].copy()
+            oil_property[undersaturated] = self.__interpolate_saturated(column, saturation_pressure) * \
+                factors.get(column, 1.0)
+            results[column] = oil_property
+        return results
+
+    def __undersaturated_factors(self, saturation_pressure: np.ndarray, pressure_above_saturation: np.ndarray) -> \
+            dict[str, np.ndarray]:
+        """Interpolates the undersaturated oil factors between the two branches nearest to each saturation pressure."""
+        branches = self.undersaturated_oil
+        if not branches:
+            return {}
+        branch_pressures = np.array([x.saturation_pressure for x in branches])
+        if len(branches) == 1:
+            lower_branch = np.zeros(len(saturation_pressure), dtype=np.intp)
+            upper_weight = np.zeros(len(saturation_pressure))
+        else:
+            lower_branch = np.clip(np.searchsorted(branch_pressures, saturation_pressure, side='right') - 1, 0,
+                                   len(branches) - 2)
+            upper_weight = np.clip((saturation_pressure - branch_pressures[lower_branch]) /
+                                   (branch_pressures[lower_branch + 1] - branch_pressures[lower_branch]), 0.0, 1.0)
+
+        factors: dict[str, np.ndarray] = {}
+        for column in _UNDERSATURATED_OIL_FACTORS:
+            if not all(column in x.factors for x in branches):
+                continue
+            column_factors = np.zeros(len(saturation_pressure))
+            for branch_index, branch in enumerate(branches):
+                for selected, weight in [(lower_branch == branch_index, 1.0 - upper_weight),
+                                         (lower_branch + 1 == branch_index, upper_weight)]:
+                    if not selected.any():
+                        continue
+                    column_factors[selected] += weight[selected] * _interpolate_linear_extrapolation(
+                        pressure_above_saturation[selected], branch.pressure_above_saturation, branch.factors[column])
+            factors[column] = column_factors
+        return factors
+
+
+def _interpolate_linear_extrapolation(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """Linearly interpolates, extrapolating from the first and last two points outside the range of xp."""
+    result = np.interp(x, xp, fp)
+    if len(xp) < 2:
+        return result
+    below = x < xp[0]
+    result[below] = fp[0] + (x[below] - xp[0]) * (fp[1] - fp[0]) / (xp[1] - xp[0])
+    above = x > xp[-1]
+    result[above] = fp[-1] + (x[above] - xp[-1]) * (fp[-1] - fp[-2]) / (xp[-1] - xp[-2])
+    return result
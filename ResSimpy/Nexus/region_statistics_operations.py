@@ -0,0 +1,142 @@
+"""Functions for calculating statistics of grid arrays grouped by a region array such as IREGION, IPVT or ISECTOR."""
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+SUPPORTED_STATISTICS = ['count', 'sum', 'mean', 'min', 'max']
+
+
+class RegionIndex:
+    """Precomputed mapping from each region number to the cells in that region.
+
+    The cells are stored sorted by region, so each region is a contiguous slice and reductions across all regions can
+    be carried out with a single vectorised call.
+
+    Attributes:
+        regions (np.ndarray): the unique region numbers in ascending order.
+        counts (np.ndarray): the number of cells in each region.
+        order (np.ndarray): flat cell indices sorted by region number.
+        starts (np.ndarray): position in order of the first cell in each region.
+    """
+    regions: np.ndarray
+    counts: np.ndarray
+    order: np.ndarray
+    starts: np.ndarray
+
+    def __init__(self, region_array: np.ndarray) -> None:
+        """Initialises the RegionIndex class.
+
+        Args:
+            region_array (np.ndarray): flat array with the integer region number of each cell.
+        """
+        region_numbers = np.asarray(region_array).ravel().astype(np.int64, copy=False)
+        self.order = np.argsort(region_numbers, kind='stable')
+        self.regions, self.starts, self.counts = np.unique(region_numbers[self.order], return_index=True,
+                                                           return_counts=True)
+
+    @property
+    def cell_count(self) -> int:
+        """Returns the total number of cells in the index."""
+        return len(self.order)
+
+    def cell_indices(self, region: int) -> np.ndarray:
+        """Returns the flat indices of the cells in a region, or an empty array if the region is not used.
+
+        Args:
+            region (int): the region number.
+        """
+        position = np.searchsorted(self.regions, region)
+        if position == len(self.regions) or self.regions[position] != region:
+            return np.array([], dtype=self.order.dtype)
+        start = self.starts[position]
+        return self.order[start:start + self.counts[position]]
+
+
+def region_statistics(values: np.ndarray | float, region_index: RegionIndex,
+                      statistics: Sequence[str] = ('mean', 'min', 'max'),
+                      percentiles: Sequence[float] = (), weights: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """Calculates statistics of a grid array for each region.
+
+    When weights are provided the mean and percentiles are weighted, while count, sum, min and max are not.
+
+    Args:
+        values (np.ndarray | float): flat array of values, or a single value for every cell.
+        region_index (RegionIndex): the precomputed region index for the region array.
+        statistics (Sequence[str]): any of 'count', 'sum', 'mean', 'min' and 'max'.
+        percentiles (Sequence[float]): percentiles between 0 and 100 to calculate, added as columns named e.g. 'P10'.
+        weights (Optional[np.ndarray]): flat array of weights for each cell, e.g. pore volume.
+
+    Returns:
+        pd.DataFrame: a row for each region, indexed by region number, with a column for each statistic.
+    """
+    unknown_statistics = [x for x in statistics if x not in SUPPORTED_STATISTICS]
+    if unknown_statistics:
+        raise ValueError(f'Unsupported statistics {unknown_statistics}, expected any of {SUPPORTED_STATISTICS}.')
+    if any(not 0 <= x <= 100 for x in percentiles):
+        raise ValueError('Percentiles must be between 0 and 100.')
+
+    sorted_values = _sorted_by_region(values, region_index)
+    sorted_weights = None if weights is None else _sorted_by_region(weights, region_index)
+    starts = region_index.starts
+    results: dict[str, np.ndarray] = {}
+
+    for statistic in statistics:
+        match statistic:
+            case 'count':
+                results[statistic] = region_index.counts
+            case 'sum':
+                results[statistic] = np.add.reduceat(sorted_values, starts) if len(starts) else np.array([])
+            case 'min':
+                results[statistic] = np.minimum.reduceat(sorted_values, starts) if len(starts) else np.array([])
+            case 'max':
+                results[statistic] = np.maximum.reduceat(sorted_values, starts) if len(starts) else np.array([])
+            case 'mean':
+                if not len(starts):
+                    results[statistic] = np.array([])
+                elif sorted_weights is None:
+                    results[statistic] = np.add.reduceat(sorted_values, starts) / region_index.counts
+                else:
+                    weight_totals = np.add.reduceat(sorted_weights, starts)
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        results[statistic] = np.add.reduceat(sorted_values * sorted_weights, starts) / weight_totals
+
+    if percentiles:
+        percentile_values = _region_percentiles(sorted_values, sorted_weights, region_index, percentiles)
+        for percentile, column in zip(percentiles, percentile_values.T):
+            results[f'P{percentile:g}'] = column
+
+    return pd.DataFrame(results, index=pd.Index(region_index.regions, name='REGION'))
+
+
+def _sorted_by_region(values: np.ndarray | float, region_index: RegionIndex) -> np.ndarray:
+    """Returns the values reordered so that the cells in each region are contiguous."""
+    if np.ndim(values) == 0:
+        return np.full(region_index.cell_count, float(values))  # type: ignore[arg-type]
+    array = np.asarray(values, dtype=float).ravel()
+    if array.size != region_index.cell_count:
+        raise ValueError(f'Array of size {array.size} does not match region array of size {region_index.cell_count}.')
+    return array[region_index.order]
+
+
+def _region_percentiles(sorted_values: np.ndarray, sorted_weights: Optional[np.ndarray], region_index: RegionIndex,
+                        percentiles: Sequence[float]) -> np.ndarray:
+    """Calculates percentiles for each region, weighted by the cumulative weight within each region if provided."""
+    fractions = np.asarray(percentiles, dtype=float) / 100.0
+    results = np.full((len(region_index.regions), len(fractions)), np.nan)
+    for position, (start, count) in enumerate(zip(region_index.starts, region_index.counts)):
+        region_values = sorted_values[start:start + count]
+        if sorted_weights is None:
+            results[position] = np.quantile(region_values, fractions)
+            continue
+        region_weights = sorted_weights[start:start + count]
+        value_order = np.argsort(region_values, kind='stable')
+        cumulative_weights = np.cumsum(region_weights[value_order])
+        if cumulative_weights[-1] <= 0:
+            continue
+        # place each value at the midpoint of its cell's share of the cumulative weight
+        positions = (cumulative_weights - 0.5 * region_weights[value_order]) / cumulative_weights[-1]
+        results[position] = np.interp(fractions, positions, region_values[value_order])
+    return results
@@ -1,5 +1,4 @@
 from __future__ import annotations
-from typing import Optional
 import ResSimpy.Nexus.nexus_file_operations as nfo
 
 
@@ -81,9 +80,9 @@ def load_nexus_relperm_table(relperm_file_path: str) -> dict[str, list[tuple[flo
     table_heading = None
 
     for index, line in enumerate(file_as_list):
-        first_value_in_line = nfo.get_next_value(0, [line], line)
-        if first_value_in_line in possible_table_headings:
-            table_heading = first_value_in_line
+        line_values = _split_table_line(line)
+        if line_values and line_values[0] in possible_table_headings:
+            table_heading = line_values[0]
             header_index = index + 1
             break
 
@@ -91,39 +90,19 @@ def load_nexus_relperm_table(relperm_file_path: str) -> dict[str, list[tuple[flo
         raise ValueError("Cannot find the header for this relperm table")
 
     # Read in the header line to get the column order
-    header_line = file_as_list[header_index]
-    columns: list[str] = []
-
-    next_column_heading = nfo.get_next_value(0, [header_line], header_line)
-    next_line = header_line
-    while next_column_heading is not None:
-        columns.append(next_column_heading)
-        next_line = next_line.replace(next_column_heading, "", 1)
-        next_column_heading = nfo.get_next_value(0, [next_line], next_line)
+    columns = _split_table_line(file_as_list[header_index]) if header_index < len(file_as_list) else []
 
     # Load in each row from the table
-    all_values: list[Optional[dict[str, str]]] = []
+    all_values: list[dict[str, str]] = []
 
     for line in file_as_list[header_index + 1:]:
-        trimmed_line = line
-        line_values: Optional[dict[str, str]] = {}
-        for column in columns:
-            value = nfo.get_next_value(0, [trimmed_line], trimmed_line)
-
-            # If we hit a comment or blank line, assume that we've reached the end of our table
-            if value is None:
-                line_values = None
+        line_values = _split_table_line(line)
+        # If we hit a comment or blank line, assume that we've reached the end of our table
+        if len(line_values) < len(columns) or not columns:
+            if len(all_values) > 0:
                 break
-
-            trimmed_line = trimmed_line.replace(value, "", 1)
-
-            if line_values is not None:
-                line_values[column] = value
-        if line_values is not None:
-            all_values.append(line_values)
-        elif len(all_values) > 0:
-            # We've reached the end of the table, finish reading the lines now
-            break
+            continue
+        all_values.append(dict(zip(columns, line_values)))
 
     # Retrieve the water and gas values, and return them
     single_fluid_relperms = []  # E.g. Water
@@ -136,9 +115,7 @@ def load_nexus_relperm_table(relperm_file_path: str) -> dict[str, list[tuple[flo
     base_saturation_heading = get_relperm_base_saturation_column_heading(
         table_heading)
 
-    for index, row in enumerate(all_values):
-        if row is None:
-            continue
+    for row in all_values:
         single_fluid_relperms.append(
             (float(row[base_saturation_heading]),
              float(row[single_fluid_column_heading]))
@@ -149,3 +126,14 @@ def load_nexus_relperm_table(relperm_file_path: str) -> dict[str, list[tuple[flo
         )
 
     return {'single_fluid': single_fluid_relperms, 'combined_fluids': combined_fluid_relperms}
+
+
+def _split_table_line(line: str) -> list[str]:
+    """Splits a line of a relperm table into its values, ignoring comments.
+
+    Values are separated by whitespace or commas. Everything after a ! is a comment, as is a line starting with a
+    single C.
+    """
+    if line.startswith('C') and (len(line) == 1 or line[1] == ' '):
+        return []
+    return line.split('!', 1)[0].replace(',', ' ').split()
@@ -0,0 +1,199 @@
+"""Batched evaluation of Nexus relative permeability and capillary pressure tables.
+
+RelPermTables converts the saturation tables of a NexusRelPermMethod (e.g. WOTABLE, GOTABLE, GWTABLE) into sorted,
+contiguous NumPy arrays once, then looks up the relative permeabilities and capillary pressures for arrays of
+saturations with NumPy operations only. Values are linearly interpolated in saturation and held constant beyond the
+ends of the table.
+
+End point scaling is applied cell by cell when arrays of end points are given. The saturation of each cell is mapped
+piecewise linearly from the end points of the cell onto the end points of the table before the lookup, using the Nexus
+end point names for the phase of the table, e.g. SWL (lowest), SWR (critical) and SWU (highest) for a table of SW.
+Giving the lowest and highest end points scales the table with two points, also giving the critical end point scales
+it with three points.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ResSimpy.Nexus.NexusKeywords.relpm_keywords import RELPM_TABLE_KEYWORDS
+
+# columns that a table of relative permeabilities is tabulated against
+_SATURATION_COLUMNS = ('SW', 'SG', 'SL')
+# suffixes of the lowest, critical and highest end points, e.g. SWL, SWR and SWU for a table of SW
+_END_POINT_SUFFIXES = ('L', 'R', 'U')
+
+
+@dataclass(frozen=True)
+class RelPermCurves:
+    """A single relative permeability table as sorted arrays.
+
+    Attributes:
+        saturation_name (str): the Nexus column the table is tabulated against, e.g. SW or SG.
+        saturation (np.ndarray): the saturations of the table, ascending.
+        values (dict[str, np.ndarray]): the relative permeabilities and capillary pressures at each saturation, keyed
+            by the Nexus column name (e.g. KRW, KROW, PCWO). Blank entries are interpolated from the rest of the
+            column.
+        end_points (tuple[float, float, float]): the lowest, critical and highest saturations of the table. The
+            critical saturation is the highest saturation at which the relative permeability of the phase is zero.
+    """
+    saturation_name: str
+    saturation: np.ndarray
+    values: dict[str, np.ndarray]
+    end_points: tuple[float, float, float]
+
+    @classmethod
+    def from_table(cls: type[RelPermCurves], table: pd.DataFrame) -> RelPermCurves:
+        """Builds the arrays from a table read from a relperm method file.
+
+        Args:
+            table (pd.DataFrame): the table, with the saturation as the first column.
+
+        Raises:
+            ValueError: if the first column of the table isn't a saturation.
+        """
+        saturation_name = str(table.columns[0])
+        if saturation_name not in _SATURATION_COLUMNS:
+            raise ValueError(f'Expected the first column of a relperm table to be one of {_SATURATION_COLUMNS}, found '
+                             f'{saturation_name}.')
+        table = table.sort_values(saturation_name, kind='stable')
+        saturation = np.ascontiguousarray(table[saturation_name].to_numpy(dtype=float))
+
+        values = {}
+        for column in table.columns[1:]:
+            column_values = pd.to_numeric(table[column], errors='coerce').to_numpy(dtype=float)
+            tabulated = ~np.isnan(column_values)
+            if not tabulated.any():
+                continue
+            if not tabulated.all():
+                column_values = np.interp(saturation, saturation[tabulated], column_values[tabulated])
+            values[str(column)] = np.ascontiguousarray(column_values)
+
+        critical_saturation = saturation[0]
+        phase_relperm = values.get('KR' + saturation_name[1:])
+        if phase_relperm is not None:
+            mobile = phase_relperm > 0.0
+            leading_zeros = int(np.argmax(mobile)) if mobile.any() else len(mobile)
+            critical_saturation = saturation[max(leading_zeros - 1, 0)]
+
+        return cls(saturation_name=saturation_name, saturation=saturation, values=values,
+                   end_points=(float(saturation[0]), float(critical_saturation), float(saturation[-1])))
+
+    @property
+    def end_point_names(self) -> tuple[str, ...]:
+        """The Nexus names of the end points of the table, e.g. (SWL, SWR, SWU) for a table of SW."""
+        return tuple(self.saturation_name + x for x in _END_POINT_SUFFIXES)
+
+    def evaluate(self, saturation: npt.ArrayLike, end_points: Optional[Mapping[str, npt.ArrayLike]] = None,
+                 columns: Optional[list[str]] = None) -> dict[str, np.ndarray]:
+        """Evaluates the columns of the table at an array of saturations.
+
+        Args:
+            saturation (npt.ArrayLike): the saturation of each cell.
+            end_points (Optional[Mapping[str, npt.ArrayLike]]): the end points of each cell to scale the table to,
+                keyed by the Nexus name (e.g. SWL, SWR, SWU). End points not given are taken from the table. Defaults
+                to no scaling.
+            columns (Optional[list[str]]): the columns to evaluate. Defaults to all of them.
+
+        Raises:
+            ValueError: if an end point or column isn't in the table.
+
+        Returns:
+            dict[str, np.ndarray]: the value of each column at each cell, with the broadcast shape of the saturations
+                and end points.
+        """
+        if columns is None:
+            columns = list(self.values)
+        unknown_columns = [x for x in columns if x not in self.values]
+        if unknown_columns:
+            raise ValueError(f'Columns {unknown_columns} are not in the {self.saturation_name} table, expected '
+                             f'{list(self.values)}.')
+
+        saturation = np.asarray(saturation, dtype=float)
+        if end_points:
+            saturation = self.__scale_saturation(saturation, end_points)
+        return {column: np.interp(saturation, self.saturation, self.values[column]) for column in columns}
+
+    def __scale_saturation(self, saturation: np.ndarray, end_points: Mapping[str, npt.ArrayLike]) -> np.ndarray:
+        """Maps the saturation of each cell from the end points of the cell onto the end points of the table."""
+        unknown_end_points = set(end_points) - set(self.end_point_names)
+        if unknown_end_points:
+            raise ValueError(f'End points {sorted(unknown_end_points)} do not apply to a table of '
+                             f'{self.saturation_name}, expected some of {list(self.end_point_names)}.')
+
+        # the critical end point is only used for three point scaling, when it is given
+        used_points = [(name, table_point) for name, table_point in zip(self.end_point_names, self.end_points)
+                       if name in end_points or name != self.end_point_names[1]]
+        cell_points = [np.asarray(end_points[name], dtype=float) if name in end_points else np.asarray(table_point)
+                       for name, table_point in used_points]
+        table_points = [table_point for _, table_point in used_points]
+
+        scaled = np.empty(np.broadcast_shapes(saturation.shape, *[x.shape for x in cell_points]))
+        for segment in range(len(cell_points) - 1):
+            cell_start, cell_end = cell_points[segment], cell_points[segment + 1]
+            table_start, table_end = table_points[segment], table_points[segment + 1]
+            cell_range = cell_end - cell_start
+            segment_scaled = table_start + np.divide((saturation - cell_start) * (table_end - table_start),
+                                                     cell_range, out=np.zeros(scaled.shape), where=cell_range != 0.0)
+            if segment == 0:
+                scaled[...] = segment_scaled
+            else:
+                np.copyto(scaled, segment_scaled, where=saturation > cell_start)
+        return scaled
+
+
+@dataclass(frozen=True)
+class RelPermTables:
+    """The saturation tables of a relperm method as sorted arrays.
+
+    Attributes:
+        tables (dict[str, RelPermCurves]): the arrays for each table, keyed by the Nexus table keyword (e.g. WOTABLE,
+            GOTABLE).
+    """
+    tables: dict[str, RelPermCurves]
+
+    @classmethod
+    def from_properties(cls: type[RelPermTables], properties: Mapping[str, object]) -> RelPermTables:
+        """Builds the arrays from the properties of a NexusRelPermMethod.
+
+        Args:
+            properties (Mapping[str, object]): the properties read from a relperm method file.
+
+        Raises:
+            ValueError: if there are no tables tabulated against a saturation.
+        """
+        tables = {}
+        for table_name in RELPM_TABLE_KEYWORDS:
+            table = properties.get(table_name)
+            if isinstance(table, pd.DataFrame) and len(table.columns) > 0 and not table.empty and \
+                    table.columns[0] in _SATURATION_COLUMNS:
+                tables[table_name] = RelPermCurves.from_table(table)
+        if not tables:
+            raise ValueError(f'No relperm table with a first column of {_SATURATION_COLUMNS} found to evaluate.')
+        return cls(tables=tables)
+
+    def evaluate(self, table_name: str, saturation: npt.ArrayLike,
+                 end_points: Optional[Mapping[str, npt.ArrayLike]] = None,
+                 columns: Optional[list[str]] = None) -> dict[str, np.ndarray]:
+        """Evaluates the columns of a table at an array of saturations.
+
+        Args:
+            table_name (str): the Nexus keyword of the table, e.g. WOTABLE.
+            saturation (npt.ArrayLike): the saturation of each cell.
+            end_points (Optional[Mapping[str, npt.ArrayLike]]): the end points of each cell to scale the table to,
+                keyed by the Nexus name (e.g. SWL, SWR, SWU). Defaults to no scaling.
+            columns (Optional[list[str]]): the columns to evaluate. Defaults to all of them.
+
+        Raises:
+            ValueError: if the table, an end point or a column can't be found.
+
+        Returns:
+            dict[str, np.ndarray]: the value of each column at each cell.
+        """
+        if table_name not in self.tables:
+            raise ValueError(f'No {table_name} table found, expected one of {list(self.tables)}.')
+        return self.tables[table_name].evaluate(saturation, end_points=end_points, columns=columns)
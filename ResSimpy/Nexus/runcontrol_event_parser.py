@@ -0,0 +1,154 @@
+"""Single pass, event driven parser for the Nexus runcontrol file.
+
+The runcontrol file is read by several consumers (the times and start date in SimControls, the solver parameters and
+the reporting requests). Rather than each of them walking the file and checking every line for each of their keywords,
+the consumers subscribe to the keywords they need and the RuncontrolEventParser walks the file once, finding all the
+subscribed keywords in a line with a single precompiled regex and emitting a RuncontrolLineEvent to each subscriber.
+The parser also tracks the TIME blocks, reading the value of each TIME card once for all the subscribers.
+Consumers that are loaded lazily record their events in a RuncontrolEventBuffer and read them when first used.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+
+import ResSimpy.FileOperations.file_operations as fo
+from ResSimpy.FileOperations.keyword_matcher import KeywordMatcher
+
+if TYPE_CHECKING:
+    from ResSimpy.FileOperations.File import File
+
+
+@dataclass(frozen=True)
+class RuncontrolLineEvent:
+    """A line of the runcontrol file emitted to a subscriber of the RuncontrolEventParser.
+
+    Attributes:
+        line_index (int): index of the line in the flattened runcontrol file.
+        line (str): the line itself.
+        keywords (frozenset[str]): the upper case keywords subscribed to that are found in the line, under the same
+            rules as check_token.
+        time (Optional[str]): the value of the latest TIME card at or before the line, None before the first TIME card
+            or if the TIME card has no value.
+    """
+    line_index: int
+    line: str
+    keywords: frozenset[str]
+    time: Optional[str] = None
+
+
+@dataclass
+class _Subscription:
+    """Holds the callbacks and keywords for a single subscriber to the RuncontrolEventParser."""
+    keywords: frozenset[str]
+    on_line: Callable[[RuncontrolLineEvent], None]
+    every_line: bool
+    on_finish: Optional[Callable[[], None]]
+
+
+class RuncontrolEventParser:
+    """Walks a flattened runcontrol file once, emitting the lines each subscriber is interested in.
+
+    Attributes:
+        file_content (list[str]): the flattened runcontrol file, as returned by get_flat_list_str_file.
+        source_file (Optional[File]): the runcontrol file that the content was read from.
+    """
+    file_content: list[str]
+    source_file: Optional[File]
+
+    def __init__(self, file_content: list[str], source_file: Optional[File] = None) -> None:
+        """Initialises the RuncontrolEventParser class.
+
+        Args:
+            file_content (list[str]): the flattened runcontrol file, as returned by get_flat_list_str_file.
+            source_file (Optional[File]): the runcontrol file that the content was read from. Defaults to None.
+        """
+        self.file_content = file_content
+        self.source_file = source_file
+        self.__subscriptions: list[_Subscription] = []
+
+    @classmethod
+    def from_file(cls: type[RuncontrolEventParser], runcontrol_file: File) -> RuncontrolEventParser:
+        """Creates a parser for the flattened contents of a runcontrol file.
+
+        Args:
+            runcontrol_file (File): the runcontrol file to parse.
+        """
+        return cls(runcontrol_file.get_flat_list_str_file, source_file=runcontrol_file)
+
+    def subscribe(self, keywords: Iterable[str], on_line: Callable[[RuncontrolLineEvent], None],
+                  every_line: bool = False, on_finish: Optional[Callable[[], None]] = None) -> None:
+        """Registers a subscriber to the runcontrol events.
+
+        Args:
+            keywords (Iterable[str]): the keywords that the subscriber needs to know about.
+            on_line (Callable[[RuncontrolLineEvent], None]): called in file order with an event for each line that \
+            contains at least one of the keywords.
+            every_line (bool): if True on_line is called for every line in the file, including those without any of \
+            the keywords. Used by subscribers that read the contents of blocks. Defaults to False.
+            on_finish (Optional[Callable[[], None]]): called once the whole file has been parsed.
+        """
+        self.__subscriptions.append(_Subscription(keywords=frozenset(x.upper() for x in keywords), on_line=on_line,
+                                                  every_line=every_line, on_finish=on_finish))
+
+    def parse(self) -> None:
+        """Walks the file once, emitting the events to each of the subscribers, then calls their on_finish."""
+        subscriptions = self.__subscriptions
+        # TIME is always searched for so that the events can carry the current TIME block
+        all_keywords: dict[str, None] = {'TIME': None}
+        for subscription in subscriptions:
+            all_keywords.update(dict.fromkeys(sorted(subscription.keywords)))
+        matcher = KeywordMatcher(list(all_keywords))
+        no_keywords: frozenset[str] = frozenset()
+        current_time: Optional[str] = None
+
+        for line_index, line in enumerate(self.file_content):
+            found_keywords = frozenset(matcher.find_all(line))
+            if 'TIME' in found_keywords:
+                current_time = fo.get_token_value_at('TIME', self.file_content, line_index)
+            for subscription in subscriptions:
+                relevant_keywords = found_keywords & subscription.keywords if found_keywords else no_keywords
+                if relevant_keywords or subscription.every_line:
+                    subscription.on_line(RuncontrolLineEvent(line_index=line_index, line=line,
+                                                             keywords=relevant_keywords, time=current_time))
+
+        for subscription in subscriptions:
+            if subscription.on_finish is not None:
+                subscription.on_finish()
+
+
+class RuncontrolEventBuffer:
+    """Records the events for a consumer during a shared parse, so that they can be read when the consumer is used.
+
+    Attributes:
+        file_content (list[str]): the flattened runcontrol file that the events came from.
+        events (list[RuncontrolLineEvent]): the events emitted to the consumer, in file order.
+    """
+    file_content: list[str]
+    events: list[RuncontrolLineEvent]
+
+    def __init__(self, parser: RuncontrolEventParser, keywords: Iterable[str], every_line: bool = False) -> None:
+        """Initialises the RuncontrolEventBuffer class and subscribes it to the parser.
+
+        Args:
+            parser (RuncontrolEventParser): the parser to record the events from.
+            keywords (Iterable[str]): the keywords that the consumer needs to know about.
+            every_line (bool): if True records an event for every line in the file. Defaults to False.
+        """
+        self.file_content = parser.file_content
+        self.events = []
+        self.__source_file = parser.source_file
+        self.__parse_complete = False
+        parser.subscribe(keywords, self.events.append, every_line=every_line, on_finish=self.__set_parse_complete)
+
+    def __set_parse_complete(self) -> None:
+        self.__parse_complete = True
+
+    def is_current(self, runcontrol_file: Optional[File]) -> bool:
+        """Returns True if the parse has finished and the runcontrol file is unchanged since it was parsed.
+
+        Args:
+            runcontrol_file (Optional[File]): the runcontrol file currently held by the model.
+        """
+        return (self.__parse_complete and runcontrol_file is not None and runcontrol_file is self.__source_file and
+                not runcontrol_file.file_modified)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import warnings
 from datetime import datetime, timedelta
-from functools import cmp_to_key
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 
@@ -13,12 +13,19 @@ from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
 
 from ResSimpy.Nexus.NexusSolverParameters import NexusSolverParameters
 from ResSimpy.Nexus.constants import DATE_WITH_TIME_LENGTH
+from ResSimpy.Nexus.runcontrol_event_parser import RuncontrolEventParser, RuncontrolLineEvent
 from ResSimpy.Time.ISODateTime import ISODateTime
 
 if TYPE_CHECKING:
     from ResSimpy.Nexus.NexusSimulator import NexusSimulator
 
 
+@lru_cache(maxsize=64)
+def _strptime(date_string: str, date_format: str) -> datetime:
+    """Cached datetime.strptime for the start date, which is parsed for every date compared or converted."""
+    return datetime.strptime(date_string, date_format)
+
+
 class SimControls:
     """Class for controlling all runcontrol and time related functionality."""
 
@@ -147,7 +154,7 @@ class SimControls:
             date_format = self.date_format_string
             if len(self.__model.start_date) == DATE_WITH_TIME_LENGTH:
                 date_format += "(%H:%M:%S)"
-            start_date_as_datetime = datetime.strptime(self.__model.start_date, date_format)
+            start_date_as_datetime = _strptime(self.__model.start_date, date_format)
             date_as_datetime = start_date_as_datetime + timedelta(days=converted_date)
         else:
             start_date_format = self.date_format_string
@@ -157,7 +164,7 @@ class SimControls:
             if len(converted_date) == DATE_WITH_TIME_LENGTH:
                 end_date_format += "(%H:%M:%S)"
             date_as_datetime = datetime.strptime(converted_date, end_date_format)
-            start_date_as_datetime = datetime.strptime(self.__model.start_date, start_date_format)
+            start_date_as_datetime = _strptime(self.__model.start_date, start_date_format)
 
         difference = date_as_datetime - start_date_as_datetime
         return difference.total_seconds() / timedelta(days=1).total_seconds()
@@ -196,12 +203,15 @@ class SimControls:
             list[str]: list of times without duplicates
         """
         new_times = []
+        seen_times: set[str] = set()
         for i in times:
             i_value = i.strip()
-            if i != i or i_value in new_times:
+            if i != i or i_value in seen_times:
                 continue
+            seen_times.add(i_value)
             new_times.append(i_value)
-        new_times = sorted(new_times, key=cmp_to_key(self.compare_dates))
+        # sorting on the number of days from the start date orders the same as compare_dates, converting each once
+        new_times = sorted(new_times, key=self.convert_date_to_number)
         return new_times
 
     def check_date_format(self, date: str | float) -> None:
@@ -290,29 +300,15 @@ class SimControls:
         if (run_control_file_content is None) or (self.__model.model_files.runcontrol_file.location is None):
             raise ValueError(f"No file path provided for {self.__model.model_files.runcontrol_file.location=}")
 
-        # set the start date
-        for line in run_control_file_content:
-            if nfo.check_token('START', line):
-                value = nfo.get_expected_token_value('START', line, run_control_file_content)
-                if value is not None:
-                    self.__model.start_date = value
-
-        times = []
-        run_control_times = self.get_times(run_control_file_content)
-        times.extend(run_control_times)
-        if self.__model.start_date is None or self.__model.start_date == '':
-            try:
-                self.__model.start_date = times[0]
-            except IndexError:
-                for line in run_control_file_content:
-                    if nfo.check_token('TIME', line):
-                        value = nfo.get_expected_token_value('TIME', line, run_control_file_content)
-                        self.__model.start_date = value
-                        warnings.warn(f'Setting start date to first time card found in the runcontrol file as: {value}')
-                        break
-                warnings.warn('No value found for start date explicitly with START or TIME card')
-
-        self.__times = self.sort_remove_duplicate_times(times)
+        # walk the file once, recording the events for the other runcontrol consumers that haven't been loaded yet
+        parser = RuncontrolEventParser(run_control_file_content, source_file=self.__model.model_files.runcontrol_file)
+        times: list[str] = []
+        self.__subscribe_to_runcontrol(parser, times)
+        if not self.__solver_parameters.solver_parameters_loaded:
+            self.__solver_parameters.subscribe_to_runcontrol(parser)
+        if not self.__model.reporting.output_requests_loaded:
+            self.__model.reporting.subscribe_to_runcontrol(parser)
+        parser.parse()
 
         # If we don't want to write the times, return here.
         if not self.__model.write_times:
@@ -326,6 +322,48 @@ class SimControls:
 
         self.modify_times(content=times, operation='replace')
 
+    def __subscribe_to_runcontrol(self, parser: RuncontrolEventParser, times: list[str]) -> None:
+        """Subscribes to the START, TIME and STOP cards, setting the start date and times once the parse finishes.
+
+        Args:
+            parser (RuncontrolEventParser): parser for the flattened runcontrol file.
+            times (list[str]): list to add the times found before the STOP card to.
+        """
+        file_content = parser.file_content
+        first_time_line_index: int | None = None
+        stopped = False
+
+        def read_line(event: RuncontrolLineEvent) -> None:
+            nonlocal first_time_line_index, stopped
+            # set the start date
+            if 'START' in event.keywords:
+                start_date = nfo.get_expected_token_value_at('START', file_content, event.line_index)
+                if start_date is not None:
+                    self.__model.start_date = start_date
+            if 'TIME' in event.keywords:
+                if first_time_line_index is None:
+                    first_time_line_index = event.line_index
+                if not stopped:
+                    if event.time is not None:
+                        times.append(event.time)
+            if 'STOP' in event.keywords:
+                stopped = True
+
+        def set_start_date_and_times() -> None:
+            if self.__model.start_date is None or self.__model.start_date == '':
+                try:
+                    self.__model.start_date = times[0]
+                except IndexError:
+                    if first_time_line_index is not None:
+                        value = nfo.get_expected_token_value_at('TIME', file_content, first_time_line_index)
+                        self.__model.start_date = value
+                        warnings.warn(f'Setting start date to first time card found in the runcontrol file as: {value}')
+                    warnings.warn('No value found for start date explicitly with START or TIME card')
+
+            self.__times = self.sort_remove_duplicate_times(times)
+
+        parser.subscribe(['START', 'TIME', 'STOP'], read_line, on_finish=set_start_date_and_times)
+
     def modify_times(self, content: None | list[str] = None, operation: str = 'merge',
                      update_in_file: bool = True) -> None:
         """Modifies the output times in the simulation.
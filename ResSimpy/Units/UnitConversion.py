@@ -0,0 +1,471 @@
+"""Numeric conversion of values between unit systems.
+
+Every UnitDimension has a factor for each unit system that converts a value in that unit system to the METRIC unit
+system, along with an offset for temperatures. Conversions between any two unit systems go through METRIC. Values are
+converted a whole array or DataFrame column at a time, with per row unit systems supported for DataFrames from get_df
+which hold the unit system of each object in a unit_system column.
+
+Examples:
+    >>> from ResSimpy.Enums.UnitsEnum import TemperatureUnits, UnitSystem
+    >>> from ResSimpy.Units.Units import Pressure
+    >>> from ResSimpy.Units.UnitConversion import convert_values
+    >>> convert_values([1000.0, 2000.0], Pressure(), UnitSystem.ENGLISH, UnitSystem.METBAR)
+"""
+from __future__ import annotations
+
+import math
+import warnings
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ResSimpy.Enums.UnitsEnum import TemperatureUnits, UnitSystem
+from ResSimpy.Units.Units import (UnitDimension, AcousticImpedance, AcousticWaveVelocity, Angle, Area, BulkModulus,
+                                  Compressibility, CriticalPressure, CriticalTemperature, CriticalVolume,
+                                  DeltaPressure, Density, Diameter, DiffusionCoefficient, Dimensionless,
+                                  FormationVolumeFactorGas, FormationVolumeFactorLiquid, GasLiquidRatio,
+                                  GravityGradient, HeatCapacity, HeatTransfer, InterfacialTension, InverseTime, Length,
+                                  LiquidGasRatio, MolarDensity, MolarRates, Moles, NonDarcySkin, Permeability,
+                                  PermeabilityThickness, Pressure, ProductivityIndex, ReservoirProductivityIndex,
+                                  ReservoirRates, ReservoirVolume, ReservoirVolumeOverPressure,
+                                  ReservoirVolumeThousand, Roughness, SaturationFraction, SolutionGasOilRatio,
+                                  SolutionOilGasRatio, SurfaceRatesGas, SurfaceRatesLiquid, SurfaceVolumesGas,
+                                  SurfaceVolumesLiquid, Temperature, ThermalConductivity, Time, TracerConcentrations,
+                                  Transmissibility, ValveCoefficient, Viscosity, Volume)
+
+from ResSimpy.Utils.structured_grid_indexing import KEYWORD_OPERATOR_MAPPING
+
+if TYPE_CHECKING:
+    from ResSimpy.DataModelBaseClasses.GridArrayDefinition import GridArrayDefinition
+
+_CONVERTIBLE_UNIT_SYSTEMS = (UnitSystem.ENGLISH, UnitSystem.METRIC, UnitSystem.METKGCM2, UnitSystem.METBAR,
+                             UnitSystem.LAB, UnitSystem.METRIC_ATM)
+
+# size of the units used in the other unit systems in METRIC units
+_FOOT = 0.3048  # m
+_PSI = 6.894757293168361  # kPa
+_KG_PER_CM2 = 98.0665  # kPa
+_BAR = 100.0  # kPa
+_ATM = 101.325  # kPa
+_BARREL = 0.158987294928  # m3
+_THOUSAND_SCF = 28.316846592  # m3
+_POUND = 0.45359237  # kg
+
+
+def _factors(english: float = 1.0, lab: float = 1.0, metkgcm2: float = 1.0, metbar: float = 1.0,
+             metric_atm: float = 1.0) -> dict[UnitSystem, float]:
+    """Returns the factors converting from each unit system to METRIC."""
+    return {UnitSystem.ENGLISH: english, UnitSystem.METRIC: 1.0, UnitSystem.METKGCM2: metkgcm2,
+            UnitSystem.METBAR: metbar, UnitSystem.LAB: lab, UnitSystem.METRIC_ATM: metric_atm}
+
+
+def _derived(numerators: Sequence[dict[UnitSystem, float]],
+             denominators: Sequence[dict[UnitSystem, float]] = ()) -> dict[UnitSystem, float]:
+    """Returns the factors for a unit made from the product and quotient of other units."""
+    return {unit_system: math.prod(x[unit_system] for x in numerators) /
+            math.prod(x[unit_system] for x in denominators) for unit_system in _CONVERTIBLE_UNIT_SYSTEMS}
+
+
+_LENGTH = _factors(english=_FOOT, lab=0.01)
+_VOLUME = _derived([_LENGTH, _LENGTH, _LENGTH])
+_PRESSURE = _factors(english=_PSI, lab=_PSI, metkgcm2=_KG_PER_CM2, metbar=_BAR, metric_atm=_ATM)
+_TIME = _factors(lab=1 / 24)
+_MASS = _factors(english=_POUND, lab=0.001)
+_RESERVOIR_VOLUME = _factors(english=_BARREL, lab=1e-6)
+_SURFACE_LIQUID_VOLUME = _factors(english=_BARREL, lab=1e-6)
+_SURFACE_GAS_VOLUME = _factors(english=_THOUSAND_SCF, lab=1e-6)
+_SURFACE_GAS_OVER_LIQUID = _derived([_SURFACE_GAS_VOLUME], [_SURFACE_LIQUID_VOLUME])
+_SURFACE_LIQUID_OVER_GAS = _derived([_SURFACE_LIQUID_VOLUME], [_SURFACE_GAS_VOLUME])
+
+# converted values are rounded to this many significant figures, so that they are written without rounding noise
+SIGNIFICANT_FIGURES = 9
+
+# factors converting a value in each unit system to METRIC, for each dimension
+UNIT_CONVERSION_FACTORS: Mapping[type[UnitDimension], Mapping[UnitSystem, float]] = {
+    AcousticImpedance: _factors(english=_FOOT * 1000, lab=10.0),
+    AcousticWaveVelocity: _factors(english=_FOOT),
+    Angle: _factors(),
+    Area: _derived([_LENGTH, _LENGTH]),
+    BulkModulus: _PRESSURE,
+    Compressibility: _derived([], [_PRESSURE]),
+    CriticalPressure: _PRESSURE,
+    CriticalTemperature: _factors(english=1 / 1.8),
+    CriticalVolume: _derived([_VOLUME], [_MASS]),
+    DeltaPressure: _PRESSURE,
+    Density: _derived([_MASS], [_VOLUME]),
+    Diameter: _factors(english=2.54),
+    DiffusionCoefficient: _derived([_LENGTH, _LENGTH], [_TIME]),
+    Dimensionless: _factors(),
+    FormationVolumeFactorGas: _derived([_RESERVOIR_VOLUME], [_SURFACE_GAS_VOLUME]),
+    FormationVolumeFactorLiquid: _derived([_RESERVOIR_VOLUME], [_SURFACE_LIQUID_VOLUME]),
+    GasLiquidRatio: _SURFACE_GAS_OVER_LIQUID,
+    GravityGradient: _derived([_PRESSURE], [_LENGTH]),
+    HeatCapacity: _factors(english=4.1868),
+    HeatTransfer: _factors(english=5.678263337, lab=1e4),
+    InterfacialTension: _factors(),
+    InverseTime: _derived([], [_TIME]),
+    Length: _LENGTH,
+    LiquidGasRatio: _SURFACE_LIQUID_OVER_GAS,
+    MolarDensity: _derived([_MASS], [_VOLUME]),
+    MolarRates: _derived([_MASS], [_TIME]),
+    Moles: _MASS,
+    NonDarcySkin: _derived([_TIME], [_SURFACE_GAS_VOLUME]),
+    Permeability: _factors(),
+    PermeabilityThickness: _factors(english=_FOOT),
+    Pressure: _PRESSURE,
+    ProductivityIndex: _derived([_SURFACE_LIQUID_VOLUME], [_TIME, _PRESSURE]),
+    ReservoirProductivityIndex: _derived([_RESERVOIR_VOLUME], [_TIME, _PRESSURE]),
+    ReservoirRates: _derived([_RESERVOIR_VOLUME], [_TIME]),
+    ReservoirVolume: _RESERVOIR_VOLUME,
+    ReservoirVolumeOverPressure: _derived([_RESERVOIR_VOLUME], [_PRESSURE]),
+    ReservoirVolumeThousand: _RESERVOIR_VOLUME,
+    Roughness: _factors(english=25.4),
+    SaturationFraction: _factors(),
+    SolutionGasOilRatio: _SURFACE_GAS_OVER_LIQUID,
+    SolutionOilGasRatio: _SURFACE_LIQUID_OVER_GAS,
+    SurfaceRatesGas: _derived([_SURFACE_GAS_VOLUME], [_TIME]),
+    SurfaceRatesLiquid: _derived([_SURFACE_LIQUID_VOLUME], [_TIME]),
+    SurfaceVolumesGas: _SURFACE_GAS_VOLUME,
+    SurfaceVolumesLiquid: _SURFACE_LIQUID_VOLUME,
+    Temperature: _factors(english=1 / 1.8),
+    ThermalConductivity: _factors(english=1.730734666, lab=100.0),
+    Time: _TIME,
+    TracerConcentrations: _factors(),
+    Transmissibility: _derived([_VOLUME], [_TIME, _PRESSURE]),
+    ValveCoefficient: _derived([_PRESSURE, _MASS], [_VOLUME, _MASS, _MASS]),
+    Viscosity: _factors(),
+    Volume: _VOLUME,
+}
+
+# offsets added after applying the factor when converting to METRIC, for dimensions that don't start at zero
+UNIT_CONVERSION_OFFSETS: Mapping[type[UnitDimension], Mapping[UnitSystem, float]] = {
+    CriticalTemperature: {UnitSystem.ENGLISH: -32 / 1.8},
+    Temperature: {UnitSystem.ENGLISH: -32 / 1.8},
+}
+
+
+def conversion_factors(dimension: Union[UnitDimension, type[UnitDimension]], from_unit_system: UnitSystem,
+                       to_unit_system: UnitSystem) -> tuple[float, float]:
+    """Returns the scale and offset converting values of a dimension between unit systems.
+
+    A value in the new unit system is the value in the original unit system multiplied by the scale plus the offset.
+
+    Args:
+        dimension (Union[UnitDimension, type[UnitDimension]]): the dimension of the values, e.g. Pressure().
+        from_unit_system (UnitSystem): the unit system the values are in.
+        to_unit_system (UnitSystem): the unit system to convert the values to.
+
+    Raises:
+        ValueError: if either unit system can't be converted or there are no factors for the dimension.
+    """
+    dimension_type = dimension if isinstance(dimension, type) else type(dimension)
+    for unit_system in (from_unit_system, to_unit_system):
+        if unit_system not in _CONVERTIBLE_UNIT_SYSTEMS:
+            raise ValueError(f'Cannot convert values in unit system {unit_system}, expected one of '
+                             f'{[x.value for x in _CONVERTIBLE_UNIT_SYSTEMS]}.')
+    factors = UNIT_CONVERSION_FACTORS.get(dimension_type)
+    if factors is None:
+        raise ValueError(f'No conversion factors found for {dimension_type.__name__}.')
+    if from_unit_system == to_unit_system:
+        return 1.0, 0.0
+
+    offsets = UNIT_CONVERSION_OFFSETS.get(dimension_type, {})
+    scale = factors[from_unit_system] / factors[to_unit_system]
+    offset = (offsets.get(from_unit_system, 0.0) - offsets.get(to_unit_system, 0.0)) / factors[to_unit_system]
+    return scale, offset
+
+
+def _transform(values: npt.ArrayLike, scale: Union[float, np.ndarray], offset: Union[float, np.ndarray]) -> np.ndarray:
+    """Multiplies values by a scale and adds an offset, rounding the results to SIGNIFICANT_FIGURES.
+
+    Without the rounding a converted value such as 476.961885 is held as 476.96188478400006 and written to the deck
+    as such.
+    """
+    scaled = np.asarray(values, dtype=float) * scale
+    transformed = scaled + offset
+    # the figures are counted from the larger of the terms, so that a value that should be zero after adding the
+    # offset is rounded to zero
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exponents = np.floor(np.log10(np.maximum(np.abs(scaled), np.abs(offset))))
+    decimals = SIGNIFICANT_FIGURES - 1 - np.nan_to_num(exponents, nan=0.0, posinf=0.0, neginf=0.0)
+    # powers of ten up to 1e22 are exact, so dividing or multiplying by them rounds correctly
+    powers = 10.0 ** np.minimum(np.abs(decimals), 22)
+    rounded = np.where(decimals >= 0, np.round(transformed * powers) / powers, np.round(transformed / powers) * powers)
+    return np.where(np.isfinite(transformed) & (np.abs(decimals) <= 22), rounded, transformed)
+
+
+def convert_values(values: npt.ArrayLike, dimension: Union[UnitDimension, type[UnitDimension]],
+                   from_unit_system: UnitSystem, to_unit_system: UnitSystem) -> np.ndarray:
+    """Converts an array of values of a dimension between unit systems.
+
+    Args:
+        values (npt.ArrayLike): the values to convert.
+        dimension (Union[UnitDimension, type[UnitDimension]]): the dimension of the values, e.g. Length().
+        from_unit_system (UnitSystem): the unit system the values are in.
+        to_unit_system (UnitSystem): the unit system to convert the values to.
+
+    Returns:
+        np.ndarray: the converted values, with the shape of the values, rounded to SIGNIFICANT_FIGURES.
+    """
+    scale, offset = conversion_factors(dimension, from_unit_system, to_unit_system)
+    return _transform(values, scale, offset)
+
+
+def _unit_system_from_value(value: Any) -> Optional[UnitSystem]:
+    """Returns the unit system from a value in a unit_system column, None if it isn't a unit system."""
+    if isinstance(value, UnitSystem):
+        return value
+    try:
+        return UnitSystem(value)
+    except ValueError:
+        return None
+
+
+def convert_dataframe(df: pd.DataFrame, dimensions: Mapping[str, UnitDimension], to_unit_system: UnitSystem,
+                      from_unit_system: Optional[UnitSystem] = None,
+                      unit_system_column: str = 'unit_system') -> pd.DataFrame:
+    """Converts the columns of a DataFrame to a unit system, a whole column at a time.
+
+    Args:
+        df (pd.DataFrame): the DataFrame to convert, e.g. from get_df or a property table.
+        dimensions (Mapping[str, UnitDimension]): the dimension of each column to convert, e.g. the attribute_map of
+            the unit mapping for the objects in the DataFrame. Columns without a dimension are left unchanged.
+        to_unit_system (UnitSystem): the unit system to convert to.
+        from_unit_system (Optional[UnitSystem]): the unit system of every row. If None, the unit system of each row
+            is read from the unit_system_column, so that rows in different unit systems can be converted together.
+        unit_system_column (str): the column holding the unit system of each row. It is set to the new unit system
+            when present.
+
+    Raises:
+        ValueError: if from_unit_system is None and there is no unit_system_column.
+
+    Returns:
+        pd.DataFrame: a copy of the DataFrame with the columns converted.
+    """
+    if from_unit_system is None and unit_system_column not in df.columns:
+        raise ValueError(f'No unit system given and no {unit_system_column} column found in the DataFrame.')
+    converted = df.copy()
+
+    row_unit_systems: Optional[pd.Series] = None
+    if from_unit_system is None:
+        row_unit_systems = df[unit_system_column].map(_unit_system_from_value)
+
+    for column in df.columns:
+        dimension = dimensions.get(column)
+        if dimension is None or column == unit_system_column:
+            continue
+        values = df[column]
+        # columns holding a mix of numbers and other values (e.g. None or strings) keep the other values
+        mixed_types = not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values)
+        if mixed_types:
+            values = pd.to_numeric(values, errors='coerce')
+            if values.isna().all():
+                continue
+
+        if row_unit_systems is None:
+            if from_unit_system is None:
+                continue
+            scale, offset = conversion_factors(dimension, from_unit_system, to_unit_system)
+            if scale == 1.0 and offset == 0.0:
+                continue
+            new_values = _transform(values.to_numpy(dtype=float), scale, offset)
+        else:
+            factors = {x: conversion_factors(dimension, x, to_unit_system) for x in row_unit_systems.dropna().unique()}
+            if all(x == (1.0, 0.0) for x in factors.values()):
+                continue
+            scales = row_unit_systems.map(lambda x: factors[x][0] if x in factors else np.nan).to_numpy(dtype=float)
+            offsets = row_unit_systems.map(lambda x: factors[x][1] if x in factors else np.nan).to_numpy(dtype=float)
+            new_values = _transform(values.to_numpy(dtype=float), scales, offsets)
+
+        numeric = values.notna().to_numpy()
+        if not mixed_types or numeric.all():
+            converted[column] = new_values
+        else:
+            converted[column] = converted[column].astype(object)
+            converted.loc[numeric, column] = new_values[numeric]
+
+    if unit_system_column in converted.columns:
+        unit_systems = df[unit_system_column]
+        keep_as_string = bool(len(unit_systems)) and isinstance(unit_systems.iloc[0], str) and \
+            not isinstance(unit_systems.iloc[0], UnitSystem)
+        converted[unit_system_column] = to_unit_system.value if keep_as_string else to_unit_system
+    return converted
+
+
+def set_stored_attribute(data_object: Any, attribute_name: str, value: Any) -> None:
+    """Sets an attribute on an object, including attributes only stored privately behind a read only property.
+
+    Args:
+        data_object (Any): the object to set the attribute on.
+        attribute_name (str): the name of the attribute, e.g. well_radius or unit_system.
+        value (Any): the new value of the attribute.
+
+    Raises:
+        AttributeError: if the object doesn't store the attribute.
+    """
+    storage = [x for x in vars(data_object) if x == attribute_name or x == '_' + attribute_name or
+               x.endswith('__' + attribute_name)]
+    if not storage:
+        raise AttributeError(f'{type(data_object).__name__} does not store an attribute called {attribute_name}.')
+    for key in storage:
+        setattr(data_object, key, value)
+
+
+def convert_data_objects(data_objects: Iterable[Any], to_unit_system: UnitSystem) -> None:
+    """Converts the attributes of data objects (e.g. completions, constraints) to a unit system in place.
+
+    The objects are grouped by type and unit system, then each attribute with a dimension in the unit mapping of the
+    objects is converted for the whole group at once. Objects without a unit system are left unchanged.
+
+    Args:
+        data_objects (Iterable[Any]): objects with units and unit_system properties.
+        to_unit_system (UnitSystem): the unit system to convert to.
+    """
+    groups: dict[tuple[type, UnitSystem], list[Any]] = {}
+    for data_object in data_objects:
+        unit_system = getattr(data_object, 'unit_system', None)
+        if isinstance(unit_system, UnitSystem) and unit_system != to_unit_system:
+            groups.setdefault((type(data_object), unit_system), []).append(data_object)
+
+    for (_, from_unit_system), group in groups.items():
+        # objects without dimensional attributes (e.g. well lists) have no attribute map
+        attribute_map: Mapping[str, UnitDimension] = getattr(group[0].units, 'attribute_map', {})
+        for attribute_name, dimension in attribute_map.items():
+            scale, offset = conversion_factors(dimension, from_unit_system, to_unit_system)
+            if scale == 1.0 and offset == 0.0:
+                continue
+            values = [getattr(x, attribute_name, None) for x in group]
+            numeric_indices = [i for i, x in enumerate(values) if isinstance(x, (int, float)) and
+                               not isinstance(x, bool)]
+            if not numeric_indices:
+                continue
+            new_values = _transform(np.array([values[i] for i in numeric_indices], dtype=float), scale, offset)
+            for index, new_value in zip(numeric_indices, new_values.tolist()):
+                set_stored_attribute(group[index], attribute_name, new_value)
+        for data_object in group:
+            set_stored_attribute(data_object, 'unit_system', to_unit_system)
+
+
+def convert_grid_array(grid_array: GridArrayDefinition, dimension: Union[UnitDimension, type[UnitDimension]],
+                       from_unit_system: UnitSystem, to_unit_system: UnitSystem) -> None:
+    """Converts the values of a grid array, including the values of its MOD cards, to a unit system in place.
+
+    A warning is raised for mods that can't be converted: VMOD cards that add, subtract or assign the values in their
+    include files, and multiplications and divisions when the conversion has an offset (e.g. for temperatures).
+
+    Args:
+        grid_array (GridArrayDefinition): the grid array to convert.
+        dimension (Union[UnitDimension, type[UnitDimension]]): the dimension of the values in the grid array.
+        from_unit_system (UnitSystem): the unit system the grid array is in.
+        to_unit_system (UnitSystem): the unit system to convert the grid array to.
+    """
+    scale, offset = conversion_factors(dimension, from_unit_system, to_unit_system)
+    if scale == 1.0 and offset == 0.0:
+        return
+    grid_array.transform_values(scale, offset)
+
+    mods = grid_array.mods or {}
+    multiplicative_operators = ('*', '/') if offset != 0.0 else ()
+    unconverted_mods = []
+    mod_table = mods.get('MOD')
+    if mod_table is not None and not mod_table.empty and \
+            any(str(x).strip().startswith(multiplicative_operators) for x in mod_table['#v']):
+        unconverted_mods.append('MOD')
+    vmod_table = mods.get('VMOD')
+    if vmod_table is not None and not vmod_table.empty and (offset != 0.0 or not {
+            KEYWORD_OPERATOR_MAPPING.get(str(x).upper()) for x in vmod_table['operation']} <= {'*', '/'}):
+        unconverted_mods.append('VMOD')
+    if unconverted_mods:
+        warnings.warn(f'Some of the {" and ".join(unconverted_mods)} cards of the {grid_array.name} grid array can '
+                      f'not be converted to {to_unit_system.value} units and have been left unchanged.')
+
+
+# keywords used for the keys of a group of tables that are a saturated value of another keyword
+_TABLE_KEY_KEYWORDS = {'RSSAT': 'RS', 'RVSAT': 'RV'}
+
+
+def _column_dimension(column: str, dimensions: Mapping[str, UnitDimension]) -> Optional[UnitDimension]:
+    """Returns the dimension of a table column, including numbered columns such as BHP0, BHP1 for BHP."""
+    return dimensions.get(column, dimensions.get(column.rstrip('0123456789')))
+
+
+def _convert_property_table(table: pd.DataFrame, dimensions: Mapping[str, UnitDimension],
+                            from_unit_system: UnitSystem, to_unit_system: UnitSystem) -> pd.DataFrame:
+    """Converts a table of a dynamic property, keyed by the simulator keyword of each column."""
+    if 'VARIABLE' not in table.columns:
+        column_dimensions = {x: _column_dimension(str(x), dimensions) for x in table.columns}
+        return convert_dataframe(table, {x: y for x, y in column_dimensions.items() if y is not None},
+                                 to_unit_system, from_unit_system=from_unit_system)
+
+    # tables such as LIMITS hold a different variable on each row, named in the VARIABLE column
+    converted = table.copy()
+    row_factors = [conversion_factors(dimension, from_unit_system, to_unit_system) if dimension is not None else
+                   (1.0, 0.0) for dimension in (_column_dimension(str(x).upper(), dimensions)
+                                                for x in table['VARIABLE'])]
+    scales = np.array([x[0] for x in row_factors])
+    offsets = np.array([x[1] for x in row_factors])
+    for column in table.columns:
+        if column != 'VARIABLE' and pd.api.types.is_numeric_dtype(table[column]):
+            converted[column] = _transform(table[column].to_numpy(dtype=float), scales, offsets)
+    return converted
+
+
+def convert_dynamic_property(dynamic_property: Any, to_unit_system: UnitSystem) -> None:
+    """Converts the tables and values of a dynamic property (e.g. a PVT or relperm method) to a unit system in place.
+
+    Tables are converted a column at a time, using the unit mapping of the keyword for each column. Columns and values
+    without a unit mapping (e.g. saturations and relative permeabilities) are left unchanged, as are temperatures
+    when the method specifies its own temperature units.
+
+    Args:
+        dynamic_property (Any): the method to convert, with properties, units, unit_system and get_keyword_mapping.
+        to_unit_system (UnitSystem): the unit system to convert to.
+    """
+    from_unit_system = dynamic_property.units.unit_system
+    if not isinstance(from_unit_system, UnitSystem) or from_unit_system == to_unit_system:
+        return
+
+    properties = dynamic_property.properties
+    attribute_map = dynamic_property.units.attribute_map
+    has_temperature_units = any(isinstance(x, TemperatureUnits) for x in properties.values())
+    dimensions = {keyword: attribute_map[attribute_name] for keyword, (attribute_name, _)
+                  in dynamic_property.get_keyword_mapping().items() if attribute_name in attribute_map and not
+                  (has_temperature_units and isinstance(attribute_map[attribute_name], Temperature))}
+
+    def convert_value(value: Any, dimension: Optional[UnitDimension]) -> Any:
+        if dimension is None:
+            return value
+        if isinstance(value, np.ndarray):
+            return convert_values(value, dimension, from_unit_system, to_unit_system)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(convert_values(value, dimension, from_unit_system, to_unit_system))
+        return value
+
+    for key, value in properties.items():
+        if isinstance(value, pd.DataFrame):
+            properties[key] = _convert_property_table(value, dimensions, from_unit_system, to_unit_system)
+        elif isinstance(value, dict):
+            # e.g. UNSATOIL_PSAT tables keyed by their saturation pressure
+            key_keyword = key.split('_')[-1]
+            key_dimension = dimensions.get(_TABLE_KEY_KEYWORDS.get(key_keyword, key_keyword))
+            converted: dict[Any, Any] = {}
+            for sub_key, sub_value in value.items():
+                new_key = sub_key
+                if key_dimension is not None and isinstance(sub_key, str) and \
+                        pd.notna(pd.to_numeric(sub_key, errors='coerce')):
+                    new_key = f'{convert_value(float(sub_key), key_dimension):.9g}'
+                if isinstance(sub_value, pd.DataFrame):
+                    converted[new_key] = _convert_property_table(sub_value, dimensions, from_unit_system,
+                                                                 to_unit_system)
+                else:
+                    converted[new_key] = convert_value(sub_value, dimensions.get(str(sub_key)))
+            properties[key] = converted
+        else:
+            properties[key] = convert_value(value, dimensions.get(key))
+
+    if isinstance(properties.get('UNIT_SYSTEM'), UnitSystem):
+        properties['UNIT_SYSTEM'] = to_unit_system
+    dynamic_property.unit_system = to_unit_system
+    dynamic_property.clear_cached_tables()
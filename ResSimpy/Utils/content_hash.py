@@ -0,0 +1,205 @@
+"""Streaming content hashes of the values held by ResSimpy objects.
+
+ContentHasher feeds values into a BLAKE2b hash, using the raw buffers of NumPy arrays and numeric DataFrame columns
+rather than building Python objects for each element. Equal content gives an equal digest regardless of the identity
+of the objects holding it: dictionaries and sets are hashed independently of their order, and numbers are hashed by
+value so that 1 and 1.0 give the same digest as they compare equal.
+
+Examples:
+    >>> import pandas as pd
+    >>> from ResSimpy.Utils.content_hash import content_digest
+    >>> content_digest({'PRES': pd.DataFrame({'PRES': [1000.0, 2000.0]})}).hex()
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+from enum import Enum
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+# size in bytes of the digests
+DIGEST_SIZE = 16
+# number of lines joined at a time when hashing the content of a file
+_LINES_PER_CHUNK = 10000
+# number of bytes read at a time when hashing a file on disk
+_FILE_CHUNK_SIZE = 1 << 20
+# largest integer that a float can hold exactly, below which integral floats are hashed as integers
+_EXACT_FLOAT_INTEGER_LIMIT = 2 ** 53
+
+
+class ContentHasher:
+    """Builds a digest of a sequence of values.
+
+    Each value is written with a type tag and, where needed, its length, so that different sequences of values can't
+    give the same stream of bytes.
+    """
+
+    def __init__(self) -> None:
+        """Initialises the ContentHasher class with an empty hash."""
+        self.__hash = hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+    def digest(self) -> bytes:
+        """Returns the digest of the values added so far."""
+        return self.__hash.digest()
+
+    def update(self, value: Any) -> None:
+        """Adds a value to the hash.
+
+        Args:
+            value (Any): the value to add. Containers are added recursively. Objects with a content_digest method are
+                added by their digest, other objects by their repr.
+        """
+        write = self.__hash.update
+        if value is None:
+            write(b'N')
+        elif isinstance(value, (bool, np.bool_)):
+            write(b'T' if value else b'F')
+        elif isinstance(value, (int, float, np.integer, np.floating)):
+            self.__update_number(value)
+        elif isinstance(value, Enum):
+            write(b'E')
+            self.update(value.value)
+        elif isinstance(value, str):
+            self.__update_bytes(b's', value.encode('utf-8'))
+        elif isinstance(value, (bytes, bytearray)):
+            self.__update_bytes(b'b', bytes(value))
+        elif isinstance(value, np.ndarray):
+            self.__update_array(value)
+        elif isinstance(value, pd.DataFrame):
+            write(b'D' + len(value.columns).to_bytes(8, 'little'))
+            self.__update_index(value.index)
+            for column_name, column in value.items():
+                self.update(column_name)
+                self.__update_series(column)
+        elif isinstance(value, pd.Series):
+            write(b'S')
+            self.update(value.name)
+            self.__update_index(value.index)
+            self.__update_series(value)
+        elif isinstance(value, dict):
+            if all(isinstance(x, str) for x in value):
+                # dictionaries keyed by strings, such as from to_dict, are hashed in order of their keys
+                write(b'k' + len(value).to_bytes(8, 'little'))
+                for key in sorted(value):
+                    self.__update_bytes(b's', key.encode('utf-8'))
+                    self.update(value[key])
+            else:
+                self.__update_unordered(b'd', ((k, v) for k, v in value.items()))
+        elif isinstance(value, (set, frozenset)):
+            self.__update_unordered(b'u', value)
+        elif isinstance(value, (list, tuple)):
+            write(b'l' + len(value).to_bytes(8, 'little'))
+            for item in value:
+                self.update(item)
+        elif callable(getattr(value, 'content_digest', None)):
+            self.__update_bytes(b'o', value.content_digest())
+        else:
+            self.__update_bytes(b'r', repr(value).encode('utf-8'))
+
+    def __update_bytes(self, tag: bytes, data: bytes) -> None:
+        """Adds a tagged, length prefixed run of bytes."""
+        self.__hash.update(tag + len(data).to_bytes(8, 'little'))
+        self.__hash.update(data)
+
+    def __update_number(self, value: float | np.integer | np.floating) -> None:
+        """Adds a number, hashing integral values the same whether they are held as an int or a float."""
+        if isinstance(value, (int, np.integer)):
+            self.__update_bytes(b'i', str(int(value)).encode())
+            return
+        float_value = float(value)
+        if math.isfinite(float_value) and float_value.is_integer() and abs(float_value) < _EXACT_FLOAT_INTEGER_LIMIT:
+            self.__update_bytes(b'i', str(int(float_value)).encode())
+        else:
+            self.__update_bytes(b'f', repr(float_value).encode())
+
+    def __update_array(self, array: np.ndarray) -> None:
+        """Adds an array from its raw buffer, or element by element for arrays of Python objects."""
+        self.__hash.update(b'a' + array.ndim.to_bytes(8, 'little'))
+        for size in array.shape:
+            self.__hash.update(size.to_bytes(8, 'little'))
+        if array.dtype.hasobject:
+            for item in array.ravel():
+                self.update(item)
+            return
+        self.__update_bytes(b't', array.dtype.str.encode())
+        self.__hash.update(np.ascontiguousarray(array).view(np.uint8).data)
+
+    def __update_index(self, index: pd.Index) -> None:
+        """Adds the index of a DataFrame or Series, cheaply for the default range index."""
+        if isinstance(index, pd.RangeIndex):
+            self.update(('range', index.start, index.stop, index.step))
+        else:
+            self.__hash.update(b'x')
+            self.__update_array(pd.util.hash_pandas_object(index, index=False).to_numpy())
+
+    def __update_series(self, series: pd.Series) -> None:
+        """Adds the values of a Series, from the raw buffer for numeric values."""
+        if pd.api.types.is_numeric_dtype(series.dtype) and isinstance(series.dtype, np.dtype):
+            self.__update_array(series.to_numpy())
+        else:
+            self.__hash.update(b'h')
+            self.__update_array(pd.util.hash_pandas_object(series, index=False).to_numpy())
+
+    def __update_unordered(self, tag: bytes, items: Iterable[Any]) -> None:
+        """Adds a collection whose order doesn't matter, from the sorted digests of its items."""
+        item_digests = sorted(content_digest(item) for item in items)
+        self.__hash.update(tag + len(item_digests).to_bytes(8, 'little'))
+        for item_digest in item_digests:
+            self.__hash.update(item_digest)
+
+
+def content_digest(*values: Any) -> bytes:
+    """Returns the digest of the content of one or more values.
+
+    Args:
+        *values (Any): the values to hash, e.g. DataFrames, arrays, dictionaries or data objects.
+
+    Returns:
+        bytes: a digest of DIGEST_SIZE bytes, equal for values with equal content.
+    """
+    hasher = ContentHasher()
+    for value in values:
+        hasher.update(value)
+    return hasher.digest()
+
+
+def digest_to_int(digest: bytes) -> int:
+    """Converts a digest to a signed 64 bit integer, e.g. for use as the result of __hash__."""
+    return int.from_bytes(digest[:8], 'little', signed=True)
+
+
+def lines_digest(lines: list[str]) -> bytes:
+    """Returns the digest of the text of a file held as a list of lines, e.g. the file_content_as_list of a File.
+
+    The lines are hashed as the text they join to, in chunks, so that the digest doesn't depend on how the text is
+    split into lines.
+
+    Args:
+        lines (list[str]): the lines of the file.
+
+    Returns:
+        bytes: a digest of DIGEST_SIZE bytes, equal for lists of lines that join to the same text.
+    """
+    lines_hash = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for start in range(0, len(lines), _LINES_PER_CHUNK):
+        lines_hash.update(''.join(lines[start:start + _LINES_PER_CHUNK]).encode('utf-8'))
+    return lines_hash.digest()
+
+
+def file_digest(file_path: str) -> bytes:
+    """Returns the digest of the bytes of a file on disk, read in chunks so that large files aren't held in memory.
+
+    Args:
+        file_path (str): path to the file to hash.
+
+    Returns:
+        bytes: a digest of DIGEST_SIZE bytes, equal for files with equal bytes.
+    """
+    file_hash = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_FILE_CHUNK_SIZE), b''):
+            file_hash.update(chunk)
+    return file_hash.digest()
@@ -14,7 +14,8 @@ def generic_repr(input_class: Any, exclude_attributes: Optional[list[str]] = Non
     -------
         (str): Pretty representation of the string.
     """
-    filtered_attrs = {k: v for k, v in vars(input_class).items() if v is not None}
+    filtered_attrs = {k: v for k, v in vars(input_class).items() if v is not None and
+                      not k.endswith('__content_digest')}
 
     # Remove the leading underscores from the repr.
     sanitised_attrs = {}
@@ -48,7 +49,8 @@ def generic_str(input_class: Any) -> str:
     Returns:
         (str): String representation of the object.
     """
-    filtered_attrs = {k: v for k, v in vars(input_class).items() if v is not None}
+    filtered_attrs = {k: v for k, v in vars(input_class).items() if v is not None and
+                      not k.endswith('__content_digest')}
     id_keys = [id_attr for id_attr in filtered_attrs if id_attr.endswith('__id')]
     for id_attr in id_keys:
         del filtered_attrs[id_attr]
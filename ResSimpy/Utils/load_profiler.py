@@ -0,0 +1,225 @@
+"""Opt-in timing of the phases of loading and writing a model.
+
+Profiling is disabled by default, in which case the decorated functions are called directly after a single flag check.
+It is enabled by calling enable_profiling or by setting the RESSIMPY_PROFILE environment variable to a value other
+than 0. When enabled, each call to a decorated phase is timed and counted, along with the number of lines and bytes
+read from files and the number of lines parsed while it runs. A structured log event is emitted on the
+'ResSimpy.Utils.load_profiler' logger at DEBUG level as each phase finishes.
+
+Phases are recorded into the profiler that is active in the current context, which is the profiler of the model being
+loaded for calls made by a model. Calls made outside of a model are recorded into a process wide profiler, returned by
+get_default_profiler.
+
+Examples:
+    >>> from ResSimpy import NexusSimulator
+    >>> from ResSimpy.Utils import load_profiler
+    >>> load_profiler.enable_profiling()
+    >>> model = NexusSimulator('/path/to/model.fcs')
+    >>> model.wells.get_df()
+    >>> model.load_report()
+"""
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+import pandas as pd
+
+_logger = logging.getLogger(__name__)
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+@dataclass
+class PhaseStats:
+    """Totals for one phase of loading or writing a model.
+
+    Attributes:
+        calls (int): number of times the phase was called, including recursive calls.
+        seconds (float): total time spent in the phase. Time spent in recursive calls is only counted once.
+        lines_read (int): number of lines read from files during the phase.
+        bytes_read (int): number of bytes read from files during the phase.
+        lines_processed (int): number of lines parsed during the phase, including lines already read into memory.
+    """
+    calls: int = 0
+    seconds: float = 0.0
+    lines_read: int = 0
+    bytes_read: int = 0
+    lines_processed: int = 0
+
+
+@dataclass
+class _PhaseFrame:
+    """A call to a phase in progress."""
+    name: str
+    outermost: bool
+    lines_read: int = 0
+    bytes_read: int = 0
+    lines_processed: int = 0
+
+
+@dataclass
+class _ProfilingState:
+    enabled: bool = field(default_factory=lambda: os.environ.get('RESSIMPY_PROFILE', '0') not in ('', '0'))
+
+
+_state = _ProfilingState()
+_active_profiler: ContextVar[Optional[LoadProfiler]] = ContextVar('_active_profiler', default=None)
+_active_frames: ContextVar[tuple[_PhaseFrame, ...]] = ContextVar('_active_frames', default=())
+
+
+class LoadProfiler:
+    """Collects the totals for each phase of loading or writing a model."""
+
+    def __init__(self) -> None:
+        """Initialises the LoadProfiler class with no phases recorded."""
+        self.phases: dict[str, PhaseStats] = {}
+
+    @contextmanager
+    def activate(self) -> Iterator[LoadProfiler]:
+        """Records the phases called within the context into this profiler."""
+        profiler_token = _active_profiler.set(self)
+        frames_token = _active_frames.set(())
+        try:
+            yield self
+        finally:
+            _active_frames.reset(frames_token)
+            _active_profiler.reset(profiler_token)
+
+    def reset(self) -> None:
+        """Removes all the recorded phases."""
+        self.phases = {}
+
+    def report(self) -> pd.DataFrame:
+        """Returns the totals for each recorded phase, ordered by the time spent in them.
+
+        Returns:
+            pd.DataFrame: a row for each phase with the columns phase, calls, seconds, lines_read, bytes_read and \
+                lines_processed.
+        """
+        columns = ['phase', 'calls', 'seconds', 'lines_read', 'bytes_read', 'lines_processed']
+        rows = [[name, stats.calls, stats.seconds, stats.lines_read, stats.bytes_read, stats.lines_processed]
+                for name, stats in self.phases.items()]
+        report = pd.DataFrame(rows, columns=columns)
+        return report.sort_values('seconds', ascending=False, ignore_index=True)
+
+    def _record_phase(self, frame: _PhaseFrame, seconds: float) -> None:
+        stats = self.phases.setdefault(frame.name, PhaseStats())
+        stats.calls += 1
+        if not frame.outermost:
+            return
+        stats.seconds += seconds
+        stats.lines_read += frame.lines_read
+        stats.bytes_read += frame.bytes_read
+        stats.lines_processed += frame.lines_processed
+        _logger.debug('Load phase %s took %.6f seconds', frame.name, seconds,
+                      extra={'phase': frame.name, 'seconds': seconds, 'lines_read': frame.lines_read,
+                             'bytes_read': frame.bytes_read, 'lines_processed': frame.lines_processed})
+
+
+_default_profiler = LoadProfiler()
+
+
+def enable_profiling() -> None:
+    """Starts recording the phases of loading and writing models."""
+    _state.enabled = True
+
+
+def disable_profiling() -> None:
+    """Stops recording the phases of loading and writing models."""
+    _state.enabled = False
+
+
+def profiling_enabled() -> bool:
+    """Returns True if the phases of loading and writing models are being recorded."""
+    return _state.enabled
+
+
+def get_default_profiler() -> LoadProfiler:
+    """Returns the profiler that phases called outside of a model are recorded into."""
+    return _default_profiler
+
+
+def attach_profiler(owner: Any, profiler: LoadProfiler) -> None:
+    """Records phases called on an object into a profiler when no other profiler is active.
+
+    Used for the parts of a model that are loaded lazily, after the model itself has finished loading.
+
+    Args:
+        owner (Any): the object with decorated methods, e.g. the wells or grid of a model.
+        profiler (LoadProfiler): the profiler to record the phases into.
+    """
+    owner._load_profiler = profiler
+
+
+def record_read(lines: list[str]) -> None:
+    """Adds the lines read from a file to the phases in progress.
+
+    Args:
+        lines (list[str]): the lines read from the file.
+    """
+    if not _state.enabled:
+        return
+    frames = _active_frames.get()
+    if not frames:
+        return
+    number_of_lines = len(lines)
+    bytes_read = sum(len(line.encode('utf-8', errors='replace')) for line in lines)
+    for frame in frames:
+        frame.lines_read += number_of_lines
+        frame.bytes_read += bytes_read
+
+
+def record_processed(number_of_lines: int) -> None:
+    """Adds the number of lines parsed to the phases in progress.
+
+    Args:
+        number_of_lines (int): the number of lines parsed.
+    """
+    if not _state.enabled:
+        return
+    for frame in _active_frames.get():
+        frame.lines_processed += number_of_lines
+
+
+def profiled_phase(name: str) -> Callable[[F], F]:
+    """Decorator recording the calls to a function as a phase of loading or writing a model.
+
+    Args:
+        name (str): the name of the phase in the load report.
+    """
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _state.enabled:
+                return function(*args, **kwargs)
+            return _call_phase(name, function, args, kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def _call_phase(name: str, function: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Calls a function, recording the call into the active profiler."""
+    profiler = _active_profiler.get()
+    if profiler is None:
+        owner_profiler = getattr(args[0], '_load_profiler', None) if args else None
+        profiler = owner_profiler if isinstance(owner_profiler, LoadProfiler) else _default_profiler
+        with profiler.activate():
+            return _call_phase(name, function, args, kwargs)
+
+    frames = _active_frames.get()
+    frame = _PhaseFrame(name=name, outermost=all(x.name != name for x in frames))
+    frames_token = _active_frames.set((*frames, frame))
+    start = time.perf_counter()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - start
+        _active_frames.reset(frames_token)
+        profiler._record_phase(frame, seconds)
@@ -0,0 +1,121 @@
+"""Helper functions for indexing flat grid arrays on a structured (i, j, k) grid.
+
+Nexus writes grid arrays with the i index varying fastest, followed by j and then k. A flat array of length
+nx * ny * nz can therefore be viewed as a 3D array with shape (nz, ny, nx) without copying any data.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# mapping from the keyword operators used in TOVER and VMOD cards to arithmetic operators
+KEYWORD_OPERATOR_MAPPING = {'MULT': '*', 'DIV': '/', 'ADD': '+', 'SUB': '-', 'EQ': '='}
+
+ARITHMETIC_OPERATORS = ['*', '/', '+', '-', '=']
+
+
+def grid_shape(range_x: int, range_y: int, range_z: int) -> tuple[int, int, int]:
+    """Returns the shape of the 3D (k, j, i) view for a grid with the provided dimensions.
+
+    Args:
+        range_x (int): number of cells in the i direction (NX).
+        range_y (int): number of cells in the j direction (NY).
+        range_z (int): number of cells in the k direction (NZ).
+    """
+    return range_z, range_y, range_x
+
+
+def as_3d_view(array: np.ndarray, range_x: int, range_y: int, range_z: int) -> np.ndarray:
+    """Returns a (k, j, i) view of a flat grid array. Writing to the view writes to the original array.
+
+    Args:
+        array (np.ndarray): flat array with one value per grid cell.
+        range_x (int): number of cells in the i direction (NX).
+        range_y (int): number of cells in the j direction (NY).
+        range_z (int): number of cells in the k direction (NZ).
+
+    Raises:
+        ValueError: if the array size does not match the grid dimensions.
+    """
+    expected_size = range_x * range_y * range_z
+    if array.size != expected_size:
+        raise ValueError(f'Array of size {array.size} does not match grid dimensions '
+                         f'{range_x} x {range_y} x {range_z} = {expected_size} cells.')
+    return array.reshape(grid_shape(range_x, range_y, range_z))
+
+
+def box_slices(i1: int, i2: int, j1: int, j2: int, k1: int, k2: int) -> tuple[slice, slice, slice]:
+    """Converts a 1-based inclusive Nexus box (i1 i2 j1 j2 k1 k2) into slices for a (k, j, i) view.
+
+    Args:
+        i1 (int): first cell in the i direction.
+        i2 (int): last cell in the i direction.
+        j1 (int): first cell in the j direction.
+        j2 (int): last cell in the j direction.
+        k1 (int): first cell in the k direction.
+        k2 (int): last cell in the k direction.
+    """
+    return slice(k1 - 1, k2), slice(j1 - 1, j2), slice(i1 - 1, i2)
+
+
+def box_mask(blocks: list[int] | None, range_x: int, range_y: int, range_z: int) -> np.ndarray:
+    """Creates a flat boolean mask which is True for the cells inside a box.
+
+    Args:
+        blocks (list[int] | None): box as [i1, i2, j1, j2, k1, k2]. If None the whole grid is selected.
+        range_x (int): number of cells in the i direction (NX).
+        range_y (int): number of cells in the j direction (NY).
+        range_z (int): number of cells in the k direction (NZ).
+    """
+    if blocks is None:
+        return np.ones(range_x * range_y * range_z, dtype=bool)
+    mask = np.zeros(grid_shape(range_x, range_y, range_z), dtype=bool)
+    mask[box_slices(*blocks)] = True
+    return mask.ravel()
+
+
+def box_flat_indices(blocks: list[int], range_x: int, range_y: int, range_z: int) -> np.ndarray:
+    """Returns the flat array indices of the cells inside a box, ordered with i varying fastest.
+
+    Args:
+        blocks (list[int]): box as [i1, i2, j1, j2, k1, k2].
+        range_x (int): number of cells in the i direction (NX).
+        range_y (int): number of cells in the j direction (NY).
+        range_z (int): number of cells in the k direction (NZ).
+    """
+    i1, i2, j1, j2, k1, k2 = blocks
+    if not (1 <= i1 <= i2 <= range_x and 1 <= j1 <= j2 <= range_y and 1 <= k1 <= k2 <= range_z):
+        raise ValueError(f'Box {blocks} is outside of the grid dimensions {range_x} x {range_y} x {range_z}.')
+    i_indices = np.arange(i1 - 1, i2)
+    j_indices = np.arange(j1 - 1, j2)
+    k_indices = np.arange(k1 - 1, k2)
+    return ((k_indices[:, None, None] * range_y + j_indices[None, :, None]) * range_x +
+            i_indices[None, None, :]).ravel()
+
+
+def apply_indexed_operation(array: np.ndarray, indices: np.ndarray, operator: str,
+                            values: np.ndarray | float) -> None:
+    """Applies an arithmetic operation in place to the cells at the provided flat indices.
+
+    Repeated indices are handled in order, so overlapping boxes can be combined into a single call.
+
+    Args:
+        array (np.ndarray): flat array to modify.
+        indices (np.ndarray): flat indices of the cells to modify.
+        operator (str): one of '*', '/', '+', '-', '='.
+        values (np.ndarray | float): a single value or one value per index.
+    """
+    match operator:
+        case '=':
+            # numpy doesn't guarantee the order of repeated assignments, so only keep the last value for each cell
+            last_positions = indices.size - 1 - np.unique(indices[::-1], return_index=True)[1]
+            array[indices[last_positions]] = values if np.ndim(values) == 0 else np.asarray(values)[last_positions]
+        case '*':
+            np.multiply.at(array, indices, values)
+        case '/':
+            np.divide.at(array, indices, values)
+        case '+':
+            np.add.at(array, indices, values)
+        case '-':
+            np.subtract.at(array, indices, values)
+        case _:
+            raise ValueError(f'Unsupported operator {operator}.')
@@ -13,14 +13,27 @@
 
 __version__ = "0.0.0"  # Set at build time
 
-from ResSimpy.Nexus.NexusSimulator import NexusSimulator
-from ResSimpy.OpenGoSim.OpenGoSimSimulator import OpenGoSimSimulator
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# Useful regularly used objects
-from ResSimpy.Time.ISODateTime import ISODateTime
-from ResSimpy.Enums.UnitsEnum import UnitSystem
-from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
+if TYPE_CHECKING:
+    from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+    from ResSimpy.OpenGoSim.OpenGoSimSimulator import OpenGoSimSimulator
 
+    # Useful regularly used objects
+    from ResSimpy.Time.ISODateTime import ISODateTime
+    from ResSimpy.Enums.UnitsEnum import UnitSystem
+    from ResSimpy.Nexus.NexusEnums.DateFormatEnum import DateFormat
+
+# The simulator classes import pandas, numpy and every data model, so the public objects are only imported from their
+# modules when first accessed. This keeps importing lightweight objects such as ISODateTime or UnitSystem fast.
+_LAZY_IMPORTS = {
+    "NexusSimulator": "ResSimpy.Nexus.NexusSimulator",
+    "OpenGoSimSimulator": "ResSimpy.OpenGoSim.OpenGoSimSimulator",
+    "ISODateTime": "ResSimpy.Time.ISODateTime",
+    "UnitSystem": "ResSimpy.Enums.UnitsEnum",
+    "DateFormat": "ResSimpy.Nexus.NexusEnums.DateFormatEnum",
+}
 
 __all__ = [
     "NexusSimulator",
@@ -29,3 +42,18 @@ __all__ = [
     "UnitSystem",
     "DateFormat",
    ]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the public objects of the package on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Lists the public objects of the package alongside the attributes already loaded."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1 @@
+"""Performance benchmarks for ResSimpy. These are not run as part of the test suite."""
@@ -0,0 +1,153 @@
+"""Generates synthetic Nexus decks at a configurable scale for the benchmarks.
+
+The deck has a wells file with a WELLSPEC table for every well at every date, a surface network with a node
+connection, well connection and constraint per well at every date, a structured grid with NETGRS, POROSITY and KX arrays
+in include files and a runcontrol file with a TIME card per day.
+
+Run with:
+    python -m benchmarks.deck_generator /path/to/output [--wells 1000] [--dates 12] [--cells 1000000] [--times 365]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterator, TextIO
+
+import numpy as np
+
+from benchmarks.runcontrol_parsing import generate_runcontrol
+
+# number of values written on each line of the grid array include files
+_VALUES_PER_LINE = 10
+# number of cells written to the grid array include files at a time, limiting the memory used for large grids
+_CELLS_PER_CHUNK = 1_000_000
+
+
+@dataclass(frozen=True)
+class DeckScale:
+    """The size of a synthetic deck.
+
+    Attributes:
+        wells (int): number of wells.
+        dates (int): number of dates with a WELLSPEC table and network constraints for every well.
+        cells (int): number of cells in the structured grid, rounded down to a multiple of 100.
+        times (int): number of TIME cards in the runcontrol file.
+    """
+    wells: int = 1000
+    dates: int = 12
+    cells: int = 1_000_000
+    times: int = 365
+
+    @property
+    def grid_dimensions(self) -> tuple[int, int, int]:
+        """Returns NX, NY and NZ for the grid, with 10 x 10 cells per layer column block."""
+        nz = max(self.cells // 100, 1)
+        return 10, 10, nz
+
+
+def _dates(number_of_dates: int) -> list[str]:
+    """Returns the first day of each month from January 2020, in MM/DD/YYYY format."""
+    start_date = date(2020, 1, 1)
+    return [(start_date + timedelta(days=31 * n)).replace(day=1).strftime('%m/%d/%Y') for n in range(number_of_dates)]
+
+
+def _wellspec_lines(scale: DeckScale) -> Iterator[str]:
+    """Yields the lines of the wells file."""
+    nx, ny, nz = scale.grid_dimensions
+    for date_index, time in enumerate(_dates(scale.dates)):
+        yield f'TIME {time}\n'
+        for well in range(scale.wells):
+            yield f'WELLSPEC well_{well}\n'
+            yield 'IW JW L RADW SKIN\n'
+            for layer in range(1, min(nz, 5) + 1):
+                yield f'{well % nx + 1} {(well // nx) % ny + 1} {layer} 0.354 {date_index * 0.1:.2f}\n'
+            yield '\n'
+
+
+def _surface_lines(scale: DeckScale) -> Iterator[str]:
+    """Yields the lines of the surface network file."""
+    for date_index, time in enumerate(_dates(scale.dates)):
+        yield f'TIME {time}\n'
+        if date_index == 0:
+            yield 'NODECON\nNAME NODEIN NODEOUT TYPE METHOD DDEPTH\n'
+            for well in range(scale.wells):
+                yield f'well_{well}_tubing well_{well} wh_{well} PIPE 1 {1000 + well % 100}.5\n'
+            yield 'ENDNODECON\n'
+            yield 'WELLS\nNAME STREAM NUMBER DATUM CROSSFLOW CROSS_SHUT\n'
+            for well in range(scale.wells):
+                stream = 'PRODUCER' if well % 4 else 'WATER'
+                yield f'well_{well} {stream} {well + 1} 4039.3 ON CELLGRAD\n'
+            yield 'ENDWELLS\n'
+        yield 'CONSTRAINTS\n'
+        for well in range(scale.wells):
+            yield f'well_{well} QLIQSMAX {3000 + date_index * 10 + well % 50}.0 QWSMAX {well % 7}.0\n'
+        yield 'ENDCONSTRAINTS\n'
+
+
+def _write_array(file: TextIO, number_of_cells: int, low: float, high: float, seed: int) -> None:
+    """Writes random values for a grid array in chunks."""
+    random_generator = np.random.default_rng(seed)
+    for chunk_start in range(0, number_of_cells, _CELLS_PER_CHUNK):
+        chunk_size = min(_CELLS_PER_CHUNK, number_of_cells - chunk_start)
+        values = random_generator.uniform(low, high, chunk_size)
+        np.savetxt(file, values.reshape(-1, _VALUES_PER_LINE), fmt='%.4f')
+
+
+def generate_deck(directory: str, scale: DeckScale) -> str:
+    """Writes a synthetic deck to a directory.
+
+    Args:
+        directory (str): the directory to write the deck to. Created if it doesn't exist.
+        scale (DeckScale): the size of the deck.
+
+    Returns:
+        str: the path to the FCS file of the deck.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = {name: os.path.join(directory, file_name) for name, file_name in [
+        ('fcs', 'model.fcs'), ('runcontrol', 'runcontrol.dat'), ('wells', 'wells.dat'), ('surface', 'surface.dat'),
+        ('grid', 'structured_grid.dat'), ('netgrs', 'netgrs.inc'), ('porosity', 'porosity.inc'), ('kx', 'kx.inc')]}
+
+    with open(paths['runcontrol'], 'w') as file:
+        file.write(generate_runcontrol(scale.times))
+    with open(paths['wells'], 'w') as file:
+        file.writelines(_wellspec_lines(scale))
+    with open(paths['surface'], 'w') as file:
+        file.writelines(_surface_lines(scale))
+
+    nx, ny, nz = scale.grid_dimensions
+    number_of_cells = nx * ny * nz
+    for seed, (array_name, low, high) in enumerate([('netgrs', 0.5, 1.0), ('porosity', 0.05, 0.35),
+                                                    ('kx', 1.0, 1000.0)]):
+        with open(paths[array_name], 'w') as file:
+            _write_array(file, number_of_cells, low, high, seed)
+    with open(paths['grid'], 'w') as file:
+        file.write(f'NX NY NZ\n{nx} {ny} {nz}\n\nDX CON\n100\nDY CON\n100\nDZ CON\n10\n\n'
+                   f'NETGRS VALUE\n INCLUDE {paths["netgrs"]}\n\nPOROSITY VALUE\n INCLUDE {paths["porosity"]}\n\n'
+                   f'KX VALUE\n INCLUDE {paths["kx"]}\n\nKY MULT\n1 KX\n\nKZ MULT\n0.1 KX\n')
+
+    with open(paths['fcs'], 'w') as file:
+        file.write(f'DESC synthetic benchmark deck\nRUN_UNITS ENGLISH\nDEFAULT_UNITS ENGLISH\nDATEFORMAT MM/DD/YYYY\n'
+                   f'GRID_FILES\n  STRUCTURED_GRID {paths["grid"]}\nINITIALIZATION_FILES\n'
+                   f'RECURRENT_FILES\n  RUNCONTROL {paths["runcontrol"]}\n  WELLS set 1 {paths["wells"]}\n'
+                   f'  SURFACE Network 1 {paths["surface"]}\n')
+    return paths['fcs']
+
+
+def main() -> None:
+    """Writes a synthetic deck to the directory given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('directory', help='directory to write the deck to')
+    parser.add_argument('--wells', type=int, default=DeckScale.wells, help='number of wells')
+    parser.add_argument('--dates', type=int, default=DeckScale.dates, help='number of wellspec and constraint dates')
+    parser.add_argument('--cells', type=int, default=DeckScale.cells, help='number of grid cells')
+    parser.add_argument('--times', type=int, default=DeckScale.times, help='number of runcontrol TIME cards')
+    arguments = parser.parse_args()
+    scale = DeckScale(wells=arguments.wells, dates=arguments.dates, cells=arguments.cells, times=arguments.times)
+    print(generate_deck(arguments.directory, scale))
+
+
+if __name__ == '__main__':
+    main()
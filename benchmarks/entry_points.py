@@ -0,0 +1,167 @@
+"""Times the main NexusSimulator entry points on a synthetic deck, reporting time and peak memory as JSON.
+
+Each entry point is run on a freshly opened model so that lazily loaded parts of the model are loaded by the entry point
+being timed. Timings are taken without memory tracing, then the entry point is run once more with tracemalloc to
+measure the peak memory allocated by it. Results from different commits can be compared with --compare.
+
+Run with:
+    python -m benchmarks.entry_points [--wells 1000] [--dates 12] [--cells 1000000] [--times 365] [--repeats 3]
+        [--output results.json] [--compare baseline.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+import warnings
+from typing import Any, Callable, Optional
+
+from benchmarks.deck_generator import DeckScale, generate_deck
+from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+
+# a benchmark is a setup function returning the model to run on, and the entry point to run on it
+Benchmark = tuple[Callable[[], Any], Callable[[Any], Any]]
+
+
+def _benchmarks(fcs_path: str, output_directory: str) -> dict[str, Benchmark]:
+    """Returns the benchmarks for each entry point, keyed by the name of the entry point."""
+    def open_model() -> NexusSimulator:
+        return NexusSimulator(fcs_path)
+
+    def open_model_with_grid_properties() -> NexusSimulator:
+        model = open_model()
+        if model.grid is not None:
+            model.grid.load_grid_properties_if_not_loaded()
+        return model
+
+    def grid_array(model: NexusSimulator) -> Any:
+        if model.grid is None:
+            raise ValueError('No structured grid found in the deck')
+        return model.grid.kx.get_array()
+
+    def load_grid_properties(model: NexusSimulator) -> None:
+        if model.grid is None:
+            raise ValueError('No structured grid found in the deck')
+        model.grid.load_grid_properties_if_not_loaded()
+
+    return {
+        'NexusSimulator.__init__': (lambda: None, lambda _: open_model()),
+        'wells.get_df': (open_model, lambda model: model.wells.get_df()),
+        'network.load': (open_model, lambda model: model.network.load()),
+        'grid.load_grid_properties_if_not_loaded': (open_model, load_grid_properties),
+        'GridArrayDefinition.get_array': (open_model_with_grid_properties, grid_array),
+        'write_out_new_model': (open_model, lambda model: model.write_out_new_model(
+            new_location=output_directory, new_model_name='benchmark_copy')),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """Returns the current git commit hash, None if it can't be found."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _run(benchmark: Benchmark, repeats: int) -> dict[str, float]:
+    """Returns the fastest time in seconds and the peak memory in MB allocated by the entry point."""
+    setup, entry_point = benchmark
+    timings = []
+    for _ in range(repeats):
+        model = setup()
+        start = time.perf_counter()
+        entry_point(model)
+        timings.append(time.perf_counter() - start)
+
+    model = setup()
+    tracemalloc.start()
+    try:
+        entry_point(model)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': min(timings), 'peak_memory_mb': peak_memory / 1024 ** 2}
+
+
+def run_benchmarks(scale: DeckScale, repeats: int = 3, names: Optional[list[str]] = None) -> dict[str, Any]:
+    """Generates a synthetic deck and times each of the entry points on it.
+
+    Args:
+        scale (DeckScale): the size of the synthetic deck.
+        repeats (int): number of times to repeat each benchmark. The fastest time is reported.
+        names (Optional[list[str]]): only run the benchmarks with these names. Runs all of them if None.
+
+    Returns:
+        dict[str, Any]: the metadata for the run and the results for each entry point.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        fcs_path = generate_deck(os.path.join(directory, 'deck'), scale)
+        benchmarks = _benchmarks(fcs_path, os.path.join(directory, 'output'))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for name, benchmark in benchmarks.items():
+                if names is None or name in names:
+                    results[name] = _run(benchmark, repeats)
+
+    return {
+        'metadata': {'commit': _git_commit(), 'python': platform.python_version(), 'platform': platform.platform(),
+                     'repeats': repeats, 'scale': {'wells': scale.wells, 'dates': scale.dates, 'cells': scale.cells,
+                                                   'times': scale.times}},
+        'results': results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """Returns the ratio of the current time and peak memory to the baseline for each entry point in both runs.
+
+    Args:
+        baseline (dict[str, Any]): results from run_benchmarks for the baseline commit.
+        current (dict[str, Any]): results from run_benchmarks for the current commit.
+    """
+    ratios = {}
+    for name, current_result in current['results'].items():
+        baseline_result = baseline['results'].get(name)
+        if baseline_result is None:
+            continue
+        ratios[name] = {key: current_result[key] / baseline_result[key] if baseline_result[key] else float('nan')
+                        for key in ('seconds', 'peak_memory_mb')}
+    return ratios
+
+
+def main() -> None:
+    """Runs the benchmarks and prints or writes the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--wells', type=int, default=DeckScale.wells, help='number of wells')
+    parser.add_argument('--dates', type=int, default=DeckScale.dates, help='number of wellspec and constraint dates')
+    parser.add_argument('--cells', type=int, default=DeckScale.cells, help='number of grid cells')
+    parser.add_argument('--times', type=int, default=DeckScale.times, help='number of runcontrol TIME cards')
+    parser.add_argument('--repeats', type=int, default=3, help='number of repeats, the fastest is reported')
+    parser.add_argument('--only', nargs='*', help='names of the entry points to benchmark')
+    parser.add_argument('--output', help='file to write the JSON results to, printed if not given')
+    parser.add_argument('--compare', help='JSON results from an earlier run to report the ratios against')
+    arguments = parser.parse_args()
+
+    scale = DeckScale(wells=arguments.wells, dates=arguments.dates, cells=arguments.cells, times=arguments.times)
+    results = run_benchmarks(scale, arguments.repeats, arguments.only)
+    if arguments.compare is not None:
+        with open(arguments.compare) as baseline_file:
+            results['ratio_to_baseline'] = compare(json.load(baseline_file), results)
+
+    output = json.dumps(results, indent=2)
+    if arguments.output is None:
+        print(output)
+    else:
+        with open(arguments.output, 'w') as output_file:
+            output_file.write(output)
+
+
+if __name__ == '__main__':
+    main()
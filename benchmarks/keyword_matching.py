@@ -0,0 +1,101 @@
+"""Microbenchmarks comparing per keyword check_token calls with the precompiled KeywordMatcher.
+
+Run with:
+    python -m benchmarks.keyword_matching [--lines 20000] [--repeats 5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import timeit
+from typing import Callable
+
+import ResSimpy.Nexus.nexus_file_operations as nfo
+from ResSimpy.FileOperations.file_operations import check_token
+from ResSimpy.FileOperations.keyword_matcher import KeywordMatcher
+from ResSimpy.Nexus.NexusKeywords.nexus_keywords import VALID_NEXUS_KEYWORDS
+from ResSimpy.Nexus.NexusKeywords.wells_keywords import WELLS_KEYWORDS
+
+COMMON_INPUT_TOKENS = ['DESC', 'LABEL', 'DATEFORMAT', 'ENGLISH', 'METRIC', 'METKG/CM2', 'METBAR', 'LAB', 'SUNITS',
+                       'KELVIN', 'RANKINE', 'FAHR', 'CELSIUS']
+
+
+def generate_lines(number_of_lines: int, seed: int = 0) -> list[str]:
+    """Generates a mix of wellspec table rows, keyword lines and comments similar to a Nexus deck."""
+    random_generator = random.Random(seed)
+    templates = [
+        'well_{n} {i} {j} {k} 0.354 {v:.3f} 1.0 ! completion {n}',
+        'TIME 01/{d:02d}/2025',
+        'WELLSPEC well_{n}',
+        'IW JW L RADW SKIN',
+        '! a comment line mentioning ENGLISH and LABEL',
+        'C old style comment',
+        '{v:.4f} {v:.4f} {v:.4f} {v:.4f} {v:.4f}',
+    ]
+    lines = []
+    for n in range(number_of_lines):
+        template = random_generator.choice(templates)
+        lines.append(template.format(n=n, i=n % 100 + 1, j=n % 37 + 1, k=n % 11 + 1, v=random_generator.random(),
+                                     d=n % 28 + 1))
+    return lines
+
+
+def _time(function: Callable[[], object], repeats: int) -> float:
+    """Returns the best time in seconds over a number of repeats."""
+    return min(timeit.repeat(function, number=1, repeat=repeats))
+
+
+def run_benchmarks(number_of_lines: int = 20000, repeats: int = 5) -> dict[str, dict[str, float]]:
+    """Times the original per keyword approach against the KeywordMatcher for the common line checks.
+
+    Args:
+        number_of_lines (int): number of synthetic lines to check.
+        repeats (int): number of times to repeat each benchmark. The fastest time is reported.
+
+    Returns:
+        dict[str, dict[str, float]]: the time in seconds for each approach keyed by benchmark name.
+    """
+    lines = generate_lines(number_of_lines)
+    common_input_matcher = KeywordMatcher(COMMON_INPUT_TOKENS)
+    list_tokens = ['WELLSPEC', 'WELLS', 'NODECON', 'CONSTRAINTS', 'QMULT', 'CONDEFAULTS', 'TARGET', 'WELLLIST',
+                   'GASLIFT', 'ACTIONS', 'PROCS', 'NODES', 'WELLHEAD', 'WELLBORE', 'ELEVATION']
+    list_tokens_matcher = KeywordMatcher(list_tokens)
+    wells_keywords_set = set(WELLS_KEYWORDS)
+
+    benchmarks = {
+        'common_input_data': {
+            'check_token_loop': lambda: [[x for x in COMMON_INPUT_TOKENS if check_token(x, line)] for line in lines],
+            'keyword_matcher': lambda: [common_input_matcher.find_all(line) for line in lines],
+        },
+        'check_list_tokens': {
+            'check_token_loop': lambda: [next((x for x in list_tokens if check_token(x, line)), None)
+                                         for line in lines],
+            'keyword_matcher': lambda: [list_tokens_matcher.find_first(line) for line in lines],
+        },
+        'nexus_token_found_wells': {
+            'set_per_line': lambda: [not set(WELLS_KEYWORDS).isdisjoint(line.upper().split()) for line in lines],
+            'cached_set': lambda: [not wells_keywords_set.isdisjoint(line.upper().split()) for line in lines],
+            'nexus_token_found': lambda: [nfo.nexus_token_found(line, WELLS_KEYWORDS) for line in lines],
+        },
+        'nexus_token_found_all_keywords': {
+            'set_per_line': lambda: [not set(VALID_NEXUS_KEYWORDS).isdisjoint(line.upper().split())
+                                     for line in lines],
+            'nexus_token_found': lambda: [nfo.nexus_token_found(line) for line in lines],
+        },
+    }
+    return {name: {approach: _time(function, repeats) for approach, function in approaches.items()}
+            for name, approaches in benchmarks.items()}
+
+
+def main() -> None:
+    """Runs the benchmarks and prints the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lines', type=int, default=20000, help='number of synthetic lines to check')
+    parser.add_argument('--repeats', type=int, default=5, help='number of repeats, the fastest is reported')
+    arguments = parser.parse_args()
+    print(json.dumps(run_benchmarks(arguments.lines, arguments.repeats), indent=2))
+
+
+if __name__ == '__main__':
+    main()
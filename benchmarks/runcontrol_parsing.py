@@ -0,0 +1,73 @@
+"""Times loading a synthetic runcontrol file with many TIME cards through SimControls, solver parameters and reporting.
+
+Run with:
+    python -m benchmarks.runcontrol_parsing [--times 10000] [--repeats 3]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+
+
+def generate_runcontrol(number_of_times: int) -> str:
+    """Generates a runcontrol file with a TIME card per day, with solver and reporting blocks every 100 times."""
+    start_date = date(2020, 1, 1)
+    lines = ['START 01/01/2020', 'DT AUTO 0.1', '   MIN 0.001', '   MAX 60.', 'METHOD IMPLICIT', '']
+    for n in range(1, number_of_times + 1):
+        lines.append(f'TIME {(start_date + timedelta(days=n)).strftime("%m/%d/%Y")}')
+        if n % 100 == 0:
+            lines.extend(['SOLVER ALL ITERATIVE', 'TOLS VOLCON 1e-5', 'SPREADSHEET', '  FIELD TIMESTEP 1',
+                          '  WELLS TNEXT', 'ENDSPREADSHEET', 'OUTPUT', '  MAPS TNEXT', 'ENDOUTPUT'])
+        lines.append('')
+    lines.append('STOP')
+    return '\n'.join(lines) + '\n'
+
+
+def run_benchmark(number_of_times: int = 10000, repeats: int = 3) -> dict[str, float]:
+    """Times loading the model and reading the times, solver parameters and output requests from the runcontrol.
+
+    Args:
+        number_of_times (int): number of TIME cards in the synthetic runcontrol file.
+        repeats (int): number of times to repeat the benchmark. The fastest time is reported.
+
+    Returns:
+        dict[str, float]: the fastest time in seconds and the number of times, solver parameters and requests read.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        runcontrol_path = os.path.join(directory, 'runcontrol.dat')
+        fcs_path = os.path.join(directory, 'model.fcs')
+        with open(runcontrol_path, 'w') as runcontrol_file:
+            runcontrol_file.write(generate_runcontrol(number_of_times))
+        with open(fcs_path, 'w') as fcs_file:
+            fcs_file.write(f'DESC benchmark\nRUN_UNITS ENGLISH\nDATEFORMAT MM/DD/YYYY\nRUNCONTROL {runcontrol_path}\n')
+
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            model = NexusSimulator(fcs_path)
+            times = model.sim_controls.times
+            solver_parameters = model.sim_controls.solver_parameters.get_all()
+            output_requests = model.reporting.ss_output_requests + model.reporting.array_output_requests
+            timings.append(time.perf_counter() - start)
+
+    return {'seconds': min(timings), 'times': len(times), 'solver_parameters': len(solver_parameters),
+            'output_requests': len(output_requests)}
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--times', type=int, default=10000, help='number of TIME cards in the runcontrol file')
+    parser.add_argument('--repeats', type=int, default=3, help='number of repeats, the fastest is reported')
+    arguments = parser.parse_args()
+    print(json.dumps(run_benchmark(arguments.times, arguments.repeats), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Regression benchmark checking that looking up token values line by line scales linearly with the file length.
+
+Every token line in a synthetic file is looked up in turn, as the line-by-line parsers do. get_token_value_at takes
+the index of the line, so the total time should grow linearly with the number of lines. get_token_value searches the
+file for the line, which grows quadratically, and is timed for comparison on the smaller files.
+
+Run with:
+    python -m benchmarks.token_lookup [--lines 2000] [--doublings 3] [--repeats 3] [--max-ratio 2.0]
+
+The scaling ratio is the growth in time divided by the growth in the number of lines between the smallest and largest
+files. It is close to 1 for linear scaling. The benchmark exits with a non-zero status if the ratio for
+get_token_value_at exceeds --max-ratio.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from typing import Callable
+
+from ResSimpy.FileOperations.file_operations import get_token_value, get_token_value_at
+
+# above this number of lines the quadratic get_token_value is not timed, as it takes too long to be useful
+MAX_LINES_FOR_SEARCH = 20000
+
+
+def generate_lines(number_of_lines: int) -> list[str]:
+    """Generates a wells file with a WELLSPEC block of four lines for each well."""
+    lines = []
+    for n in range(number_of_lines // 4):
+        lines.extend([f'WELLSPEC well_{n}\n', 'IW JW L RADW\n', f'{n % 100 + 1} 1 1 0.354\n', '\n'])
+    return lines
+
+
+def _time(function: Callable[[], object], repeats: int) -> float:
+    """Returns the best time in seconds over a number of repeats."""
+    return min(timeit.repeat(function, number=1, repeat=repeats))
+
+
+def _lookup_at(lines: list[str], token_indices: list[int]) -> list[str | None]:
+    """Looks up the value after each token line using its index."""
+    return [get_token_value_at('WELLSPEC', lines, index) for index in token_indices]
+
+
+def _lookup_by_search(lines: list[str], token_indices: list[int]) -> list[str | None]:
+    """Looks up the value after each token line by searching the file for the line."""
+    return [get_token_value('WELLSPEC', lines[index], lines) for index in token_indices]
+
+
+def run_benchmark(number_of_lines: int = 2000, doublings: int = 3, repeats: int = 3) -> dict[str, dict]:
+    """Times looking up the value after every token line for files of doubling length.
+
+    Args:
+        number_of_lines (int): number of lines in the smallest file.
+        doublings (int): number of times the file length is doubled.
+        repeats (int): number of times to repeat each timing. The fastest time is reported.
+
+    Returns:
+        dict[str, dict]: the time in seconds for each approach and file length, and the scaling ratio of each
+            approach between the smallest and largest file it was timed on.
+    """
+    line_counts = [number_of_lines * 2 ** x for x in range(doublings + 1)]
+    timings: dict[str, dict[int, float]] = {'get_token_value_at': {}, 'get_token_value': {}}
+    for line_count in line_counts:
+        lines = generate_lines(line_count)
+        token_indices = [index for index, line in enumerate(lines) if line.startswith('WELLSPEC')]
+        timings['get_token_value_at'][line_count] = _time(lambda: _lookup_at(lines, token_indices), repeats)
+        if line_count <= MAX_LINES_FOR_SEARCH:
+            timings['get_token_value'][line_count] = _time(lambda: _lookup_by_search(lines, token_indices), repeats)
+
+    scaling_ratios = {}
+    for approach, approach_timings in timings.items():
+        if len(approach_timings) < 2:
+            continue
+        smallest, largest = min(approach_timings), max(approach_timings)
+        scaling_ratios[approach] = (approach_timings[largest] / approach_timings[smallest]) / (largest / smallest)
+    return {'timings': timings, 'scaling_ratios': scaling_ratios}
+
+
+def main() -> None:
+    """Runs the benchmark, prints the results as JSON and fails if the lookup by index doesn't scale linearly."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lines', type=int, default=2000, help='number of lines in the smallest file')
+    parser.add_argument('--doublings', type=int, default=3, help='number of times the file length is doubled')
+    parser.add_argument('--repeats', type=int, default=3, help='number of repeats, the fastest is reported')
+    parser.add_argument('--max-ratio', type=float, default=2.0,
+                        help='largest scaling ratio allowed for get_token_value_at, 1 is linear')
+    arguments = parser.parse_args()
+    results = run_benchmark(arguments.lines, arguments.doublings, arguments.repeats)
+    print(json.dumps(results, indent=2))
+    scaling_ratio = results['scaling_ratios']['get_token_value_at']
+    if scaling_ratio > arguments.max_ratio:
+        sys.exit(f'get_token_value_at scaling ratio {scaling_ratio:.2f} exceeds {arguments.max_ratio}, lookups are no '
+                 f'longer linear in the number of lines.')
+
+
+if __name__ == '__main__':
+    main()
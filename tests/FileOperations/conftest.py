@@ -15,6 +15,7 @@ def mock_out_file_datetime_operations(mocker, request):
     os_stat_mock = mocker.MagicMock()
     mocker.patch('os.stat', os_stat_mock)
     os_stat_mock.return_value.st_mtime = None
+    os_stat_mock.return_value.st_size = 0
 
     os_path_mock = mocker.MagicMock(return_value=True)
     mocker.patch('os.path.exists', os_path_mock)
@@ -0,0 +1,129 @@
+import gc
+
+import pytest
+
+from ResSimpy.FileOperations.file_content_store import FileContentStore
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+
+
+def make_files(number_of_files):
+    return [NexusFile(location=f'/path/file_{i}.dat', file_content_as_list=['KX CON\n', f'{i * 100}\n'] * 50)
+            for i in range(number_of_files)]
+
+
+def test_content_store_evicts_least_recently_used():
+    # Arrange
+    files = make_files(3)
+    expected_contents = [list(file.file_content_as_list) for file in files]
+    store = FileContentStore(memory_budget=10**9)
+    for file in files:
+        store.attach(file)
+
+    # Act
+    files[0].file_content_as_list
+    store.memory_budget = store.resident_bytes // 2
+
+    # Assert
+    assert store.evicted_file_count == 2
+    assert [file._File__content is None for file in files] == [False, True, True]
+    assert store.compressed_bytes > 0
+    assert [file.file_content_as_list for file in files] == expected_contents
+    assert store.evicted_file_count == 2
+
+
+def test_content_store_round_trip():
+    # Arrange
+    content = ['KX CON\r\n', 'éèà ∂\n', '\x0b\x1c\n', '', 'no line end']
+    file = NexusFile(location='/path/file.dat', file_content_as_list=list(content))
+    other_file = NexusFile(location='/path/other_file.dat', file_content_as_list=['KY CON\n'])
+    store = FileContentStore(memory_budget=0)
+
+    # Act
+    store.attach(file)
+    store.attach(other_file)
+    result = file.file_content_as_list
+
+    # Assert
+    assert result == content
+    assert store.evicted_file_count == 1
+
+
+def test_content_store_keeps_modified_files():
+    # Arrange
+    files = make_files(2)
+    files[0]._file_modified_set(True)
+    store = FileContentStore(memory_budget=0)
+
+    # Act
+    for file in files:
+        store.attach(file)
+    files[0].file_content_as_list
+    files[1].file_content_as_list
+
+    # Assert
+    assert store.evicted_file_count == 0
+
+
+def test_content_store_detach_and_garbage_collection():
+    # Arrange
+    files = make_files(3)
+    store = FileContentStore(memory_budget=0)
+    for file in files:
+        store.attach(file)
+
+    # Act
+    store.detach(files[0])
+    del files[1]
+    gc.collect()
+
+    # Assert
+    assert files[0]._content_store is None
+    assert files[0].file_content_as_list == ['KX CON\n', '0\n'] * 50
+    assert store.evicted_file_count == 1
+    assert store.resident_bytes == 0
+
+
+def test_content_store_clones_share_content():
+    # Arrange
+    files = make_files(2)
+    store = FileContentStore(memory_budget=10**9)
+    for file in files:
+        store.attach(file)
+    files_bytes = store.resident_bytes
+    first_file_store = FileContentStore(memory_budget=10**9)
+    first_file = make_files(1)[0]
+    first_file_store.attach(first_file)
+
+    # Act
+    clones = [files[0].clone() for _ in range(3)]
+    bytes_with_clones = store.resident_bytes
+    store.memory_budget = 0
+    evicted_file_count = store.evicted_file_count
+    restored_content = clones[1].file_content_as_list
+
+    # Assert
+    assert bytes_with_clones == files_bytes
+    assert evicted_file_count == 5
+    assert restored_content == ['KX CON\n', '0\n'] * 50
+    assert all(x._File__content is restored_content for x in [files[0], *clones])
+    assert files[1]._File__content is None
+    assert store.evicted_file_count == 1
+    assert store.resident_bytes == first_file_store.resident_bytes
+
+    # Act
+    clones[2].line_locations = [(0, clones[2].id)]
+    clones[2].add_to_file_as_list(additional_content=['KY CON\n', '50\n'], index=0)
+    store.memory_budget = 0
+
+    # Assert
+    assert clones[2].file_content_as_list[:2] == ['KY CON\n', '50\n']
+    assert files[0]._File__content is None and clones[0]._File__content is None
+    assert clones[2]._File__content is not None
+    assert files[0].file_content_as_list == ['KX CON\n', '0\n'] * 50
+    assert clones[0]._File__content is files[0]._File__content
+
+
+def test_content_store_negative_budget():
+    # Act Assert
+    with pytest.raises(ValueError, match='The memory budget must be zero or more bytes'):
+        FileContentStore(memory_budget=-1)
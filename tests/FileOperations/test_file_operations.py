@@ -88,6 +88,43 @@ def test_get_token_value(mocker: MockerFixture, line_contents, file_contents, ex
     assert with_index_result == (expected_result, expected_line_index)
 
 
+def test_get_token_value_at_repeated_lines():
+    # Arrange
+    file_as_list = ['MYTESTTOKEN', 'first', 'OTHERTOKEN 1', 'MYTESTTOKEN', 'second', 'MYTESTTOKEN third']
+
+    # Act
+    result_first = fo.get_token_value_at('MYTESTTOKEN', file_as_list, line_index=0)
+    result_repeated = fo.get_token_value_at('MYTESTTOKEN', file_as_list, line_index=3)
+    result_same_line = fo.get_expected_token_value_at('MYTESTTOKEN', file_as_list, line_index=5)
+
+    # Assert
+    assert result_first == 'first'
+    assert result_repeated == 'second'
+    assert result_same_line == 'third'
+
+
+def test_get_token_value_at_does_not_search_file():
+    # Arrange
+    class NoSearchList(list):
+        def index(self, *args, **kwargs):
+            raise AssertionError('The file should not be searched for the token line.')
+
+    file_as_list = NoSearchList(['TIME 01/01/2020', 'MYTESTTOKEN 5'] * 1000)
+
+    # Act
+    result = [fo.get_token_value_at('MYTESTTOKEN', file_as_list, line_index=i) for i in range(1, 2000, 2)]
+
+    # Assert
+    assert result == ['5'] * 1000
+
+
+def test_get_expected_token_value_at_no_value():
+    # Act / Assert
+    with pytest.raises(ValueError, match='Custom message MYTESTTOKEN'):
+        fo.get_expected_token_value_at('MYTESTTOKEN', ['VALUE 1', 'MYTESTTOKEN'], line_index=1,
+                                       custom_message='Custom message')
+
+
 @pytest.mark.parametrize("line, number_tokens, expected_result, comment_chars", [
     ('EQUIL METHOD 1 /path/equil.dat', 4, ['EQUIL', 'METHOD', '1', '/path/equil.dat'], None),
     ('EQUIL METHOD 1 /path/equil.dat ! comment', 4, ['EQUIL', 'METHOD', '1', '/path/equil.dat'], None),
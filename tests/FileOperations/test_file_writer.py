@@ -0,0 +1,139 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from ResSimpy.Enums.FileCopyMethodEnum import FileCopyMethod
+from ResSimpy.FileOperations.file_writer import BatchFileWriter, copy_file
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+
+
+@pytest.fixture
+def mock_file_system(mocker):
+    mocker.patch('os.path.isdir', MagicMock(return_value=False))
+    mocker.patch('os.listdir', MagicMock(return_value=[]))
+    makedirs_mock = MagicMock()
+    mocker.patch('os.makedirs', makedirs_mock)
+    link_mock = MagicMock()
+    mocker.patch('os.link', link_mock)
+    symlink_mock = MagicMock()
+    mocker.patch('os.symlink', symlink_mock)
+    writing_mock_open = mocker.mock_open()
+    mocker.patch('builtins.open', writing_mock_open)
+    return makedirs_mock, link_mock, symlink_mock, writing_mock_open
+
+
+def test_batch_file_writer_links_shared_content(mock_file_system):
+    # Arrange
+    makedirs_mock, link_mock, _, writing_mock_open = mock_file_system
+    shared_content = ['WELLSPEC well1\n', 'IW JW L\n', '1 1 1\n']
+    first_file = NexusFile(location='/base/wells.inc', file_content_as_list=shared_content)
+    cloned_file = NexusFile(location='/base/wells.inc', file_content_as_list=shared_content)
+    modified_file = NexusFile(location='/base/wells.inc', file_content_as_list=shared_content)
+    modified_file._file_modified_set(True)
+    writer = BatchFileWriter()
+
+    # Act
+    writer.make_dirs('/cases')
+    writer.make_dirs('/cases')
+    writer.write(first_file, '/cases/case_1_wells.inc')
+    writer.write(cloned_file, '/cases/case_2_wells.inc')
+    writer.write(modified_file, '/cases/case_3_wells.inc')
+
+    # Assert
+    makedirs_mock.assert_called_once_with(os.path.abspath('/cases'), exist_ok=True)
+    link_mock.assert_called_once_with('/cases/case_1_wells.inc', '/cases/case_2_wells.inc')
+    assert [call.args[0] for call in writing_mock_open.call_args_list] == ['/cases/case_1_wells.inc',
+                                                                           '/cases/case_3_wells.inc']
+    assert writer.exists('/cases/case_2_wells.inc')
+    assert not writer.exists('/cases/case_4_wells.inc')
+
+
+def test_batch_file_writer_links_identical_content(mock_file_system):
+    # Arrange
+    _, link_mock, _, writing_mock_open = mock_file_system
+    content = ['KX CON\n', '100\n']
+    first_file = NexusFile(location='/base/kx.inc', file_content_as_list=content)
+    # e.g. the content of a clone restored from a FileContentStore, held in a new list
+    restored_file = NexusFile(location='/base/kx.inc', file_content_as_list=list(content))
+    different_file = NexusFile(location='/base/kx.inc', file_content_as_list=['KX CON\n', '200\n'])
+    writer = BatchFileWriter()
+
+    # Act
+    writer.write(first_file, '/cases/case_1_kx.inc')
+    writer.write(restored_file, '/cases/case_2_kx.inc')
+    writer.write(different_file, '/cases/case_3_kx.inc')
+
+    # Assert
+    link_mock.assert_called_once_with('/cases/case_1_kx.inc', '/cases/case_2_kx.inc')
+    assert [call.args[0] for call in writing_mock_open.call_args_list] == ['/cases/case_1_kx.inc',
+                                                                           '/cases/case_3_kx.inc']
+
+
+@pytest.mark.parametrize('allow_symlinks, expected_writes', [
+    (True, ['/cases/case_1_wells.inc']),
+    (False, ['/cases/case_1_wells.inc', '/cases/case_2_wells.inc']),
+], ids=['symlink', 'write'])
+def test_batch_file_writer_hard_link_fails(mock_file_system, allow_symlinks, expected_writes):
+    # Arrange
+    _, link_mock, symlink_mock, writing_mock_open = mock_file_system
+    link_mock.side_effect = OSError('Invalid cross-device link')
+    shared_content = ['KX CON\n', '100\n']
+    writer = BatchFileWriter(allow_symlinks=allow_symlinks)
+
+    # Act
+    writer.write(NexusFile(location='/base/kx.inc', file_content_as_list=shared_content), '/cases/case_1_wells.inc')
+    writer.write(NexusFile(location='/base/kx.inc', file_content_as_list=shared_content), '/cases/case_2_wells.inc')
+
+    # Assert
+    assert [call.args[0] for call in writing_mock_open.call_args_list] == expected_writes
+    assert symlink_mock.call_count == int(allow_symlinks)
+
+
+@pytest.mark.parametrize('copy_method, link_error, copy_file_range_error, expected_calls', [
+    (FileCopyMethod.HARDLINK, None, None, (1, 0, 0)),
+    (FileCopyMethod.HARDLINK, OSError('Invalid cross-device link'), None, (1, 1, 0)),
+    (FileCopyMethod.COPY, None, None, (0, 1, 0)),
+    (FileCopyMethod.COPY, None, OSError('Operation not supported'), (0, 1, 1)),
+], ids=['hard link', 'hard link fails', 'copy', 'copy_file_range fails'])
+def test_copy_file(mocker, copy_method, link_error, copy_file_range_error, expected_calls):
+    # Arrange
+    link_mock = MagicMock(side_effect=link_error)
+    mocker.patch('os.link', link_mock)
+    copy_file_range_mock = MagicMock(side_effect=copy_file_range_error)
+    mocker.patch('ResSimpy.FileOperations.file_writer._copy_file_range', copy_file_range_mock)
+    mocker.patch('os.copy_file_range', MagicMock(), create=True)
+    copyfile_mock = MagicMock()
+    mocker.patch('shutil.copyfile', copyfile_mock)
+
+    # Act
+    copy_file('/base/arrays.dat', '/new/arrays.dat', copy_method)
+
+    # Assert
+    assert (link_mock.call_count, copy_file_range_mock.call_count, copyfile_mock.call_count) == expected_calls
+
+
+@pytest.mark.parametrize('copy_method', [FileCopyMethod.WRITE, FileCopyMethod.HARDLINK],
+                         ids=['write', 'hard link'])
+def test_batch_file_writer_replaces_existing_files(mock_file_system, mocker, copy_method):
+    # Arrange
+    _, link_mock, _, writing_mock_open = mock_file_system
+    mocker.patch('os.path.lexists', MagicMock(side_effect=lambda x: x == '/cases/case_1_kx.inc'))
+    mocker.patch('os.path.isfile', MagicMock(return_value=True))
+    replace_mock = MagicMock()
+    mocker.patch('os.replace', replace_mock)
+    file = NexusFile(location='/base/kx.inc', file_content_as_list=['KX CON\n', '100\n'])
+    writer = BatchFileWriter(copy_method=copy_method)
+
+    # Act
+    writer.write(file, '/cases/case_1_kx.inc')
+
+    # Assert
+    replace_mock.assert_called_once()
+    temporary_path, replaced_path = replace_mock.call_args.args
+    assert replaced_path == '/cases/case_1_kx.inc'
+    assert os.path.dirname(temporary_path) == '/cases'
+    assert temporary_path != replaced_path
+    written_paths = [call.args[0] for call in writing_mock_open.call_args_list] + \
+        [call.args[1] for call in link_mock.call_args_list]
+    assert written_paths == [temporary_path]
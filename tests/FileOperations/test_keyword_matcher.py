@@ -0,0 +1,59 @@
+import pytest
+
+import ResSimpy.FileOperations.file_operations as fo
+from ResSimpy.FileOperations.keyword_matcher import KeywordMatcher, get_keyword_matcher
+from ResSimpy.Nexus.nexus_file_operations import check_list_tokens
+
+
+@pytest.mark.parametrize('line', [
+    'ENGLISH',
+    'metric  LAB  ! FAHR',
+    'C ENGLISH',
+    'DATEFORMAT MM/DD/YYYY KELVIN',
+    'XTIME TIME',
+    'TIME!comment',
+    '"LABEL" my label',
+    'METKG/CM2\n',
+    'LABEL LAB LABORATORY',
+    'DESC some description with TIME in it',
+    '\tSUNITS\tPPM',
+    'CELSIUS',
+    '',
+], ids=['single', 'comment', 'c_comment', 'multiple', 'embedded_first', 'comment_directly_after', 'quotes',
+        'slash_newline', 'prefix_keywords', 'desc', 'tabs', 'end_of_line', 'empty'])
+@pytest.mark.parametrize('comment_characters', [None, ['!'], ['--', '!']], ids=['default', 'nexus', 'other'])
+def test_keyword_matcher_matches_check_token(line, comment_characters):
+    # Arrange
+    keywords = ['DESC', 'LABEL', 'DATEFORMAT', 'ENGLISH', 'METRIC', 'METKG/CM2', 'LAB', 'SUNITS', 'KELVIN', 'FAHR',
+                'CELSIUS', 'TIME']
+    matcher = KeywordMatcher(keywords, comment_characters=comment_characters)
+    expected_result = [x for x in keywords if fo.check_token(x, line, comment_characters=comment_characters)]
+
+    # Act
+    result = matcher.find_all(line)
+
+    # Assert
+    assert result == expected_result
+    assert matcher.contains_any(line) == bool(expected_result)
+    assert matcher.find_first(line) == (expected_result[0] if expected_result else None)
+
+
+def test_get_keyword_matcher_is_cached():
+    # Act
+    result = get_keyword_matcher(('TIME', 'WELLSPEC'))
+
+    # Assert
+    assert get_keyword_matcher(('TIME', 'WELLSPEC')) is result
+
+
+@pytest.mark.parametrize('list_tokens, line, expected_result', [
+    (['WellSpec', 'Time'], 'time 01/01/2020 wellspec well1', 'WellSpec'),
+    (['NODECON', 'CONSTRAINTS'], 'CONSTRAINTS', 'CONSTRAINTS'),
+    (['NODECON', 'CONSTRAINTS'], '! CONSTRAINTS', None),
+], ids=['returns_original_case', 'found', 'commented'])
+def test_check_list_tokens(list_tokens, line, expected_result):
+    # Act
+    result = check_list_tokens(list_tokens, line)
+
+    # Assert
+    assert result == expected_result
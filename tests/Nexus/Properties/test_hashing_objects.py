@@ -230,3 +230,35 @@ def test_watermethod_hash():
     # Assert 
     assert hash(wat_obj) == hash(wat_obj_2)
     assert hash(wat_obj) != hash(wat_obj_3)
+
+
+def test_dynamic_property_content_digest():
+    # Arrange
+    pvt_file = NexusFile(location='test/file/pvt.dat')
+    properties = {'API': 30.0, 'UNIT_SYSTEM': UnitSystem.ENGLISH,
+                  'SATURATED': pd.DataFrame({'PRES': [14.7, 115.0, 2515.0], 'BO': [1.05, 1.08, 1.25]}),
+                  'UNSATOIL_PSAT': {'2000.0': pd.DataFrame({'PRES': [2515, 3515], 'BO': [1.25, 1.24]})}}
+    method_1 = NexusPVTMethod(file=pvt_file, input_number=1, model_unit_system=UnitSystem.ENGLISH,
+                              pvt_type=PvtType.BLACKOIL, properties=properties)
+    method_2 = NexusPVTMethod(file=pvt_file, input_number=2, model_unit_system=UnitSystem.ENGLISH,
+                              pvt_type=PvtType.BLACKOIL,
+                              properties={k: v.copy() if hasattr(v, 'copy') else v for k, v in properties.items()})
+
+    # Act
+    digest_1 = method_1.content_digest()
+    digest_2 = method_2.content_digest()
+
+    # Assert
+    assert digest_1 == digest_2
+    assert method_1.content_digest() is digest_1
+
+    # setting an attribute recalculates the digest
+    method_2.unit_system = UnitSystem.METRIC
+    assert method_2.content_digest() != digest_1
+    method_2.unit_system = UnitSystem.ENGLISH
+    assert method_2.content_digest() == digest_1
+
+    # modifying the properties in place requires clearing the cached tables
+    method_2.properties['SATURATED'].loc[0, 'BO'] = 1.06
+    method_2.clear_cached_tables()
+    assert method_2.content_digest() != digest_1
@@ -6,6 +6,7 @@ from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.NexusHydraulicsMethod import NexusHydraulicsMethod
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Nexus.NexusHydraulicsMethods import NexusHydraulicsMethods
+from ResSimpy.Nexus.hydraulics_interpolation import HydraulicsExtrapolation
 
 # TODO: refactor as a class
 
@@ -457,3 +458,40 @@ def test_nexus_hydraulics_ranges():
                         'IQOIL': (1, 3),
                       'DEPTH': (10000.0, 10000.0),
                       }
+
+
+def test_hydraulics_interpolate_pressure():
+    # Arrange
+    properties = {'QOIL': np.array([1.0, 1000., 3000.]),
+                  'GOR': np.array([0.0, 0.5]),
+                  'WCUT': np.array([0.0]),
+                  'THP': np.array([100., 500.]),
+                  'HYD_TABLE': pd.DataFrame({'IGOR': [1, 1, 1, 2, 2, 2],
+                                             'IWCUT': [1, 1, 1, 1, 1, 1],
+                                             'IQOIL': [1, 2, 3, 1, 2, 3],
+                                             'BHP0': [2470., 2478., 2493., 1860., 1881., 1947.],
+                                             'BHP1': [2545., 2548., 2569., 1990., 2002., 2039.0]}),
+                  'LIMITS': pd.DataFrame({'VARIABLE': ['QOIL'], 'MIN': [0.0], 'MAX': [4000.0]})}
+    hyd_obj = NexusHydraulicsMethod(file=None, input_number=1, model_unit_system=UnitSystem.ENGLISH,
+                                    properties=properties)
+    qoil = np.array([1000., 500.5, 4000., 5000., 0.])
+    gor = np.array([0.5, 0.25, 0.0, 0.0, 0.0])
+    expected_clamped = np.array([1881., 2221.75, 2500.5, 2500.5, 2470. - 8 / 999])
+
+    # Act
+    clamped = hyd_obj.interpolate_pressure(QOIL=qoil, GOR=gor, THP=np.array([100., 300., 100., 100., 100.]))
+    linear = hyd_obj.interpolate_pressure(extrapolation=HydraulicsExtrapolation.LINEAR, QOIL=5000., GOR=0., THP=100.)
+    outside_limits = hyd_obj.interpolate_pressure(extrapolation=HydraulicsExtrapolation.NAN, QOIL=qoil, GOR=gor,
+                                                  THP=100.)
+    grid = hyd_obj.interpolation_grid
+
+    # Assert
+    assert grid.axis_names == ('GOR', 'WCUT', 'QOIL', 'THP')
+    assert grid.values.shape == (2, 1, 3, 2)
+    assert grid.pressure_name == 'BHP'
+    assert hyd_obj.interpolation_grid is grid
+    np.testing.assert_allclose(clamped, expected_clamped)
+    np.testing.assert_allclose(linear, 2508.)
+    np.testing.assert_array_equal(np.isnan(outside_limits), [False, False, False, True, False])
+    with pytest.raises(ValueError, match='GOR'):
+        hyd_obj.interpolate_pressure(QOIL=qoil, THP=100.)
@@ -754,3 +754,34 @@ def test_pvt_method_ranges():
     result = pvt_obj.ranges
     # Assert
     assert result == expected_result
+
+
+def test_pvt_interpolate_properties():
+    # Arrange
+    properties = {'PVT_TYPE': PvtType.BLACKOIL,
+                  'SATURATED': pd.DataFrame({'PRES': [14.7, 115., 2515, 3515],
+                                             'BO': [1.05, 1.08, 1.25, 1.33],
+                                             'BG': [225, 25, 1.089, 0.787],
+                                             'RS': [0.005, 0.045, 0.505, 0.69],
+                                             'VO': [3.93, 2.78, 0.99, 0.79],
+                                             'VG': [0.0105, 0.0109, 0.0193, 0.0193]}),
+                  'UNSATOIL_PSAT': {'3515.0': pd.DataFrame({'PRES': [3515, 4515], 'BO': [1.33, 1.31],
+                                                            'VO': [0.79, 0.77]}),
+                                    '2515.0': pd.DataFrame({'PRES': [2515, 3515], 'BO': [1.25, 1.24],
+                                                            'VO': [0.99, 0.98]})}}
+    pvt_obj = NexusPVTMethod(file=None, input_number=1, model_unit_system=UnitSystem.ENGLISH, properties=properties)
+    pressure = np.array([1315., 3015., 3515., 1315.])
+    solution_gas_oil_ratio = np.array([0.275, 0.505, 0.5975, 0.6])
+    bo_factor_between_branches = ((1 - 0.5 * 0.01 / 1.25) + (1 - 0.5 * 0.02 / 1.33)) / 2
+
+    # Act
+    saturated = pvt_obj.interpolate_properties(pressure)
+    result = pvt_obj.interpolate_properties(pressure, solution_gas_oil_ratio)
+
+    # Assert
+    assert [x.saturation_pressure for x in pvt_obj.black_oil_tables.undersaturated_oil] == [2515., 3515.]
+    np.testing.assert_allclose(saturated['BO'], [1.165, 1.29, 1.33, 1.165])
+    np.testing.assert_allclose(result['RS'], [0.275, 0.505, 0.5975, 0.275])
+    np.testing.assert_allclose(result['BO'], [1.165, 1.245, 1.29 * bo_factor_between_branches, 1.165])
+    np.testing.assert_allclose(result['VO'][1], 0.985)
+    np.testing.assert_allclose(result['BG'], saturated['BG'])
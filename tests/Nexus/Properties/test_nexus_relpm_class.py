@@ -599,3 +599,38 @@ HYSTERESIS KRG LINEAR MAXTRAP 0.2 NOMOD
 
     # Assert
     assert result == expected_output
+
+
+def test_relpm_interpolate_relperm():
+    # Arrange
+    properties = {'WOTABLE': pd.DataFrame({'SW': [0.8, 0.2, 0.3, 0.5],
+                                           'KRW': [0.6, 0.0, 0.0, 0.2],
+                                           'KROW': [0.0, 1.0, 0.6, 0.2],
+                                           'PCWO': [0.0, 2.0, np.nan, 1.0]}),
+                  'PRSTAB': pd.DataFrame({'SWL': [0.1], 'SWR': [0.2], 'SWRO': [0.6], 'SWU': [1.0]})}
+    relpm_obj = NexusRelPermMethod(file=NexusFile(location='relpm.dat'), input_number=1,
+                                   model_unit_system=UnitSystem.ENGLISH, properties=properties)
+    water_saturation = np.array([0.1, 0.4, 0.8, 0.9])
+
+    # Act
+    unscaled = relpm_obj.interpolate_relperm('WOTABLE', water_saturation)
+    two_point = relpm_obj.interpolate_relperm('WOTABLE', [0.5, 0.7], end_points={'SWL': 0.1, 'SWU': [0.9, 0.9]},
+                                              columns=['KRW'])
+    three_point = relpm_obj.interpolate_relperm('WOTABLE', [0.15, 0.55], end_points={
+        'SWL': np.array([0.1, 0.1]), 'SWR': np.array([0.2, 0.2]), 'SWU': np.array([0.9, 0.9])}, columns=['KRW'])
+    tables = relpm_obj.relperm_tables
+
+    # Assert
+    assert list(tables.tables) == ['WOTABLE']
+    assert tables.tables['WOTABLE'].end_points == (0.2, 0.3, 0.8)
+    assert relpm_obj.relperm_tables is tables
+    np.testing.assert_allclose(unscaled['KRW'], [0.0, 0.1, 0.6, 0.6])
+    np.testing.assert_allclose(unscaled['KROW'], [1.0, 0.4, 0.0, 0.0])
+    np.testing.assert_allclose(unscaled['PCWO'], [2.0, 4 / 3, 0.0, 0.0])
+    assert list(two_point) == ['KRW']
+    np.testing.assert_allclose(two_point['KRW'], [0.2, 0.4])
+    np.testing.assert_allclose(three_point['KRW'], [0.0, 0.2 + 0.4 / 6])
+    with pytest.raises(ValueError, match='SGL'):
+        relpm_obj.interpolate_relperm('WOTABLE', water_saturation, end_points={'SGL': 0.1})
+    with pytest.raises(ValueError, match='GOTABLE'):
+        relpm_obj.interpolate_relperm('GOTABLE', water_saturation)
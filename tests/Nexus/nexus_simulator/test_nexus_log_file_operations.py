@@ -74,7 +74,7 @@ def test_get_simulation_progress(mocker, log_file_contents, times, expected_prog
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
     run_control_file = "START 01/01/2000"
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(mocker, filename, fcs_file, run_control_file, "",
@@ -133,7 +133,7 @@ def test_get_status_finished(mocker, log_file_contents, errors, warnings):
     listdir_mock = mocker.MagicMock(return_value=['nexus_run.log', ''])
     mocker.patch("os.listdir", listdir_mock)
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(
@@ -191,7 +191,7 @@ def test_get_base_case_run_time(mocker, log_file_contents, run_time):
     """Test the 'retrieve previous time for run' functionality"""
     # Arrange
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     # Returns the contents of a completed run when looking at the 'original' model
     def open_file_mock(filename, operation=None):
@@ -212,7 +212,7 @@ def test_get_base_case_run_time(mocker, log_file_contents, run_time):
     final_listdir_mock = mocker.Mock(return_value=['new_case.log', ''])
     mocker.patch("os.listdir", final_listdir_mock)
 
-    new_open_mock = mocker.mock_open(read_data='Nexus finished\n')
+    new_open_mock = mocker.mock_open(read_data=b'Nexus finished\n')
     mocker.patch("builtins.open", new_open_mock)
 
     # Act
@@ -240,7 +240,7 @@ def test_get_simulation_start_time(mocker, log_file_contents, start_time):
     # Arrange
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(
@@ -276,7 +276,7 @@ def test_get_simulation_end_time(mocker, log_file_contents, end_time):
     # Arrange
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(
@@ -320,7 +320,7 @@ def test_get_simulation_start_end_time(mocker, log_file_contents, expected_start
     # Arrange
     fcs_file = f"RUNCONTROL /run_control/path\nDATEFORMAT DD/MM/YYYY\n"
 
-    log_file_mock = mocker.mock_open(read_data=log_file_contents)
+    log_file_mock = mocker.mock_open(read_data=log_file_contents.encode())
 
     def mock_open_wrapper(filename, operation=None):
         mock_open = mock_multiple_opens(
@@ -0,0 +1,184 @@
+import os
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from ResSimpy import NexusSimulator
+
+from ResSimpy.Enums.DiffChangeEnum import DiffChange
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+from ResSimpy.Nexus.nexus_model_diff import ModelDiffEntry
+from tests.Nexus.nexus_simulator.test_nexus_model_diff import load_models
+
+
+def test_file_clone_shares_content_until_edited():
+    # Arrange
+    include_file = NexusFile(location='/path/include.dat', file_content_as_list=['KX CON\n', '100\n'])
+    include_file.line_locations = [(0, include_file.id)]
+    include_file.object_locations = {'kx_uuid': [0]}
+    file = NexusFile(location='/path/file.dat', include_objects=[include_file],
+                     file_content_as_list=['START\n', 'INCLUDE /path/include.dat\n', 'END\n'])
+
+    # Act
+    clone = file.clone()
+    cloned_include_file = clone.include_objects[0]
+    cloned_include_file.add_to_file_as_list(additional_content=['KY CON\n', '50\n'], index=0,
+                                            additional_objects={'ky_uuid': [0]})
+
+    # Assert
+    assert cloned_include_file is not include_file
+    assert clone.file_content_as_list is file.file_content_as_list
+    assert include_file.file_content_as_list == ['KX CON\n', '100\n']
+    assert include_file.object_locations == {'kx_uuid': [0]}
+    assert cloned_include_file.file_content_as_list == ['KY CON\n', '50\n', 'KX CON\n', '100\n']
+    assert cloned_include_file.object_locations == {'kx_uuid': [2], 'ky_uuid': [0]}
+    assert cloned_include_file.file_modified and not include_file.file_modified
+
+
+def test_clone_model(mocker):
+    # Arrange
+    base_model, _ = load_models(mocker)
+    base_well = base_model.wells.get('well1')
+
+    # Act
+    clone = base_model.clone()
+    clone.wells.get('well1').completions[0].update({'skin': 2.5})
+
+    # Assert
+    assert clone.model_files is not base_model.model_files
+    for role in ['well_files', 'pvt_files', 'surface_files']:
+        base_file = getattr(base_model.model_files, role)[1]
+        cloned_file = getattr(clone.model_files, role)[1]
+        assert cloned_file is not base_file
+        assert cloned_file.file_content_as_list is base_file.file_content_as_list
+    assert clone.wells.model is clone
+    assert clone.network.model is clone
+    assert clone.pvt.files[1] is clone.model_files.pvt_files[1]
+    assert base_well.completions[0].skin is None
+    assert base_model.diff(clone).get_entries(section='wells') == [
+        ModelDiffEntry('wells.completions', 'well1', DiffChange.CHANGED, ('01/01/2020', 1, 1, 1, None, None),
+                       {'skin': (None, 2.5)}),
+    ]
+
+
+def test_clone_model_shares_arrays_read_only(mocker):
+    # Arrange
+    base_model, _ = load_models(mocker)
+    base_model.grid.kx.array = np.array([100.0, 100.0])
+    base_table = base_model.pvt.inputs[1].properties['SATURATED']
+
+    # Act
+    clone = base_model.clone()
+    cloned_table = clone.pvt.inputs[1].properties['SATURATED']
+
+    # Assert
+    assert np.shares_memory(clone.grid.kx.array, base_model.grid.kx.array)
+    assert not clone.grid.kx.array.flags.writeable
+    assert not base_model.grid.kx.array.flags.writeable
+    assert np.shares_memory(cloned_table['PRES'].to_numpy(), base_table['PRES'].to_numpy())
+    assert cloned_table.equals(base_table)
+    with pytest.raises(ValueError, match='read-only'):
+        clone.grid.kx.array[0] = 50.0
+    with pytest.raises(ValueError, match='read-only'):
+        base_model.grid.kx.array[0] = 50.0
+    with pytest.raises(ValueError, match='read-only'):
+        cloned_table.loc[0, 'BO'] = 1.5
+    with pytest.raises(ValueError, match='read-only'):
+        base_table.loc[0, 'BO'] = 7.7
+    clone.grid.kx.array = clone.grid.kx.array * 2
+    cloned_table['BO'] = cloned_table['BO'] * 2
+    base_table['PRES'] = base_table['PRES'] + 1
+    assert base_model.grid.kx.array.tolist() == [100.0, 100.0]
+    assert base_table['BO'].tolist() == [1.1, 1.2]
+    assert cloned_table['PRES'].tolist() == [base_pressure - 1 for base_pressure in base_table['PRES']]
+
+
+def test_clone_model_write_out_case(mocker):
+    # Arrange
+    base_model, _ = load_models(mocker)
+    clone = base_model.clone()
+    clone.wells.add_completion(well_name='well2', completion_properties={'date': '01/01/2020', 'i': 1, 'j': 1,
+                                                                         'k': 3, 'well_radius': 0.3})
+    writing_mock_open = mocker.mock_open()
+    mocker.patch('builtins.open', writing_mock_open)
+    mocker.patch('os.path.exists', MagicMock(side_effect=lambda x: False))
+    mocker.patch('os.makedirs', MagicMock())
+
+    # Act
+    clone.write_out_case(new_file_path='/case_1/fcs_file.fcs', case_suffix='case_1')
+
+    # Assert
+    base_wells_file = base_model.model_files.well_files[1]
+    assert clone.model_files.well_files[1].file_content_as_list is not base_wells_file.file_content_as_list
+    assert '1 1 3 0.3\n' not in base_wells_file.file_content_as_list
+    assert not base_wells_file.file_modified
+    written_files = [call.args[0] for call in writing_mock_open.call_args_list]
+    assert written_files == [os.path.join('include_files', 'wells_case_1.dat'), '/case_1/fcs_file.fcs']
+    list_of_writes = [call for call in writing_mock_open.mock_calls if 'call().write' in str(call)]
+    assert '1 1 3 0.3' in list_of_writes[0].args[0]
+
+
+def test_write_out_cases(mocker):
+    # Arrange
+    base_model, _ = load_models(mocker)
+    cases = [base_model.clone() for _ in range(3)]
+    for k, case in enumerate(cases):
+        case.wells.add_completion(well_name='well2', completion_properties={'date': '01/01/2020', 'i': 1, 'j': 1,
+                                                                            'k': k + 2, 'well_radius': 0.3})
+    writing_mock_open = mocker.mock_open()
+    mocker.patch('builtins.open', writing_mock_open)
+    mocker.patch('os.path.isdir', MagicMock(return_value=False))
+    makedirs_mock = MagicMock()
+    mocker.patch('os.makedirs', makedirs_mock)
+    new_file_paths = [f'/cases/case_{k}/fcs_file.fcs' for k in range(3)]
+
+    # Act
+    NexusSimulator.write_out_cases(cases, new_file_paths, new_include_file_location='/cases/include_files',
+                                   case_suffixes=['a', 'b', 'c'], max_workers=2)
+
+    # Assert
+    written_files = {call.args[0] for call in writing_mock_open.call_args_list}
+    assert written_files == {*new_file_paths, *[os.path.join('/cases/include_files', f'wells_{x}.dat') for x in 'abc']}
+    created_directories = [call.args[0] for call in makedirs_mock.call_args_list]
+    assert sorted(created_directories) == [os.path.abspath(x) for x in ['/cases/case_0', '/cases/case_1',
+                                                                        '/cases/case_2', '/cases/include_files']]
+    assert not base_model.model_files.well_files[1].file_modified
+
+
+def test_write_out_cases_same_model(mocker):
+    # Arrange
+    base_model, _ = load_models(mocker)
+
+    # Act Assert
+    with pytest.raises(ValueError, match='The same model was provided for more than one case'):
+        NexusSimulator.write_out_cases([base_model, base_model], ['/case_1/fcs_file.fcs', '/case_2/fcs_file.fcs'])
+
+
+def test_file_content_memory_budget(mocker):
+    # Arrange
+    base_model, _ = load_models(mocker)
+    base_wells_file = base_model.model_files.well_files[1]
+    expected_wells_content = list(base_wells_file.file_content_as_list)
+
+    # Act
+    base_model.file_content_memory_budget = 0
+    clone = base_model.clone()
+    clone.wells.add_completion(well_name='well2', completion_properties={'date': '01/01/2020', 'i': 1, 'j': 1,
+                                                                         'k': 3, 'well_radius': 0.3})
+    cloned_wells_file = clone.model_files.well_files[1]
+    base_model.model_files.pvt_files[1].file_content_as_list
+
+    # Assert
+    assert clone.file_content_memory_budget == 0
+    assert base_wells_file._File__content is None
+    assert cloned_wells_file._File__content is not None
+    assert '1 1 3 0.3\n' in cloned_wells_file.file_content_as_list
+    assert base_wells_file.file_content_as_list == expected_wells_content
+    cloned_pvt_file = clone.model_files.pvt_files[1]
+    assert cloned_pvt_file._content_store is base_wells_file._content_store
+    assert cloned_pvt_file.file_content_as_list is base_model.model_files.pvt_files[1].file_content_as_list
+    base_model.file_content_memory_budget = None
+    assert base_model.file_content_memory_budget is None
+    assert base_wells_file._content_store is None
+    assert all(file._File__content is not None for file in base_model.model_files.all_model_files)
@@ -0,0 +1,117 @@
+from unittest.mock import Mock
+
+import pandas as pd
+
+from ResSimpy import NexusSimulator
+from ResSimpy.Enums.DiffChangeEnum import DiffChange
+from ResSimpy.Nexus.nexus_model_diff import ModelDiffEntry
+from tests.multifile_mocker import mock_multiple_files
+
+BASE_FILES = {
+    '/base/fcs_file.fcs': 'DESC base model\nDEFAULT_UNITS ENGLISH\nRUNCONTROL /shared/runcontrol.dat\n'
+                          'STRUCTURED_GRID /base/grid.dat\nWELLS set 1 /base/wells.dat\n'
+                          'PVT Method 1 /shared/pvt.dat\nPVT Method 2 /base/pvt2.dat\n'
+                          'SURFACE Network 1 /base/surface.dat\n',
+    '/shared/runcontrol.dat': 'START 01/01/2020\n',
+    '/base/grid.dat': 'NX NY NZ\n1 1 2\nKX CON\n100\nNETGRS CON\n1\n',
+    '/base/wells.dat': 'WELLSPEC well1\nIW JW L RADW\n1 1 1 0.5\n1 1 2 0.5\n\n'
+                       'WELLSPEC well2\nIW JW L RADW\n1 1 1 0.3\n',
+    '/shared/pvt.dat': 'BLACKOIL API 30 SPECG 0.6\nSATURATED\nPRES BO RS\n1000 1.1 0.2\n2000 1.2 0.4\n',
+    '/base/pvt2.dat': 'BLACKOIL API 30 SPECG 0.6\nSATURATED\nPRES BO RS\n1000 1.1 0.2\n2000 1.2 0.4\n',
+    '/base/surface.dat': 'NODECON\nNAME NODEIN NODEOUT TYPE LENGTH\nconn1 node1 node2 PIPE 500\nENDNODECON\n',
+}
+
+OTHER_FILES = {
+    '/other/fcs_file.fcs': 'DESC other model\nDEFAULT_UNITS ENGLISH\nRUNCONTROL /shared/runcontrol.dat\n'
+                           'STRUCTURED_GRID /other/grid.dat\nWELLS set 1 /other/wells.dat\n'
+                           'PVT Method 1 /shared/pvt.dat\nPVT Method 2 /other/pvt2.dat\n'
+                           'SURFACE Network 1 /other/surface.dat\n',
+    '/other/grid.dat': 'NX NY NZ\n1 1 2\nKX CON\n250\nNETGRS CON\n1\nKY CON\n50\n',
+    '/other/wells.dat': 'WELLSPEC well1\nIW JW L RADW\n1 1 1 0.5\n1 1 2 0.25\n\n'
+                        'WELLSPEC well3\nIW JW L RADW\n1 1 2 0.3\n',
+    '/other/pvt2.dat': 'BLACKOIL API 35 SPECG 0.6\nSATURATED\nPRES BO RS\n1000 1.1 0.2\n2000 1.3 0.4\n',
+    '/other/surface.dat': 'NODECON\nNAME NODEIN NODEOUT TYPE LENGTH\nconn1 node1 node2 PIPE 500\nENDNODECON\n',
+}
+
+
+def load_models(mocker):
+    potential_file_dict = BASE_FILES | OTHER_FILES
+
+    def mock_open_wrapper(filename, mode='r'):
+        return mock_multiple_files(mocker, filename, potential_file_dict=potential_file_dict).return_value
+
+    mocker.patch('builtins.open', mock_open_wrapper)
+    mocker.patch('os.path.isfile', Mock(side_effect=lambda x: True))
+    mocker.patch('os.listdir', Mock(return_value=[]))
+    return NexusSimulator(origin='/base/fcs_file.fcs'), NexusSimulator(origin='/other/fcs_file.fcs')
+
+
+def test_diff_models(mocker):
+    # Arrange
+    base_model, other_model = load_models(mocker)
+
+    # Act
+    result = base_model.diff(other_model)
+
+    # Assert
+    assert not result.is_equal
+    assert result.skipped_sections == ['network', 'separator', 'water', 'equil', 'rock', 'relperm', 'valve',
+                                       'aquifer', 'hydraulics', 'gaslift']
+    assert result.get_entries(section='files') == [
+        ModelDiffEntry('files', 'STRUCTURED_GRID', DiffChange.CHANGED,
+                       changes={'location': ('/base/grid.dat', '/other/grid.dat')}),
+        ModelDiffEntry('files', 'WELLS 1', DiffChange.CHANGED,
+                       changes={'location': ('/base/wells.dat', '/other/wells.dat')}),
+        ModelDiffEntry('files', 'PVT 2', DiffChange.CHANGED,
+                       changes={'location': ('/base/pvt2.dat', '/other/pvt2.dat')}),
+    ]
+    assert result.get_entries(section='wells') == [
+        ModelDiffEntry('wells.completions', 'well1', DiffChange.CHANGED, ('01/01/2020', 1, 1, 2, None, None),
+                       {'well_radius': (0.5, 0.25)}),
+        ModelDiffEntry('wells', 'well2', DiffChange.REMOVED),
+        ModelDiffEntry('wells', 'well3', DiffChange.ADDED),
+    ]
+    pvt_entries = result.get_entries(section='pvt')
+    assert [(x.name, x.change, x.key) for x in pvt_entries] == [('2', DiffChange.CHANGED, ('API',)),
+                                                                ('2', DiffChange.CHANGED, ('SATURATED',))]
+    assert pvt_entries[0].changes == {'value': (30.0, 35.0)}
+    grid_entries = result.get_entries(section='grid')
+    assert [(x.name, x.change) for x in grid_entries] == [('kx', DiffChange.CHANGED), ('ky', DiffChange.ADDED)]
+    assert grid_entries[0].changes == {'value': ('100', '250')}
+
+
+def test_diff_models_identical(mocker):
+    # Arrange
+    base_model, _ = load_models(mocker)
+    other_model = NexusSimulator(origin='/base/fcs_file.fcs')
+
+    # Act
+    result = base_model.diff(other_model)
+
+    # Assert
+    assert result.is_equal
+    assert 'wells' in result.skipped_sections
+    assert not base_model.wells._wells_loaded
+    assert result.to_dataframe().empty
+
+
+def test_diff_models_compares_loaded_sections(mocker):
+    # Arrange
+    base_model, _ = load_models(mocker)
+    other_model = NexusSimulator(origin='/base/fcs_file.fcs')
+    other_model.wells.get('well1').completions[0].update({'skin': 2.5})
+    other_model.network.connections.get_all()[0].length = 750.0
+
+    # Act
+    result = base_model.diff(other_model)
+
+    # Assert
+    assert result.get_entries(change=DiffChange.CHANGED) == [
+        ModelDiffEntry('wells.completions', 'well1', DiffChange.CHANGED, ('01/01/2020', 1, 1, 1, None, None),
+                       {'skin': (None, 2.5)}),
+        ModelDiffEntry('network.connections', 'conn1', DiffChange.CHANGED, ('01/01/2020',), {'length': (500.0, 750.0)}),
+    ]
+    assert result.get_entries(section='files') == []
+    expected_df = pd.DataFrame({'section': ['wells.completions', 'network.connections'],
+                                'change': ['CHANGED', 'CHANGED']})
+    pd.testing.assert_frame_equal(result.to_dataframe()[['section', 'change']], expected_df)
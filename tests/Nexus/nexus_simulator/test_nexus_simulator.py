@@ -46,6 +46,7 @@ from ResSimpy.Nexus.NexusPVTMethods import NexusPVTMethods
 from ResSimpy.Nexus.NexusHydraulicsMethods import NexusHydraulicsMethods
 from ResSimpy.Nexus.NexusEquilMethods import NexusEquilMethods
 from ResSimpy.Nexus.runcontrol_operations import SimControls
+from ResSimpy.Utils.content_hash import content_digest, digest_to_int
 from tests.multifile_mocker import mock_multiple_files
 from tests.utility_for_tests import get_fake_nexus_simulator
 
@@ -2066,7 +2067,14 @@ def test_hash_and_attr_info_to_tuple(mocker):
     # Assert
     assert network_attr == expected_network
     assert wells_attr == expected_wells
-    assert result_hash == hash((network_attr, wells_attr))
+    assert result_hash == digest_to_int(fake_simulator.network_wells_digest())
+    assert fake_simulator.hash_network_wells() == result_hash
+
+    # changing a completion in place changes the hash
+    expected_well_completion_2.update({'skin': 4.53})
+    assert fake_simulator.hash_network_wells() != result_hash
+    expected_well_completion_2.update({'skin': 4.52})
+    assert fake_simulator.hash_network_wells() == result_hash
 
 
 @pytest.mark.parametrize("attr_info_to_tuple_return_value, expected_result", [
@@ -2115,7 +2123,7 @@ def test_hash_tuple_empty(mocker):
     fake_simulator._wells = completions
 
     # Assert
-    assert fake_simulator.hash_network_wells() == hash(((), ()))
+    assert fake_simulator.hash_network_wells() == digest_to_int(content_digest('constraints', 'completions'))
 
 
 def test_wells_and_network_equal(mocker):
@@ -2627,3 +2635,92 @@ ENDIPRTABLE
 
     assert result[1].date == expected_IprTable_2.date
     assert_frame_equal(result[1].table, expected_IprTable_2.table)
+
+
+def test_open_header_only(mocker):
+    # Arrange
+    fcs_file_path = '/path/fcs_file.fcs'
+    runcontrol_path = '/path/runcontrol.dat'
+    fcs_content = f'''DESC header only
+    RUN_UNITS METRIC
+    DEFAULT_UNITS METBAR
+    DATEFORMAT DD/MM/YYYY
+    RUNCONTROL {runcontrol_path}
+    WELLS set 1 /path/wells.dat
+    PVT Method 1 /path/pvt.dat
+    SURFACE Network 1 /path/surface.dat
+    '''
+    runcontrol_content = '''START 01/01/2020
+    TIME 01/02/2020
+    TIME 01/03/2020
+    '''
+    opened_files: list[str] = []
+
+    def mock_open_wrapper(filename, mode='r'):
+        opened_files.append(filename)
+        return mock_multiple_files(mocker, filename, potential_file_dict={
+            fcs_file_path: fcs_content,
+            runcontrol_path: runcontrol_content,
+            '/path/wells.dat': 'WELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n',
+            '/path/pvt.dat': 'BLACKOIL\n',
+            '/path/surface.dat': 'BLACKOIL\n',
+        }).return_value
+
+    mocker.patch('builtins.open', mock_open_wrapper)
+    mocker.patch('os.path.isfile', Mock(side_effect=lambda x: True))
+    listdir_mock = mocker.patch('os.listdir', Mock(return_value=[]))
+
+    # Act
+    model = NexusSimulator.open_header_only(fcs_file_path)
+    header_only_opened_files = set(opened_files)
+    model.load_full_model()
+
+    # Assert
+    assert header_only_opened_files == {fcs_file_path, runcontrol_path}
+    assert model.run_units is UnitSystem.METRIC
+    assert model.default_units is UnitSystem.METBAR
+    assert model.start_date == '01/01/2020'
+    assert model.sim_controls.times == ['01/02/2020', '01/03/2020']
+    assert not model.header_only
+    assert '/path/pvt.dat' in opened_files
+    assert model.model_files.well_files[1].file_content_as_list == ['WELLSPEC well1\n', 'IW JW L RADW\n',
+                                                                     '1 2 3 4.5\n']
+    listdir_mock.assert_called_once()
+
+
+def test_open_header_only_loads_full_model_on_first_use(mocker):
+    # Arrange
+    fcs_file_path = '/path/fcs_file.fcs'
+    runcontrol_path = '/path/runcontrol.dat'
+    fcs_content = f'''DESC header only
+    DATEFORMAT DD/MM/YYYY
+    RUNCONTROL {runcontrol_path}
+    WELLS set 1 /path/wells.dat
+    SURFACE Network 1 /path/surface.dat
+    '''
+    runcontrol_content = '''START 01/01/2020
+    TIME 01/02/2020
+    '''
+    opened_files: list[str] = []
+
+    def mock_open_wrapper(filename, mode='r'):
+        opened_files.append(filename)
+        return mock_multiple_files(mocker, filename, potential_file_dict={
+            fcs_file_path: fcs_content,
+            runcontrol_path: runcontrol_content,
+            '/path/wells.dat': 'WELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n',
+            '/path/surface.dat': 'BLACKOIL\n',
+        }).return_value
+
+    mocker.patch('builtins.open', mock_open_wrapper)
+    mocker.patch('os.path.isfile', Mock(side_effect=lambda x: True))
+    mocker.patch('os.listdir', Mock(return_value=[]))
+    model = NexusSimulator.open_header_only(fcs_file_path)
+
+    # Act
+    result = model.wells.get_all()
+
+    # Assert
+    assert not model.header_only
+    assert '/path/wells.dat' in opened_files
+    assert [well.well_name for well in result] == ['well1']
@@ -0,0 +1,106 @@
+import os
+import tempfile
+from os import stat as real_stat
+from unittest.mock import MagicMock
+
+from ResSimpy.Nexus.deck_scanner import DeckIndex, hash_file
+
+
+def write_file(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+def write_deck(directory: str, name: str, well_names: list[str], pvt_path: str) -> str:
+    fcs_path = os.path.join(directory, name, f'{name}.fcs')
+    runcontrol_path = os.path.join(directory, name, 'runcontrol.dat')
+    wells_path = os.path.join(directory, name, 'wells.dat')
+    write_file(fcs_path, f'DESC {name}\nDATEFORMAT DD/MM/YYYY\nRUN_UNITS METRIC\nRUNCONTROL {runcontrol_path}\n'
+                         f'WELLS set 1 {wells_path}\nPVT method 1 {pvt_path}\n')
+    write_file(runcontrol_path, 'START 01/01/2020\nTIME 01/02/2020\nTIME 01/03/2020\n')
+    write_file(wells_path, ''.join(f'WELLSPEC {x}\nIW JW L RADW\n1 2 3 4.5\n' for x in well_names) +
+               'INCLUDE extra_wells.inc\n')
+    write_file(os.path.join(directory, name, 'extra_wells.inc'), 'WELLSPEC extra_well\nIW JW L RADW\n1 2 3 4.5\n')
+    return fcs_path
+
+
+def touch_file(path: str, content: str) -> None:
+    write_file(path, content)
+    os.utime(path, (0, real_stat(path).st_mtime + 10))
+
+
+def test_deck_index_scan_and_rescan(mocker):
+    # Arrange
+    mocker.patch('os.stat', real_stat)
+    with tempfile.TemporaryDirectory() as directory:
+        directory = os.path.realpath(directory)
+        pvt_path = os.path.join(directory, 'shared', 'pvt_method_1.dat')
+        write_file(pvt_path, 'BLACKOIL\n')
+        deck_1 = write_deck(directory, 'deck_1', ['well_1', 'well_2'], pvt_path)
+        deck_2 = write_deck(directory, 'deck_2', ['well_2'], os.path.join(directory, 'deck_2', '..', 'shared',
+                                                                          'pvt_method_1.dat'))
+
+        with DeckIndex(':memory:') as index:
+            # Act
+            first_scan = index.scan([directory], processes=2)
+            second_scan = index.scan([directory], processes=1)
+            touch_file(os.path.join(directory, 'deck_2', 'wells.dat'), 'WELLSPEC well_3\nIW JW L RADW\n1 2 3 4.5\n'
+                                                                       'INCLUDE extra_wells.inc\n')
+            third_scan = index.scan([directory], processes=1)
+            os.remove(deck_1)
+            fourth_scan = index.scan([directory], processes=1)
+            touch_file(os.path.join(directory, 'deck_2', 'extra_wells.inc'), 'WELLSPEC well_4\nIW JW L RADW\n1 2 3 4\n')
+            fifth_scan = index.scan([directory], processes=1)
+
+            # Assert
+            assert sorted(first_scan.scanned) == [deck_1, deck_2]
+            assert first_scan.failed == {}
+            assert sorted(second_scan.unchanged) == [deck_1, deck_2]
+            assert second_scan.scanned == []
+            assert third_scan.scanned == [deck_2]
+            assert third_scan.unchanged == [deck_1]
+            assert fourth_scan.removed == [deck_1]
+            assert fifth_scan.scanned == [deck_2]
+
+            assert index.find_decks_using_file('pvt_method_1.dat') == [deck_2]
+            assert index.find_decks_using_file(pvt_path, keyword='pvt') == [deck_2]
+            assert index.find_decks_using_file(pvt_path, keyword='WELLS') == []
+            assert index.find_decks_using_file(os.path.join(directory, 'deck_2', '..', 'shared',
+                                                            'pvt_method_1.dat')) == [deck_2]
+            assert index.find_decks_using_file(os.path.join(directory, 'deck_2', 'extra_wells.inc'),
+                                               keyword='INCLUDE') == [deck_2]
+            assert index.find_decks_with_file_hash(hash_file(pvt_path)) == [deck_2]
+            assert index.find_decks_with_well('well_3') == [deck_2]
+            assert index.find_decks_with_well('well_4') == [deck_2]
+            assert index.find_decks_with_well('well_1') == []
+            assert index.find_decks_with_well('extra_well') == []
+
+            deck = index.get_deck(deck_2)
+            assert deck is not None
+            assert (deck.start_date, deck.run_units, deck.date_format) == ('01/01/2020', 'METRIC', 'DD_MM_YYYY')
+            assert deck.times == ['01/02/2020', '01/03/2020']
+            assert [(x.keyword, x.method_number) for x in deck.files] == [('FCS', None), ('RUNCONTROL', None),
+                                                                          ('WELLS', 1), ('PVT', 1), ('INCLUDE', None)]
+            assert deck.files[3].path == pvt_path
+            assert index.get_deck(deck_1) is None
+
+
+def test_deck_index_scan_records_failed_decks(mocker):
+    # Arrange
+    mocker.patch('os.stat', real_stat)
+    mocker.patch('ResSimpy.Nexus.deck_scanner.scan_deck', MagicMock(side_effect=RuntimeError('unexpected card')))
+    with tempfile.TemporaryDirectory() as directory:
+        directory = os.path.realpath(directory)
+        pvt_path = os.path.join(directory, 'shared', 'pvt_method_1.dat')
+        write_file(pvt_path, 'BLACKOIL\n')
+        deck_1 = write_deck(directory, 'deck_1', ['well_1'], pvt_path)
+        deck_2 = write_deck(directory, 'deck_2', ['well_2'], pvt_path)
+
+        with DeckIndex(':memory:') as index:
+            # Act
+            result = index.scan([directory], processes=1)
+
+            # Assert
+            assert result.failed == {deck_1: 'RuntimeError: unexpected card', deck_2: 'RuntimeError: unexpected card'}
+            assert result.scanned == []
@@ -6,6 +6,7 @@ from unittest.mock import Mock, MagicMock
 import pytest
 
 from ResSimpy import NexusSimulator
+from ResSimpy.Enums.FileCopyMethodEnum import FileCopyMethod
 from ResSimpy.Nexus.DataModels.FcsFile import FcsNexusFile
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from tests.multifile_mocker import mock_multiple_files
@@ -555,6 +556,63 @@ def test_move_model_files_skipped_array(mocker):
     assert len(list_of_write_names) == 4
 
 
+@pytest.mark.parametrize('copy_method', [FileCopyMethod.COPY, FileCopyMethod.HARDLINK])
+def test_move_model_files_copy_unmodified_files(mocker, copy_method):
+    # Arrange
+    fcs_path = 'test_fcs.fcs'
+
+    fcs_content = '''DESC reservoir1
+            INITIALIZATION_FILES
+             STRUCTURED_GRID nexus_data/structured_grid.dat
+            RECURRENT_FILES
+            RUNCONTROL nexus_data/runcontrol.dat
+            '''
+
+    structured_grid_content = '''some content
+    KX VALUE
+    INCLUDE arrays.dat'''
+
+    def mock_open_wrapper(filename, mode):
+        mock_open = mock_multiple_files(mocker, filename, potential_file_dict={
+            'test_fcs.fcs': fcs_content,
+            'nexus_data/structured_grid.dat': structured_grid_content,
+            'nexus_data/runcontrol.dat': 'START 01/01/2020',
+        }).return_value
+        return mock_open
+
+    mocker.patch("builtins.open", mock_open_wrapper)
+    mocker.patch('os.path.isfile', Mock(side_effect=lambda x: True))
+
+    fcs = FcsNexusFile.generate_fcs_structure(fcs_path)
+
+    mocker.patch('os.path.exists', MagicMock(side_effect=lambda x: False))
+    mocker.patch('os.makedirs', MagicMock())
+    writing_mock_open = mocker.mock_open()
+    mocker.patch("builtins.open", writing_mock_open)
+    load_file_mock = MagicMock()
+    mocker.patch('ResSimpy.FileOperations.file_operations.load_file_as_list', load_file_mock)
+    copy_file_mock = MagicMock()
+    mocker.patch('ResSimpy.FileOperations.file_writer.copy_file', copy_file_mock)
+    expected_arrays_path = os.path.join('/data', 'nexus_data', 'structured_grid_arrays.dat')
+    expected_runcontrol_path = os.path.join('/data', 'nexus_data', 'runcontrol.dat')
+    expected_grid_path = os.path.join('/data', 'nexus_data', 'structured_grid.dat')
+
+    # Act
+    fcs.move_model_files(new_file_path='/data/new_fcs.fcs', new_include_file_location='nexus_data',
+                         copy_method=copy_method)
+
+    # Assert
+    # the skipped array is copied on disk without being loaded, along with the unmodified runcontrol file
+    load_file_mock.assert_not_called()
+    assert [call.args for call in copy_file_mock.call_args_list] == [
+        (os.path.join('nexus_data', 'arrays.dat'), expected_arrays_path, copy_method),
+        ('nexus_data/runcontrol.dat', expected_runcontrol_path, copy_method),
+    ]
+    # the grid file and fcs file are written out as their include paths have changed
+    assert [call.args[0] for call in writing_mock_open.call_args_list] == [expected_grid_path, '/data/new_fcs.fcs']
+    assert fcs.runcontrol_file.location == expected_runcontrol_path
+
+
 def test_fcs_repr(mocker):
     # Arrange
     fcs_content = '''DESC reservoir1
@@ -0,0 +1,70 @@
+import io
+
+from ResSimpy.Nexus.log_file_tailer import LogFileState, LogFileTailer
+from ResSimpy.Nexus.logfile_operations import Logging, SimulationPollResult
+
+
+def mock_growing_log_file(mocker, log_file: dict[str, bytes]):
+    """Mocks open and os.stat to read from the current contents of log_file['content']."""
+    mocker.patch('builtins.open', lambda path, mode: io.BytesIO(log_file['content']))
+    stat_mock = mocker.patch('os.stat')
+    stat_mock.side_effect = lambda path: mocker.Mock(st_size=len(log_file['content']))
+
+
+def test_log_file_tailer_only_parses_appended_lines(mocker):
+    # Arrange
+    log_file = {'content': b'Job number: 1234\n Case Name = case\nTIME  TS NWT\n 1.50 0 1\n 2.'}
+    mock_growing_log_file(mocker, log_file)
+    tailer = LogFileTailer('/path/case.log', case_name='case')
+    parse_line_spy = mocker.spy(LogFileTailer, 'parse_line')
+
+    # Act
+    first_state = tailer.update()
+    first_offset = tailer.offset
+    log_file['content'] += b'50 0 1\r\n  3.00 0 1\nNexus finished\n'
+    parse_line_spy.reset_mock()
+    second_state = tailer.update()
+    parsed_lines = [call.args[0] for call in parse_line_spy.call_args_list]
+
+    # Assert
+    assert first_state == LogFileState(job_number_line='Job number: 1234\n', read_in_times=True,
+                                       time_heading_location=0, last_time='2.')
+    assert first_offset == len(b'Job number: 1234\n Case Name = case\nTIME  TS NWT\n 1.50 0 1\n')
+    assert parsed_lines == [' 2.50 0 1\n', '  3.00 0 1\n', 'Nexus finished\n']
+    assert second_state == LogFileState(job_number_line='Job number: 1234\n', read_in_times=True,
+                                        time_heading_location=0, last_time='3.00', job_finished=True)
+    assert tailer.offset == len(log_file['content'])
+
+
+def test_log_file_tailer_rereads_replaced_file(mocker):
+    # Arrange
+    log_file = {'content': b'Job number: 1234\nerrors 0 warnings 2\n'}
+    mock_growing_log_file(mocker, log_file)
+    tailer = LogFileTailer('/path/case.log')
+    tailer.update()
+
+    # Act
+    log_file['content'] = b'Job number: 99\n'
+    result = tailer.update()
+
+    # Assert
+    assert result == LogFileState(job_number_line='Job number: 99\n')
+
+
+def test_poll_simulations(mocker):
+    # Arrange
+    running_model = mocker.Mock()
+    running_model.logging.get_simulation_status.return_value = 'Job Running, ID: 12'
+    running_model.logging.get_job_id.return_value = 12
+    running_model.logging.get_simulation_progress.return_value = 25.0
+    no_log_model = mocker.Mock()
+    no_log_model.logging.get_simulation_status.side_effect = NotImplementedError
+    no_log_model.logging.get_job_id.return_value = -1
+
+    # Act
+    result = Logging.poll_simulations([running_model, no_log_model])
+
+    # Assert
+    assert result == [SimulationPollResult(status='Job Running, ID: 12', job_id=12, progress=25.0),
+                      SimulationPollResult(status=None, job_id=-1, progress=None)]
+    no_log_model.logging.get_simulation_progress.assert_not_called()
@@ -0,0 +1,118 @@
+import asyncio
+import io
+from unittest.mock import Mock
+
+from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+from ResSimpy.Nexus.log_monitor import SimulationMonitor, SimulationStatusUpdate
+from tests.multifile_mocker import mock_multiple_files
+
+FCS_FILE_PATH = '/path/case.fcs'
+RUNCONTROL_PATH = '/path/runcontrol.dat'
+LOG_FILE_PATH = '/path/case.log'
+FCS_CONTENT = f'''DESC monitored case
+DATEFORMAT DD/MM/YYYY
+RUNCONTROL {RUNCONTROL_PATH}
+'''
+RUNCONTROL_CONTENT = '''START 01/01/2020
+TIME 11/01/2020
+TIME 21/01/2020
+STOP
+'''
+RUNNING_LOG = b'Job number: 12\n Case Name = case\nTIME  TS NWT\n 5.00 0 1\n'
+
+
+def mock_case_files(mocker, log_file_contents: list[bytes]):
+    """Mocks the case files, with each read of the log file returning the next of the log file contents."""
+    log_reads = iter(log_file_contents)
+    current_log = {'content': b''}
+
+    def mock_open_wrapper(filename, mode='r'):
+        if filename == LOG_FILE_PATH:
+            current_log['content'] = next(log_reads, current_log['content'])
+            return io.BytesIO(current_log['content'])
+        return mock_multiple_files(mocker, filename, potential_file_dict={
+            FCS_FILE_PATH: FCS_CONTENT,
+            RUNCONTROL_PATH: RUNCONTROL_CONTENT,
+        }).return_value
+
+    mocker.patch('builtins.open', mock_open_wrapper)
+    mocker.patch('os.path.isfile', Mock(side_effect=lambda x: True))
+
+
+def test_simulation_monitor_poll(mocker):
+    # Arrange
+    mock_case_files(mocker, [RUNNING_LOG])
+    monitor = SimulationMonitor([FCS_FILE_PATH])
+    simulator_init_spy = mocker.spy(NexusSimulator, '__init__')
+
+    # Act
+    result = asyncio.run(monitor.poll())
+
+    # Assert
+    assert result == [SimulationStatusUpdate(case=FCS_FILE_PATH, status='Job Running, ID: 12', job_id=12,
+                                             progress=25.0)]
+    simulator_init_spy.assert_not_called()
+
+
+def test_simulation_monitor_updates_only_yields_changes(mocker):
+    # Arrange
+    finished_log = RUNNING_LOG + b' 20.00 0 1\nNexus finished\nErrors 0 Warnings 3\n'
+    mock_case_files(mocker, [RUNNING_LOG, RUNNING_LOG, finished_log])
+    monitor = SimulationMonitor([FCS_FILE_PATH], poll_interval=0, max_poll_interval=0)
+
+    async def collect_updates():
+        return [update async for update in monitor.updates()]
+
+    # Act
+    result = asyncio.run(collect_updates())
+
+    # Assert
+    assert result == [
+        SimulationStatusUpdate(case=FCS_FILE_PATH, status='Job Running, ID: 12', job_id=12, progress=25.0),
+        SimulationStatusUpdate(case=FCS_FILE_PATH, status='Simulation complete - Errors: 0 and Warnings: 3',
+                               job_id=12, progress=100.0, errors=0, warnings=3, finished=True),
+    ]
+
+
+def test_simulation_monitor_updates_yields_case_errors_without_stopping_other_cases(mocker):
+    # Arrange
+    missing_fcs_file_path = '/path/missing.fcs'
+    finished_log = RUNNING_LOG + b' 20.00 0 1\nNexus finished\nErrors 0 Warnings 3\n'
+    mock_case_files(mocker, [RUNNING_LOG, finished_log])
+    monitor = SimulationMonitor([missing_fcs_file_path, FCS_FILE_PATH], poll_interval=0, max_poll_interval=0)
+
+    async def collect_updates():
+        return [update async for update in monitor.updates()]
+
+    # Act
+    result = asyncio.run(collect_updates())
+
+    # Assert
+    missing_case_updates = [x for x in result if x.case == missing_fcs_file_path]
+    assert len(missing_case_updates) == 1
+    assert missing_case_updates[0].finished
+    assert missing_case_updates[0].error.startswith('FileNotFoundError')
+    assert [x for x in result if x.case == FCS_FILE_PATH][-1] == \
+        SimulationStatusUpdate(case=FCS_FILE_PATH, status='Simulation complete - Errors: 0 and Warnings: 3',
+                               job_id=12, progress=100.0, errors=0, warnings=3, finished=True)
+
+
+def test_simulation_monitor_updates_stops_monitoring_idle_cases(mocker):
+    # Arrange
+    mock_case_files(mocker, [RUNNING_LOG])
+    monitor = SimulationMonitor([FCS_FILE_PATH], poll_interval=0.01, max_poll_interval=0.01, idle_timeout=0.05)
+    expected_running_update = SimulationStatusUpdate(case=FCS_FILE_PATH, status='Job Running, ID: 12', job_id=12,
+                                                     progress=25.0)
+
+    async def collect_updates():
+        return [update async for update in monitor.updates()]
+
+    # Act
+    result = asyncio.run(collect_updates())
+
+    # Assert
+    assert result == [
+        expected_running_update,
+        SimulationStatusUpdate(case=FCS_FILE_PATH, status='Job Running, ID: 12', job_id=12, progress=25.0,
+                               finished=True, error='The status has not changed for 0.05 seconds.'),
+    ]
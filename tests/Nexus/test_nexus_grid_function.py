@@ -3,7 +3,8 @@ from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
 from ResSimpy.Nexus.DataModels.StructuredGrid.NexusGrid import NexusGrid
 from ResSimpy.Nexus.DataModels.StructuredGrid.NexusGridArrayFunction import NexusGridArrayFunction
-from ResSimpy.Nexus.array_function_operations import object_from_array_function_block
+from ResSimpy.Nexus.array_function_operations import object_from_array_function_block, evaluate_grid_array_function
+import numpy as np
 import pytest
 import pandas as pd
 
@@ -490,3 +491,77 @@ def test_tabular_array_function_block(input_file, expected_result):
                 pd.testing.assert_frame_equal(result_dict[key], expected_result_dict[key])
             else:
                 assert result_dict[key] == expected_result_dict[key]
+
+
+@pytest.mark.parametrize('array_function, input_arrays, region_array, existing_output, expected_result', [
+    (NexusGridArrayFunction(function_type=GridFunctionTypeEnum.POLYN, input_array=['KX'], output_array=['KY'],
+                            function_values=[2.0, 1.0]),
+     {'KX': np.array([1., 2., 3., 4., 5., 6., 7., 8.])}, None, None,
+     np.array([3., 5., 7., 9., 11., 13., 15., 17.])),
+    (NexusGridArrayFunction(function_type=GridFunctionTypeEnum.POLYN, input_array=['KX'], output_array=['KY'],
+                            function_values=[2.0, 1.0], blocks=[1, 1, 1, 2, 2, 2]),
+     {'KX': np.array([1., 2., 3., 4., 5., 6., 7., 8.])}, None, {'KY': np.zeros(8)},
+     np.array([0., 0., 0., 0., 11., 0., 15., 0.])),
+    (NexusGridArrayFunction(function_type=GridFunctionTypeEnum.MULT, input_array=['KX', 'WORKA1'],
+                            output_array=['KZ'], region_type='IREGION', region_number=[2]),
+     {'KX': np.array([1., 2., 3., 4., 5., 6., 7., 8.]), 'WORKA1': 0.1}, np.array([1, 1, 2, 2, 1, 1, 2, 2]),
+     {'KZ': 1.0},
+     np.array([1., 1., 0.3, 0.4, 1., 1., 0.7, 0.8])),
+    (NexusGridArrayFunction(function_type=GridFunctionTypeEnum.DIV, input_array=['KX', 'KY'], output_array=['KZ'],
+                            input_range=[(2.0, 7.0)], output_range=[(0.0, 2.0)]),
+     {'KX': np.array([1., 2., 3., 4., 5., 6., 7., 8.]), 'KY': np.array([1., 1., 0., 2., 2., 2., 1., 1.])}, None,
+     None, np.array([np.nan, 2., 2., 2., 2., 2., 2., np.nan])),
+    (NexusGridArrayFunction(function_type=GridFunctionTypeEnum.GE, input_array=['KX'], output_array=['KX'],
+                            function_values=[4.0, 0.0]),
+     {'KX': np.array([1., 2., 3., 4., 5., 6., 7., 8.])}, None, None,
+     np.array([0., 0., 0., 4., 5., 6., 7., 8.])),
+    (NexusGridArrayFunction(function_type=GridFunctionTypeEnum.FUNCTION_TABLE, input_array=['WORKA5'],
+                            output_array=['WORKA1'],
+                            function_table=pd.DataFrame({'WORKA5': [8., 2., 4.], 'WORKA1': [80., 20., 40.]})),
+     {'WORKA5': np.array([1., 2., 3., 4., 5., 6., 7., 8.])}, None, None,
+     np.array([20., 20., 30., 40., 50., 60., 70., 80.])),
+], ids=['polyn_full_grid', 'polyn_blocks', 'mult_region_con_input', 'div_ranges', 'ge', 'function_table'])
+def test_evaluate_grid_array_function(array_function, input_arrays, region_array, existing_output,
+                                      expected_result):
+    # Act
+    result = evaluate_grid_array_function(array_function, input_arrays, range_x=2, range_y=2, range_z=2,
+                                          region_array=region_array, existing_output_arrays=existing_output)
+
+    # Assert
+    output_name = array_function.output_array[0]
+    assert list(result.keys()) == array_function.output_array
+    assert result[output_name].name == output_name
+    assert result[output_name].modifier == 'VALUE'
+    np.testing.assert_allclose(result[output_name].array, expected_result)
+
+
+def test_nexus_grid_evaluate_array_functions():
+    # Arrange
+    grid_file_contents = '''NX NY NZ
+2 2 1
+
+KX VALUE
+10 20 30 40
+
+WORKA1 CON
+0.5
+
+FUNCTION
+BLOCKS 1 2 1 1 1 1
+ANALYT MULT
+KX WORKA1 OUTPUT KY
+
+FUNCTION
+ANALYT POLYN 1.0 5.0
+KY OUTPUT KZ
+'''
+    file = NexusFile(location='path/to/file.dat',
+                     file_content_as_list=grid_file_contents.splitlines(keepends=True))
+    grid = NexusGrid(grid_nexus_file=file, model_unit_system=UnitSystem.ENGLISH)
+
+    # Act
+    result = grid.evaluate_array_functions()
+
+    # Assert
+    np.testing.assert_allclose(result['KY'].array, [5., 10., np.nan, np.nan])
+    np.testing.assert_allclose(result['KZ'].array, [10., 15., np.nan, np.nan])
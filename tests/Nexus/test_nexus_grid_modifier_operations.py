@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from ResSimpy.Enums.UnitsEnum import UnitSystem
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusGrid import NexusGrid
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusMultir import NexusMultir
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusOver import NexusOver
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusTOver import NexusTOver
+from ResSimpy.Nexus.grid_modifier_operations import apply_grid_modifiers
+
+
+@pytest.mark.parametrize('overs, expected_result', [
+    ([NexusOver(array='TX', i1=1, i2=2, j1=1, j2=1, k1=1, k2=1, operator='*', value=2.0, grid='ROOT'),
+      NexusOver(array='TX', i1=1, i2=2, j1=1, j2=1, k1=1, k2=1, operator='+', value=1.0, grid='ROOT'),
+      NexusOver(array='TX', i1=1, i2=2, j1=1, j2=1, k1=1, k2=1, operator='/', value=4.0, grid='ROOT')],
+     [0.75, 0.75, 1., 1., 1., 1., 1., 1.]),
+    ([NexusOver(array='TX', i1=1, i2=2, j1=1, j2=2, k1=2, k2=2, operator='=', value=5.0, grid='ROOT'),
+      NexusOver(array='TX', i1=2, i2=2, j1=1, j2=2, k1=1, k2=2, operator='-', value=1.0, grid='ROOT')],
+     [1., 0., 1., 0., 5., 4., 5., 4.]),
+    ([NexusOver(array='TX', i1=1, i2=1, j1=1, j2=2, k1=1, k2=2, operator='=', value=3.0, grid='ROOT'),
+      NexusOver(array='TX', i1=1, i2=2, j1=1, j2=2, k1=1, k2=2, operator='GE', value=5.0, threshold=2.0,
+                grid='ROOT'),
+      NexusOver(array='TX', i1=1, i2=2, j1=1, j2=2, k1=1, k2=2, operator='LE', value=0.0, threshold=1.0,
+                grid='ROOT')],
+     [5., 0., 5., 0., 5., 0., 5., 0.]),
+], ids=['batched_box', 'overlapping_boxes', 'ge_le'])
+def test_apply_overs(overs, expected_result):
+    # Arrange
+    base_tx = np.ones(8)
+
+    # Act
+    result = apply_grid_modifiers({'TX': base_tx}, 2, 2, 2, overs=overs)
+
+    # Assert
+    np.testing.assert_allclose(result['TX'], expected_result)
+    # base array is left untouched
+    np.testing.assert_allclose(base_tx, np.ones(8))
+
+
+def test_apply_overs_divide_by_zero():
+    # Arrange
+    overs = [NexusOver(array='TX', i1=1, i2=2, j1=1, j2=1, k1=1, k2=1, operator='*', value=2.0, grid='ROOT'),
+             NexusOver(array='TX', i1=1, i2=2, j1=1, j2=1, k1=1, k2=1, operator='/', value=0.0, grid='ROOT')]
+
+    # Act Assert
+    with pytest.raises(ValueError, match='OVER TX 1 2 1 1 1 1 /0 divides by zero'):
+        apply_grid_modifiers({'TX': np.ones(8)}, 2, 2, 2, overs=overs)
+
+
+def test_apply_tovers():
+    # Arrange
+    tovers = [
+        NexusTOver(array='TX+', i1=1, i2=1, j1=1, j2=2, k1=1, k2=1, operator='MULT', include_file=None, value=0,
+                   array_values=[2.0, 3.0], grid='ROOT'),
+        NexusTOver(array='TY-', i1=1, i2=2, j1=2, j2=2, k1=2, k2=2, operator='EQ', include_file=None, value=0,
+                   array_values=[7.0, 8.0], grid='ROOT'),
+        NexusTOver(array='TX-', i1=1, i2=2, j1=1, j2=1, k1=2, k2=2, operator='ADD', include_file=None, value=0,
+                   array_values=[10.0, 20.0], grid='ROOT'),
+    ]
+
+    # Act
+    result = apply_grid_modifiers({'TX': np.ones(8), 'TY': np.ones(8)}, 2, 2, 2, tovers=tovers)
+
+    # Assert
+    np.testing.assert_allclose(result['TX'], [2., 1., 3., 1., 21., 1., 1., 1.])
+    np.testing.assert_allclose(result['TY'], [1., 1., 1., 1., 7., 8., 1., 1.])
+
+
+def test_apply_multirs():
+    # Arrange
+    regions = np.array([1, 2, 1, 1, 2, 2, 2, 1])
+    multirs = [NexusMultir(region_1=1, region_2=2, tmult=0.1, directions='XZ', std_connections=True,
+                           non_std_connections=True),
+               NexusMultir(region_1=2, region_2=2, tmult=0.5, directions='XYZ', std_connections=False,
+                           non_std_connections=True)]
+
+    # Act
+    result = apply_grid_modifiers({'TX': np.ones(8), 'TY': np.ones(8), 'TZ': np.ones(8)}, 2, 2, 2,
+                                  multirs=multirs, multir_region_array=regions)
+
+    # Assert
+    np.testing.assert_allclose(result['TX'], [0.1, 1., 1., 1., 1., 1., 0.1, 1.])
+    np.testing.assert_allclose(result['TY'], np.ones(8))
+    np.testing.assert_allclose(result['TZ'], [0.1, 1., 0.1, 1., 1., 1., 1., 1.])
+
+
+def test_nexus_grid_apply_modifiers():
+    # Arrange
+    grid_file_contents = '''NX NY NZ
+2 1 1
+
+ITRAN VALUE
+1 2
+
+OVER TX PV
+1 1 1 1 1 1 *0.5 =100
+
+MULTIR
+1 2 0.2 X STD
+
+KX CON
+1
+'''
+    file = NexusFile(location='path/to/grid.dat',
+                     file_content_as_list=grid_file_contents.splitlines(keepends=True))
+    grid = NexusGrid(grid_nexus_file=file, model_unit_system=UnitSystem.ENGLISH)
+
+    # Act
+    result = grid.apply_modifiers({'TX': np.array([10.0, 0.0]), 'PV': np.array([50.0, 60.0])})
+
+    # Assert
+    np.testing.assert_allclose(result['TX'], [1.0, 0.0])
+    np.testing.assert_allclose(result['PV'], [100.0, 60.0])
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ResSimpy.Enums.UnitsEnum import UnitSystem
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusGrid import NexusGrid
+from ResSimpy.Nexus.grid_volumetrics_operations import calculate_volumetrics, open_memory_mapped_array
+
+
+def test_calculate_volumetrics():
+    # Arrange
+    porosity = np.array([0.1, 0.2, 0.3, 0.0, 0.25, 0.2, 0.1, 0.2])
+    sw = np.array([0.2, 0.5, 0.1, 1.0, 0.4, 0.2, 0.0, 1.0])
+    regions = np.array([1, 1, 3, 3, 1, 3, 3, 3])
+    pore_volume_cells = np.zeros(8)
+
+    # Act
+    result = calculate_volumetrics(dx=10.0, dy=10.0, dz=np.array([1.0] * 4 + [2.0] * 4), range_x=2, range_y=2,
+                                   range_z=2, netgrs=0.5, porosity=porosity, sw=sw, pvmult=2.0, tolpv=15.0,
+                                   region_arrays={'IEQUIL': regions},
+                                   cell_outputs={'PORE_VOLUME': pore_volume_cells})
+
+    # Assert
+    expected_pore_volume = np.array([10.0, 20.0, 30.0, 0.0, 50.0, 40.0, 20.0, 40.0])
+    expected_pore_volume[0] = 0.0  # below TOLPV
+    expected_hcpv = expected_pore_volume * (1.0 - sw)
+    np.testing.assert_allclose(pore_volume_cells, expected_pore_volume)
+    assert result.bulk_volume == pytest.approx(1200.0)
+    assert result.pore_volume == pytest.approx(expected_pore_volume.sum())
+    assert result.hydrocarbon_pore_volume == pytest.approx(expected_hcpv.sum())
+
+    expected_regions = pd.DataFrame({'BULK_VOLUME': [400.0, 800.0],
+                                     'PORE_VOLUME': [70.0, 130.0],
+                                     'HCPV': [40.0, 79.0]}, index=pd.Index([1, 3], name='REGION'))
+    pd.testing.assert_frame_equal(result.region_totals['IEQUIL'], expected_regions)
+
+
+@pytest.mark.parametrize('file_path, expected_loader', [
+    ('/path/to/porosity.npy', 'load'),
+    ('/path/to/porosity.bin', 'memmap'),
+], ids=['npy', 'raw_binary'])
+def test_calculate_volumetrics_memory_mapped(mocker, file_path, expected_loader):
+    # Arrange
+    porosity_values = np.full(6, 0.2)
+    porosity_values.setflags(write=False)
+    mock_load = mocker.patch('numpy.load', return_value=porosity_values)
+    mock_memmap = mocker.patch('numpy.memmap', return_value=porosity_values)
+
+    # Act
+    porosity = open_memory_mapped_array(file_path, 3, 1, 2)
+    result = calculate_volumetrics(dx=1.0, dy=1.0, dz=np.arange(1.0, 7.0), range_x=3, range_y=1, range_z=2,
+                                   porosity=porosity)
+
+    # Assert
+    if expected_loader == 'load':
+        mock_load.assert_called_once_with(file_path, mmap_mode='r')
+    else:
+        mock_memmap.assert_called_once_with(file_path, dtype=np.float64, mode='r', shape=(6,))
+    assert result.bulk_volume == pytest.approx(21.0)
+    assert result.pore_volume == pytest.approx(4.2)
+    assert result.hydrocarbon_pore_volume == pytest.approx(4.2)
+
+
+def test_calculate_volumetrics_wrong_size():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        calculate_volumetrics(dx=1.0, dy=1.0, dz=np.ones(5), range_x=3, range_y=1, range_z=2)
+
+
+def test_nexus_grid_calculate_volumetrics():
+    # Arrange
+    grid_file_contents = '''NX NY NZ
+2 1 1
+
+DX CON
+100
+DY CON
+50
+DZ VALUE
+2 4
+
+POROSITY VALUE
+0.1 0.2
+
+SW CON
+0.25
+
+IEQUIL VALUE
+1 2
+
+KX CON
+1
+'''
+    file = NexusFile(location='path/to/grid.dat',
+                     file_content_as_list=grid_file_contents.splitlines(keepends=True))
+    grid = NexusGrid(grid_nexus_file=file, model_unit_system=UnitSystem.ENGLISH)
+
+    # Act
+    result = grid.calculate_volumetrics()
+
+    # Assert
+    assert result.bulk_volume == pytest.approx(30000.0)
+    assert result.pore_volume == pytest.approx(5000.0)
+    assert result.hydrocarbon_pore_volume == pytest.approx(3750.0)
+    np.testing.assert_allclose(result.region_totals['IEQUIL']['PORE_VOLUME'], [1000.0, 4000.0])
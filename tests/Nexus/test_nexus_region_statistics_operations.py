@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ResSimpy.Enums.UnitsEnum import UnitSystem
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+from ResSimpy.Nexus.DataModels.StructuredGrid.NexusGrid import NexusGrid
+from ResSimpy.Nexus.region_statistics_operations import RegionIndex, region_statistics
+
+
+def test_region_index():
+    # Arrange
+    regions = np.array([3, 1, 3, 2, 1, 3])
+
+    # Act
+    result = RegionIndex(regions)
+
+    # Assert
+    np.testing.assert_array_equal(result.regions, [1, 2, 3])
+    np.testing.assert_array_equal(result.counts, [2, 1, 3])
+    np.testing.assert_array_equal(result.cell_indices(1), [1, 4])
+    np.testing.assert_array_equal(result.cell_indices(3), [0, 2, 5])
+    assert result.cell_indices(4).size == 0
+
+
+@pytest.mark.parametrize('weights, expected_result', [
+    (None,
+     pd.DataFrame({'count': [2, 3], 'sum': [6.0, 9.0], 'mean': [3.0, 3.0], 'min': [2.0, 1.0], 'max': [4.0, 5.0],
+                   'P50': [3.0, 3.0]}, index=pd.Index([1, 2], name='REGION'))),
+    (np.array([1.0, 3.0, 1.0, 0.0, 1.0]),
+     pd.DataFrame({'count': [2, 3], 'sum': [6.0, 9.0], 'mean': [3.5, 2.0], 'min': [2.0, 1.0], 'max': [4.0, 5.0],
+                   'P50': [3.5, 2.0]}, index=pd.Index([1, 2], name='REGION'))),
+], ids=['unweighted', 'weighted'])
+def test_region_statistics(weights, expected_result):
+    # Arrange
+    values = np.array([2.0, 4.0, 1.0, 5.0, 3.0])
+    region_index = RegionIndex(np.array([1, 1, 2, 2, 2]))
+
+    # Act
+    result = region_statistics(values, region_index, statistics=['count', 'sum', 'mean', 'min', 'max'],
+                               percentiles=[50], weights=weights)
+
+    # Assert
+    pd.testing.assert_frame_equal(result, expected_result)
+
+
+def test_region_statistics_unsupported_statistic():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        region_statistics(np.ones(3), RegionIndex(np.array([1, 1, 2])), statistics=['median'])
+
+
+def test_nexus_grid_get_region_statistics(mocker):
+    # Arrange
+    grid_file_contents = '''NX NY NZ
+3 1 1
+
+DX CON
+10
+DY CON
+10
+DZ CON
+1
+
+POROSITY VALUE
+0.1 0.2 0.3
+
+KX VALUE
+10 30 100
+
+IROCK VALUE
+1 1 2
+'''
+    file = NexusFile(location='path/to/grid.dat',
+                     file_content_as_list=grid_file_contents.splitlines(keepends=True))
+    grid = NexusGrid(grid_nexus_file=file, model_unit_system=UnitSystem.ENGLISH)
+
+    # Act
+    result = grid.get_region_statistics('KX', region_keyword='IROCK', statistics=['mean', 'max'],
+                                        weight_by_pore_volume=True)
+    region_index_spy = mocker.spy(grid.irock, 'get_effective_array')
+    repeated_result = grid.get_region_statistics('POROSITY', region_keyword='IROCK', statistics=['mean'])
+
+    # Assert
+    expected_result = pd.DataFrame({'mean': [(10 * 10 + 30 * 20) / 30, 100.0], 'max': [30.0, 100.0]},
+                                   index=pd.Index([1, 2], name='REGION'))
+    pd.testing.assert_frame_equal(result, expected_result)
+    np.testing.assert_allclose(repeated_result['mean'], [0.15, 0.3])
+    region_index_spy.assert_not_called()
+
+
+def test_nexus_grid_get_region_statistics_after_arrays_change():
+    # Arrange
+    grid_file_contents = '''NX NY NZ
+4 1 1
+
+DX CON
+10
+DY CON
+10
+DZ CON
+1
+
+POROSITY VALUE
+0.1 0.2 0.3 0.4
+
+KX VALUE
+1 2 3 4
+
+IROCK VALUE
+1 1 2 2
+'''
+    file = NexusFile(location='path/to/grid.dat',
+                     file_content_as_list=grid_file_contents.splitlines(keepends=True))
+    grid = NexusGrid(grid_nexus_file=file, model_unit_system=UnitSystem.ENGLISH)
+    first_result = grid.get_region_statistics('KX', region_keyword='IROCK', statistics=['mean'],
+                                              weight_by_pore_volume=True)
+
+    # Act
+    grid.irock.value = '1 2 2 2'
+    new_regions_result = grid.get_region_statistics('KX', region_keyword='IROCK', statistics=['count'])
+    grid.irock.value = '1 1 2 2'
+    grid.porosity.value = '0.4 0.3 0.2 0.1'
+    new_porosity_result = grid.get_region_statistics('KX', region_keyword='IROCK', statistics=['mean'],
+                                                     weight_by_pore_volume=True)
+    grid.porosity.array[:] = [0.1, 0.2, 0.3, 0.4]
+    grid.porosity.clear_effective_array()
+    edited_porosity_result = grid.get_region_statistics('KX', region_keyword='IROCK', statistics=['mean'],
+                                                        weight_by_pore_volume=True)
+
+    # Assert
+    np.testing.assert_allclose(first_result['mean'], [(1 * 0.1 + 2 * 0.2) / 0.3, (3 * 0.3 + 4 * 0.4) / 0.7])
+    assert new_regions_result['count'].tolist() == [1, 3]
+    np.testing.assert_allclose(new_porosity_result['mean'], [(1 * 0.4 + 2 * 0.3) / 0.7, (3 * 0.2 + 4 * 0.1) / 0.3])
+    np.testing.assert_allclose(edited_porosity_result['mean'], first_result['mean'])
@@ -0,0 +1,107 @@
+from unittest.mock import Mock
+
+from ResSimpy.Enums.FrequencyEnum import FrequencyEnum
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+from ResSimpy.Nexus.NexusSimulator import NexusSimulator
+from ResSimpy.Nexus.runcontrol_event_parser import RuncontrolEventBuffer, RuncontrolEventParser, RuncontrolLineEvent
+from tests.multifile_mocker import mock_multiple_files
+
+
+def test_runcontrol_event_parser():
+    # Arrange
+    file_content = ['START 01/01/2020\n', 'DT AUTO 0.1\n', '  MAX 60\n', 'TIME 01/02/2020 ! DT\n', 'SPREADSHEET\n',
+                    'ENDSPREADSHEET\n', 'C TIME 01/03/2020\n', 'STOP\n']
+    parser = RuncontrolEventParser(file_content)
+    keyword_events: list[RuncontrolLineEvent] = []
+    every_line_events: list[RuncontrolLineEvent] = []
+    finished: list[str] = []
+    parser.subscribe(['Start', 'SPREADSHEET', 'STOP'], keyword_events.append, on_finish=lambda: finished.append('a'))
+    parser.subscribe(['DT', 'TIME'], every_line_events.append, every_line=True, on_finish=lambda: finished.append('b'))
+
+    # Act
+    parser.parse()
+
+    # Assert
+    assert keyword_events == [
+        RuncontrolLineEvent(line_index=0, line='START 01/01/2020\n', keywords=frozenset({'START'})),
+        RuncontrolLineEvent(line_index=4, line='SPREADSHEET\n', keywords=frozenset({'SPREADSHEET'}),
+                            time='01/02/2020'),
+        RuncontrolLineEvent(line_index=7, line='STOP\n', keywords=frozenset({'STOP'}), time='01/02/2020'),
+    ]
+    assert [x.line_index for x in every_line_events] == list(range(len(file_content)))
+    assert [x.keywords for x in every_line_events[:4]] == [frozenset(), frozenset({'DT'}), frozenset(),
+                                                           frozenset({'TIME'})]
+    assert every_line_events[6].keywords == frozenset()
+    assert finished == ['a', 'b']
+
+
+def test_runcontrol_event_buffer_is_current():
+    # Arrange
+    runcontrol_file = NexusFile(location='runcontrol.dat', file_content_as_list=['TIME 01/02/2020\n'])
+    parser = RuncontrolEventParser.from_file(runcontrol_file)
+    buffer = RuncontrolEventBuffer(parser, ['TIME'])
+
+    # Act
+    current_before_parse = buffer.is_current(runcontrol_file)
+    parser.parse()
+    current_after_parse = buffer.is_current(runcontrol_file)
+    current_for_other_file = buffer.is_current(NexusFile(location='runcontrol.dat',
+                                                         file_content_as_list=['TIME 01/02/2020\n']))
+    runcontrol_file._file_modified_set(True)
+    current_after_modification = buffer.is_current(runcontrol_file)
+
+    # Assert
+    assert buffer.events == [RuncontrolLineEvent(line_index=0, line='TIME 01/02/2020\n', keywords=frozenset({'TIME'}),
+                                                 time='01/02/2020')]
+    assert not current_before_parse
+    assert current_after_parse
+    assert not current_for_other_file
+    assert not current_after_modification
+
+
+def test_runcontrol_read_once_for_all_consumers(mocker):
+    # Arrange
+    fcs_file_path = '/path/fcs_file.fcs'
+    runcontrol_path = '/runcontrol_file.dat'
+    fcs_content = f'''DESC reservoir1
+    RUN_UNITS ENGLISH
+    DATEFORMAT DD/MM/YYYY
+    RUNCONTROL {runcontrol_path}
+    '''
+    runcontrol_content = '''START 01/01/2020
+    DT MAX 60.
+    TIME 01/02/2020
+    SPREADSHEET
+      FIELD TNEXT
+    ENDSPREADSHEET
+    TIME 01/03/2020
+    DT MAX 30.
+    STOP
+    TIME 01/04/2020
+    '''
+
+    def mock_open_wrapper(filename, mode):
+        mock_open = mock_multiple_files(mocker, filename, potential_file_dict={
+            fcs_file_path: fcs_content,
+            runcontrol_path: runcontrol_content,
+        }).return_value
+        return mock_open
+
+    mocker.patch("builtins.open", mock_open_wrapper)
+    mocker.patch('os.path.isfile', Mock(side_effect=lambda x: True))
+    nexus_sim = NexusSimulator(fcs_file_path)
+    iterate_line_spy = mocker.spy(NexusFile, 'iterate_line')
+
+    # Act
+    times = nexus_sim.sim_controls.times
+    solver_parameters = nexus_sim.sim_controls.solver_parameters.get_all()
+    output_requests = nexus_sim.reporting.ss_output_requests
+
+    # Assert
+    assert nexus_sim.start_date == '01/01/2020'
+    assert times == ['01/02/2020', '01/03/2020']
+    assert [(x.date, x.dt_max) for x in solver_parameters] == [('01/01/2020', 60.0), ('01/03/2020', 30.0),
+                                                               ('01/04/2020', None)]
+    assert [(x.date, x.output, x.output_frequency) for x in output_requests] == [
+        ('01/02/2020', 'FIELD', FrequencyEnum.TNEXT)]
+    iterate_line_spy.assert_not_called()
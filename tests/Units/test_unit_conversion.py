@@ -0,0 +1,253 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ResSimpy import NexusSimulator
+from ResSimpy.Enums.UnitsEnum import UnitSystem
+from ResSimpy.Nexus.DataModels.NexusCompletion import NexusCompletion
+from ResSimpy.Nexus.DataModels.NexusFile import NexusFile
+from ResSimpy.Nexus.DataModels.NexusPVTMethod import NexusPVTMethod
+from ResSimpy.DataModelBaseClasses.GridArrayDefinition import GridArrayDefinition
+from ResSimpy.Units.UnitConversion import (conversion_factors, convert_data_objects, convert_dataframe,
+                                           convert_dynamic_property, convert_grid_array, convert_values)
+from tests.multifile_mocker import mock_multiple_files
+from ResSimpy.Units.Units import FormationVolumeFactorGas, Length, Pressure, SolutionGasOilRatio, Temperature
+
+
+@pytest.mark.parametrize('dimension, from_unit_system, to_unit_system, value, expected_result', [
+    (Pressure(), UnitSystem.ENGLISH, UnitSystem.METRIC, 1000.0, 6894.757293168361),
+    (Pressure(), UnitSystem.METBAR, UnitSystem.METKGCM2, 1.0, 1.0197162129779282),
+    (Length(), UnitSystem.ENGLISH, UnitSystem.LAB, 1.0, 30.48),
+    (Temperature(), UnitSystem.ENGLISH, UnitSystem.METRIC, 100.0, 37.77777777777778),
+    (Temperature(), UnitSystem.METRIC, UnitSystem.ENGLISH, 100.0, 212.0),
+    (SolutionGasOilRatio(), UnitSystem.ENGLISH, UnitSystem.METRIC, 1.0, 178.1076066),
+    (FormationVolumeFactorGas(), UnitSystem.METRIC, UnitSystem.METRIC, 2.5, 2.5),
+], ids=['psia to kPa', 'bar to kg/cm2', 'ft to cm', 'degF to degC', 'degC to degF', 'mscf/stb to sm3/sm3',
+        'same unit system'])
+def test_convert_values(dimension, from_unit_system, to_unit_system, value, expected_result):
+    # Act
+    result = convert_values([value], dimension, from_unit_system, to_unit_system)
+
+    # Assert
+    np.testing.assert_allclose(result, [expected_result])
+
+
+def test_convert_values_round_trip():
+    # Arrange
+    values = np.array([-40.0, 0.0, 250.0])
+
+    # Act
+    result = convert_values(convert_values(values, Temperature(), UnitSystem.ENGLISH, UnitSystem.LAB), Temperature(),
+                            UnitSystem.LAB, UnitSystem.ENGLISH)
+
+    # Assert
+    np.testing.assert_allclose(result, values)
+
+
+def test_conversion_factors_undefined_unit_system():
+    # Act Assert
+    with pytest.raises(ValueError, match='Cannot convert values in unit system'):
+        conversion_factors(Pressure(), UnitSystem.UNDEFINED, UnitSystem.METRIC)
+
+
+def test_convert_dataframe_mixed_unit_systems():
+    # Arrange
+    df = pd.DataFrame({'name': ['well1', 'well2', 'well3'],
+                       'depth': [1000.0, 500.0, None],
+                       'unit_system': ['ENGLISH', 'METRIC', 'ENGLISH']})
+    expected_df = pd.DataFrame({'name': ['well1', 'well2', 'well3'],
+                                'depth': [304.8, 500.0, None],
+                                'unit_system': ['METRIC', 'METRIC', 'METRIC']})
+
+    # Act
+    result = convert_dataframe(df, {'depth': Length()}, UnitSystem.METRIC)
+
+    # Assert
+    pd.testing.assert_frame_equal(result, expected_df)
+    # the original DataFrame is unchanged
+    assert df['depth'].iloc[0] == 1000.0
+
+
+def test_convert_data_objects():
+    # Arrange
+    completions = [NexusCompletion(date='01/01/2020', i=1, j=1, k=1, well_radius=0.5, depth=1000.0, skin=2.0,
+                                   unit_system=UnitSystem.ENGLISH),
+                   NexusCompletion(date='01/01/2020', i=1, j=1, k=2, well_radius=0.1, depth=None,
+                                   unit_system=UnitSystem.METRIC)]
+
+    # Act
+    convert_data_objects(completions, UnitSystem.METRIC)
+
+    # Assert
+    assert completions[0].well_radius == pytest.approx(0.1524)
+    assert completions[0].depth == pytest.approx(304.8)
+    assert completions[0].skin == 2.0
+    assert completions[0].unit_system == UnitSystem.METRIC
+    assert completions[0].units.unit_system == UnitSystem.METRIC
+    assert completions[1].well_radius == 0.1
+    assert completions[1].depth is None
+
+
+def test_convert_dynamic_property():
+    # Arrange
+    pvt_obj = NexusPVTMethod(file=NexusFile(location='pvt.dat'), input_number=1, model_unit_system=UnitSystem.ENGLISH)
+    pvt_obj.properties = {
+        'API': 30.0,
+        'UNIT_SYSTEM': UnitSystem.ENGLISH,
+        'SATURATED': pd.DataFrame({'PRES': [1000.0, 2000.0], 'BO': [1.1, 1.2], 'RS': [0.2, 0.4]}),
+        'UNSATOIL_PSAT': {'2000.0': pd.DataFrame({'PRES': [2000.0, 3000.0], 'BOFAC': [1.0, 0.98]})},
+    }
+
+    # Act
+    convert_dynamic_property(pvt_obj, UnitSystem.METBAR)
+
+    # Assert
+    saturated = pvt_obj.properties['SATURATED']
+    np.testing.assert_allclose(saturated['PRES'], [68.94757293, 137.89514586])
+    np.testing.assert_allclose(saturated['BO'], [1.1, 1.2])
+    np.testing.assert_allclose(saturated['RS'], [0.2 * 178.1076066, 0.4 * 178.1076066])
+    assert pvt_obj.properties['API'] == 30.0
+    assert list(pvt_obj.properties['UNSATOIL_PSAT']) == ['137.895146']
+    np.testing.assert_allclose(pvt_obj.properties['UNSATOIL_PSAT']['137.895146']['BOFAC'], [1.0, 0.98])
+    assert pvt_obj.properties['UNIT_SYSTEM'] == UnitSystem.METBAR
+    assert pvt_obj.unit_system == UnitSystem.METBAR
+
+
+@pytest.mark.parametrize('modifier, value, expected_value', [
+    ('CON', '100', '30.48'),
+    ('VALUE', '100 200\n300', '30.48 60.96 91.44'),
+    ('ZVAR', '10 20', '3.048 6.096'),
+], ids=['CON', 'VALUE', 'ZVAR'])
+def test_convert_grid_array(modifier, value, expected_value):
+    # Arrange
+    grid_array = GridArrayDefinition(modifier=modifier, value=value, name='DZ')
+
+    # Act
+    convert_grid_array(grid_array, Length(), UnitSystem.ENGLISH, UnitSystem.METRIC)
+
+    # Assert
+    assert grid_array.value == expected_value
+    assert grid_array.modifier == modifier
+
+
+def test_convert_values_rounds_to_significant_figures():
+    # Act
+    result = convert_values([1564.8, 1e-7, 0.0, 1e12], Length(), UnitSystem.ENGLISH, UnitSystem.METRIC)
+
+    # Assert
+    assert [repr(x) for x in result.tolist()] == ['476.95104', '3.048e-08', '0.0', '304800000000.0']
+
+
+def test_convert_data_objects_rounds_to_significant_figures():
+    # Arrange
+    completion = NexusCompletion(date='01/01/2020', i=1, j=1, k=1, depth=1564.8, unit_system=UnitSystem.ENGLISH)
+
+    # Act
+    convert_data_objects([completion], UnitSystem.METRIC)
+
+    # Assert
+    assert repr(completion.depth) == '476.95104'
+
+
+def test_convert_grid_array_mods():
+    # Arrange
+    mod_table = pd.DataFrame({'i1': [1, 1, 1, 1, 1], 'i2': [2, 2, 2, 2, 2], 'j1': [1, 1, 1, 1, 1],
+                              'j2': [1, 1, 1, 1, 1], 'k1': [1, 1, 1, 1, 1], 'k2': [1, 1, 1, 1, 1],
+                              '#v': ['*2', '/4', '+100', '-10', '50']})
+    vmod_table = pd.DataFrame({'i1': [1], 'i2': [2], 'j1': [1], 'j2': [1], 'k1': [1], 'k2': [1],
+                               'operation': ['MULT'], 'include_file': ['/path/vmod.inc']})
+    grid_array = GridArrayDefinition(modifier='CON', value='100', name='DZ',
+                                     mods={'MOD': mod_table, 'VMOD': vmod_table})
+    temperature_array = GridArrayDefinition(modifier='CON', value='212', name='TEMPERATURE',
+                                            mods={'MOD': mod_table.iloc[2:].copy()})
+
+    # Act
+    convert_grid_array(grid_array, Length(), UnitSystem.ENGLISH, UnitSystem.METRIC)
+    convert_grid_array(temperature_array, Temperature(), UnitSystem.ENGLISH, UnitSystem.METRIC)
+
+    # Assert
+    assert grid_array.value == '30.48'
+    assert grid_array.mods['MOD']['#v'].tolist() == ['*2', '/4', '+30.48', '-3.048', '15.24']
+    assert list(mod_table['#v']) == ['*2', '/4', '+100', '-10', '50']
+    assert grid_array.mods['VMOD'] is vmod_table
+    assert temperature_array.value == '100'
+    assert temperature_array.mods['MOD']['#v'].tolist() == ['+55.5555556', '-5.55555556', '10']
+
+
+@pytest.mark.parametrize('mods, dimension', [
+    ({'VMOD': pd.DataFrame({'i1': [1], 'i2': [1], 'j1': [1], 'j2': [1], 'k1': [1], 'k2': [1],
+                            'operation': ['ADD'], 'include_file': ['/path/vmod.inc']})}, Length()),
+    ({'MOD': pd.DataFrame({'i1': [1], 'i2': [1], 'j1': [1], 'j2': [1], 'k1': [1], 'k2': [1], '#v': ['*2']})},
+     Temperature()),
+], ids=['VMOD ADD', 'MOD multiply with offset'])
+def test_convert_grid_array_unconverted_mods_warn(mods, dimension):
+    # Arrange
+    grid_array = GridArrayDefinition(modifier='CON', value='100', name='DEPTH', mods=mods)
+
+    # Act Assert
+    with pytest.warns(UserWarning, match='can not be converted to METRIC units'):
+        convert_grid_array(grid_array, dimension, UnitSystem.ENGLISH, UnitSystem.METRIC)
+
+
+def test_model_to_unit_system(mocker):
+    # Arrange
+    fcs_file_path = '/path/fcs_file.fcs'
+
+    def mock_open_wrapper(filename, mode='r'):
+        return mock_multiple_files(mocker, filename, potential_file_dict={
+            fcs_file_path: 'DESC converted model\nDEFAULT_UNITS ENGLISH\nRUNCONTROL /path/runcontrol.dat\n'
+                           'WELLS set 1 /path/wells.dat\nPVT Method 1 /path/pvt.dat\n'
+                           'SURFACE Network 1 /path/surface.dat\n',
+            '/path/runcontrol.dat': 'START 01/01/2020\n',
+            '/path/wells.dat': 'WELLSPEC well1\nIW JW L RADW DEPTH\n1 2 3 0.5 1000\n',
+            '/path/pvt.dat': 'BLACKOIL API 30 SPECG 0.6\nSATURATED\nPRES BO RS\n1000 1.1 0.2\n2000 1.2 0.4\n',
+            '/path/surface.dat': 'NODECON\nNAME NODEIN NODEOUT TYPE LENGTH\nconn1 node1 node2 PIPE 500\nENDNODECON\n',
+        }).return_value
+
+    mocker.patch('builtins.open', mock_open_wrapper)
+    mocker.patch('os.path.isfile', Mock(side_effect=lambda x: True))
+    mocker.patch('os.listdir', Mock(return_value=[]))
+    model = NexusSimulator(origin=fcs_file_path)
+
+    # Act
+    model.to_unit_system(UnitSystem.METRIC)
+
+    # Assert
+    assert model.default_units == UnitSystem.METRIC
+    completion = model.wells.get('well1').completions[0]
+    assert completion.well_radius == pytest.approx(0.1524)
+    assert completion.depth == pytest.approx(304.8)
+    assert completion.unit_system == UnitSystem.METRIC
+    assert model.wells.get('well1').unit_system == UnitSystem.METRIC
+    connection = model.network.connections.get_all()[0]
+    assert connection.length == pytest.approx(152.4)
+    np.testing.assert_allclose(model.pvt.inputs[1].properties['SATURATED']['PRES'], [6894.757293, 13789.514586])
+
+
+def test_model_to_unit_system_grid_unit_system(mocker):
+    # Arrange
+    fcs_file_path = '/path/fcs_file.fcs'
+
+    def mock_open_wrapper(filename, mode='r'):
+        return mock_multiple_files(mocker, filename, potential_file_dict={
+            fcs_file_path: 'DESC converted model\nDEFAULT_UNITS ENGLISH\nRUNCONTROL /path/runcontrol.dat\n'
+                           'STRUCTURED_GRID /path/grid.dat\nSURFACE Network 1 /path/surface.dat\n',
+            '/path/runcontrol.dat': 'START 01/01/2020\n',
+            '/path/surface.dat': 'NODECON\nNAME NODEIN NODEOUT TYPE LENGTH\nconn1 node1 node2 PIPE 500\nENDNODECON\n',
+            '/path/grid.dat': 'METBAR\nNX NY NZ\n1 1 1\nDZ CON\n10\nPRESSURE CON\n200\n',
+        }).return_value
+
+    mocker.patch('builtins.open', mock_open_wrapper)
+    mocker.patch('os.path.isfile', Mock(side_effect=lambda x: True))
+    mocker.patch('os.listdir', Mock(return_value=[]))
+    model = NexusSimulator(origin=fcs_file_path)
+
+    # Act
+    model.to_unit_system(UnitSystem.METRIC)
+
+    # Assert
+    assert model.grid.dz.value == '10'
+    assert model.grid.pressure.value == '20000'
+    assert model.grid.unit_system == UnitSystem.METRIC
@@ -16,3 +16,4 @@ def mock_out_file_datetime_operations(mocker, request):
     os_mock = mocker.MagicMock()
     mocker.patch('os.stat', os_mock)
     os_mock.return_value.st_mtime = None
+    os_mock.return_value.st_size = 0
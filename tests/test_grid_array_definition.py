@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -69,3 +70,83 @@ def test_grid_array_definition_to_string(name, region_name, modifier, value, mod
     result = grid_array_definition.to_string()
     # Assert
     assert result == expected_result
+
+
+@pytest.mark.parametrize('modifier, value, mods, expected_result', [
+    ('CON', '1.0',
+     {'MOD': pd.DataFrame(columns=['i1', 'i2', 'j1', 'j2', 'k1', 'k2', '#v'],
+                          data=[[1, 2, 1, 1, 1, 1, '*2'],
+                                [2, 3, 1, 1, 1, 1, '*3'],
+                                [1, 1, 1, 1, 2, 2, '+1.5']])},
+     [2.0, 6.0, 3.0, 2.5, 1.0, 1.0]),
+    ('CON', '4.0',
+     {'MOD': pd.DataFrame(columns=['i1', 'i2', 'j1', 'j2', 'k1', 'k2', '#v'],
+                          data=[[1, 3, 1, 1, 1, 2, '=1'],
+                                [2, 2, 1, 1, 1, 2, '=2'],
+                                [3, 3, 1, 1, 2, 2, '7'],
+                                [1, 3, 1, 1, 2, 2, '/2']])},
+     [1.0, 2.0, 1.0, 0.5, 1.0, 3.5]),
+    ('VALUE', '/path/to/file.dat',
+     {'MOD': pd.DataFrame(columns=['i1', 'i2', 'j1', 'j2', 'k1', 'k2', '#v'],
+                          data=[[1, 3, 1, 1, 2, 2, '-1']])},
+     [1.0, 2.0, 3.0, 3.0, 4.0, 5.0]),
+    ('CON', '1.0',
+     {'VMOD': pd.DataFrame({'i1': [2], 'i2': [3], 'j1': [1], 'j2': [1], 'k1': [1], 'k2': [2],
+                            'operation': ['MULT'], 'include_file': ['/path/to/vmod.inc']})},
+     [1.0, 10.0, 20.0, 1.0, 30.0, 40.0]),
+    ('CON', '1.0',
+     {'MODX': pd.DataFrame(columns=['i1', 'i2', 'j1', 'j2', 'k1', 'k2', '#v'],
+                           data=[[1, 3, 1, 1, 1, 2, 10203040]])},
+     [1.0, 1.0, 1.0, 1.0, 1.0, 1.0]),
+], ids=['mod_multiply_overlapping', 'mod_assign_overlapping', 'mod_on_value_array', 'vmod_mult', 'modx_ignored'])
+def test_grid_array_definition_get_effective_array(mocker, modifier, value, mods, expected_result):
+    # Arrange
+    grid_array_definition = GridArrayDefinition(modifier=modifier, value=value, mods=mods)
+
+    def mock_open_wrapper(filename, mode):
+        mock_open = mock_multiple_files(mocker, filename, potential_file_dict={
+            '/path/to/file.dat': '1 2 3\n4 5 6\n',
+            '/path/to/vmod.inc': '10 20\n30 40\n',
+        }).return_value
+        return mock_open
+    mocker.patch("builtins.open", mock_open_wrapper)
+
+    # Act
+    result = grid_array_definition.get_effective_array(3, 1, 2)
+
+    # Assert
+    np.testing.assert_array_equal(result, np.array(expected_result))
+    assert grid_array_definition.get_effective_array(3, 1, 2) is result
+
+
+def test_grid_array_definition_get_effective_array_cache_cleared():
+    # Arrange
+    mods = {'MOD': pd.DataFrame(columns=['i1', 'i2', 'j1', 'j2', 'k1', 'k2', '#v'], data=[[1, 1, 1, 1, 1, 1, '*2']])}
+    grid_array_definition = GridArrayDefinition(modifier='CON', value='1.0', mods=mods)
+    first_result = grid_array_definition.get_effective_array(3, 1, 2)
+
+    # Act
+    grid_array_definition.mods['MOD'].loc[0, '#v'] = '*3'
+    grid_array_definition.clear_effective_array()
+    edited_mod_result = grid_array_definition.get_effective_array(3, 1, 2)
+    grid_array_definition.mods = {
+        'MOD': pd.DataFrame(columns=['i1', 'i2', 'j1', 'j2', 'k1', 'k2', '#v'], data=[[2, 3, 1, 1, 1, 1, '+1']])}
+    new_mods_result = grid_array_definition.get_effective_array(3, 1, 2)
+    grid_array_definition.value = '5.0'
+    new_value_result = grid_array_definition.get_effective_array(3, 1, 2)
+
+    # Assert
+    np.testing.assert_array_equal(first_result, [2.0, 1.0, 1.0, 1.0, 1.0, 1.0])
+    np.testing.assert_array_equal(edited_mod_result, [3.0, 1.0, 1.0, 1.0, 1.0, 1.0])
+    np.testing.assert_array_equal(new_mods_result, [1.0, 2.0, 2.0, 1.0, 1.0, 1.0])
+    np.testing.assert_array_equal(new_value_result, [5.0, 6.0, 6.0, 5.0, 5.0, 5.0])
+
+
+def test_grid_array_definition_get_effective_array_box_outside_grid():
+    # Arrange
+    mods = {'MOD': pd.DataFrame(columns=['i1', 'i2', 'j1', 'j2', 'k1', 'k2', '#v'], data=[[1, 4, 1, 1, 1, 1, '*2']])}
+    grid_array_definition = GridArrayDefinition(modifier='CON', value='1.0', mods=mods)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        grid_array_definition.get_effective_array(3, 1, 2)
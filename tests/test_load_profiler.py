@@ -0,0 +1,67 @@
+from unittest.mock import Mock
+
+from ResSimpy import NexusSimulator
+from ResSimpy.Utils import load_profiler
+from tests.multifile_mocker import mock_multiple_files
+
+
+def mock_model_files(mocker):
+    fcs_file_path = '/path/fcs_file.fcs'
+    wells_content = 'WELLSPEC well1\nIW JW L RADW\n1 2 3 4.5\n\nWELLSPEC well2\nIW JW L RADW\n4 5 6 7.5\n'
+
+    def mock_open_wrapper(filename, mode='r'):
+        return mock_multiple_files(mocker, filename, potential_file_dict={
+            fcs_file_path: 'DESC profiled model\nRUNCONTROL /path/runcontrol.dat\nWELLS set 1 /path/wells.dat\n'
+                           'PVT Method 1 /path/pvt.dat\nSURFACE Network 1 /path/surface.dat\n',
+            '/path/runcontrol.dat': 'START 01/01/2020\n',
+            '/path/wells.dat': wells_content,
+            '/path/pvt.dat': 'BLACKOIL\n',
+            '/path/surface.dat': 'BLACKOIL\n',
+        }).return_value
+
+    mocker.patch('builtins.open', mock_open_wrapper)
+    mocker.patch('os.path.isfile', Mock(side_effect=lambda x: True))
+    mocker.patch('os.listdir', Mock(return_value=[]))
+    return fcs_file_path, wells_content
+
+
+def test_load_report(mocker):
+    # Arrange
+    fcs_file_path, wells_content = mock_model_files(mocker)
+    load_profiler.enable_profiling()
+
+    # Act
+    try:
+        model = NexusSimulator(origin=fcs_file_path)
+        model.wells.get_df()
+        model.wells.get_df()
+        model.pvt.inputs
+        report = model.load_report().set_index('phase')
+    finally:
+        load_profiler.disable_profiling()
+
+    # Assert
+    assert {'NexusSimulator.load_fcs_file', 'generate_file_include_structure', 'generate_fcs_structure',
+            'NexusWells.load', 'load_wells', 'NexusNetwork.load', 'collect_all_tables_to_objects',
+            'load_pvt_methods'}.issubset(report.index)
+    assert report.loc['NexusWells.load', 'calls'] == 1
+    assert report.loc['load_wells', 'lines_processed'] == wells_content.count('\n')
+    # loading the wells also loads the network, so its lines are included in the wells totals
+    assert report.loc['NexusWells.load', 'lines_processed'] == (report.loc['load_wells', 'lines_processed'] +
+                                                                report.loc['NexusNetwork.load', 'lines_processed'])
+    assert report.loc['generate_fcs_structure', 'bytes_read'] >= len(wells_content)
+    fcs_phases = report.loc[['NexusSimulator.load_fcs_file', 'generate_fcs_structure'], 'lines_read']
+    assert fcs_phases.iloc[0] >= fcs_phases.iloc[1] > 0
+    assert (report['seconds'] >= 0).all()
+
+
+def test_load_report_disabled(mocker):
+    # Arrange
+    fcs_file_path, _ = mock_model_files(mocker)
+
+    # Act
+    model = NexusSimulator(origin=fcs_file_path)
+    model.wells.get_df()
+
+    # Assert
+    assert model.load_report().empty
@@ -1,3 +1,10 @@
+import subprocess
+import sys
+from os import stat as real_stat
+
+import pytest
+
+
 def test_import_ISODateTime():
     from ResSimpy import ISODateTime
     assert ISODateTime is not None
@@ -10,6 +17,34 @@ def test_import_DateFormat():
     from ResSimpy import DateFormat
     assert DateFormat is not None
 
-def test_import_NexusSimulator():
+def test_import_NexusSimulator(mocker):
+    # the simulator modules are imported on first access, which needs the real os.stat
+    mocker.patch('os.stat', real_stat)
     from ResSimpy import NexusSimulator
     assert NexusSimulator is not None
+
+def test_import_OpenGoSimSimulator(mocker):
+    mocker.patch('os.stat', real_stat)
+    from ResSimpy import OpenGoSimSimulator
+    assert OpenGoSimSimulator is not None
+
+def test_import_unknown_attribute():
+    import ResSimpy
+    with pytest.raises(AttributeError):
+        ResSimpy.NotAClass
+
+def test_lightweight_imports_do_not_load_simulators():
+    # Arrange
+    code = 'import sys, ResSimpy; from ResSimpy import ISODateTime, UnitSystem, DateFormat; print(*sys.modules)'
+
+    # Act
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True,
+                            check=True)
+
+    # Assert
+    imported_modules = {line.split('|')[-1].strip() for line in result.stderr.splitlines()
+                        if line.startswith('import time:')}
+    imported_modules.update(result.stdout.split())
+    assert 'ResSimpy.Time.ISODateTime' in imported_modules
+    assert imported_modules.isdisjoint({'pandas', 'numpy', 'ResSimpy.Nexus.NexusSimulator',
+                                        'ResSimpy.OpenGoSim.OpenGoSimSimulator'})
@@ -2,11 +2,13 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from ResSimpy.Enums.UnitsEnum import UnitSystem
 from ResSimpy.Utils import to_dict_generic
+from ResSimpy.Utils.content_hash import DIGEST_SIZE, content_digest, lines_digest
 from ResSimpy.Utils.general_utilities import expand_string_list_of_numbers, convert_to_number, is_number
 from ResSimpy.Utils.generic_repr import generic_repr, generic_str
 from ResSimpy.Utils.invert_nexus_map import invert_nexus_map, attribute_name_to_nexus_keyword, \
@@ -289,3 +291,40 @@ def test_get_column_headers_required():
 
     # Assert
     assert result_headers == expected_headers
+
+
+@pytest.mark.parametrize('value_1, value_2, expected_equal', [
+    ({'a': 1, 'b': [1.0, 'x']}, {'b': [1, 'x'], 'a': 1.0}, True),
+    (pd.DataFrame({'PRES': [1000.0, 2000.0], 'NAME': ['a', 'b']}),
+     pd.DataFrame({'PRES': [1000.0, 2000.0], 'NAME': ['a', 'b']}), True),
+    (pd.DataFrame({'PRES': [1000.0, 2000.0]}), pd.DataFrame({'PRES': [1000.0, 2000.1]}), False),
+    (pd.DataFrame({'PRES': [1000.0, 2000.0]}), pd.DataFrame({'BHP': [1000.0, 2000.0]}), False),
+    (np.arange(2000, dtype=float), np.arange(2000, dtype=float), True),
+    (np.arange(2000, dtype=float), np.arange(2000, dtype=float)[::-1], False),
+    (['a', 'b'], ['b', 'a'], False),
+    ([UnitSystem.ENGLISH, None], [UnitSystem.ENGLISH, None], True),
+    ('1', 1, False),
+], ids=['unordered dict', 'equal DataFrames', 'different values', 'different columns', 'equal arrays',
+        'different arrays', 'ordered list', 'enums and None', 'string and number'])
+def test_content_digest(value_1, value_2, expected_equal):
+    # Act
+    digest_1 = content_digest(value_1)
+    digest_2 = content_digest(value_2)
+
+    # Assert
+    assert (digest_1 == digest_2) is expected_equal
+    assert len(digest_1) == DIGEST_SIZE
+
+
+@pytest.mark.parametrize('lines_1, lines_2, expected_equal', [
+    (['KX CON\n', '100\n'], ['KX CON\n', '100\n'], True),
+    (['KX CON\n', '100\n'], ['KX CON\n100\n'], True),
+    (['KX CON\n', '100\n'], ['KX CON\n', '200\n'], False),
+    (['line\n'] * 25000, ['line\n'] * 25001, False),
+], ids=['equal', 'split differently', 'different', 'multiple chunks'])
+def test_lines_digest(lines_1, lines_2, expected_equal):
+    # Act
+    result = lines_digest(lines_1) == lines_digest(lines_2)
+
+    # Assert
+    assert result is expected_equal